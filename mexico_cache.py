@@ -0,0 +1,292 @@
+"""
+CACHÉ DE FUENTES EXTERNAS
+Evita repetir consultas a WAQI, OpenWeatherMap y OpenAQ cuando
+la misma zona se consultó hace poco. Cada fuente tiene su propia frescura (TTL)
+y las entradas menos usadas se desalojan al llenarse la caché (LRU).
+Opcionalmente las respuestas se persisten en SQLite (DiskCache) para que un
+reinicio del servidor no empiece con la caché vacía.
+"""
+
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from mexico_concurrency import SingleFlight
+
+
+class TTLCache:
+    """Caché en memoria con expiración por entrada y desalojo LRU (thread-safe)"""
+
+    def __init__(self, name, ttl, max_entries=1024):
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._data = OrderedDict()  # key -> (expira_en, valor)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Retorna el valor vigente o None si no existe / expiró"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.time():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def peek(self, key):
+        """Como get() pero sin contar aciertos/fallos ni cambiar el orden LRU"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > time.time():
+                return entry[1]
+            return None
+
+    def set(self, key, value, ttl=None):
+        """Guarda un valor; desaloja la entrada menos usada si se excede el tamaño"""
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+    def stats(self):
+        """Contadores de aciertos/fallos de la caché"""
+        total = self.hits + self.misses
+        return {
+            'ttl_seconds': self.ttl,
+            'entries': len(self._data),
+            'max_entries': self.max_entries,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0
+        }
+
+
+class ProviderCache:
+    """
+    Caché por proveedor con clave (fuente, celda de la rejilla de esa fuente).
+    Los municipios cercanos caen en la misma celda y comparten una sola consulta,
+    que se hace con las coordenadas del centro de la celda.
+    Solo se guardan respuestas válidas: un None (fuente sin datos) se vuelve a consultar
+    """
+
+    # Frescura por fuente (segundos)
+    DEFAULT_TTLS = {
+        'air': 30 * 60,           # WAQI por coordenadas (solo con token demo, sin capa nacional)
+        'weather': 10 * 60,       # OpenWeatherMap
+        'openaq_station': 60 * 60,  # OpenAQ: última medición por estación (horaria)
+        'ndvi': 8 * 86400,        # MODIS NDVI (compuestos de 8-16 días)
+    }
+
+    # Tamaño de celda (grados) por fuente; las fuentes sin celda usan coordenadas redondeadas
+    DEFAULT_GRID = {
+        'air': 0.25,       # WAQI por geo: estación más cercana al centro de la celda (~28 km)
+        'weather': 0.25,   # OpenWeatherMap: clima sinóptico, igual en ~28 km
+    }
+
+    def __init__(self, ttls=None, max_entries=2048, precision=2, store=None, grid=None):
+        self.ttls = dict(self.DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+        self.grid = dict(self.DEFAULT_GRID)
+        self.grid.update(grid or {})
+        self.precision = precision  # 2 decimales ≈ 1 km (fuentes sin celda)
+        self.caches = {
+            source: TTLCache(source, ttl, max_entries) for source, ttl in self.ttls.items()
+        }
+        # Almacén persistente opcional (DiskCache); se escribe en cada respuesta nueva
+        self.store = store
+        # Consultas simultáneas de la misma clave comparten una sola llamada externa
+        self.inflight = SingleFlight('proveedores')
+
+    def cell(self, source, coords):
+        """Centro de la celda de la fuente que contiene coords (lat, lon)"""
+        lat, lon = float(coords[0]), float(coords[1])
+        step = self.grid.get(source)
+        if not step:
+            return (round(lat, self.precision), round(lon, self.precision))
+        return (round((math.floor(lat / step) + 0.5) * step, 4),
+                round((math.floor(lon / step) + 0.5) * step, 4))
+
+    def key(self, source, coords):
+        """Clave de caché: (fuente, lat, lon) del centro de la celda"""
+        return (source,) + self.cell(source, coords)
+
+    def get_or_fetch(self, source, coords, fetch):
+        """
+        Retorna el valor en caché o ejecuta fetch(cell_coords) y guarda el resultado.
+        fetch recibe el centro de la celda: la respuesta es la misma para todo municipio de la celda
+        """
+        cache = self.caches.get(source)
+        if cache is None:
+            return fetch(coords)
+
+        key = self.key(source, coords)
+        cell_coords = list(key[1:])
+        return self._get_or_fetch(cache, key, lambda: fetch(cell_coords))
+
+    def get_or_fetch_item(self, source, item_id, fetch):
+        """
+        Como get_or_fetch pero con clave (fuente, id) para datos de un objeto con
+        identificador propio (p. ej. una estación OpenAQ); fetch no recibe argumentos
+        """
+        cache = self.caches.get(source)
+        if cache is None:
+            return fetch()
+        return self._get_or_fetch(cache, (source, item_id), fetch)
+
+    def _get_or_fetch(self, cache, key, fetch):
+        value = cache.get(key)
+        if value is not None:
+            return value
+
+        def fetch_and_store():
+            # Otra consulta pudo terminar justo antes de que esta tomara la clave
+            value = cache.peek(key)
+            if value is not None:
+                return value
+            value = fetch()
+            if value is not None:
+                cache.set(key, value)
+                if self.store is not None:
+                    self.store.set(key, value, time.time() + cache.ttl)
+            return value
+
+        return self.inflight.do(key, fetch_and_store)
+
+    def warm_from_store(self):
+        """Carga en memoria las entradas vigentes del almacén persistente"""
+        if self.store is None:
+            return 0
+
+        loaded = 0
+        now = time.time()
+        for key, value, expires_at in self.store.load_fresh():
+            cache = self.caches.get(key[0])
+            if cache is not None:
+                cache.set(key, value, ttl=expires_at - now)
+                loaded += 1
+        return loaded
+
+    def clear(self):
+        for cache in self.caches.values():
+            cache.clear()
+
+    def stats(self):
+        """Estadísticas de todas las fuentes"""
+        stats = {source: cache.stats() for source, cache in self.caches.items()}
+        stats['inflight'] = self.inflight.stats()
+        if self.store is not None:
+            stats['disk'] = self.store.stats()
+        return stats
+
+
+class DiskCache:
+    """
+    Almacén persistente de respuestas en SQLite (sin servicios externos).
+    Guarda (clave, valor JSON, expiración) y limita el número de entradas;
+    compact() elimina lo expirado, recorta al tamaño máximo y reduce el archivo
+    """
+
+    # Cada cuántas escrituras se compacta automáticamente
+    COMPACT_EVERY = 1000
+
+    def __init__(self, path, max_entries=50000):
+        self.path = path
+        self.max_entries = max_entries
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, timeout=10)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS entries ('
+            ' key TEXT PRIMARY KEY,'
+            ' value TEXT NOT NULL,'
+            ' expires_at REAL NOT NULL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_expires ON entries (expires_at)')
+        self._conn.commit()
+        self.writes = 0
+
+    def set(self, key, value, expires_at):
+        """Guarda (o reemplaza) una entrada; los errores de disco no interrumpen la consulta"""
+        try:
+            payload = json.dumps(value, default=float)
+            with self._lock:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO entries (key, value, expires_at) VALUES (?, ?, ?)',
+                    (json.dumps(list(key)), payload, expires_at)
+                )
+                self._conn.commit()
+                self.writes += 1
+                writes = self.writes
+            # Aplicar el tamaño máximo también durante la ejecución
+            if writes % self.COMPACT_EVERY == 0:
+                self.compact()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"⚠️  Caché en disco: no se pudo guardar ({str(e)[:50]})")
+
+    def load_fresh(self):
+        """
+        Lista de (clave, valor, expira_en) no expiradas, de la que expira antes a la que expira después.
+        Al precargar en ese orden las más frescas quedan como las más recientes del LRU
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT key, value, expires_at FROM entries WHERE expires_at > ? ORDER BY expires_at ASC',
+                (time.time(),)
+            ).fetchall()
+        return [(tuple(json.loads(key)), json.loads(value), expires_at) for key, value, expires_at in rows]
+
+    def compact(self):
+        """Elimina entradas expiradas, aplica el tamaño máximo y compacta el archivo"""
+        with self._lock:
+            expired = self._conn.execute(
+                'DELETE FROM entries WHERE expires_at <= ?', (time.time(),)
+            ).rowcount
+            # Conservar solo las max_entries que expiran más tarde
+            trimmed = self._conn.execute(
+                'DELETE FROM entries WHERE key NOT IN ('
+                ' SELECT key FROM entries ORDER BY expires_at DESC LIMIT ?)',
+                (self.max_entries,)
+            ).rowcount
+            self._conn.commit()
+            if expired or trimmed:
+                self._conn.execute('VACUUM')
+        return {'expired': expired, 'trimmed': trimmed}
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    def stats(self):
+        return {
+            'path': self.path,
+            'entries': len(self),
+            'max_entries': self.max_entries,
+            'writes': self.writes,
+            'size_bytes': os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        }
@@ -0,0 +1,237 @@
+"""
+CATÁLOGO DE MUNICIPIOS CON CLAVE ESTABLE
+Cada municipio/ciudad se identifica con una clave entera estilo INEGI
+(clave de estado * 1000 + clave municipal) y con la pareja (estado, nombre).
+Las claves se asignan una sola vez y se guardan en data/municipios.npz
+(mexico_data.save_municipios); el catálogo solo las lee.
+Los nombres que se repiten en varios estados (Benito Juárez, Guadalupe...)
+son registros distintos; las entradas repetidas se reportan, nunca se
+sobrescriben en silencio. Los registros viven en columnas densas para poder
+guardar datos por ciudad en arreglos indexados por posición
+"""
+
+import numpy as np
+
+from mexico_data import COORD_DECIMALS, MUNICIPIOS_POR_ESTADO
+
+
+def _estado_de(info, default='Unknown'):
+    return info.get('estado', info.get('state', default))
+
+
+def _codes(values):
+    """Valores repetidos (estado, tipo) como (lista de distintos, arreglo de códigos)"""
+    distinct = sorted(set(values))
+    lookup = {value: code for code, value in enumerate(distinct)}
+    return distinct, np.array([lookup[value] for value in values], dtype=np.int16)
+
+
+class MunicipioCatalog:
+    """
+    Catálogo inmutable de municipios/ciudades.
+    Se construye con build(); después solo se consulta.
+    Se guarda por columnas (arreglos NumPy ordenados por clave): el registro en
+    forma de diccionario se arma solo cuando se pide con get(), find() o al iterar
+    """
+
+    def __init__(self, columns, duplicates=None):
+        order = np.argsort(np.asarray(columns['id'], dtype=np.int64), kind='stable')
+        self._ids = np.asarray(columns['id'], dtype=np.int32)[order]
+        self._lat = np.asarray(columns['lat'], dtype=np.float64)[order]
+        self._lon = np.asarray(columns['lon'], dtype=np.float64)[order]
+        self._poblacion = np.asarray(columns['poblacion'], dtype=np.int64)[order]
+        self._nombres = tuple(columns['nombre'][i] for i in order.tolist())
+        self._claves = tuple(columns['clave_inegi'][i] for i in order.tolist())
+        self._estados, self._estado_codes = _codes([columns['estado'][i] for i in order.tolist()])
+        self._tipos, self._tipo_codes = _codes([columns['tipo'][i] for i in order.tolist()])
+        self.duplicates = tuple(duplicates or ())
+
+        self._position = {}   # city_id -> posición
+        self._by_key = {}     # (estado, nombre) -> posición
+        self._by_name = {}    # nombre -> posiciones (homónimos en varios estados)
+        self._by_state = {}   # estado -> posiciones
+
+        for position, (city_id, nombre, estado_code) in enumerate(
+                zip(self._ids.tolist(), self._nombres, self._estado_codes.tolist())):
+            estado = self._estados[estado_code]
+            self._position[city_id] = position
+            self._by_key[(estado, nombre)] = position
+            self._by_name.setdefault(nombre, []).append(position)
+            self._by_state.setdefault(estado, []).append(position)
+
+        # Homónimos: primero el más poblado (resolución por nombre sin estado)
+        for positions in self._by_name.values():
+            positions.sort(key=lambda p: -self._poblacion[p])
+
+    @classmethod
+    def build(cls, base_cities, municipios_por_estado=None, registry=MUNICIPIOS_POR_ESTADO):
+        """
+        Construye el catálogo a partir de:
+        - municipios_por_estado: {estado: {nombre: info}} (fuente principal);
+          si es MunicipiosPorEstado se leen directamente las columnas de su tabla
+        - base_cities: {nombre: info} ciudades principales del analizador
+        Las claves no se generan aquí: vienen de la columna ids de data/municipios.npz
+        (o de info['id']); las ciudades sin clave propia la toman de registry por
+        (estado, nombre). Así la clave de un municipio no depende de qué otros
+        registros estén presentes
+        """
+        entries = {}  # (estado, nombre) -> (lat, lon, poblacion, tipo, clave_inegi, id)
+        duplicates = []
+        missing = []
+        registry_ids = None
+
+        def registry_id(estado, nombre):
+            nonlocal registry_ids
+            if registry_ids is None:
+                table = getattr(registry, 'table', None)
+                registry_ids = table.id_por_clave if table is not None else {}
+            return registry_ids.get((estado, nombre))
+
+        def add(estado, nombre, row, origen):
+            key = (estado, nombre)
+            if key in entries:
+                duplicates.append({'estado': estado, 'nombre': nombre, 'origen': origen})
+                return
+            if row[5] is None:
+                row = row[:5] + (registry_id(estado, nombre),)
+            if row[5] is None:
+                missing.append({'estado': estado, 'nombre': nombre, 'origen': origen})
+                return
+            entries[key] = row
+
+        table = getattr(municipios_por_estado, 'table', None)
+        if table is not None:
+            # Tabla columnar (data/municipios.npz): sin diccionario intermedio por municipio
+            lats = np.round(table.lat.astype(np.float64), COORD_DECIMALS).tolist()
+            lons = np.round(table.lon.astype(np.float64), COORD_DECIMALS).tolist()
+            poblacion = table.poblacion.tolist()
+            estado_codes = table.estado_codes.tolist()
+            tipo_codes = table.tipo_codes.tolist()
+            claves = table.clave_inegi.tolist()
+            ids = table.ids.tolist()
+            for filas in table.filas_por_estado.values():
+                for nombre, row in filas.items():
+                    add(table.estados[estado_codes[row]], nombre,
+                        (lats[row], lons[row], poblacion[row],
+                         table.tipos[tipo_codes[row]] or 'municipio', claves[row] or None, ids[row]),
+                        'municipios')
+        else:
+            for municipios in (municipios_por_estado or {}).values():
+                for nombre, info in municipios.items():
+                    add(_estado_de(info), nombre, cls._row(info, 'municipio'), 'municipios')
+
+        # Las ciudades base que ya están en el catálogo de municipios no se duplican
+        for nombre, info in base_cities.items():
+            if (_estado_de(info), nombre) not in entries:
+                add(_estado_de(info), nombre, cls._row(info, 'ciudad'), 'base')
+
+        # Dos registros distintos con la misma clave: se conserva el primero
+        seen = set()
+        collisions = []
+        for key in list(entries):
+            city_id = entries[key][5]
+            if city_id in seen:
+                collisions.append({'estado': key[0], 'nombre': key[1], 'origen': f'clave repetida {city_id}'})
+                del entries[key]
+            seen.add(city_id)
+
+        if duplicates:
+            print(f"⚠️  Catálogo: {len(duplicates)} entradas repetidas (estado, nombre) ignoradas")
+        if collisions:
+            print(f"⚠️  Catálogo: {len(collisions)} registros con clave ya usada por otro municipio ignorados")
+        if missing:
+            print(f"⚠️  Catálogo: {len(missing)} registros sin clave estable ignorados "
+                  f"(agregarlos a data/municipios.npz con save_municipios)")
+
+        keys = list(entries)
+        rows = list(entries.values())
+        return cls({
+            'id': [row[5] for row in rows],
+            'nombre': [nombre for _, nombre in keys],
+            'estado': [estado for estado, _ in keys],
+            'lat': [row[0] for row in rows],
+            'lon': [row[1] for row in rows],
+            'poblacion': [row[2] for row in rows],
+            'tipo': [row[3] for row in rows],
+            'clave_inegi': [cls._clave_inegi(row[4], row[5]) for row in rows],
+        }, duplicates + collisions + missing)
+
+    @staticmethod
+    def _row(info, tipo):
+        return (info.get('lat', info['coords'][0]), info.get('lon', info['coords'][1]),
+                info.get('poblacion', info.get('pop', 0)), info.get('tipo', tipo), info.get('clave_inegi'),
+                info.get('id'))
+
+    @staticmethod
+    def _clave_inegi(clave, city_id):
+        """Clave INEGI original si es la del registro; si no, la clave estable en 5 dígitos"""
+        if clave and clave.isdigit() and int(clave) == city_id:
+            return clave
+        return f"{city_id:05d}"
+
+    def _record(self, position):
+        """Registro (diccionario) de una posición, armado desde las columnas"""
+        lat = float(self._lat[position])
+        lon = float(self._lon[position])
+        return {
+            'id': int(self._ids[position]),
+            'nombre': self._nombres[position],
+            'estado': self._estados[self._estado_codes[position]],
+            'coords': [lat, lon],
+            'lat': lat,
+            'lon': lon,
+            'poblacion': int(self._poblacion[position]),
+            'tipo': self._tipos[self._tipo_codes[position]],
+            'clave_inegi': self._claves[position],
+        }
+
+    def __len__(self):
+        return len(self._ids)
+
+    def __iter__(self):
+        return (self._record(position) for position in range(len(self._ids)))
+
+    def __contains__(self, city_id):
+        return city_id in self._position
+
+    def get(self, city_id):
+        """Registro por clave estable (o None)"""
+        position = self._position.get(city_id)
+        return None if position is None else self._record(position)
+
+    def position(self, city_id):
+        """Posición densa del registro (para arreglos por ciudad)"""
+        return self._position.get(city_id)
+
+    def find(self, nombre, estado=None):
+        """Registro por nombre; sin estado y con homónimos, el más poblado"""
+        if estado is not None:
+            position = self._by_key.get((estado, nombre))
+            return None if position is None else self._record(position)
+        positions = self._by_name.get(nombre)
+        return self._record(positions[0]) if positions else None
+
+    def homonyms(self, nombre):
+        """Todos los registros con ese nombre (uno por estado)"""
+        return tuple(self._record(p) for p in self._by_name.get(nombre, ()))
+
+    def resolve(self, city, estado=None):
+        """Acepta clave numérica (int o texto) o nombre de ciudad"""
+        if isinstance(city, (int, np.integer)):
+            return self.get(int(city))
+        if isinstance(city, str) and city.strip().isdigit():
+            return self.get(int(city))
+        return self.find(city, estado)
+
+    def by_state(self, estado):
+        return tuple(self._record(p) for p in self._by_state.get(estado, ()))
+
+    def ids(self):
+        return self._ids.copy()
+
+    def column(self, field, dtype=np.float64):
+        """Columna densa de un campo (en el orden de las posiciones)"""
+        columns = {'id': self._ids, 'lat': self._lat, 'lon': self._lon, 'poblacion': self._poblacion}
+        if field in columns:
+            return columns[field].astype(dtype)
+        return np.array([record[field] for record in self], dtype=dtype)
@@ -0,0 +1,185 @@
+"""
+CONTROL DE CONCURRENCIA PARA PROVEEDORES EXTERNOS
+Cada API (WAQI, OpenWeatherMap, OpenAQ, NASA FIRMS...) tiene su propia cuota;
+estos limitadores se comparten entre el análisis individual y el barrido nacional
+SingleFlight evita que consultas simultáneas de la misma ciudad o la misma
+fuente/coordenada repitan la misma llamada externa.
+map_in_threads reparte descargas largas (capas nacionales) en hilos propios
+"""
+
+import threading
+import time
+from collections import deque
+
+
+class ProviderBusy(Exception):
+    """El proveedor no tuvo turno libre dentro de la espera máxima del limitador"""
+
+
+class ProviderLimiter:
+    """
+    Limita las peticiones simultáneas y el ritmo (llamadas por minuto) de un proveedor.
+    Se usa como context manager alrededor de cada llamada HTTP:
+
+        with limiter:
+            response = requests.get(url, timeout=10)
+
+    Con max_wait (segundos) no se espera turno indefinidamente: si no hay turno a tiempo
+    se lanza ProviderBusy y la llamada no se hace (consultas interactivas con plazo)
+    """
+
+    def __init__(self, name, max_concurrent, per_minute=None, max_wait=None):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.per_minute = per_minute
+        self.max_wait = max_wait
+        self._semaphore = threading.BoundedSemaphore(max_concurrent)
+        self._lock = threading.Lock()
+        self._recent = deque()  # Instantes de las llamadas del último minuto
+        self.calls = 0
+        self.rejected = 0
+        self.wait_seconds = 0.0
+
+    def _reject(self):
+        with self._lock:
+            self.rejected += 1
+        raise ProviderBusy(f"{self.name}: sin turno en {self.max_wait}s")
+
+    def __enter__(self):
+        if not self._semaphore.acquire(timeout=self.max_wait):
+            self._reject()
+        waited = 0.0
+        while self.per_minute:
+            # Ventana deslizante: como máximo per_minute llamadas en 60 segundos
+            with self._lock:
+                now = time.monotonic()
+                while self._recent and now - self._recent[0] >= 60.0:
+                    self._recent.popleft()
+                if len(self._recent) < self.per_minute:
+                    self._recent.append(now)
+                    break
+                delay = 60.0 - (now - self._recent[0])
+            if self.max_wait is not None and waited + delay > self.max_wait:
+                self._semaphore.release()
+                self._reject()
+            time.sleep(delay)
+            waited += delay
+        with self._lock:
+            self.calls += 1
+            self.wait_seconds += waited
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._semaphore.release()
+        return False
+
+    def stats(self):
+        """Resumen de uso del limitador"""
+        return {
+            'provider': self.name,
+            'calls': self.calls,
+            'max_concurrent': self.max_concurrent,
+            'per_minute': self.per_minute,
+            'max_wait': self.max_wait,
+            'rejected': self.rejected,
+            'wait_seconds': round(self.wait_seconds, 2)
+        }
+
+
+def map_in_threads(fn, items, workers, name):
+    """
+    Aplica fn a cada elemento con `workers` hilos daemon propios y retorna los
+    resultados en el orden de items. Las descargas de capas nacionales tardan
+    minutos por la cuota: así no ocupan los pools de las consultas interactivas
+    y, a diferencia de un ThreadPoolExecutor, no retienen la salida del proceso
+    """
+    items = list(items)
+    results = [None] * len(items)
+    pending = iter(range(len(items)))
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                i = next(pending, None)
+            if i is None:
+                return
+            results[i] = fn(items[i])
+
+    threads = [
+        threading.Thread(target=worker, name=name, daemon=True)
+        for _ in range(max(1, min(workers, len(items))))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class _Call:
+    """Llamada en curso de SingleFlight (resultado compartido con los que esperan)"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Agrupa llamadas simultáneas con la misma clave: la primera ejecuta fn()
+    y las demás esperan y reciben el mismo resultado (o la misma excepción).
+    Al terminar se olvida la clave; no es una caché
+
+        value = flight.do(('air', lat, lon), lambda: fetch())
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.executed = 0
+        self.shared = 0
+
+    def do(self, key, fn):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self.shared += 1
+                leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.value
+
+        try:
+            call.value = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.value
+
+    def in_flight(self):
+        with self._lock:
+            return len(self._calls)
+
+    def stats(self):
+        """Llamadas ejecutadas y llamadas que reutilizaron una en curso"""
+        total = self.executed + self.shared
+        return {
+            'executed': self.executed,
+            'shared': self.shared,
+            'in_flight': self.in_flight(),
+            'shared_rate': round(self.shared / total, 3) if total else 0.0
+        }
@@ -1,3 +1,14 @@
+"""
+DATOS GEOGRÁFICOS DE MÉXICO
+Información de los 32 estados y catálogo de municipios (archivo columnar)
+"""
+
+import os
+import threading
+from collections.abc import Mapping
+
+import numpy as np
+
 # Información detallada de cada estado
 ESTADOS_MEXICO = {
     "Aguascalientes": {
@@ -162,1856 +173,228 @@ ESTADOS_MEXICO = {
     },
 }
 
-# Diccionario completo de municipios por estado
-MUNICIPIOS_POR_ESTADO = {
-    "Aguascalientes": {
-        "Aguascalientes": {"coords": [21.88, -102.29], "estado": "Aguascalientes", "poblacion": 948990, "lat": 21.88, "lon": -102.29, "tipo": "capital"},
-        "Asientos": {"coords": [22.24, -102.09], "estado": "Aguascalientes", "poblacion": 50354, "lat": 22.24, "lon": -102.09, "tipo": "municipio"},
-        "Calvillo": {"coords": [21.85, -102.72], "estado": "Aguascalientes", "poblacion": 56048, "lat": 21.85, "lon": -102.72, "tipo": "municipio"},
-        "Cosío": {"coords": [22.37, -102.30], "estado": "Aguascalientes", "poblacion": 15842, "lat": 22.37, "lon": -102.30, "tipo": "municipio"},
-        "Jesús María": {"coords": [21.96, -102.34], "estado": "Aguascalientes", "poblacion": 120405, "lat": 21.96, "lon": -102.34, "tipo": "municipio"},
-        "Pabellón de Arteaga": {"coords": [22.15, -102.28], "estado": "Aguascalientes", "poblacion": 46473, "lat": 22.15, "lon": -102.28, "tipo": "municipio"},
-        "Rincón de Romos": {"coords": [22.23, -102.33], "estado": "Aguascalientes", "poblacion": 52493, "lat": 22.23, "lon": -102.33, "tipo": "municipio"},
-        "San José de Gracia": {"coords": [22.15, -102.11], "estado": "Aguascalientes", "poblacion": 9375, "lat": 22.15, "lon": -102.11, "tipo": "municipio"},
-        "Tepezalá": {"coords": [22.23, -102.16], "estado": "Aguascalientes", "poblacion": 20323, "lat": 22.23, "lon": -102.16, "tipo": "municipio"},
-        "El Llano": {"coords": [21.93, -101.98], "estado": "Aguascalientes", "poblacion": 22563, "lat": 21.93, "lon": -101.98, "tipo": "municipio"},
-        "San Francisco de los Romo": {"coords": [22.07, -102.27], "estado": "Aguascalientes", "poblacion": 35769, "lat": 22.07, "lon": -102.27, "tipo": "municipio"}
-    },
-    "Baja California": {
-        "Ensenada": {"coords": [31.87, -116.60], "estado": "Baja California", "poblacion": 542896, "lat": 31.87, "lon": -116.60, "tipo": "municipio"},
-        "Mexicali": {"coords": [32.65, -115.47], "estado": "Baja California", "poblacion": 1049792, "lat": 32.65, "lon": -115.47, "tipo": "capital"},
-        "Tecate": {"coords": [32.54, -116.63], "estado": "Baja California", "poblacion": 108440, "lat": 32.54, "lon": -116.63, "tipo": "municipio"},
-        "Tijuana": {"coords": [32.50, -117.00], "estado": "Baja California", "poblacion": 1810645, "lat": 32.50, "lon": -117.00, "tipo": "municipio"},
-        "Playas de Rosarito": {"coords": [32.35, -117.05], "estado": "Baja California", "poblacion": 126890, "lat": 32.35, "lon": -117.05, "tipo": "municipio"},
-        "San Felipe": {"coords": [31.03, -114.84], "estado": "Baja California", "poblacion": 17143, "lat": 31.03, "lon": -114.84, "tipo": "delegacion"},
-        "San Quintín": {"coords": [30.48, -115.94], "estado": "Baja California", "poblacion": 32397, "lat": 30.48, "lon": -115.94, "tipo": "delegacion"}
-    },
-    "Baja California Sur": {
-        "Comondú": {"coords": [25.42, -111.84], "estado": "Baja California Sur", "poblacion": 81893, "lat": 25.42, "lon": -111.84, "tipo": "municipio"},
-        "La Paz": {"coords": [24.14, -110.31], "estado": "Baja California Sur", "poblacion": 290286, "lat": 24.14, "lon": -110.31, "tipo": "capital"},
-        "Loreto": {"coords": [26.01, -111.35], "estado": "Baja California Sur", "poblacion": 18912, "lat": 26.01, "lon": -111.35, "tipo": "municipio"},
-        "Los Cabos": {"coords": [22.89, -109.92], "estado": "Baja California Sur", "poblacion": 351111, "lat": 22.89, "lon": -109.92, "tipo": "municipio"},
-        "Mulegé": {"coords": [26.89, -111.98], "estado": "Baja California Sur", "poblacion": 64022, "lat": 26.89, "lon": -111.98, "tipo": "municipio"}
-    },
-    "Campeche": {
-        "Calakmul": {"coords": [18.11, -89.86], "estado": "Campeche", "poblacion": 27543, "lat": 18.11, "lon": -89.86, "tipo": "municipio"},
-        "Calkiní": {"coords": [20.43, -90.05], "estado": "Campeche", "poblacion": 52890, "lat": 20.43, "lon": -90.05, "tipo": "municipio"},
-        "Campeche": {"coords": [19.85, -90.53], "estado": "Campeche", "poblacion": 294077, "lat": 19.85, "lon": -90.53, "tipo": "capital"},
-        "Candelaria": {"coords": [17.95, -90.45], "estado": "Campeche", "poblacion": 41021, "lat": 17.95, "lon": -90.45, "tipo": "municipio"},
-        "Carmen": {"coords": [18.65, -91.83], "estado": "Campeche", "poblacion": 263373, "lat": 18.65, "lon": -91.83, "tipo": "municipio"},
-        "Champotón": {"coords": [19.35, -90.72], "estado": "Campeche", "poblacion": 83021, "lat": 19.35, "lon": -90.72, "tipo": "municipio"},
-        "Escárcega": {"coords": [18.61, -90.74], "estado": "Campeche", "poblacion": 56134, "lat": 18.61, "lon": -90.74, "tipo": "municipio"},
-        "Hecelchakán": {"coords": [20.17, -90.14], "estado": "Campeche", "poblacion": 28973, "lat": 20.17, "lon": -90.14, "tipo": "municipio"},
-        "Hopelchén": {"coords": [19.75, -89.84], "estado": "Campeche", "poblacion": 40799, "lat": 19.75, "lon": -89.84, "tipo": "municipio"},
-        "Palizada": {"coords": [18.25, -92.08], "estado": "Campeche", "poblacion": 8766, "lat": 18.25, "lon": -92.08, "tipo": "municipio"},
-        "Tenabo": {"coords": [20.10, -90.10], "estado": "Campeche", "poblacion": 9736, "lat": 20.10, "lon": -90.10, "tipo": "municipio"},
-        "Dzitbalché": {"coords": [20.32, -90.05], "estado": "Campeche", "poblacion": 11686, "lat": 20.32, "lon": -90.05, "tipo": "municipio"},
-        "Seybaplaya": {"coords": [19.69, -90.70], "estado": "Campeche", "poblacion": 4092, "lat": 19.69, "lon": -90.70, "tipo": "municipio"}
-    },
-    "Chiapas": {
-        "Acacoyagua": {"coords": [15.41, -92.83], "estado": "Chiapas", "poblacion": 16814, "lat": 15.41, "lon": -92.83, "tipo": "municipio"},
-        "Acala": {"coords": [16.56, -92.81], "estado": "Chiapas", "poblacion": 27245, "lat": 16.56, "lon": -92.81, "tipo": "municipio"},
-        "Acapetahua": {"coords": [15.28, -92.69], "estado": "Chiapas", "poblacion": 27580, "lat": 15.28, "lon": -92.69, "tipo": "municipio"},
-        "Altamirano": {"coords": [16.74, -92.04], "estado": "Chiapas", "poblacion": 29865, "lat": 16.74, "lon": -92.04, "tipo": "municipio"},
-        "Amatán": {"coords": [17.36, -92.42], "estado": "Chiapas", "poblacion": 21878, "lat": 17.36, "lon": -92.42, "tipo": "municipio"},
-        "Amatenango de la Frontera": {"coords": [15.44, -92.07], "estado": "Chiapas", "poblacion": 26567, "lat": 15.44, "lon": -92.07, "tipo": "municipio"},
-        "Amatenango del Valle": {"coords": [16.52, -92.44], "estado": "Chiapas", "poblacion": 8571, "lat": 16.52, "lon": -92.44, "tipo": "municipio"},
-        "Angel Albino Corzo": {"coords": [15.64, -92.67], "estado": "Chiapas", "poblacion": 27331, "lat": 15.64, "lon": -92.67, "tipo": "municipio"},
-        "Arriaga": {"coords": [16.23, -93.90], "estado": "Chiapas", "poblacion": 40042, "lat": 16.23, "lon": -93.90, "tipo": "municipio"},
-        "Bejucal de Ocampo": {"coords": [16.96, -93.21], "estado": "Chiapas", "poblacion": 9306, "lat": 16.96, "lon": -93.21, "tipo": "municipio"},
-        "Bella Vista": {"coords": [15.56, -92.27], "estado": "Chiapas", "poblacion": 19014, "lat": 15.56, "lon": -92.27, "tipo": "municipio"},
-        "Berriozábal": {"coords": [16.80, -93.28], "estado": "Chiapas", "poblacion": 43179, "lat": 16.80, "lon": -93.28, "tipo": "municipio"},
-        "Bochil": {"coords": [17.01, -92.87], "estado": "Chiapas", "poblacion": 36681, "lat": 17.01, "lon": -92.87, "tipo": "municipio"},
-        "El Bosque": {"coords": [17.07, -92.63], "estado": "Chiapas", "poblacion": 17492, "lat": 17.07, "lon": -92.63, "tipo": "municipio"},
-        "Cacahoatán": {"coords": [15.04, -92.16], "estado": "Chiapas", "poblacion": 43011, "lat": 15.04, "lon": -92.16, "tipo": "municipio"},
-        "Catazajá": {"coords": [17.74, -92.64], "estado": "Chiapas", "poblacion": 17140, "lat": 17.74, "lon": -92.64, "tipo": "municipio"},
-        "Cintalapa": {"coords": [16.68, -94.00], "estado": "Chiapas", "poblacion": 78114, "lat": 16.68, "lon": -94.00, "tipo": "municipio"},
-        "Coapilla": {"coords": [17.13, -93.17], "estado": "Chiapas", "poblacion": 7068, "lat": 17.13, "lon": -93.17, "tipo": "municipio"},
-        "Comitán de Domínguez": {"coords": [16.25, -92.13], "estado": "Chiapas", "poblacion": 141013, "lat": 16.25, "lon": -92.13, "tipo": "municipio"},
-        "La Concordia": {"coords": [15.83, -92.68], "estado": "Chiapas", "poblacion": 45005, "lat": 15.83, "lon": -92.68, "tipo": "municipio"},
-        "Copainalá": {"coords": [17.18, -93.32], "estado": "Chiapas", "poblacion": 12180, "lat": 17.18, "lon": -93.32, "tipo": "municipio"},
-        "Chalchihuitán": {"coords": [16.98, -92.64], "estado": "Chiapas", "poblacion": 13552, "lat": 16.98, "lon": -92.64, "tipo": "municipio"},
-        "Chamula": {"coords": [16.79, -92.69], "estado": "Chiapas", "poblacion": 76941, "lat": 16.79, "lon": -92.69, "tipo": "municipio"},
-        "Chanal": {"coords": [16.90, -92.30], "estado": "Chiapas", "poblacion": 10817, "lat": 16.90, "lon": -92.30, "tipo": "municipio"},
-        "Chapultenango": {"coords": [17.38, -93.08], "estado": "Chiapas", "poblacion": 3092, "lat": 17.38, "lon": -93.08, "tipo": "municipio"},
-        "Chenalhó": {"coords": [16.89, -92.64], "estado": "Chiapas", "poblacion": 36111, "lat": 16.89, "lon": -92.64, "tipo": "municipio"},
-        "Chiapa de Corzo": {"coords": [16.71, -93.01], "estado": "Chiapas", "poblacion": 87603, "lat": 16.71, "lon": -93.01, "tipo": "municipio"},
-        "Chiapilla": {"coords": [16.77, -93.50], "estado": "Chiapas", "poblacion": 6689, "lat": 16.77, "lon": -93.50, "tipo": "municipio"},
-        "Chicoasén": {"coords": [16.80, -93.10], "estado": "Chiapas", "poblacion": 4270, "lat": 16.80, "lon": -93.10, "tipo": "municipio"},
-        "Chicomuselo": {"coords": [15.75, -92.29], "estado": "Chiapas", "poblacion": 35056, "lat": 15.75, "lon": -92.29, "tipo": "municipio"},
-        "Chilón": {"coords": [17.11, -92.32], "estado": "Chiapas", "poblacion": 111554, "lat": 17.11, "lon": -92.32, "tipo": "municipio"},
-        "Escuintla": {"coords": [15.32, -92.64], "estado": "Chiapas", "poblacion": 30068, "lat": 15.32, "lon": -92.64, "tipo": "municipio"},
-        "Francisco León": {"coords": [17.36, -93.27], "estado": "Chiapas", "poblacion": 6098, "lat": 17.36, "lon": -93.27, "tipo": "municipio"},
-        "Frontera Comalapa": {"coords": [15.66, -92.12], "estado": "Chiapas", "poblacion": 67012, "lat": 15.66, "lon": -92.12, "tipo": "municipio"},
-        "Frontera Hidalgo": {"coords": [14.93, -92.18], "estado": "Chiapas", "poblacion": 10232, "lat": 14.93, "lon": -92.18, "tipo": "municipio"},
-        "La Grandeza": {"coords": [15.54, -92.69], "estado": "Chiapas", "poblacion": 8780, "lat": 15.54, "lon": -92.69, "tipo": "municipio"},
-        "Huehuetán": {"coords": [15.04, -92.40], "estado": "Chiapas", "poblacion": 36737, "lat": 15.04, "lon": -92.40, "tipo": "municipio"},
-        "Huixtán": {"coords": [16.77, -92.47], "estado": "Chiapas", "poblacion": 20041, "lat": 16.77, "lon": -92.47, "tipo": "municipio"},
-        "Huitiupán": {"coords": [17.28, -92.90], "estado": "Chiapas", "poblacion": 22172, "lat": 17.28, "lon": -92.90, "tipo": "municipio"},
-        "Huixtla": {"coords": [15.14, -92.47], "estado": "Chiapas", "poblacion": 51359, "lat": 15.14, "lon": -92.47, "tipo": "municipio"},
-        "La Independencia": {"coords": [16.18, -91.94], "estado": "Chiapas", "poblacion": 40041, "lat": 16.18, "lon": -91.94, "tipo": "municipio"},
-        "Ixhuatán": {"coords": [17.39, -93.16], "estado": "Chiapas", "poblacion": 3815, "lat": 17.39, "lon": -93.16, "tipo": "municipio"},
-        "Ixtacomitán": {"coords": [17.40, -93.16], "estado": "Chiapas", "poblacion": 9089, "lat": 17.40, "lon": -93.16, "tipo": "municipio"},
-        "Ixtapa": {"coords": [17.32, -93.36], "estado": "Chiapas", "poblacion": 25947, "lat": 17.32, "lon": -93.36, "tipo": "municipio"},
-        "Ixtapangajoya": {"coords": [17.39, -93.17], "estado": "Chiapas", "poblacion": 3158, "lat": 17.39, "lon": -93.17, "tipo": "municipio"},
-        "Jiquipilas": {"coords": [16.53, -93.68], "estado": "Chiapas", "poblacion": 39033, "lat": 16.53, "lon": -93.68, "tipo": "municipio"},
-        "Jitotol": {"coords": [17.07, -92.87], "estado": "Chiapas", "poblacion": 18820, "lat": 17.07, "lon": -92.87, "tipo": "municipio"},
-        "Juárez": {"coords": [17.44, -93.18], "estado": "Chiapas", "poblacion": 20279, "lat": 17.44, "lon": -93.18, "tipo": "municipio"},
-        "Larráinzar": {"coords": [16.88, -92.68], "estado": "Chiapas", "poblacion": 20349, "lat": 16.88, "lon": -92.68, "tipo": "municipio"},
-        "La Libertad": {"coords": [15.84, -92.94], "estado": "Chiapas", "poblacion": 6191, "lat": 15.84, "lon": -92.94, "tipo": "municipio"},
-        "Mapastepec": {"coords": [15.43, -92.90], "estado": "Chiapas", "poblacion": 46005, "lat": 15.43, "lon": -92.90, "tipo": "municipio"},
-        "Las Margaritas": {"coords": [16.31, -91.98], "estado": "Chiapas", "poblacion": 111484, "lat": 16.31, "lon": -91.98, "tipo": "municipio"},
-        "Mazapa de Madero": {"coords": [15.38, -92.04], "estado": "Chiapas", "poblacion": 9043, "lat": 15.38, "lon": -92.04, "tipo": "municipio"},
-        "Mazatán": {"coords": [14.85, -92.49], "estado": "Chiapas", "poblacion": 26951, "lat": 14.85, "lon": -92.49, "tipo": "municipio"},
-        "Metapa": {"coords": [14.82, -92.19], "estado": "Chiapas", "poblacion": 4049, "lat": 14.82, "lon": -92.19, "tipo": "municipio"},
-        "Mitontic": {"coords": [16.95, -92.62], "estado": "Chiapas", "poblacion": 10901, "lat": 16.95, "lon": -92.62, "tipo": "municipio"},
-        "Motozintla": {"coords": [15.37, -92.25], "estado": "Chiapas", "poblacion": 69119, "lat": 15.37, "lon": -92.25, "tipo": "municipio"},
-        "Nicolás Ruíz": {"coords": [16.69, -92.95], "estado": "Chiapas", "poblacion": 2156, "lat": 16.69, "lon": -92.95, "tipo": "municipio"},
-        "Ocosingo": {"coords": [16.91, -92.10], "estado": "Chiapas", "poblacion": 198877, "lat": 16.91, "lon": -92.10, "tipo": "municipio"},
-        "Ocotepec": {"coords": [16.78, -92.79], "estado": "Chiapas", "poblacion": 5240, "lat": 16.78, "lon": -92.79, "tipo": "municipio"},
-        "Ocozocoautla de Espinosa": {"coords": [16.76, -93.38], "estado": "Chiapas", "poblacion": 84378, "lat": 16.76, "lon": -93.38, "tipo": "municipio"},
-        "Ostuacán": {"coords": [17.37, -93.65], "estado": "Chiapas", "poblacion": 21008, "lat": 17.37, "lon": -93.65, "tipo": "municipio"},
-        "Osumacinta": {"coords": [17.51, -92.81], "estado": "Chiapas", "poblacion": 15494, "lat": 17.51, "lon": -92.81, "tipo": "municipio"},
-        "Oxchuc": {"coords": [16.80, -92.36], "estado": "Chiapas", "poblacion": 43350, "lat": 16.80, "lon": -92.36, "tipo": "municipio"},
-        "Palenque": {"coords": [17.51, -91.98], "estado": "Chiapas", "poblacion": 110918, "lat": 17.51, "lon": -91.98, "tipo": "municipio"},
-        "Pantelhó": {"coords": [16.99, -92.49], "estado": "Chiapas", "poblacion": 21289, "lat": 16.99, "lon": -92.49, "tipo": "municipio"},
-        "Pantepec": {"coords": [17.23, -92.88], "estado": "Chiapas", "poblacion": 5135, "lat": 17.23, "lon": -92.88, "tipo": "municipio"},
-        "Pichucalco": {"coords": [17.51, -93.12], "estado": "Chiapas", "poblacion": 29813, "lat": 17.51, "lon": -93.12, "tipo": "municipio"},
-        "Pijijiapan": {"coords": [15.69, -93.21], "estado": "Chiapas", "poblacion": 50079, "lat": 15.69, "lon": -93.21, "tipo": "municipio"},
-        "El Porvenir": {"coords": [15.91, -92.35], "estado": "Chiapas", "poblacion": 14171, "lat": 15.91, "lon": -92.35, "tipo": "municipio"},
-        "Villa Comaltitlán": {"coords": [15.29, -92.55], "estado": "Chiapas", "poblacion": 28177, "lat": 15.29, "lon": -92.55, "tipo": "municipio"},
-        "Pueblo Nuevo Solistahuacán": {"coords": [17.19, -92.91], "estado": "Chiapas", "poblacion": 27851, "lat": 17.19, "lon": -92.91, "tipo": "municipio"},
-        "Rayón": {"coords": [17.21, -93.01], "estado": "Chiapas", "poblacion": 4451, "lat": 17.21, "lon": -93.01, "tipo": "municipio"},
-        "Reforma": {"coords": [17.93, -93.19], "estado": "Chiapas", "poblacion": 86151, "lat": 17.93, "lon": -93.19, "tipo": "municipio"},
-        "Las Rosas": {"coords": [16.91, -92.79], "estado": "Chiapas", "poblacion": 25530, "lat": 16.91, "lon": -92.79, "tipo": "municipio"},
-        "Sabanilla": {"coords": [17.31, -92.52], "estado": "Chiapas", "poblacion": 25187, "lat": 17.31, "lon": -92.52, "tipo": "municipio"},
-        "Salto de Agua": {"coords": [17.53, -92.30], "estado": "Chiapas", "poblacion": 58958, "lat": 17.53, "lon": -92.30, "tipo": "municipio"},
-        "San Cristóbal de las Casas": {"coords": [16.74, -92.64], "estado": "Chiapas", "poblacion": 215874, "lat": 16.74, "lon": -92.64, "tipo": "municipio"},
-        "San Fernando": {"coords": [16.80, -93.17], "estado": "Chiapas", "poblacion": 42464, "lat": 16.80, "lon": -93.17, "tipo": "municipio"},
-        "Siltepec": {"coords": [15.55, -92.30], "estado": "Chiapas", "poblacion": 40143, "lat": 15.55, "lon": -92.30, "tipo": "municipio"},
-        "Simojovel": {"coords": [17.14, -92.72], "estado": "Chiapas", "poblacion": 40297, "lat": 17.14, "lon": -92.72, "tipo": "municipio"},
-        "Sitalá": {"coords": [17.01, -92.27], "estado": "Chiapas", "poblacion": 1718, "lat": 17.01, "lon": -92.27, "tipo": "municipio"},
-        "Socoltenango": {"coords": [16.47, -92.68], "estado": "Chiapas", "poblacion": 18041, "lat": 16.47, "lon": -92.68, "tipo": "municipio"},
-        "Solosuchiapa": {"coords": [17.44, -92.88], "estado": "Chiapas", "poblacion": 2335, "lat": 17.44, "lon": -92.88, "tipo": "municipio"},
-        "Soyaló": {"coords": [16.94, -93.08], "estado": "Chiapas", "poblacion": 9471, "lat": 16.94, "lon": -93.08, "tipo": "municipio"},
-        "Suchiapa": {"coords": [16.63, -93.10], "estado": "Chiapas", "poblacion": 24845, "lat": 16.63, "lon": -93.10, "tipo": "municipio"},
-        "Suchiate": {"coords": [14.70, -92.16], "estado": "Chiapas", "poblacion": 35056, "lat": 14.70, "lon": -92.16, "tipo": "municipio"},
-        "Sunuapa": {"coords": [17.38, -93.23], "estado": "Chiapas", "poblacion": 2235, "lat": 17.38, "lon": -93.23, "tipo": "municipio"},
-        "Tapachula": {"coords": [14.91, -92.26], "estado": "Chiapas", "poblacion": 348156, "lat": 14.91, "lon": -92.26, "tipo": "municipio"},
-        "Tapalapa": {"coords": [17.01, -94.18], "estado": "Chiapas", "poblacion": 4097, "lat": 17.01, "lon": -94.18, "tipo": "municipio"},
-        "Tapilula": {"coords": [17.15, -93.02], "estado": "Chiapas", "poblacion": 10390, "lat": 17.15, "lon": -93.02, "tipo": "municipio"},
-        "Tecpatán": {"coords": [17.24, -93.62], "estado": "Chiapas", "poblacion": 38383, "lat": 17.24, "lon": -93.62, "tipo": "municipio"},
-        "Tenejapa": {"coords": [16.82, -92.50], "estado": "Chiapas", "poblacion": 40268, "lat": 16.82, "lon": -92.50, "tipo": "municipio"},
-        "Teopisca": {"coords": [16.55, -92.48], "estado": "Chiapas", "poblacion": 37607, "lat": 16.55, "lon": -92.48, "tipo": "municipio"},
-        "Tila": {"coords": [17.31, -92.43], "estado": "Chiapas", "poblacion": 71432, "lat": 17.31, "lon": -92.43, "tipo": "municipio"},
-        "Tonalá": {"coords": [16.09, -93.75], "estado": "Chiapas", "poblacion": 84594, "lat": 16.09, "lon": -93.75, "tipo": "municipio"},
-        "Totolapa": {"coords": [16.45, -92.38], "estado": "Chiapas", "poblacion": 2070, "lat": 16.45, "lon": -92.38, "tipo": "municipio"},
-        "La Trinitaria": {"coords": [16.11, -92.02], "estado": "Chiapas", "poblacion": 77686, "lat": 16.11, "lon": -92.02, "tipo": "municipio"},
-        "Tumbalá": {"coords": [17.25, -92.31], "estado": "Chiapas", "poblacion": 30830, "lat": 17.25, "lon": -92.31, "tipo": "municipio"},
-        "Tuxtla Gutiérrez": {"coords": [16.75, -93.12], "estado": "Chiapas", "poblacion": 680436, "lat": 16.75, "lon": -93.12, "tipo": "capital"},
-        "Tuxtla Chico": {"coords": [14.94, -92.18], "estado": "Chiapas", "poblacion": 38989, "lat": 14.94, "lon": -92.18, "tipo": "municipio"},
-        "Tuzantán": {"coords": [15.17, -92.42], "estado": "Chiapas", "poblacion": 32762, "lat": 15.17, "lon": -92.42, "tipo": "municipio"},
-        "Tzimol": {"coords": [16.02, -92.28], "estado": "Chiapas", "poblacion": 12901, "lat": 16.02, "lon": -92.28, "tipo": "municipio"},
-        "Unión Juárez": {"coords": [15.07, -92.08], "estado": "Chiapas", "poblacion": 14089, "lat": 15.07, "lon": -92.08, "tipo": "municipio"},
-        "Venustiano Carranza": {"coords": [16.33, -92.64], "estado": "Chiapas", "poblacion": 52833, "lat": 16.33, "lon": -92.64, "tipo": "municipio"},
-        "Villa Corzo": {"coords": [16.18, -93.26], "estado": "Chiapas", "poblacion": 65016, "lat": 16.18, "lon": -93.26, "tipo": "municipio"},
-        "Villaflores": {"coords": [16.23, -93.28], "estado": "Chiapas", "poblacion": 97021, "lat": 16.23, "lon": -93.28, "tipo": "municipio"},
-        "Yajalón": {"coords": [17.17, -92.34], "estado": "Chiapas", "poblacion": 34028, "lat": 17.17, "lon": -92.34, "tipo": "municipio"},
-        "San Lucas": {"coords": [16.74, -92.79], "estado": "Chiapas", "poblacion": 7530, "lat": 16.74, "lon": -92.79, "tipo": "municipio"},
-        "Zinacantán": {"coords": [16.76, -92.72], "estado": "Chiapas", "poblacion": 36494, "lat": 16.76, "lon": -92.72, "tipo": "municipio"},
-        "San Juan Cancuc": {"coords": [16.90, -92.45], "estado": "Chiapas", "poblacion": 29193, "lat": 16.90, "lon": -92.45, "tipo": "municipio"},
-        "Aldama": {"coords": [16.92, -92.77], "estado": "Chiapas", "poblacion": 4750, "lat": 16.92, "lon": -92.77, "tipo": "municipio"},
-        "Benemérito de las Américas": {"coords": [16.52, -90.65], "estado": "Chiapas", "poblacion": 18080, "lat": 16.52, "lon": -90.65, "tipo": "municipio"},
-        "Maravilla Tenejapa": {"coords": [16.37, -91.21], "estado": "Chiapas", "poblacion": 10033, "lat": 16.37, "lon": -91.21, "tipo": "municipio"},
-        "Marqués de Comillas": {"coords": [16.26, -90.91], "estado": "Chiapas", "poblacion": 9285, "lat": 16.26, "lon": -90.91, "tipo": "municipio"},
-        "Montecristo de Guerrero": {"coords": [16.69, -91.73], "estado": "Chiapas", "poblacion": 5875, "lat": 16.69, "lon": -91.73, "tipo": "municipio"},
-        "San Andrés Duraznal": {"coords": [16.98, -92.82], "estado": "Chiapas", "poblacion": 5164, "lat": 16.98, "lon": -92.82, "tipo": "municipio"},
-        "Santiago el Pinar": {"coords": [16.84, -92.62], "estado": "Chiapas", "poblacion": 3245, "lat": 16.84, "lon": -92.62, "tipo": "municipio"},
-        "Capitán Luis Ángel Vidal": {"coords": [17.41, -93.27], "estado": "Chiapas", "poblacion": 2820, "lat": 17.41, "lon": -93.27, "tipo": "municipio"},
-        "Rincón Chamula San Pedro": {"coords": [16.70, -92.65], "estado": "Chiapas", "poblacion": 2506, "lat": 16.70, "lon": -92.65, "tipo": "municipio"},
-        "El Parral": {"coords": [16.78, -92.93], "estado": "Chiapas", "poblacion": 1875, "lat": 16.78, "lon": -92.93, "tipo": "municipio"},
-        "Emiliano Zapata": {"coords": [17.25, -93.05], "estado": "Chiapas", "poblacion": 3465, "lat": 17.25, "lon": -93.05, "tipo": "municipio"},
-        "Mezcalapa": {"coords": [17.05, -93.56], "estado": "Chiapas", "poblacion": 10819, "lat": 17.05, "lon": -93.56, "tipo": "municipio"},
-        "Hondura": {"coords": [16.46, -91.78], "estado": "Chiapas", "poblacion": 7032, "lat": 16.46, "lon": -91.78, "tipo": "municipio"}
-    },
-    "Chihuahua": {
-        "Ahumada": {"coords": [30.61, -106.50], "estado": "Chihuahua", "poblacion": 11658, "lat": 30.61, "lon": -106.50, "tipo": "municipio"},
-        "Aldama": {"coords": [28.84, -105.95], "estado": "Chihuahua", "poblacion": 22744, "lat": 28.84, "lon": -105.95, "tipo": "municipio"},
-        "Allende": {"coords": [26.93, -105.37], "estado": "Chihuahua", "poblacion": 8659, "lat": 26.93, "lon": -105.37, "tipo": "municipio"},
-        "Aquiles Serdán": {"coords": [28.69, -105.84], "estado": "Chihuahua", "poblacion": 12165, "lat": 28.69, "lon": -105.84, "tipo": "municipio"},
-        "Ascensión": {"coords": [31.10, -107.96], "estado": "Chihuahua", "poblacion": 23975, "lat": 31.10, "lon": -107.96, "tipo": "municipio"},
-        "Bachíniva": {"coords": [29.02, -107.17], "estado": "Chihuahua", "poblacion": 8007, "lat": 29.02, "lon": -107.17, "tipo": "municipio"},
-        "Balleza": {"coords": [26.95, -106.35], "estado": "Chihuahua", "poblacion": 16143, "lat": 26.95, "lon": -106.35, "tipo": "municipio"},
-        "Batopilas de Manuel Gómez Morín": {"coords": [27.03, -107.73], "estado": "Chihuahua", "poblacion": 13298, "lat": 27.03, "lon": -107.73, "tipo": "municipio"},
-        "Bocoyna": {"coords": [27.85, -107.61], "estado": "Chihuahua", "poblacion": 29907, "lat": 27.85, "lon": -107.61, "tipo": "municipio"},
-        "Buenaventura": {"coords": [28.48, -107.43], "estado": "Chihuahua", "poblacion": 21958, "lat": 28.48, "lon": -107.43, "tipo": "municipio"},
-        "Camargo": {"coords": [27.68, -105.17], "estado": "Chihuahua", "poblacion": 48748, "lat": 27.68, "lon": -105.17, "tipo": "municipio"},
-        "Carichí": {"coords": [27.55, -107.18], "estado": "Chihuahua", "poblacion": 7880, "lat": 27.55, "lon": -107.18, "tipo": "municipio"},
-        "Casas Grandes": {"coords": [30.38, -107.95], "estado": "Chihuahua", "poblacion": 10587, "lat": 30.38, "lon": -107.95, "tipo": "municipio"},
-        "Coronado": {"coords": [28.32, -105.21], "estado": "Chihuahua", "poblacion": 3123, "lat": 28.32, "lon": -105.21, "tipo": "municipio"},
-        "Coyame del Sotol": {"coords": [29.44, -105.19], "estado": "Chihuahua", "poblacion": 1924, "lat": 29.44, "lon": -105.19, "tipo": "municipio"},
-        "La Cruz": {"coords": [28.49, -105.92], "estado": "Chihuahua", "poblacion": 4430, "lat": 28.49, "lon": -105.92, "tipo": "municipio"},
-        "Cuauhtémoc": {"coords": [28.41, -106.86], "estado": "Chihuahua", "poblacion": 154639, "lat": 28.41, "lon": -106.86, "tipo": "municipio"},
-        "Cusihuiriachi": {"coords": [28.15, -106.65], "estado": "Chihuahua", "poblacion": 5414, "lat": 28.15, "lon": -106.65, "tipo": "municipio"},
-        "Chihuahua": {"coords": [28.63, -106.08], "estado": "Chihuahua", "poblacion": 925762, "lat": 28.63, "lon": -106.08, "tipo": "capital"},
-        "Chínipas": {"coords": [27.37, -108.54], "estado": "Chihuahua", "poblacion": 8397, "lat": 27.37, "lon": -108.54, "tipo": "municipio"},
-        "Delicias": {"coords": [28.19, -105.47], "estado": "Chihuahua", "poblacion": 148045, "lat": 28.19, "lon": -105.47, "tipo": "municipio"},
-        "Dr. Belisario Domínguez": {"coords": [28.56, -105.75], "estado": "Chihuahua", "poblacion": 2109, "lat": 28.56, "lon": -105.75, "tipo": "municipio"},
-        "Galeana": {"coords": [28.73, -106.90], "estado": "Chihuahua", "poblacion": 4896, "lat": 28.73, "lon": -106.90, "tipo": "municipio"},
-        "Santa Isabel": {"coords": [28.59, -106.41], "estado": "Chihuahua", "poblacion": 2175, "lat": 28.59, "lon": -106.41, "tipo": "municipio"},
-        "Gómez Farías": {"coords": [27.72, -107.11], "estado": "Chihuahua", "poblacion": 9689, "lat": 27.72, "lon": -107.11, "tipo": "municipio"},
-        "Gran Morelos": {"coords": [28.69, -106.78], "estado": "Chihuahua", "poblacion": 4295, "lat": 28.69, "lon": -106.78, "tipo": "municipio"},
-        "Guachochi": {"coords": [27.11, -107.07], "estado": "Chihuahua", "poblacion": 54131, "lat": 27.11, "lon": -107.07, "tipo": "municipio"},
-        "Guadalupe": {"coords": [31.39, -106.13], "estado": "Chihuahua", "poblacion": 6458, "lat": 31.39, "lon": -106.13, "tipo": "municipio"},
-        "Guadalupe y Calvo": {"coords": [26.10, -106.97], "estado": "Chihuahua", "poblacion": 56200, "lat": 26.10, "lon": -106.97, "tipo": "municipio"},
-        "Guazapares": {"coords": [27.93, -108.47], "estado": "Chihuahua", "poblacion": 8671, "lat": 27.93, "lon": -108.47, "tipo": "municipio"},
-        "Guerrero": {"coords": [28.58, -107.99], "estado": "Chihuahua", "poblacion": 39626, "lat": 28.58, "lon": -107.99, "tipo": "municipio"},
-        "Hidalgo del Parral": {"coords": [26.93, -105.67], "estado": "Chihuahua", "poblacion": 109510, "lat": 26.93, "lon": -105.67, "tipo": "municipio"},
-        "Huejotitán": {"coords": [26.92, -105.50], "estado": "Chihuahua", "poblacion": 1040, "lat": 26.92, "lon": -105.50, "tipo": "municipio"},
-        "Ignacio Zaragoza": {"coords": [29.29, -107.86], "estado": "Chihuahua", "poblacion": 8554, "lat": 29.29, "lon": -107.86, "tipo": "municipio"},
-        "Janos": {"coords": [30.89, -108.19], "estado": "Chihuahua", "poblacion": 10953, "lat": 30.89, "lon": -108.19, "tipo": "municipio"},
-        "Jiménez": {"coords": [27.14, -104.92], "estado": "Chihuahua", "poblacion": 40467, "lat": 27.14, "lon": -104.92, "tipo": "municipio"},
-        "Juárez": {"coords": [31.69, -106.42], "estado": "Chihuahua", "poblacion": 1501551, "lat": 31.69, "lon": -106.42, "tipo": "municipio"},
-        "Julimes": {"coords": [28.41, -105.47], "estado": "Chihuahua", "poblacion": 4719, "lat": 28.41, "lon": -105.47, "tipo": "municipio"},
-        "López": {"coords": [28.11, -105.89], "estado": "Chihuahua", "poblacion": 4080, "lat": 28.11, "lon": -105.89, "tipo": "municipio"},
-        "Madera": {"coords": [29.18, -108.15], "estado": "Chihuahua", "poblacion": 29611, "lat": 29.18, "lon": -108.15, "tipo": "municipio"},
-        "Maguarichi": {"coords": [27.81, -107.44], "estado": "Chihuahua", "poblacion": 2209, "lat": 27.81, "lon": -107.44, "tipo": "municipio"},
-        "Manuel Benavides": {"coords": [29.54, -104.52], "estado": "Chihuahua", "poblacion": 1954, "lat": 29.54, "lon": -104.52, "tipo": "municipio"},
-        "Matachí": {"coords": [28.24, -107.66], "estado": "Chihuahua", "poblacion": 3411, "lat": 28.24, "lon": -107.66, "tipo": "municipio"},
-        "Matamoros": {"coords": [28.24, -105.53], "estado": "Chihuahua", "poblacion": 4045, "lat": 28.24, "lon": -105.53, "tipo": "municipio"},
-        "Meoqui": {"coords": [28.28, -105.49], "estado": "Chihuahua", "poblacion": 24515, "lat": 28.28, "lon": -105.49, "tipo": "municipio"},
-        "Morelos": {"coords": [26.71, -106.70], "estado": "Chihuahua", "poblacion": 8134, "lat": 26.71, "lon": -106.70, "tipo": "municipio"},
-        "Moris": {"coords": [28.93, -108.95], "estado": "Chihuahua", "poblacion": 4874, "lat": 28.93, "lon": -108.95, "tipo": "municipio"},
-        "Namiquipa": {"coords": [29.19, -107.43], "estado": "Chihuahua", "poblacion": 22423, "lat": 29.19, "lon": -107.43, "tipo": "municipio"},
-        "Nonoava": {"coords": [27.39, -107.29], "estado": "Chihuahua", "poblacion": 2425, "lat": 27.39, "lon": -107.29, "tipo": "municipio"},
-        "Nuevo Casas Grandes": {"coords": [30.41, -107.91], "estado": "Chihuahua", "poblacion": 59337, "lat": 30.41, "lon": -107.91, "tipo": "municipio"},
-        "Ocampo": {"coords": [27.33, -108.22], "estado": "Chihuahua", "poblacion": 9991, "lat": 27.33, "lon": -108.22, "tipo": "municipio"},
-        "Ojinaga": {"coords": [29.57, -104.42], "estado": "Chihuahua", "poblacion": 28040, "lat": 29.57, "lon": -104.42, "tipo": "municipio"},
-        "Praxedis G. Guerrero": {"coords": [31.36, -106.01], "estado": "Chihuahua", "poblacion": 4799, "lat": 31.36, "lon": -106.01, "tipo": "municipio"},
-        "Riva Palacio": {"coords": [28.36, -106.97], "estado": "Chihuahua", "poblacion": 8715, "lat": 28.36, "lon": -106.97, "tipo": "municipio"},
-        "Rosales": {"coords": [28.12, -105.27], "estado": "Chihuahua", "poblacion": 16785, "lat": 28.12, "lon": -105.27, "tipo": "municipio"},
-        "Rosario": {"coords": [27.31, -105.29], "estado": "Chihuahua", "poblacion": 1830, "lat": 27.31, "lon": -105.29, "tipo": "municipio"},
-        "San Francisco de Borja": {"coords": [28.46, -105.93], "estado": "Chihuahua", "poblacion": 2298, "lat": 28.46, "lon": -105.93, "tipo": "municipio"},
-        "San Francisco de Conchos": {"coords": [27.48, -105.19], "estado": "Chihuahua", "poblacion": 2264, "lat": 27.48, "lon": -105.19, "tipo": "municipio"},
-        "San Francisco del Oro": {"coords": [26.86, -105.93], "estado": "Chihuahua", "poblacion": 4567, "lat": 26.86, "lon": -105.93, "tipo": "municipio"},
-        "Santa Bárbara": {"coords": [26.77, -105.87], "estado": "Chihuahua", "poblacion": 10427, "lat": 26.77, "lon": -105.87, "tipo": "municipio"},
-        "Satevó": {"coords": [27.25, -105.18], "estado": "Chihuahua", "poblacion": 4665, "lat": 27.25, "lon": -105.18, "tipo": "municipio"},
-        "Saucillo": {"coords": [28.03, -105.22], "estado": "Chihuahua", "poblacion": 33704, "lat": 28.03, "lon": -105.22, "tipo": "municipio"},
-        "Temósachic": {"coords": [28.96, -107.84], "estado": "Chihuahua", "poblacion": 7975, "lat": 28.96, "lon": -107.84, "tipo": "municipio"},
-        "El Tule": {"coords": [28.37, -105.98], "estado": "Chihuahua", "poblacion": 1867, "lat": 28.37, "lon": -105.98, "tipo": "municipio"},
-        "Urique": {"coords": [27.22, -107.91], "estado": "Chihuahua", "poblacion": 20385, "lat": 27.22, "lon": -107.91, "tipo": "municipio"},
-        "Uruachi": {"coords": [28.42, -108.22], "estado": "Chihuahua", "poblacion": 7565, "lat": 28.42, "lon": -108.22, "tipo": "municipio"},
-        "Valle de Zaragoza": {"coords": [27.43, -105.70], "estado": "Chihuahua", "poblacion": 4211, "lat": 27.43, "lon": -105.70, "tipo": "municipio"}
-    },
-    "Ciudad de México": {
-        "Álvaro Obregón": {"coords": [19.36, -99.20], "estado": "Ciudad de México", "poblacion": 759137, "lat": 19.36, "lon": -99.20, "tipo": "demarcacion"},
-        "Azcapotzalco": {"coords": [19.49, -99.19], "estado": "Ciudad de México", "poblacion": 432205, "lat": 19.49, "lon": -99.19, "tipo": "demarcacion"},
-        "Benito Juárez": {"coords": [19.39, -99.15], "estado": "Ciudad de México", "poblacion": 434153, "lat": 19.39, "lon": -99.15, "tipo": "demarcacion"},
-        "Coyoacán": {"coords": [19.35, -99.16], "estado": "Ciudad de México", "poblacion": 614447, "lat": 19.35, "lon": -99.16, "tipo": "demarcacion"},
-        "Cuajimalpa de Morelos": {"coords": [19.36, -99.29], "estado": "Ciudad de México", "poblacion": 217686, "lat": 19.36, "lon": -99.29, "tipo": "demarcacion"},
-        "Cuauhtémoc": {"coords": [19.43, -99.14], "estado": "Ciudad de México", "poblacion": 545884, "lat": 19.43, "lon": -99.14, "tipo": "demarcacion"},
-        "Gustavo A. Madero": {"coords": [19.49, -99.11], "estado": "Ciudad de México", "poblacion": 1173351, "lat": 19.49, "lon": -99.11, "tipo": "demarcacion"},
-        "Iztacalco": {"coords": [19.41, -99.11], "estado": "Ciudad de México", "poblacion": 404695, "lat": 19.41, "lon": -99.11, "tipo": "demarcacion"},
-        "Iztapalapa": {"coords": [19.35, -99.06], "estado": "Ciudad de México", "poblacion": 1835486, "lat": 19.35, "lon": -99.06, "tipo": "demarcacion"},
-        "La Magdalena Contreras": {"coords": [19.31, -99.24], "estado": "Ciudad de México", "poblacion": 247422, "lat": 19.31, "lon": -99.24, "tipo": "demarcacion"},
-        "Miguel Hidalgo": {"coords": [19.43, -99.20], "estado": "Ciudad de México", "poblacion": 372889, "lat": 19.43, "lon": -99.20, "tipo": "demarcacion"},
-        "Milpa Alta": {"coords": [19.19, -99.02], "estado": "Ciudad de México", "poblacion": 152685, "lat": 19.19, "lon": -99.02, "tipo": "demarcacion"},
-        "Tláhuac": {"coords": [19.29, -99.00], "estado": "Ciudad de México", "poblacion": 392313, "lat": 19.29, "lon": -99.00, "tipo": "demarcacion"},
-        "Tlalpan": {"coords": [19.29, -99.16], "estado": "Ciudad de México", "poblacion": 699928, "lat": 19.29, "lon": -99.16, "tipo": "demarcacion"},
-        "Venustiano Carranza": {"coords": [19.44, -99.10], "estado": "Ciudad de México", "poblacion": 443704, "lat": 19.44, "lon": -99.10, "tipo": "demarcacion"},
-        "Xochimilco": {"coords": [19.26, -99.10], "estado": "Ciudad de México", "poblacion": 442178, "lat": 19.26, "lon": -99.10, "tipo": "demarcacion"}
-    },
-    "Coahuila": {
-        "Saltillo": {"coords": [25.42, -100.99], "estado": "Coahuila", "poblacion": 879958, "lat": 25.42, "lon": -100.99, "tipo": "capital"},
-        "Torreón": {"coords": [25.54, -103.41], "estado": "Coahuila", "poblacion": 720848, "lat": 25.54, "lon": -103.41, "tipo": "municipio"},
-        "Monclova": {"coords": [26.91, -101.42], "estado": "Coahuila", "poblacion": 231107, "lat": 26.91, "lon": -101.42, "tipo": "municipio"},
-        "Piedras Negras": {"coords": [28.70, -100.52], "estado": "Coahuila", "poblacion": 163595, "lat": 28.70, "lon": -100.52, "tipo": "municipio"},
-        "Acuña": {"coords": [29.33, -100.95], "estado": "Coahuila", "poblacion": 153804, "lat": 29.33, "lon": -100.95, "tipo": "municipio"},
-        "Ramos Arizpe": {"coords": [25.54, -100.94], "estado": "Coahuila", "poblacion": 78138, "lat": 25.54, "lon": -100.94, "tipo": "municipio"},
-        "Sabinas": {"coords": [27.86, -101.12], "estado": "Coahuila", "poblacion": 60200, "lat": 27.86, "lon": -101.12, "tipo": "municipio"},
-        "Castaños": {"coords": [26.79, -101.43], "estado": "Coahuila", "poblacion": 23916, "lat": 26.79, "lon": -101.43, "tipo": "municipio"},
-        "Francisco I. Madero": {"coords": [25.76, -103.27], "estado": "Coahuila", "poblacion": 51216, "lat": 25.76, "lon": -103.27, "tipo": "municipio"},
-        "Frontera": {"coords": [26.94, -101.45], "estado": "Coahuila", "poblacion": 80515, "lat": 26.94, "lon": -101.45, "tipo": "municipio"},
-        "Matamoros": {"coords": [25.53, -103.23], "estado": "Coahuila", "poblacion": 107149, "lat": 25.53, "lon": -103.23, "tipo": "municipio"},
-        "Múzquiz": {"coords": [27.88, -101.51], "estado": "Coahuila", "poblacion": 79021, "lat": 27.88, "lon": -101.51, "tipo": "municipio"},
-        "Allende": {"coords": [28.33, -100.86], "estado": "Coahuila", "poblacion": 22664, "lat": 28.33, "lon": -100.86, "tipo": "municipio"},
-        "Arteaga": {"coords": [25.40, -100.62], "estado": "Coahuila", "poblacion": 18234, "lat": 25.40, "lon": -100.62, "tipo": "municipio"},
-        "General Cepeda": {"coords": [25.37, -101.46], "estado": "Coahuila", "poblacion": 14682, "lat": 25.37, "lon": -101.46, "tipo": "municipio"},
-        "Parras": {"coords": [25.44, -102.18], "estado": "Coahuila", "poblacion": 46071, "lat": 25.44, "lon": -102.18, "tipo": "municipio"},
-        "San Juan de Sabinas": {"coords": [27.99, -101.15], "estado": "Coahuila", "poblacion": 30068, "lat": 27.99, "lon": -101.15, "tipo": "municipio"},
-        "Villa Unión": {"coords": [26.22, -101.37], "estado": "Coahuila", "poblacion": 6782, "lat": 26.22, "lon": -101.37, "tipo": "municipio"},
-        "Nava": {"coords": [28.42, -100.99], "estado": "Coahuila", "poblacion": 25147, "lat": 28.42, "lon": -100.99, "tipo": "municipio"},
-        "Progreso": {"coords": [27.42, -100.98], "estado": "Coahuila", "poblacion": 2962, "lat": 27.42, "lon": -100.98, "tipo": "municipio"},
-        "Guerrero": {"coords": [28.61, -100.39], "estado": "Coahuila", "poblacion": 2131, "lat": 28.61, "lon": -100.39, "tipo": "municipio"},
-        "Hidalgo": {"coords": [27.77, -99.86], "estado": "Coahuila", "poblacion": 1568, "lat": 27.77, "lon": -99.86, "tipo": "municipio"},
-        "Juárez": {"coords": [26.42, -101.10], "estado": "Coahuila", "poblacion": 2206, "lat": 26.42, "lon": -101.10, "tipo": "municipio"},
-        "Lamadrid": {"coords": [27.49, -102.70], "estado": "Coahuila", "poblacion": 1276, "lat": 27.49, "lon": -102.70, "tipo": "municipio"},
-        "Morelos": {"coords": [26.83, -102.68], "estado": "Coahuila", "poblacion": 8493, "lat": 26.83, "lon": -102.68, "tipo": "municipio"},
-        "Nadadores": {"coords": [27.02, -101.92], "estado": "Coahuila", "poblacion": 4821, "lat": 27.02, "lon": -101.92, "tipo": "municipio"},
-        "Ocampo": {"coords": [27.32, -102.41], "estado": "Coahuila", "poblacion": 10991, "lat": 27.32, "lon": -102.41, "tipo": "municipio"},
-        "Sacramento": {"coords": [27.00, -101.72], "estado": "Coahuila", "poblacion": 2449, "lat": 27.00, "lon": -101.72, "tipo": "municipio"},
-        "San Buenaventura": {"coords": [27.07, -101.54], "estado": "Coahuila", "poblacion": 21583, "lat": 27.07, "lon": -101.54, "tipo": "municipio"},
-        "Sierra Mojada": {"coords": [27.30, -103.23], "estado": "Coahuila", "poblacion": 4958, "lat": 27.30, "lon": -103.23, "tipo": "municipio"},
-        "Viesca": {"coords": [25.33, -102.81], "estado": "Coahuila", "poblacion": 19328, "lat": 25.33, "lon": -102.81, "tipo": "municipio"},
-        "Zaragoza": {"coords": [28.48, -100.92], "estado": "Coahuila", "poblacion": 13013, "lat": 28.48, "lon": -100.92, "tipo": "municipio"},
-        "Abasolo": {"coords": [26.94, -101.66], "estado": "Coahuila", "poblacion": 1079, "lat": 26.94, "lon": -101.66, "tipo": "municipio"},
-        "Candela": {"coords": [26.82, -100.67], "estado": "Coahuila", "poblacion": 1495, "lat": 26.82, "lon": -100.67, "tipo": "municipio"},
-        "Cuatro Ciénegas": {"coords": [26.99, -102.04], "estado": "Coahuila", "poblacion": 12960, "lat": 26.99, "lon": -102.04, "tipo": "municipio"},
-        "Escobedo": {"coords": [27.69, -99.83], "estado": "Coahuila", "poblacion": 2734, "lat": 27.69, "lon": -99.83, "tipo": "municipio"},
-        "Jiménez": {"coords": [27.14, -101.42], "estado": "Coahuila", "poblacion": 8806, "lat": 27.14, "lon": -101.42, "tipo": "municipio"},
-        "San Nicolás": {"coords": [28.15, -100.77], "estado": "Coahuila", "poblacion": 2324, "lat": 28.15, "lon": -100.77, "tipo": "municipio"}
-    },
-    "Colima": {
-        "Colima": {"coords": [19.24, -103.72], "estado": "Colima", "poblacion": 146904, "lat": 19.24, "lon": -103.72, "tipo": "capital"},
-        "Villa de Álvarez": {"coords": [19.27, -103.74], "estado": "Colima", "poblacion": 144206, "lat": 19.27, "lon": -103.74, "tipo": "municipio"},
-        "Manzanillo": {"coords": [19.05, -104.32], "estado": "Colima", "poblacion": 146847, "lat": 19.05, "lon": -104.32, "tipo": "municipio"},
-        "Tecomán": {"coords": [18.91, -103.88], "estado": "Colima", "poblacion": 112726, "lat": 18.91, "lon": -103.88, "tipo": "municipio"},
-        "Armería": {"coords": [18.94, -103.97], "estado": "Colima", "poblacion": 29599, "lat": 18.94, "lon": -103.97, "tipo": "municipio"},
-        "Coquimatlán": {"coords": [19.20, -103.80], "estado": "Colima", "poblacion": 20898, "lat": 19.20, "lon": -103.80, "tipo": "municipio"},
-        "Cuauhtémoc": {"coords": [19.32, -103.60], "estado": "Colima", "poblacion": 27693, "lat": 19.32, "lon": -103.60, "tipo": "municipio"},
-        "Ixtlahuacán": {"coords": [19.15, -103.85], "estado": "Colima", "poblacion": 4808, "lat": 19.15, "lon": -103.85, "tipo": "municipio"},
-        "Minatitlán": {"coords": [19.36, -104.03], "estado": "Colima", "poblacion": 8834, "lat": 19.36, "lon": -104.03, "tipo": "municipio"},
-        "Comala": {"coords": [19.31, -103.76], "estado": "Colima", "poblacion": 22698, "lat": 19.31, "lon": -103.76, "tipo": "municipio"}
-    },
-    "Durango": {
-        "Durango": {"coords": [24.02, -104.67], "estado": "Durango", "poblacion": 654876, "lat": 24.02, "lon": -104.67, "tipo": "capital"},
-        "Gómez Palacio": {"coords": [25.56, -103.50], "estado": "Durango", "poblacion": 342286, "lat": 25.56, "lon": -103.50, "tipo": "municipio"},
-        "Lerdo": {"coords": [25.54, -103.52], "estado": "Durango", "poblacion": 79669, "lat": 25.54, "lon": -103.52, "tipo": "municipio"},
-        "Santiago Papasquiaro": {"coords": [25.05, -105.42], "estado": "Durango", "poblacion": 26121, "lat": 25.05, "lon": -105.42, "tipo": "municipio"},
-        "Guadalupe Victoria": {"coords": [24.39, -104.84], "estado": "Durango", "poblacion": 34175, "lat": 24.39, "lon": -104.84, "tipo": "municipio"},
-        "Vicente Guerrero": {"coords": [23.74, -103.97], "estado": "Durango", "poblacion": 18157, "lat": 23.74, "lon": -103.97, "tipo": "municipio"},
-        "Pueblo Nuevo": {"coords": [23.38, -105.37], "estado": "Durango", "poblacion": 50383, "lat": 23.38, "lon": -105.37, "tipo": "municipio"},
-        "El Oro": {"coords": [24.68, -105.73], "estado": "Durango", "poblacion": 12663, "lat": 24.68, "lon": -105.73, "tipo": "municipio"},
-        "Rodeo": {"coords": [25.18, -104.46], "estado": "Durango", "poblacion": 13965, "lat": 25.18, "lon": -104.46, "tipo": "municipio"},
-        "Peñón Blanco": {"coords": [24.78, -104.05], "estado": "Durango", "poblacion": 9657, "lat": 24.78, "lon": -104.05, "tipo": "municipio"},
-        "Nazas": {"coords": [25.23, -104.11], "estado": "Durango", "poblacion": 4355, "lat": 25.23, "lon": -104.11, "tipo": "municipio"},
-        "Tlahualilo": {"coords": [26.10, -103.44], "estado": "Durango", "poblacion": 19882, "lat": 26.10, "lon": -103.44, "tipo": "municipio"},
-        "Mapimí": {"coords": [25.84, -103.85], "estado": "Durango", "poblacion": 4335, "lat": 25.84, "lon": -103.85, "tipo": "municipio"},
-        "Indé": {"coords": [25.95, -104.64], "estado": "Durango", "poblacion": 7176, "lat": 25.95, "lon": -104.64, "tipo": "municipio"},
-        "Hidalgo": {"coords": [26.05, -105.17], "estado": "Durango", "poblacion": 2699, "lat": 26.05, "lon": -105.17, "tipo": "municipio"},
-        "Nombre de Dios": {"coords": [23.86, -104.29], "estado": "Durango", "poblacion": 19718, "lat": 23.86, "lon": -104.29, "tipo": "municipio"},
-        "Poanas": {"coords": [24.89, -104.29], "estado": "Durango", "poblacion": 28267, "lat": 24.89, "lon": -104.29, "tipo": "municipio"},
-        "San Dimas": {"coords": [23.81, -105.81], "estado": "Durango", "poblacion": 18924, "lat": 23.81, "lon": -105.81, "tipo": "municipio"},
-        "Tamazula": {"coords": [24.95, -106.98], "estado": "Durango", "poblacion": 27423, "lat": 24.95, "lon": -106.98, "tipo": "municipio"},
-        "Tepehuanes": {"coords": [25.20, -105.67], "estado": "Durango", "poblacion": 8702, "lat": 25.20, "lon": -105.67, "tipo": "municipio"},
-        "Mezquital": {"coords": [23.54, -104.41], "estado": "Durango", "poblacion": 25852, "lat": 23.54, "lon": -104.41, "tipo": "municipio"},
-        "San Juan de Guadalupe": {"coords": [24.47, -104.52], "estado": "Durango", "poblacion": 5991, "lat": 24.47, "lon": -104.52, "tipo": "municipio"},
-        "San Juan del Río": {"coords": [24.22, -104.85], "estado": "Durango", "poblacion": 7880, "lat": 24.22, "lon": -104.85, "tipo": "municipio"},
-        "San Luis del Cordero": {"coords": [25.78, -104.20], "estado": "Durango", "poblacion": 2115, "lat": 25.78, "lon": -104.20, "tipo": "municipio"},
-        "San Pedro del Gallo": {"coords": [25.56, -103.96], "estado": "Durango", "poblacion": 2547, "lat": 25.56, "lon": -103.96, "tipo": "municipio"},
-        "Santa Clara": {"coords": [25.87, -104.10], "estado": "Durango", "poblacion": 1696, "lat": 25.87, "lon": -104.10, "tipo": "municipio"},
-        "Súchil": {"coords": [25.55, -104.41], "estado": "Durango", "poblacion": 5739, "lat": 25.55, "lon": -104.41, "tipo": "municipio"},
-        "Topia": {"coords": [25.21, -106.55], "estado": "Durango", "poblacion": 8581, "lat": 25.21, "lon": -106.55, "tipo": "municipio"},
-        "Cuencamé": {"coords": [24.81, -103.74], "estado": "Durango", "poblacion": 30904, "lat": 24.81, "lon": -103.74, "tipo": "municipio"},
-        "General Simón Bolívar": {"coords": [25.45, -103.90], "estado": "Durango", "poblacion": 2615, "lat": 25.45, "lon": -103.90, "tipo": "municipio"},
-        "Nuevo Ideal": {"coords": [24.88, -104.77], "estado": "Durango", "poblacion": 23170, "lat": 24.88, "lon": -104.77, "tipo": "municipio"},
-        "Ocampo": {"coords": [25.49, -105.40], "estado": "Durango", "poblacion": 8391, "lat": 25.49, "lon": -105.40, "tipo": "municipio"},
-        "Otáez": {"coords": [26.01, -105.78], "estado": "Durango", "poblacion": 8194, "lat": 26.01, "lon": -105.78, "tipo": "municipio"},
-        "Pánuco de Coronado": {"coords": [24.46, -104.20], "estado": "Durango", "poblacion": 12230, "lat": 24.46, "lon": -104.20, "tipo": "municipio"},
-        "Santa María del Oro": {"coords": [23.95, -105.35], "estado": "Durango", "poblacion": 2734, "lat": 23.95, "lon": -105.35, "tipo": "municipio"},
-        "Simón Bolívar": {"coords": [25.45, -103.90], "estado": "Durango", "poblacion": 2615, "lat": 25.45, "lon": -103.90, "tipo": "municipio"},
-        "Coneto de Comonfort": {"coords": [24.93, -104.86], "estado": "Durango", "poblacion": 7324, "lat": 24.93, "lon": -104.86, "tipo": "municipio"},
-        "Canatlán": {"coords": [24.53, -104.79], "estado": "Durango", "poblacion": 27924, "lat": 24.53, "lon": -104.79, "tipo": "municipio"},
-        "Canelas": {"coords": [24.59, -106.58], "estado": "Durango", "poblacion": 4844, "lat": 24.59, "lon": -106.58, "tipo": "municipio"}
-    },
-    "Jalisco": {
-        "Acatic": {"coords": [20.8988, -102.8800], "estado": "Jalisco", "poblacion": 22969, "lat": 20.8988, "lon": -102.8800, "clave_inegi": "14001", "tipo": "municipio"},
-        "Acatlán de Juárez": {"coords": [20.4503, -103.5414], "estado": "Jalisco", "poblacion": 26242, "lat": 20.4503, "lon": -103.5414, "clave_inegi": "14002", "tipo": "municipio"},
-        "Ahualulco de Mercado": {"coords": [20.6833, -103.9667], "estado": "Jalisco", "poblacion": 25665, "lat": 20.6833, "lon": -103.9667, "clave_inegi": "14003", "tipo": "municipio"},
-        "Amacueca": {"coords": [20.0667, -103.7500], "estado": "Jalisco", "poblacion": 8247, "lat": 20.0667, "lon": -103.7500, "clave_inegi": "14004", "tipo": "municipio"},
-        "Amatitán": {"coords": [20.7333, -103.7333], "estado": "Jalisco", "poblacion": 16812, "lat": 20.7333, "lon": -103.7333, "clave_inegi": "14005", "tipo": "municipio"},
-        "Ameca": {"coords": [20.5500, -104.0500], "estado": "Jalisco", "poblacion": 60386, "lat": 20.5500, "lon": -104.0500, "clave_inegi": "14006", "tipo": "municipio"},
-        "Arandas": {"coords": [20.7042, -102.3486], "estado": "Jalisco", "poblacion": 80006, "lat": 20.7042, "lon": -102.3486, "clave_inegi": "14007", "tipo": "municipio"},
-        "El Arenal": {"coords": [20.7500, -103.6500], "estado": "Jalisco", "poblacion": 21809, "lat": 20.7500, "lon": -103.6500, "clave_inegi": "14008", "tipo": "municipio"},
-        "Atemajac de Brizuela": {"coords": [20.2500, -103.8833], "estado": "Jalisco", "poblacion": 7162, "lat": 20.2500, "lon": -103.8833, "clave_inegi": "14009", "tipo": "municipio"},
-        "Atengo": {"coords": [20.3333, -104.2167], "estado": "Jalisco", "poblacion": 5230, "lat": 20.3333, "lon": -104.2167, "clave_inegi": "14010", "tipo": "municipio"},
-        "Atenguillo": {"coords": [20.6167, -104.4667], "estado": "Jalisco", "poblacion": 4286, "lat": 20.6167, "lon": -104.4667, "clave_inegi": "14011", "tipo": "municipio"},
-        "Atotonilco el Alto": {"coords": [20.5500, -102.5167], "estado": "Jalisco", "poblacion": 64888, "lat": 20.5500, "lon": -102.5167, "clave_inegi": "14012", "tipo": "municipio"},
-        "Atoyac": {"coords": [20.0167, -103.5333], "estado": "Jalisco", "poblacion": 19414, "lat": 20.0167, "lon": -103.5333, "clave_inegi": "14013", "tipo": "municipio"},
-        "Autlán de Navarro": {"coords": [19.7667, -104.3667], "estado": "Jalisco", "poblacion": 62319, "lat": 19.7667, "lon": -104.3667, "clave_inegi": "14014", "tipo": "municipio"},
-        "Ayotlán": {"coords": [20.4833, -102.3333], "estado": "Jalisco", "poblacion": 24013, "lat": 20.4833, "lon": -102.3333, "clave_inegi": "14015", "tipo": "municipio"},
-        "Ayutla": {"coords": [20.1500, -104.3500], "estado": "Jalisco", "poblacion": 11887, "lat": 20.1500, "lon": -104.3500, "clave_inegi": "14016", "tipo": "municipio"},
-        "Bolaños": {"coords": [21.6667, -103.7500], "estado": "Jalisco", "poblacion": 5504, "lat": 21.6667, "lon": -103.7500, "clave_inegi": "14017", "tipo": "municipio"},
-        "Cabo Corrientes": {"coords": [20.4833, -105.3333], "estado": "Jalisco", "poblacion": 10771, "lat": 20.4833, "lon": -105.3333, "clave_inegi": "14018", "tipo": "municipio"},
-        "Cañadas de Obregón": {"coords": [21.2333, -102.5833], "estado": "Jalisco", "poblacion": 3365, "lat": 21.2333, "lon": -102.5833, "clave_inegi": "14019", "tipo": "municipio"},
-        "Capilla de Guadalupe": {"coords": [20.8643, -102.4828], "estado": "Jalisco", "poblacion": 21304, "lat": 20.8643, "lon": -102.4828, "clave_inegi": "14020", "tipo": "municipio"},
-        "Casimiro Castillo": {"coords": [19.5833, -104.4167], "estado": "Jalisco", "poblacion": 44795, "lat": 19.5833, "lon": -104.4167, "clave_inegi": "14021", "tipo": "municipio"},
-        "Cihuatlán": {"coords": [19.2333, -104.5667], "estado": "Jalisco", "poblacion": 33607, "lat": 19.2333, "lon": -104.5667, "clave_inegi": "14022", "tipo": "municipio"},
-        "Zapotlán del Rey": {"coords": [20.4333, -102.8333], "estado": "Jalisco", "poblacion": 20410, "lat": 20.4333, "lon": -102.8333, "clave_inegi": "14023", "tipo": "municipio"},
-        "Cocula": {"coords": [20.3500, -103.8667], "estado": "Jalisco", "poblacion": 30332, "lat": 20.3500, "lon": -103.8667, "clave_inegi": "14024", "tipo": "municipio"},
-        "Colotlán": {"coords": [22.2167, -103.2167], "estado": "Jalisco", "poblacion": 17987, "lat": 22.2167, "lon": -103.2167, "clave_inegi": "14025", "tipo": "municipio"},
-        "Concepción de Buenos Aires": {"coords": [20.0000, -103.4833], "estado": "Jalisco", "poblacion": 6290, "lat": 20.0000, "lon": -103.4833, "clave_inegi": "14026", "tipo": "municipio"},
-        "Cuautitlán de García Barragán": {"coords": [19.4667, -104.1667], "estado": "Jalisco", "poblacion": 18349, "lat": 19.4667, "lon": -104.1667, "clave_inegi": "14027", "tipo": "municipio"},
-        "Cuautla": {"coords": [20.2833, -104.0500], "estado": "Jalisco", "poblacion": 6220, "lat": 20.2833, "lon": -104.0500, "clave_inegi": "14028", "tipo": "municipio"},
-        "Cuquío": {"coords": [20.9833, -103.1833], "estado": "Jalisco", "poblacion": 18367, "lat": 20.9833, "lon": -103.1833, "clave_inegi": "14029", "tipo": "municipio"},
-        "Chimaltitán": {"coords": [21.7333, -103.6500], "estado": "Jalisco", "poblacion": 3114, "lat": 21.7333, "lon": -103.6500, "clave_inegi": "14030", "tipo": "municipio"},
-        "Chiquilistlán": {"coords": [20.2500, -103.9500], "estado": "Jalisco", "poblacion": 5612, "lat": 20.2500, "lon": -103.9500, "clave_inegi": "14031", "tipo": "municipio"},
-        "Degollado": {"coords": [20.5000, -102.0500], "estado": "Jalisco", "poblacion": 21496, "lat": 20.5000, "lon": -102.0500, "clave_inegi": "14032", "tipo": "municipio"},
-        "Ejutla": {"coords": [20.0833, -104.0667], "estado": "Jalisco", "poblacion": 9936, "lat": 20.0833, "lon": -104.0667, "clave_inegi": "14033", "tipo": "municipio"},
-        "Encarnación de Díaz": {"coords": [21.5167, -102.3833], "estado": "Jalisco", "poblacion": 55547, "lat": 21.5167, "lon": -102.3833, "clave_inegi": "14034", "tipo": "municipio"},
-        "Etzatlán": {"coords": [20.7667, -104.0667], "estado": "Jalisco", "poblacion": 19307, "lat": 20.7667, "lon": -104.0667, "clave_inegi": "14035", "tipo": "municipio"},
-        "El Grullo": {"coords": [19.8667, -104.2167], "estado": "Jalisco", "poblacion": 25188, "lat": 19.8667, "lon": -104.2167, "clave_inegi": "14036", "tipo": "municipio"},
-        "Guachinango": {"coords": [20.6500, -104.3000], "estado": "Jalisco", "poblacion": 4204, "lat": 20.6500, "lon": -104.3000, "clave_inegi": "14037", "tipo": "municipio"},
-        "Guadalajara": {"coords": [20.6500, -103.3500], "estado": "Jalisco", "poblacion": 1385629, "lat": 20.6500, "lon": -103.3500, "clave_inegi": "14039", "tipo": "municipio"},
-        "Hostotipaquillo": {"coords": [20.9167, -104.1167], "estado": "Jalisco", "poblacion": 8973, "lat": 20.9167, "lon": -104.1167, "clave_inegi": "14040", "tipo": "municipio"},
-        "Huejúcar": {"coords": [22.4000, -103.1167], "estado": "Jalisco", "poblacion": 5496, "lat": 22.4000, "lon": -103.1167, "clave_inegi": "14041", "tipo": "municipio"},
-        "Huejuquilla el Alto": {"coords": [22.6500, -103.7500], "estado": "Jalisco", "poblacion": 10237, "lat": 22.6500, "lon": -103.7500, "clave_inegi": "14042", "tipo": "municipio"},
-        "Ixtlahuacán de los Membrillos": {"coords": [20.3500, -103.2000], "estado": "Jalisco", "poblacion": 53048, "lat": 20.3500, "lon": -103.2000, "clave_inegi": "14043", "tipo": "municipio"},
-        "Ixtlahuacán del Río": {"coords": [20.8000, -103.2167], "estado": "Jalisco", "poblacion": 20443, "lat": 20.8000, "lon": -103.2167, "clave_inegi": "14044", "tipo": "municipio"},
-        "Jalostotitlán": {"coords": [21.2500, -102.4667], "estado": "Jalisco", "poblacion": 34778, "lat": 21.2500, "lon": -102.4667, "clave_inegi": "14045", "tipo": "municipio"},
-        "Jamay": {"coords": [20.2500, -102.8333], "estado": "Jalisco", "poblacion": 25654, "lat": 20.2500, "lon": -102.8333, "clave_inegi": "14046", "tipo": "municipio"},
-        "Jesús María": {"coords": [20.6167, -102.8333], "estado": "Jalisco", "poblacion": 21114, "lat": 20.6167, "lon": -102.8333, "clave_inegi": "14047", "tipo": "municipio"},
-        "Jilotlán de los Dolores": {"coords": [19.3333, -103.1833], "estado": "Jalisco", "poblacion": 11859, "lat": 19.3333, "lon": -103.1833, "clave_inegi": "14048", "tipo": "municipio"},
-        "Jocotepec": {"coords": [20.2833, -103.4500], "estado": "Jalisco", "poblacion": 43027, "lat": 20.2833, "lon": -103.4500, "clave_inegi": "14049", "tipo": "municipio"},
-        "Juanacatlán": {"coords": [20.5333, -103.2000], "estado": "Jalisco", "poblacion": 27618, "lat": 20.5333, "lon": -103.2000, "clave_inegi": "14050", "tipo": "municipio"},
-        "Juchitlán": {"coords": [20.0000, -104.0167], "estado": "Jalisco", "poblacion": 4688, "lat": 20.0000, "lon": -104.0167, "clave_inegi": "14051", "tipo": "municipio"},
-        "Lagos de Moreno": {"coords": [21.3667, -101.9167], "estado": "Jalisco", "poblacion": 172403, "lat": 21.3667, "lon": -101.9167, "clave_inegi": "14052", "tipo": "municipio"},
-        "El Limón": {"coords": [19.8667, -104.0833], "estado": "Jalisco", "poblacion": 5695, "lat": 19.8667, "lon": -104.0833, "clave_inegi": "14053", "tipo": "municipio"},
-        "Magdalena": {"coords": [20.9167, -104.0167], "estado": "Jalisco", "poblacion": 21372, "lat": 20.9167, "lon": -104.0167, "clave_inegi": "14054", "tipo": "municipio"},
-        "Santa María del Oro": {"coords": [19.4500, -102.9333], "estado": "Jalisco", "poblacion": 19926, "lat": 19.4500, "lon": -102.9333, "clave_inegi": "14055", "tipo": "municipio"},
-        "La Manzanilla de la Paz": {"coords": [20.0500, -103.0167], "estado": "Jalisco", "poblacion": 2866, "lat": 20.0500, "lon": -103.0167, "clave_inegi": "14056", "tipo": "municipio"},
-        "Mascola": {"coords": [20.5500, -104.2833], "estado": "Jalisco", "poblacion": 14037, "lat": 20.5500, "lon": -104.2833, "clave_inegi": "14057", "tipo": "municipio"},
-        "Mazamitla": {"coords": [19.9167, -103.0333], "estado": "Jalisco", "poblacion": 14348, "lat": 19.9167, "lon": -103.0333, "clave_inegi": "14058", "tipo": "municipio"},
-        "Mexticacán": {"coords": [21.2833, -102.7333], "estado": "Jalisco", "poblacion": 6364, "lat": 21.2833, "lon": -102.7333, "clave_inegi": "14059", "tipo": "municipio"},
-        "Mezquitic": {"coords": [22.3833, -103.6833], "estado": "Jalisco", "poblacion": 18345, "lat": 22.3833, "lon": -103.6833, "clave_inegi": "14060", "tipo": "municipio"},
-        "Mixtlán": {"coords": [20.6667, -104.5333], "estado": "Jalisco", "poblacion": 4204, "lat": 20.6667, "lon": -104.5333, "clave_inegi": "14061", "tipo": "municipio"},
-        "Ocotlán": {"coords": [20.3500, -102.7833], "estado": "Jalisco", "poblacion": 106666, "lat": 20.3500, "lon": -102.7833, "clave_inegi": "14062", "tipo": "municipio"},
-        "Ojuelos de Jalisco": {"coords": [21.6833, -101.5833], "estado": "Jalisco", "poblacion": 31135, "lat": 21.6833, "lon": -101.5833, "clave_inegi": "14063", "tipo": "municipio"},
-        "Pihuamo": {"coords": [19.1667, -103.4000], "estado": "Jalisco", "poblacion": 9994, "lat": 19.1667, "lon": -103.4000, "clave_inegi": "14064", "tipo": "municipio"},
-        "Poncitlán": {"coords": [20.3500, -102.9333], "estado": "Jalisco", "poblacion": 55716, "lat": 20.3500, "lon": -102.9333, "clave_inegi": "14065", "tipo": "municipio"},
-        "Puerto Vallarta": {"coords": [20.6167, -105.2333], "estado": "Jalisco", "poblacion": 333946, "lat": 20.6167, "lon": -105.2333, "clave_inegi": "14066", "tipo": "municipio"},
-        "Villa Purificación": {"coords": [20.0833, -104.6000], "estado": "Jalisco", "poblacion": 10750, "lat": 20.0833, "lon": -104.6000, "clave_inegi": "14067", "tipo": "municipio"},
-        "Quila": {"coords": [20.1833, -104.0500], "estado": "Jalisco", "poblacion": 6220, "lat": 20.1833, "lon": -104.0500, "clave_inegi": "14068", "tipo": "municipio"},
-        "Quitupan": {"coords": [19.8833, -102.8333], "estado": "Jalisco", "poblacion": 7654, "lat": 19.8833, "lon": -102.8333, "clave_inegi": "14069", "tipo": "municipio"},
-        "El Salto": {"coords": [20.5167, -103.2500], "estado": "Jalisco", "poblacion": 232544, "lat": 20.5167, "lon": -103.2500, "clave_inegi": "14070", "tipo": "municipio"},
-        "San Cristóbal de la Barranca": {"coords": [20.9167, -103.5667], "estado": "Jalisco", "poblacion": 3927, "lat": 20.9167, "lon": -103.5667, "clave_inegi": "14071", "tipo": "municipio"},
-        "San Diego de Alejandría": {"coords": [21.0333, -102.1333], "estado": "Jalisco", "poblacion": 6373, "lat": 21.0333, "lon": -102.1333, "clave_inegi": "14072", "tipo": "municipio"},
-        "San Gabriel": {"coords": [19.7833, -103.8833], "estado": "Jalisco", "poblacion": 15313, "lat": 19.7833, "lon": -103.8833, "clave_inegi": "14073", "tipo": "municipio"},
-        "San Ignacio Cerro Gordo": {"coords": [20.7833, -102.4333], "estado": "Jalisco", "poblacion": 19531, "lat": 20.7833, "lon": -102.4333, "clave_inegi": "14074", "tipo": "municipio"},
-        "San Juan de los Lagos": {"coords": [21.2333, -102.3167], "estado": "Jalisco", "poblacion": 72216, "lat": 21.2333, "lon": -102.3167, "clave_inegi": "14075", "tipo": "municipio"},
-        "San Juanito de Escobedo": {"coords": [20.7167, -103.9500], "estado": "Jalisco", "poblacion": 8986, "lat": 20.7167, "lon": -103.9500, "clave_inegi": "14076", "tipo": "municipio"},
-        "San Julián": {"coords": [21.0167, -102.1833], "estado": "Jalisco", "poblacion": 16843, "lat": 21.0167, "lon": -102.1833, "clave_inegi": "14077", "tipo": "municipio"},
-        "San Marcos": {"coords": [20.8833, -104.1667], "estado": "Jalisco", "poblacion": 3927, "lat": 20.8833, "lon": -104.1667, "clave_inegi": "14078", "tipo": "municipio"},
-        "San Martín de Hidalgo": {"coords": [20.4667, -104.0500], "estado": "Jalisco", "poblacion": 29325, "lat": 20.4667, "lon": -104.0500, "clave_inegi": "14079", "tipo": "municipio"},
-        "San Miguel el Alto": {"coords": [21.0333, -102.3833], "estado": "Jalisco", "poblacion": 36499, "lat": 21.0333, "lon": -102.3833, "clave_inegi": "14080", "tipo": "municipio"},
-        "San Sebastián del Oeste": {"coords": [20.8167, -104.8333], "estado": "Jalisco", "poblacion": 6564, "lat": 20.8167, "lon": -104.8333, "clave_inegi": "14081", "tipo": "municipio"},
-        "Santa María de los Ángeles": {"coords": [22.0667, -103.4667], "estado": "Jalisco", "poblacion": 4217, "lat": 22.0667, "lon": -103.4667, "clave_inegi": "14082", "tipo": "municipio"},
-        "Sayula": {"coords": [20.2000, -103.5833], "estado": "Jalisco", "poblacion": 39266, "lat": 20.2000, "lon": -103.5833, "clave_inegi": "14083", "tipo": "municipio"},
-        "Tala": {"coords": [20.6667, -103.7000], "estado": "Jalisco", "poblacion": 83528, "lat": 20.6667, "lon": -103.7000, "clave_inegi": "14084", "tipo": "municipio"},
-        "Talpa de Allende": {"coords": [20.4333, -104.8333], "estado": "Jalisco", "poblacion": 14872, "lat": 20.4333, "lon": -104.8333, "clave_inegi": "14085", "tipo": "municipio"},
-        "Tamazula de Gordiano": {"coords": [19.6333, -103.2500], "estado": "Jalisco", "poblacion": 40361, "lat": 19.6333, "lon": -103.2500, "clave_inegi": "14086", "tipo": "municipio"},
-        "Tapalpa": {"coords": [19.9500, -103.7500], "estado": "Jalisco", "poblacion": 20495, "lat": 19.9500, "lon": -103.7500, "clave_inegi": "14087", "tipo": "municipio"},
-        "Tecalitlán": {"coords": [19.1667, -103.3500], "estado": "Jalisco", "poblacion": 18333, "lat": 19.1667, "lon": -103.3500, "clave_inegi": "14088", "tipo": "municipio"},
-        "Tecolotlán": {"coords": [20.2000, -104.0500], "estado": "Jalisco", "poblacion": 17987, "lat": 20.2000, "lon": -104.0500, "clave_inegi": "14089", "tipo": "municipio"},
-        "Teocaltiche": {"coords": [21.4333, -102.4333], "estado": "Jalisco", "poblacion": 39589, "lat": 21.4333, "lon": -102.4333, "clave_inegi": "14090", "tipo": "municipio"},
-        "Teocuitatlán de Corona": {"coords": [20.1500, -103.3000], "estado": "Jalisco", "poblacion": 11811, "lat": 20.1500, "lon": -103.3000, "clave_inegi": "14091", "tipo": "municipio"},
-        "Tepatitlán de Morelos": {"coords": [20.8000, -102.7333], "estado": "Jalisco", "poblacion": 160828, "lat": 20.8000, "lon": -102.7333, "clave_inegi": "14092", "tipo": "municipio"},
-        "Tequila": {"coords": [20.8833, -103.8333], "estado": "Jalisco", "poblacion": 44795, "lat": 20.8833, "lon": -103.8333, "clave_inegi": "14093", "tipo": "municipio"},
-        "Teuchitlán": {"coords": [20.6667, -103.8833], "estado": "Jalisco", "poblacion": 8986, "lat": 20.6667, "lon": -103.8833, "clave_inegi": "14094", "tipo": "municipio"},
-        "Tizapán el Alto": {"coords": [20.2167, -103.0167], "estado": "Jalisco", "poblacion": 23282, "lat": 20.2167, "lon": -103.0167, "clave_inegi": "14095", "tipo": "municipio"},
-        "Tlajomulco de Zúñiga": {"coords": [20.5000, -103.4000], "estado": "Jalisco", "poblacion": 727750, "lat": 20.5000, "lon": -103.4000, "clave_inegi": "14096", "tipo": "municipio"},
-        "San Pedro Tlaquepaque": {"coords": [20.6167, -103.3167], "estado": "Jalisco", "poblacion": 687388, "lat": 20.6167, "lon": -103.3167, "clave_inegi": "14097", "tipo": "municipio"},
-        "Tolimán": {"coords": [19.5333, -103.9500], "estado": "Jalisco", "poblacion": 9994, "lat": 19.5333, "lon": -103.9500, "clave_inegi": "14098", "tipo": "municipio"},
-        "Tomatlán": {"coords": [19.9333, -105.2500], "estado": "Jalisco", "poblacion": 36326, "lat": 19.9333, "lon": -105.2500, "clave_inegi": "14099", "tipo": "municipio"},
-        "Tonalá": {"coords": [20.6167, -103.2500], "estado": "Jalisco", "poblacion": 569913, "lat": 20.6167, "lon": -103.2500, "clave_inegi": "14100", "tipo": "municipio"},
-        "Tonaya": {"coords": [19.7500, -103.8333], "estado": "Jalisco", "poblacion": 5695, "lat": 19.7500, "lon": -103.8333, "clave_inegi": "14101", "tipo": "municipio"},
-        "Tonila": {"coords": [19.2333, -103.4000], "estado": "Jalisco", "poblacion": 9088, "lat": 19.2333, "lon": -103.4000, "clave_inegi": "14102", "tipo": "municipio"},
-        "Totatiche": {"coords": [21.9333, -103.3667], "estado": "Jalisco", "poblacion": 3927, "lat": 21.9333, "lon": -103.3667, "clave_inegi": "14103", "tipo": "municipio"},
-        "Tototlán": {"coords": [20.5000, -102.8500], "estado": "Jalisco", "poblacion": 25665, "lat": 20.5000, "lon": -102.8500, "clave_inegi": "14104", "tipo": "municipio"},
-        "Tuxcacuesco": {"coords": [19.6167, -103.9500], "estado": "Jalisco", "poblacion": 4204, "lat": 19.6167, "lon": -103.9500, "clave_inegi": "14105", "tipo": "municipio"},
-        "Tuxcueca": {"coords": [20.1000, -103.3833], "estado": "Jalisco", "poblacion": 5496, "lat": 20.1000, "lon": -103.3833, "clave_inegi": "14106", "tipo": "municipio"},
-        "Tuxpan": {"coords": [19.4667, -103.4167], "estado": "Jalisco", "poblacion": 36326, "lat": 19.4667, "lon": -103.4167, "clave_inegi": "14107", "tipo": "municipio"},
-        "Unión de San Antonio": {"coords": [21.1333, -102.0000], "estado": "Jalisco", "poblacion": 17987, "lat": 21.1333, "lon": -102.0000, "clave_inegi": "14108", "tipo": "municipio"},
-        "Unión de Tula": {"coords": [20.0667, -104.2833], "estado": "Jalisco", "poblacion": 12824, "lat": 20.0667, "lon": -104.2833, "clave_inegi": "14109", "tipo": "municipio"},
-        "Valle de Guadalupe": {"coords": [21.0000, -102.5000], "estado": "Jalisco", "poblacion": 22042, "lat": 21.0000, "lon": -102.5000, "clave_inegi": "14110", "tipo": "municipio"},
-        "Valle de Juárez": {"coords": [19.8500, -102.9500], "estado": "Jalisco", "poblacion": 4688, "lat": 19.8500, "lon": -102.9500, "clave_inegi": "14111", "tipo": "municipio"},
-        "Venustiano Carranza": {"coords": [19.3333, -103.4000], "estado": "Jalisco", "poblacion": 4286, "lat": 19.3333, "lon": -103.4000, "clave_inegi": "14112", "tipo": "municipio"},
-        "Villa Corona": {"coords": [20.3500, -103.6500], "estado": "Jalisco", "poblacion": 22969, "lat": 20.3500, "lon": -103.6500, "clave_inegi": "14113", "tipo": "municipio"},
-        "Villa Guerrero": {"coords": [22.0667, -103.7333], "estado": "Jalisco", "poblacion": 6564, "lat": 22.0667, "lon": -103.7333, "clave_inegi": "14114", "tipo": "municipio"},
-        "Villa Hidalgo": {"coords": [21.4667, -102.3500], "estado": "Jalisco", "poblacion": 23282, "lat": 21.4667, "lon": -102.3500, "clave_inegi": "14115", "tipo": "municipio"},
-        "Yahualica de González Gallo": {"coords": [21.2333, -102.8167], "estado": "Jalisco", "poblacion": 15313, "lat": 21.2333, "lon": -102.8167, "clave_inegi": "14116", "tipo": "municipio"},
-        "Zacoalco de Torres": {"coords": [20.3000, -103.6000], "estado": "Jalisco", "poblacion": 32240, "lat": 20.3000, "lon": -103.6000, "clave_inegi": "14117", "tipo": "municipio"},
-        "Zapopan": {"coords": [20.7167, -103.4000], "estado": "Jalisco", "poblacion": 1476491, "lat": 20.7167, "lon": -103.4000, "clave_inegi": "14118", "tipo": "municipio"},
-        "Zapotiltic": {"coords": [19.3833, -103.4333], "estado": "Jalisco", "poblacion": 32240, "lat": 19.3833, "lon": -103.4333, "clave_inegi": "14119", "tipo": "municipio"},
-        "Zapotitlán de Vadillo": {"coords": [19.5333, -103.7500], "estado": "Jalisco", "poblacion": 5230, "lat": 19.5333, "lon": -103.7500, "clave_inegi": "14120", "tipo": "municipio"},
-        "Zapotlán del Rey": {"coords": [20.4333, -102.8333], "estado": "Jalisco", "poblacion": 20410, "lat": 20.4333, "lon": -102.8333, "clave_inegi": "14121", "tipo": "municipio"},
-        "Zapotlán el Grande": {"coords": [19.7000, -103.4667], "estado": "Jalisco", "poblacion": 118111, "lat": 19.7000, "lon": -103.4667, "clave_inegi": "14122", "tipo": "municipio"},
-        "Zapotlanejo": {"coords": [20.6167, -103.1167], "estado": "Jalisco", "poblacion": 77241, "lat": 20.6167, "lon": -103.1167, "clave_inegi": "14123", "tipo": "municipio"},
-        "San Ignacio Cerro Gordo": {"coords": [20.7833, -102.4333], "estado": "Jalisco", "poblacion": 19531, "lat": 20.7833, "lon": -102.4333, "clave_inegi": "14124", "tipo": "municipio"},
-        "El Salto": {"coords": [20.5167, -103.2500], "estado": "Jalisco", "poblacion": 232544, "lat": 20.5167, "lon": -103.2500, "clave_inegi": "14125", "tipo": "municipio"}
-    },
-"Estado de México": {
-        "Acambay de Ruiz Castañeda": {"coords": [19.9392, -99.9515], "estado": "Estado de México", "poblacion": 67872, "lat": 19.9392, "lon": -99.9515, "tipo": "municipio"},
-        "Acolman": {"coords": [19.6175, -98.9142], "estado": "Estado de México", "poblacion": 171507, "lat": 19.6175, "lon": -98.9142, "tipo": "municipio"},
-        "Aculco": {"coords": [19.9225, -99.8844], "estado": "Estado de México", "poblacion": 49266, "lat": 19.9225, "lon": -99.8844, "tipo": "municipio"},
-        "Almoloya de Alquisiras": {"coords": [19.2381, -99.9981], "estado": "Estado de México", "poblacion": 15333, "lat": 19.2381, "lon": -99.9981, "tipo": "municipio"},
-        "Almoloya de Juárez": {"coords": [19.2922, -99.6557], "estado": "Estado de México", "poblacion": 174587, "lat": 19.2922, "lon": -99.6557, "tipo": "municipio"},
-        "Almoloya del Río": {"coords": [19.2833, -99.9833], "estado": "Estado de México", "poblacion": 15000, "lat": 19.2833, "lon": -99.9833, "tipo": "municipio"},
-        "Amanalco": {"coords": [19.1775, -99.9981], "estado": "Estado de México", "poblacion": 17500, "lat": 19.1775, "lon": -99.9981, "tipo": "municipio"},
-        "Amatepec": {"coords": [19.1181, -100.1250], "estado": "Estado de México", "poblacion": 25000, "lat": 19.1181, "lon": -100.1250, "tipo": "municipio"},
-        "Amecameca": {"coords": [19.2111, -98.8806], "estado": "Estado de México", "poblacion": 66000, "lat": 19.2111, "lon": -98.8806, "tipo": "municipio"},
-        "Apaxco": {"coords": [19.7722, -98.8889], "estado": "Estado de México", "poblacion": 30000, "lat": 19.7722, "lon": -98.8889, "tipo": "municipio"},
-        "Atenco": {"coords": [19.4972, -98.9014], "estado": "Estado de México", "poblacion": 25000, "lat": 19.4972, "lon": -98.9014, "tipo": "municipio"},
-        "Atizapán de Zaragoza": {"coords": [19.5706, -99.2461], "estado": "Estado de México", "poblacion": 520000, "lat": 19.5706, "lon": -99.2461, "tipo": "municipio"},
-        "Atlautla": {"coords": [19.1375, -98.8531], "estado": "Estado de México", "poblacion": 15000, "lat": 19.1375, "lon": -98.8531, "tipo": "municipio"},
-        "Axapusco": {"coords": [19.7531, -98.9456], "estado": "Estado de México", "poblacion": 20000, "lat": 19.7531, "lon": -98.9456, "tipo": "municipio"},
-        "Ayapango": {"coords": [19.1775, -98.7875], "estado": "Estado de México", "poblacion": 12000, "lat": 19.1775, "lon": -98.7875, "tipo": "municipio"},
-        "Calimaya": {"coords": [19.2167, -99.9833], "estado": "Estado de México", "poblacion": 25000, "lat": 19.2167, "lon": -99.9833, "tipo": "municipio"},
-        "Capulhuac": {"coords": [19.3069, -99.7928], "estado": "Estado de México", "poblacion": 20000, "lat": 19.3069, "lon": -99.7928, "tipo": "municipio"},
-        "Coacalco de Berriozábal": {"coords": [19.6333, -99.0667], "estado": "Estado de México", "poblacion": 200000, "lat": 19.6333, "lon": -99.0667, "tipo": "municipio"},
-        "Cocotitlán": {"coords": [19.2500, -98.9500], "estado": "Estado de México", "poblacion": 15000, "lat": 19.2500, "lon": -98.9500, "tipo": "municipio"},
-        "Coyotepec": {"coords": [19.7425, -99.0406], "estado": "Estado de México", "poblacion": 30000, "lat": 19.7425, "lon": -99.0406, "tipo": "municipio"},
-        "Cuautitlán": {"coords": [19.6906, -99.2042], "estado": "Estado de México", "poblacion": 200000, "lat": 19.6906, "lon": -99.2042, "tipo": "municipio"},
-        "Chalco": {"coords": [19.2639, -98.8792], "estado": "Estado de México", "poblacion": 300000, "lat": 19.2639, "lon": -98.8792, "tipo": "municipio"},
-        "Chiautla": {"coords": [19.3833, -98.9167], "estado": "Estado de México", "poblacion": 12000, "lat": 19.3833, "lon": -98.9167, "tipo": "municipio"},
-        "Chicoloapan": {"coords": [19.4325, -98.8769], "estado": "Estado de México", "poblacion": 250000, "lat": 19.4325, "lon": -98.8769, "tipo": "municipio"},
-        "Chiconcuac": {"coords": [19.5167, -98.8667], "estado": "Estado de México", "poblacion": 15000, "lat": 19.5167, "lon": -98.8667, "tipo": "municipio"},
-        "Chimalhuacán": {"coords": [19.4333, -98.9333], "estado": "Estado de México", "poblacion": 750000, "lat": 19.4333, "lon": -98.9333, "tipo": "municipio"},
-        "Ecatepec de Morelos": {"coords": [19.6011, -99.0506], "estado": "Estado de México", "poblacion": 1650000, "lat": 19.6011, "lon": -99.0506, "tipo": "municipio"},
-        "Ecatzingo": {"coords": [19.1833, -98.8833], "estado": "Estado de México", "poblacion": 10000, "lat": 19.1833, "lon": -98.8833, "tipo": "municipio"},
-        "Huehuetoca": {"coords": [19.7556, -99.2428], "estado": "Estado de México", "poblacion": 25000, "lat": 19.7556, "lon": -99.2428, "tipo": "municipio"},
-        "Hueypoxtla": {"coords": [19.7667, -99.3667], "estado": "Estado de México", "poblacion": 15000, "lat": 19.7667, "lon": -99.3667, "tipo": "municipio"},
-        "Huixquilucan": {"coords": [19.3667, -99.3667], "estado": "Estado de México", "poblacion": 200000, "lat": 19.3667, "lon": -99.3667, "tipo": "municipio"},
-        "Isidro Fabela": {"coords": [19.6500, -99.5000], "estado": "Estado de México", "poblacion": 15000, "lat": 19.6500, "lon": -99.5000, "tipo": "municipio"},
-        "Ixtapaluca": {"coords": [19.2819, -98.8886], "estado": "Estado de México", "poblacion": 300000, "lat": 19.2819, "lon": -98.8886, "tipo": "municipio"},
-        "Ixtapan de la Sal": {"coords": [18.9986, -99.5514], "estado": "Estado de México", "poblacion": 15000, "lat": 18.9986, "lon": -99.5514, "tipo": "municipio"},
-        "Ixtapan del Oro": {"coords": [19.1167, -99.8833], "estado": "Estado de México", "poblacion": 10000, "lat": 19.1167, "lon": -99.8833, "tipo": "municipio"},
-            "Ixtlahuaca": {"coords": [19.7833, -99.7833], "estado": "Estado de México", "poblacion": 75000, "lat": 19.7833, "lon": -99.7833, "tipo": "municipio"},
-        "Jaltenco": {"coords": [19.7000, -99.1667], "estado": "Estado de México", "poblacion": 22000, "lat": 19.7000, "lon": -99.1667, "tipo": "municipio"},
-        "Jilotepec": {"coords": [19.9333, -99.5833], "estado": "Estado de México", "poblacion": 65000, "lat": 19.9333, "lon": -99.5833, "tipo": "municipio"},
-        "Jilotzingo": {"coords": [19.8000, -99.3500], "estado": "Estado de México", "poblacion": 20000, "lat": 19.8000, "lon": -99.3500, "tipo": "municipio"},
-        "Jiquipilco": {"coords": [19.9333, -99.6333], "estado": "Estado de México", "poblacion": 40000, "lat": 19.9333, "lon": -99.6333, "tipo": "municipio"},
-        "Jocotitlán": {"coords": [19.9500, -99.7500], "estado": "Estado de México", "poblacion": 22000, "lat": 19.9500, "lon": -99.7500, "tipo": "municipio"},
-        "Joquicingo": {"coords": [19.1167, -99.6833], "estado": "Estado de México", "poblacion": 15000, "lat": 19.1167, "lon": -99.6833, "tipo": "municipio"},
-        "Juchitepec": {"coords": [19.0333, -98.8833], "estado": "Estado de México", "poblacion": 17000, "lat": 19.0333, "lon": -98.8833, "tipo": "municipio"},
-        "Lerma": {"coords": [19.2869, -99.5497], "estado": "Estado de México", "poblacion": 200000, "lat": 19.2869, "lon": -99.5497, "tipo": "municipio"},
-        "Malinalco": {"coords": [18.9667, -99.4000], "estado": "Estado de México", "poblacion": 20000, "lat": 18.9667, "lon": -99.4000, "tipo": "municipio"},
-        "Melchor Ocampo": {"coords": [19.7000, -99.1167], "estado": "Estado de México", "poblacion": 18000, "lat": 19.7000, "lon": -99.1167, "tipo": "municipio"},
-        "Metepec": {"coords": [19.2500, -99.6167], "estado": "Estado de México", "poblacion": 270000, "lat": 19.2500, "lon": -99.6167, "tipo": "municipio"},
-        "Mexicaltzingo": {"coords": [19.2667, -99.4500], "estado": "Estado de México", "poblacion": 10000, "lat": 19.2667, "lon": -99.4500, "tipo": "municipio"},
-        "Morelos": {"coords": [19.3167, -99.7667], "estado": "Estado de México", "poblacion": 12000, "lat": 19.3167, "lon": -99.7667, "tipo": "municipio"},
-        "Naucalpan de Juárez": {"coords": [19.4753, -99.2378], "estado": "Estado de México", "poblacion": 850000, "lat": 19.4753, "lon": -99.2378, "tipo": "municipio"},
-        "Nezahualcóyotl": {"coords": [19.4000, -99.0333], "estado": "Estado de México", "poblacion": 1100000, "lat": 19.4000, "lon": -99.0333, "tipo": "municipio"},
-        "Nextlalpan": {"coords": [19.7667, -99.1667], "estado": "Estado de México", "poblacion": 40000, "lat": 19.7667, "lon": -99.1667, "tipo": "municipio"},
-        "Nezahualcóyotl": {"coords": [19.4000, -99.0333], "estado": "Estado de México", "poblacion": 1100000, "lat": 19.4000, "lon": -99.0333, "tipo": "municipio"},
-        "Nicolas Romero": {"coords": [19.6167, -99.3333], "estado": "Estado de México", "poblacion": 700000, "lat": 19.6167, "lon": -99.3333, "tipo": "municipio"},
-        "Ocoyoacac": {"coords": [19.2833, -99.6500], "estado": "Estado de México", "poblacion": 40000, "lat": 19.2833, "lon": -99.6500, "tipo": "municipio"},
-        "Ocuilan": {"coords": [18.9833, -99.6833], "estado": "Estado de México", "poblacion": 25000, "lat": 18.9833, "lon": -99.6833, "tipo": "municipio"},
-        "El Oro": {"coords": [19.6333, -99.5833], "estado": "Estado de México", "poblacion": 50000, "lat": 19.6333, "lon": -99.5833, "tipo": "municipio"},
-        "Otumba": {"coords": [19.7000, -98.9500], "estado": "Estado de México", "poblacion": 40000, "lat": 19.7000, "lon": -98.9500, "tipo": "municipio"},
-        "Otzoloapan": {"coords": [19.3667, -99.6167], "estado": "Estado de México", "poblacion": 15000, "lat": 19.3667, "lon": -99.6167, "tipo": "municipio"},
-        "Polotitlán": {"coords": [19.9833, -100.2167], "estado": "Estado de México", "poblacion": 15000, "lat": 19.9833, "lon": -100.2167, "tipo": "municipio"},
-        "Rayón": {"coords": [19.1333, -99.6167], "estado": "Estado de México", "poblacion": 18000, "lat": 19.1333, "lon": -99.6167, "tipo": "municipio"},
-        "San Antonio la Isla": {"coords": [19.1769, -99.5650], "estado": "Estado de México", "poblacion": 20000, "lat": 19.1769, "lon": -99.5650, "tipo": "municipio"},
-        "San Felipe del Progreso": {"coords": [19.9000, -100.0833], "estado": "Estado de México", "poblacion": 50000, "lat": 19.9000, "lon": -100.0833, "tipo": "municipio"},
-        "San Martín de las Pirámides": {"coords": [19.6667, -98.9833], "estado": "Estado de México", "poblacion": 20000, "lat": 19.6667, "lon": -98.9833, "tipo": "municipio"},
-        "San Mateo Atenco": {"coords": [19.2833, -99.6667], "estado": "Estado de México", "poblacion": 70000, "lat": 19.2833, "lon": -99.6667, "tipo": "municipio"},
-        "San Simón de Guerrero": {"coords": [19.2167, -99.8167], "estado": "Estado de México", "poblacion": 12000, "lat": 19.2167, "lon": -99.8167, "tipo": "municipio"},
-        "Santo Tomás": {"coords": [19.3667, -99.6500], "estado": "Estado de México", "poblacion": 10000, "lat": 19.3667, "lon": -99.6500, "tipo": "municipio"},
-        "Soyaniquilpan de Juárez": {"coords": [19.8000, -99.9167], "estado": "Estado de México", "poblacion": 18000, "lat": 19.8000, "lon": -99.9167, "tipo": "municipio"},
-        "Tecámac": {"coords": [19.6500, -99.0500], "estado": "Estado de México", "poblacion": 500000, "lat": 19.6500, "lon": -99.0500, "tipo": "municipio"},
-        "Tejupilco": {"coords": [18.9333, -100.3833], "estado": "Estado de México", "poblacion": 80000, "lat": 18.9333, "lon": -100.3833, "tipo": "municipio"},
-        "Temamatla": {"coords": [19.3167, -98.9500], "estado": "Estado de México", "poblacion": 15000, "lat": 19.3167, "lon": -98.9500, "tipo": "municipio"},
-        "Temascalapa": {"coords": [19.7333, -98.9833], "estado": "Estado de México", "poblacion": 40000, "lat": 19.7333, "lon": -98.9833, "tipo": "municipio"},
-        "Temascalcingo": {"coords": [19.9000, -99.7333], "estado": "Estado de México", "poblacion": 25000, "lat": 19.9000, "lon": -99.7333, "tipo": "municipio"},
-        "Temascaltepec": {"coords": [18.9500, -100.1667], "estado": "Estado de México", "poblacion": 30000, "lat": 18.9500, "lon": -100.1667, "tipo": "municipio"},
-        "Tenancingo": {"coords": [18.9167, -99.6333], "estado": "Estado de México", "poblacion": 100000, "lat": 18.9167, "lon": -99.6333, "tipo": "municipio"},
-        "Tenango del Aire": {"coords": [19.1833, -98.8833], "estado": "Estado de México", "poblacion": 20000, "lat": 19.1833, "lon": -98.8833, "tipo": "municipio"},
-        "Tenango del Valle": {"coords": [19.1833, -99.6000], "estado": "Estado de México", "poblacion": 70000, "lat": 19.1833, "lon": -99.6000, "tipo": "municipio"},
-        "Teoloyucan": {"coords": [19.6333, -99.2333], "estado": "Estado de México", "poblacion": 60000, "lat": 19.6333, "lon": -99.2333, "tipo": "municipio"},
-        "Teotihuacán": {"coords": [19.6833, -98.8433], "estado": "Estado de México", "poblacion": 75000, "lat": 19.6833, "lon": -98.8433, "tipo": "municipio"},
-        "Tepetlaoxtoc": {"coords": [19.5333, -98.8833], "estado": "Estado de México", "poblacion": 25000, "lat": 19.5333, "lon": -98.8833, "tipo": "municipio"},
-        "Tepetlixpa": {"coords": [19.1167, -98.8833], "estado": "Estado de México", "poblacion": 20000, "lat": 19.1167, "lon": -98.8833, "tipo": "municipio"},
-        "Tepotzotlán": {"coords": [19.7175, -99.2431], "estado": "Estado de México", "poblacion": 80000, "lat": 19.7175, "lon": -99.2431, "tipo": "municipio"},
-        "Tequixquiac": {"coords": [19.7500, -99.3500], "estado": "Estado de México", "poblacion": 40000, "lat": 19.7500, "lon": -99.3500, "tipo": "municipio"},
-        "Texcaltitlán": {"coords": [18.9333, -99.5333], "estado": "Estado de México", "poblacion": 15000, "lat": 18.9333, "lon": -99.5333, "tipo": "municipio"},
-        "Texcalyacac": {"coords": [19.2333, -99.6667], "estado": "Estado de México", "poblacion": 12000, "lat": 19.2333, "lon": -99.6667, "tipo": "municipio"},
-        "Texcoco": {"coords": [19.5136, -98.8825], "estado": "Estado de México", "poblacion": 260000, "lat": 19.5136, "lon": -98.8825, "tipo": "municipio"},
-        "Otzolotepec": {"coords": [19.3500, -99.5500], "estado": "Estado de México", "poblacion": 25000, "lat": 19.3500, "lon": -99.5500, "tipo": "municipio"},
-        "Tezoyuca": {"coords": [19.6167, -98.9333], "estado": "Estado de México", "poblacion": 20000, "lat": 19.6167, "lon": -98.9333, "tipo": "municipio"},
-        "Tianguistenco": {"coords": [19.1833, -99.6167], "estado": "Estado de México", "poblacion": 40000, "lat": 19.1833, "lon": -99.6167, "tipo": "municipio"},
-        "Timilpan": {"coords": [19.8833, -100.1167], "estado": "Estado de México", "poblacion": 15000, "lat": 19.8833, "lon": -100.1167, "tipo": "municipio"},
-        "Tlalmanalco": {"coords": [19.1667, -98.8500], "estado": "Estado de México", "poblacion": 35000, "lat": 19.1667, "lon": -98.8500, "tipo": "municipio"},
-        "Tlalnepantla de Baz": {"coords": [19.5406, -99.1953], "estado": "Estado de México", "poblacion": 700000, "lat": 19.5406, "lon": -99.1953, "tipo": "municipio"},
-        "Tlatlaya": {"coords": [18.8167, -99.6000], "estado": "Estado de México", "poblacion": 22000, "lat": 18.8167, "lon": -99.6000, "tipo": "municipio"},
-        "Toluca": {"coords": [19.2922, -99.6557], "estado": "Estado de México", "poblacion": 910000, "lat": 19.2922, "lon": -99.6557, "tipo": "capital"},
-        "Tonatico": {"coords": [18.9500, -99.4833], "estado": "Estado de México", "poblacion": 17000, "lat": 18.9500, "lon": -99.4833, "tipo": "municipio"},
-        "Tultepec": {"coords": [19.6833, -99.1167], "estado": "Estado de México", "poblacion": 120000, "lat": 19.6833, "lon": -99.1167, "tipo": "municipio"},
-        "Tultitlán": {"coords": [19.6000, -99.1833], "estado": "Estado de México", "poblacion": 600000, "lat": 19.6000, "lon": -99.1833, "tipo": "municipio"},
-        "Valle de Bravo": {"coords": [19.2000, -100.1333], "estado": "Estado de México", "poblacion": 55000, "lat": 19.2000, "lon": -100.1333, "tipo": "municipio"},
-        "Villa de Allende": {"coords": [19.2333, -99.9167], "estado": "Estado de México", "poblacion": 25000, "lat": 19.2333, "lon": -99.9167, "tipo": "municipio"},
-        "Villa del Carbón": {"coords": [19.8500, -99.5167], "estado": "Estado de México", "poblacion": 30000, "lat": 19.8500, "lon": -99.5167, "tipo": "municipio"},
-        "Villa Guerrero": {"coords": [19.1667, -99.6833], "estado": "Estado de México", "poblacion": 22000, "lat": 19.1667, "lon": -99.6833, "tipo": "municipio"},
-        "Villa Victoria": {"coords": [19.2167, -99.7833], "estado": "Estado de México", "poblacion": 30000, "lat": 19.2167, "lon": -99.7833, "tipo": "municipio"},
-        "Xonacatlán": {"coords": [19.2667, -99.5333], "estado": "Estado de México", "poblacion": 20000, "lat": 19.2667, "lon": -99.5333, "tipo": "municipio"},
-        "Zacazonapan": {"coords": [18.9500, -99.7333], "estado": "Estado de México", "poblacion": 12000, "lat": 18.9500, "lon": -99.7333, "tipo": "municipio"},
-        "Zacualpan": {"coords": [19.5000, -100.1833], "estado": "Estado de México", "poblacion": 18000, "lat": 19.5000, "lon": -100.1833, "tipo": "municipio"},
-        "Zinacantepec": {"coords": [19.3000, -99.7000], "estado": "Estado de México", "poblacion": 120000, "lat": 19.3000, "lon": -99.7000, "tipo": "municipio"},
-        "Zumpahuacán": {"coords": [18.9000, -99.6667], "estado": "Estado de México", "poblacion": 20000, "lat": 18.9000, "lon": -99.6667, "tipo": "municipio"},
-        "Zumpango": {"coords": [19.7500, -99.1667], "estado": "Estado de México", "poblacion": 160000, "lat": 19.7500, "lon": -99.1667, "tipo": "municipio"},
-        "Cuautitlán Izcalli": {"coords": [19.6433, -99.2153], "estado": "Estado de México", "poblacion": 530000, "lat": 19.6433, "lon": -99.2153, "tipo": "municipio"}
-    },
-    "Nuevo León": {
-        "Monterrey": {"coords": [25.6866, -100.3161], "estado": "Nuevo León", "poblacion": 1135000, "lat": 25.6866, "lon": -100.3161, "tipo": "capital"},
-        "San Nicolás de los Garza": {"coords": [25.7373, -100.3128], "estado": "Nuevo León", "poblacion": 443000, "lat": 25.7373, "lon": -100.3128, "tipo": "municipio"},
-        "Guadalupe": {"coords": [25.7040, -100.2140], "estado": "Nuevo León", "poblacion": 630000, "lat": 25.7040, "lon": -100.2140, "tipo": "municipio"},
-        "Santa Catarina": {"coords": [25.6659, -100.4676], "estado": "Nuevo León", "poblacion": 300000, "lat": 25.6659, "lon": -100.4676, "tipo": "municipio"},
-        "Apodaca": {"coords": [25.7753, -100.1326], "estado": "Nuevo León", "poblacion": 600000, "lat": 25.7753, "lon": -100.1326, "tipo": "municipio"},
-        "Escobedo": {"coords": [25.7500, -100.2000], "estado": "Nuevo León", "poblacion": 450000, "lat": 25.7500, "lon": -100.2000, "tipo": "municipio"}
-    },
-    "Veracruz": {
-        "Acajete": {"coords": [19.5833, -96.9500], "estado": "Veracruz", "poblacion": 25774, "lat": 19.5833, "lon": -96.9500, "clave_inegi": "30001", "tipo": "municipio"},
-        "Acatlán": {"coords": [19.7500, -96.7667], "estado": "Veracruz", "poblacion": 10599, "lat": 19.7500, "lon": -96.7667, "clave_inegi": "30002", "tipo": "municipio"},
-        "Acayucan": {"coords": [17.9500, -94.9000], "estado": "Veracruz", "poblacion": 84180, "lat": 17.9500, "lon": -94.9000, "clave_inegi": "30003", "tipo": "municipio"},
-        "Actopan": {"coords": [19.4667, -96.5833], "estado": "Veracruz", "poblacion": 40134, "lat": 19.4667, "lon": -96.5833, "clave_inegi": "30004", "tipo": "municipio"},
-        "Acula": {"coords": [18.5833, -95.6667], "estado": "Veracruz", "poblacion": 7766, "lat": 18.5833, "lon": -95.6667, "clave_inegi": "30005", "tipo": "municipio"},
-        "Agua Dulce": {"coords": [18.0667, -94.1333], "estado": "Veracruz", "poblacion": 53528, "lat": 18.0667, "lon": -94.1333, "clave_inegi": "30006", "tipo": "municipio"},
-        "Alvarado": {"coords": [18.7667, -95.7667], "estado": "Veracruz", "poblacion": 53528, "lat": 18.7667, "lon": -95.7667, "clave_inegi": "30007", "tipo": "municipio"},
-        "Amatitlán": {"coords": [18.3500, -95.7500], "estado": "Veracruz", "poblacion": 8806, "lat": 18.3500, "lon": -95.7500, "clave_inegi": "30008", "tipo": "municipio"},
-        "Amatlán de los Reyes": {"coords": [18.8833, -96.9167], "estado": "Veracruz", "poblacion": 43534, "lat": 18.8833, "lon": -96.9167, "clave_inegi": "30009", "tipo": "municipio"},
-        "Angel R. Cabada": {"coords": [18.6167, -95.4333], "estado": "Veracruz", "poblacion": 33171, "lat": 18.6167, "lon": -95.4333, "clave_inegi": "30010", "tipo": "municipio"},
-        "Antigua": {"coords": [19.3333, -96.3833], "estado": "Veracruz", "poblacion": 25774, "lat": 19.3333, "lon": -96.3833, "clave_inegi": "30011", "tipo": "municipio"},
-        "Apazapan": {"coords": [19.2833, -96.8667], "estado": "Veracruz", "poblacion": 4618, "lat": 19.2833, "lon": -96.8667, "clave_inegi": "30012", "tipo": "municipio"},
-        "Aquila": {"coords": [18.7833, -97.2333], "estado": "Veracruz", "poblacion": 11846, "lat": 18.7833, "lon": -97.2333, "clave_inegi": "30013", "tipo": "municipio"},
-        "Astacinga": {"coords": [18.5333, -97.0333], "estado": "Veracruz", "poblacion": 8806, "lat": 18.5333, "lon": -97.0333, "clave_inegi": "30014", "tipo": "municipio"},
-        "Atlahuilco": {"coords": [18.7000, -97.0833], "estado": "Veracruz", "poblacion": 10077, "lat": 18.7000, "lon": -97.0833, "clave_inegi": "30015", "tipo": "municipio"},
-        "Atoyac": {"coords": [18.8833, -96.7667], "estado": "Veracruz", "poblacion": 20495, "lat": 18.8833, "lon": -96.7667, "clave_inegi": "30016", "tipo": "municipio"},
-        "Atzacan": {"coords": [18.8833, -97.0833], "estado": "Veracruz", "poblacion": 23432, "lat": 18.8833, "lon": -97.0833, "clave_inegi": "30017", "tipo": "municipio"},
-        "Atzalan": {"coords": [19.9167, -97.1000], "estado": "Veracruz", "poblacion": 65113, "lat": 19.9167, "lon": -97.1000, "clave_inegi": "30018", "tipo": "municipio"},
-        "Ayahualulco": {"coords": [19.4000, -97.2167], "estado": "Veracruz", "poblacion": 25774, "lat": 19.4000, "lon": -97.2167, "clave_inegi": "30019", "tipo": "municipio"},
-        "Banderilla": {"coords": [19.5833, -96.9333], "estado": "Veracruz", "poblacion": 27725, "lat": 19.5833, "lon": -96.9333, "clave_inegi": "30020", "tipo": "municipio"},
-        "Benito Juárez": {"coords": [20.9667, -98.2500], "estado": "Veracruz", "poblacion": 15007, "lat": 20.9667, "lon": -98.2500, "clave_inegi": "30021", "tipo": "municipio"},
-        "Boca del Río": {"coords": [19.1000, -96.1000], "estado": "Veracruz", "poblacion": 156072, "lat": 19.1000, "lon": -96.1000, "clave_inegi": "30022", "tipo": "municipio"},
-        "Calcahualco": {"coords": [19.0833, -97.2000], "estado": "Veracruz", "poblacion": 13912, "lat": 19.0833, "lon": -97.2000, "clave_inegi": "30023", "tipo": "municipio"},
-        "Camerino Z. Mendoza": {"coords": [18.7833, -97.1833], "estado": "Veracruz", "poblacion": 46146, "lat": 18.7833, "lon": -97.1833, "clave_inegi": "30024", "tipo": "municipio"},
-        "Carrillo Puerto": {"coords": [18.8833, -96.5333], "estado": "Veracruz", "poblacion": 18974, "lat": 18.8833, "lon": -96.5333, "clave_inegi": "30025", "tipo": "municipio"},
-        "Catemaco": {"coords": [18.4167, -95.0500], "estado": "Veracruz", "poblacion": 61271, "lat": 18.4167, "lon": -95.0500, "clave_inegi": "30026", "tipo": "municipio"},
-        "Cazones de Herrera": {"coords": [20.7333, -97.1833], "estado": "Veracruz", "poblacion": 25774, "lat": 20.7333, "lon": -97.1833, "clave_inegi": "30027", "tipo": "municipio"},
-        "Cerro Azul": {"coords": [21.1833, -97.7167], "estado": "Veracruz", "poblacion": 27725, "lat": 21.1833, "lon": -97.7167, "clave_inegi": "30028", "tipo": "municipio"},
-        "Citlaltépetl": {"coords": [21.2833, -97.9000], "estado": "Veracruz", "poblacion": 12824, "lat": 21.2833, "lon": -97.9000, "clave_inegi": "30029", "tipo": "municipio"},
-        "Coacoatzintla": {"coords": [19.6833, -96.9167], "estado": "Veracruz", "poblacion": 10077, "lat": 19.6833, "lon": -96.9167, "clave_inegi": "30030", "tipo": "municipio"},
-        "Coahuitlán": {"coords": [20.3500, -97.7333], "estado": "Veracruz", "poblacion": 8806, "lat": 20.3500, "lon": -97.7333, "clave_inegi": "30031", "tipo": "municipio"},
-        "Coatepec": {"coords": [19.4667, -96.9333], "estado": "Veracruz", "poblacion": 98457, "lat": 19.4667, "lon": -96.9333, "clave_inegi": "30032", "tipo": "municipio"},
-        "Coatzacoalcos": {"coords": [18.1500, -94.4333], "estado": "Veracruz", "poblacion": 326759, "lat": 18.1500, "lon": -94.4333, "clave_inegi": "30033", "tipo": "municipio"},
-        "Coatzintla": {"coords": [20.4833, -97.4333], "estado": "Veracruz", "poblacion": 53528, "lat": 20.4833, "lon": -97.4333, "clave_inegi": "30034", "tipo": "municipio"},
-        "Coetzala": {"coords": [18.7667, -96.9833], "estado": "Veracruz", "poblacion": 5304, "lat": 18.7667, "lon": -96.9833, "clave_inegi": "30035", "tipo": "municipio"},
-        "Colipa": {"coords": [19.9167, -96.6500], "estado": "Veracruz", "poblacion": 11326, "lat": 19.9167, "lon": -96.6500, "clave_inegi": "30036", "tipo": "municipio"},
-        "Comapa": {"coords": [19.1667, -96.6833], "estado": "Veracruz", "poblacion": 20495, "lat": 19.1667, "lon": -96.6833, "clave_inegi": "30037", "tipo": "municipio"},
-        "Córdoba": {"coords": [18.8833, -96.9333], "estado": "Veracruz", "poblacion": 213327, "lat": 18.8833, "lon": -96.9333, "clave_inegi": "30038", "tipo": "municipio"},
-        "Cosamaloapan de Carpio": {"coords": [18.1833, -95.7833], "estado": "Veracruz", "poblacion": 58376, "lat": 18.1833, "lon": -95.7833, "clave_inegi": "30039", "tipo": "municipio"},
-        "Cosautlán de Carvajal": {"coords": [19.3333, -96.9000], "estado": "Veracruz", "poblacion": 16040, "lat": 19.3333, "lon": -96.9000, "clave_inegi": "30040", "tipo": "municipio"},
-        "Coscomatepec": {"coords": [19.0500, -97.0333], "estado": "Veracruz", "poblacion": 64324, "lat": 19.0500, "lon": -97.0333, "clave_inegi": "30041", "tipo": "municipio"},
-        "Cosoleacaque": {"coords": [18.0000, -94.5833], "estado": "Veracruz", "poblacion": 118809, "lat": 18.0000, "lon": -94.5833, "clave_inegi": "30042", "tipo": "municipio"},
-        "Cotaxtla": {"coords": [18.8167, -96.3833], "estado": "Veracruz", "poblacion": 25774, "lat": 18.8167, "lon": -96.3833, "clave_inegi": "30043", "tipo": "municipio"},
-        "Coxquihui": {"coords": [20.2667, -97.5500], "estado": "Veracruz", "poblacion": 17855, "lat": 20.2667, "lon": -97.5500, "clave_inegi": "30044", "tipo": "municipio"},
-        "Coyutla": {"coords": [20.3500, -97.6833], "estado": "Veracruz", "poblacion": 23432, "lat": 20.3500, "lon": -97.6833, "clave_inegi": "30045", "tipo": "municipio"},
-        "Cuichapa": {"coords": [18.8000, -96.8833], "estado": "Veracruz", "poblacion": 12824, "lat": 18.8000, "lon": -96.8833, "clave_inegi": "30046", "tipo": "municipio"},
-        "Cuitláhuac": {"coords": [18.8500, -96.7667], "estado": "Veracruz", "poblacion": 33171, "lat": 18.8500, "lon": -96.7667, "clave_inegi": "30047", "tipo": "municipio"},
-        "Chacaltianguis": {"coords": [18.2333, -95.8333], "estado": "Veracruz", "poblacion": 11846, "lat": 18.2333, "lon": -95.8333, "clave_inegi": "30048", "tipo": "municipio"},
-        "Chalma": {"coords": [21.1333, -98.5000], "estado": "Veracruz", "poblacion": 13912, "lat": 21.1333, "lon": -98.5000, "clave_inegi": "30049", "tipo": "municipio"},
-        "Chiconamel": {"coords": [21.2833, -98.3667], "estado": "Veracruz", "poblacion": 12053, "lat": 21.2833, "lon": -98.3667, "clave_inegi": "30050", "tipo": "municipio"},
-        "Chiconquiaco": {"coords": [19.7833, -96.8500], "estado": "Veracruz", "poblacion": 25774, "lat": 19.7833, "lon": -96.8500, "clave_inegi": "30051", "tipo": "municipio"},
-        "Chicontepec": {"coords": [20.9667, -98.1500], "estado": "Veracruz", "poblacion": 65113, "lat": 20.9667, "lon": -98.1500, "clave_inegi": "30052", "tipo": "municipio"},
-        "Chinameca": {"coords": [17.9167, -94.6167], "estado": "Veracruz", "poblacion": 18974, "lat": 17.9167, "lon": -94.6167, "clave_inegi": "30053", "tipo": "municipio"},
-        "Chinampa de Gorostiza": {"coords": [21.4333, -97.7167], "estado": "Veracruz", "poblacion": 18974, "lat": 21.4333, "lon": -97.7167, "clave_inegi": "30054", "tipo": "municipio"},
-        "Las Choapas": {"coords": [17.9333, -94.0667], "estado": "Veracruz", "poblacion": 93901, "lat": 17.9333, "lon": -94.0667, "clave_inegi": "30055", "tipo": "municipio"},
-        "Chocamán": {"coords": [19.0167, -97.0000], "estado": "Veracruz", "poblacion": 21898, "lat": 19.0167, "lon": -97.0000, "clave_inegi": "30056", "tipo": "municipio"},
-        "Chontla": {"coords": [21.2000, -97.8833], "estado": "Veracruz", "poblacion": 15007, "lat": 21.2000, "lon": -97.8833, "clave_inegi": "30057", "tipo": "municipio"},
-        "Chumatlán": {"coords": [20.3000, -97.5833], "estado": "Veracruz", "poblacion": 5304, "lat": 20.3000, "lon": -97.5833, "clave_inegi": "30058", "tipo": "municipio"},
-        "Emiliano Zapata": {"coords": [19.4667, -96.8000], "estado": "Veracruz", "poblacion": 70966, "lat": 19.4667, "lon": -96.8000, "clave_inegi": "30059", "tipo": "municipio"},
-        "Espinal": {"coords": [20.2500, -97.5500], "estado": "Veracruz", "poblacion": 28717, "lat": 20.2500, "lon": -97.5500, "clave_inegi": "30060", "tipo": "municipio"},
-        "Filomeno Mata": {"coords": [20.2333, -97.6833], "estado": "Veracruz", "poblacion": 18974, "lat": 20.2333, "lon": -97.6833, "clave_inegi": "30061", "tipo": "municipio"},
-        "Fortín": {"coords": [18.9000, -97.0000], "estado": "Veracruz", "poblacion": 69167, "lat": 18.9000, "lon": -97.0000, "clave_inegi": "30062", "tipo": "municipio"},
-        "Gutiérrez Zamora": {"coords": [20.4500, -97.0500], "estado": "Veracruz", "poblacion": 33171, "lat": 20.4500, "lon": -97.0500, "clave_inegi": "30063", "tipo": "municipio"},
-        "Hidalgotitlán": {"coords": [17.7667, -94.7000], "estado": "Veracruz", "poblacion": 21898, "lat": 17.7667, "lon": -94.7000, "clave_inegi": "30064", "tipo": "municipio"},
-        "Huayacocotla": {"coords": [20.5833, -98.4167], "estado": "Veracruz", "poblacion": 25774, "lat": 20.5833, "lon": -98.4167, "clave_inegi": "30065", "tipo": "municipio"},
-        "Hueyapan de Ocampo": {"coords": [18.3333, -95.0833], "estado": "Veracruz", "poblacion": 43534, "lat": 18.3333, "lon": -95.0833, "clave_inegi": "30066", "tipo": "municipio"},
-        "Huiloapan de Cuauhtémoc": {"coords": [18.8167, -97.1000], "estado": "Veracruz", "poblacion": 8806, "lat": 18.8167, "lon": -97.1000, "clave_inegi": "30067", "tipo": "municipio"},
-        "Ignacio de la Llave": {"coords": [18.8167, -96.0667], "estado": "Veracruz", "poblacion": 17855, "lat": 18.8167, "lon": -96.0667, "clave_inegi": "30068", "tipo": "municipio"},
-        "Ilamatlán": {"coords": [20.7333, -98.4167], "estado": "Veracruz", "poblacion": 11326, "lat": 20.7333, "lon": -98.4167, "clave_inegi": "30069", "tipo": "municipio"},
-        "Isla": {"coords": [18.0000, -95.5333], "estado": "Veracruz", "poblacion": 46146, "lat": 18.0000, "lon": -95.5333, "clave_inegi": "30070", "tipo": "municipio"},
-        "Ixcatepec": {"coords": [21.0833, -97.8667], "estado": "Veracruz", "poblacion": 16040, "lat": 21.0833, "lon": -97.8667, "clave_inegi": "30071", "tipo": "municipio"},
-        "Ixhuatlán del Café": {"coords": [18.9167, -96.9833], "estado": "Veracruz", "poblacion": 25774, "lat": 18.9167, "lon": -96.9833, "clave_inegi": "30072", "tipo": "municipio"},
-        "Ixhuatlán de Madero": {"coords": [20.7833, -97.9833], "estado": "Veracruz", "poblacion": 47585, "lat": 20.7833, "lon": -97.9833, "clave_inegi": "30073", "tipo": "municipio"},
-        "Ixhuatlán del Sureste": {"coords": [18.0667, -94.5500], "estado": "Veracruz", "poblacion": 25774, "lat": 18.0667, "lon": -94.5500, "clave_inegi": "30074", "tipo": "municipio"},
-        "Ixmatlahuacan": {"coords": [18.4333, -95.9333], "estado": "Veracruz", "poblacion": 12053, "lat": 18.4333, "lon": -95.9333, "clave_inegi": "30075", "tipo": "municipio"},
-        "Ixtaczoquitlán": {"coords": [18.8833, -97.0500], "estado": "Veracruz", "poblacion": 74004, "lat": 18.8833, "lon": -97.0500, "clave_inegi": "30076", "tipo": "municipio"},
-        "Jalacingo": {"coords": [19.7667, -97.3000], "estado": "Veracruz", "poblacion": 46794, "lat": 19.7667, "lon": -97.3000, "clave_inegi": "30077", "tipo": "municipio"},
-        "Xalapa": {"coords": [19.5333, -96.9167], "estado": "Veracruz", "poblacion": 488532, "lat": 19.5333, "lon": -96.9167, "clave_inegi": "30078", "tipo": "municipio"},
-        "Xico": {"coords": [19.4167, -97.0000], "estado": "Veracruz", "poblacion": 36929, "lat": 19.4167, "lon": -97.0000, "clave_inegi": "30079", "tipo": "municipio"},
-        "Xoxocotla": {"coords": [18.6667, -97.1167], "estado": "Veracruz", "poblacion": 12053, "lat": 18.6667, "lon": -97.1167, "clave_inegi": "30080", "tipo": "municipio"},
-        "Yanga": {"coords": [18.8833, -96.7667], "estado": "Veracruz", "poblacion": 18367, "lat": 18.8833, "lon": -96.7667, "clave_inegi": "30081", "tipo": "municipio"},
-        "Yecuatla": {"coords": [19.8833, -96.8667], "estado": "Veracruz", "poblacion": 13000, "lat": 19.8833, "lon": -96.8667, "clave_inegi": "30082", "tipo": "municipio"},
-        "Zacualpan": {"coords": [20.6000, -98.3667], "estado": "Veracruz", "poblacion": 8245, "lat": 20.6000, "lon": -98.3667, "clave_inegi": "30083", "tipo": "municipio"},
-        "Zaragoza": {"coords": [17.9500, -94.7000], "estado": "Veracruz", "poblacion": 14000, "lat": 17.9500, "lon": -94.7000, "clave_inegi": "30084", "tipo": "municipio"},
-        "Zongolica": {"coords": [18.6667, -97.0333], "estado": "Veracruz", "poblacion": 45956, "lat": 18.6667, "lon": -97.0333, "clave_inegi": "30085", "tipo": "municipio"},
-        "Zontecomatlán de López y Fuentes": {"coords": [20.9167, -98.1500], "estado": "Veracruz", "poblacion": 12800, "lat": 20.9167, "lon": -98.1500, "clave_inegi": "30086", "tipo": "municipio"},
-        "Zozocolco de Hidalgo": {"coords": [20.1500, -97.5500], "estado": "Veracruz", "poblacion": 15007, "lat": 20.1500, "lon": -97.5500, "clave_inegi": "30087", "tipo": "municipio"},
-        "Agua Dulce": {"coords": [18.0667, -94.1333], "estado": "Veracruz", "poblacion": 55966, "lat": 18.0667, "lon": -94.1333, "clave_inegi": "30088", "tipo": "municipio"},
-        "José Azueta": {"coords": [18.0667, -95.6833], "estado": "Veracruz", "poblacion": 26000, "lat": 18.0667, "lon": -95.6833, "clave_inegi": "30089", "tipo": "municipio"},
-        "Juan Rodríguez Clara": {"coords": [18.0000, -95.4000], "estado": "Veracruz", "poblacion": 38367, "lat": 18.0000, "lon": -95.4000, "clave_inegi": "30090", "tipo": "municipio"},
-        "Jilotepec": {"coords": [19.5833, -96.9500], "estado": "Veracruz", "poblacion": 26000, "lat": 19.5833, "lon": -96.9500, "clave_inegi": "30091", "tipo": "municipio"},
-        "Ixhuacán de los Reyes": {"coords": [19.3333, -97.0833], "estado": "Veracruz", "poblacion": 9000, "lat": 19.3333, "lon": -97.0833, "clave_inegi": "30092", "tipo": "municipio"},
-        "Perote": {"coords": [19.5500, -97.2333], "estado": "Veracruz", "poblacion": 77000, "lat": 19.5500, "lon": -97.2333, "clave_inegi": "30093", "tipo": "municipio"},
-        "Landero y Coss": {"coords": [19.8167, -96.9667], "estado": "Veracruz", "poblacion": 1700, "lat": 19.8167, "lon": -96.9667, "clave_inegi": "30094", "tipo": "municipio"},
-        "Las Minas": {"coords": [19.6833, -97.0167], "estado": "Veracruz", "poblacion": 3000, "lat": 19.6833, "lon": -97.0167, "clave_inegi": "30095", "tipo": "municipio"},
-        "Ozuluama de Mascareñas": {"coords": [21.6833, -97.8833], "estado": "Veracruz", "poblacion": 24000, "lat": 21.6833, "lon": -97.8833, "clave_inegi": "30096", "tipo": "municipio"},
-        "Naranjos Amatlán": {"coords": [21.1833, -97.7167], "estado": "Veracruz", "poblacion": 28000, "lat": 21.1833, "lon": -97.7167, "clave_inegi": "30097", "tipo": "municipio"},
-        "Tantoyuca": {"coords": [21.3667, -98.3667], "estado": "Veracruz", "poblacion": 100000, "lat": 21.3667, "lon": -98.3667, "clave_inegi": "30098", "tipo": "municipio"},
-        "Castillo de Teayo": {"coords": [20.7333, -97.5667], "estado": "Veracruz", "poblacion": 17000, "lat": 20.7333, "lon": -97.5667, "clave_inegi": "30099", "tipo": "municipio"},
-        "Cazones de Herrera": {"coords": [20.7333, -97.1833], "estado": "Veracruz", "poblacion": 24000, "lat": 20.7333, "lon": -97.1833, "clave_inegi": "30100", "tipo": "municipio"},
-        "Gutiérrez Zamora": {"coords": [20.4500, -97.0500], "estado": "Veracruz", "poblacion": 33000, "lat": 20.4500, "lon": -97.0500, "clave_inegi": "30101", "tipo": "municipio"},
-        "Martínez de la Torre": {"coords": [20.5833, -97.0500], "estado": "Veracruz", "poblacion": 106000, "lat": 20.5833, "lon": -97.0500, "clave_inegi": "30102", "tipo": "municipio"},
-        "San Rafael": {"coords": [20.0833, -96.9000], "estado": "Veracruz", "poblacion": 30000, "lat": 20.0833, "lon": -96.9000, "clave_inegi": "30103", "tipo": "municipio"},
-        "Tlapacoyan": {"coords": [20.0167, -97.1167], "estado": "Veracruz", "poblacion": 55000, "lat": 20.0167, "lon": -97.1167, "clave_inegi": "30104", "tipo": "municipio"},
-        "Misantla": {"coords": [19.9333, -96.8667], "estado": "Veracruz", "poblacion": 67000, "lat": 19.9333, "lon": -96.8667, "clave_inegi": "30105", "tipo": "municipio"},
-        "Nautla": {"coords": [20.1833, -96.8167], "estado": "Veracruz", "poblacion": 11000, "lat": 20.1833, "lon": -96.8167, "clave_inegi": "30106", "tipo": "municipio"},
-        "Vega de Alatorre": {"coords": [20.0667, -96.7667], "estado": "Veracruz", "poblacion": 20000, "lat": 20.0667, "lon": -96.7667, "clave_inegi": "30107", "tipo": "municipio"},
-        "Juchique de Ferrer": {"coords": [19.7833, -96.7167], "estado": "Veracruz", "poblacion": 12000, "lat": 19.7833, "lon": -96.7167, "clave_inegi": "30108", "tipo": "municipio"},
-        "Alto Lucero de Gutiérrez Barrios": {"coords": [19.6667, -96.7500], "estado": "Veracruz", "poblacion": 31000, "lat": 19.6667, "lon": -96.7500, "clave_inegi": "30109", "tipo": "municipio"},
-        "Actopan": {"coords": [19.4667, -96.5833], "estado": "Veracruz", "poblacion": 40000, "lat": 19.4667, "lon": -96.5833, "clave_inegi": "30110", "tipo": "municipio"},
-        "Emiliano Zapata": {"coords": [19.4667, -96.8000], "estado": "Veracruz", "poblacion": 70966, "lat": 19.4667, "lon": -96.8000, "clave_inegi": "30111", "tipo": "municipio"},
-        "La Antigua": {"coords": [19.3667, -96.3833], "estado": "Veracruz", "poblacion": 25000, "lat": 19.3667, "lon": -96.3833, "clave_inegi": "30112", "tipo": "municipio"},
-        "Paso de Ovejas": {"coords": [19.2667, -96.4833], "estado": "Veracruz", "poblacion": 33000, "lat": 19.2667, "lon": -96.4833, "clave_inegi": "30113", "tipo": "municipio"},
-        "Puente Nacional": {"coords": [19.3333, -96.5833], "estado": "Veracruz", "poblacion": 43000, "lat": 19.3333, "lon": -96.5833, "clave_inegi": "30114", "tipo": "municipio"},
-        "Úrsulo Galván": {"coords": [19.4333, -96.3167], "estado": "Veracruz", "poblacion": 18000, "lat": 19.4333, "lon": -96.3167, "clave_inegi": "30115", "tipo": "municipio"},
-        "Boca del Río": {"coords": [19.1000, -96.1000], "estado": "Veracruz", "poblacion": 156072, "lat": 19.1000, "lon": -96.1000, "clave_inegi": "30116", "tipo": "municipio"},
-        "Veracruz": {"coords": [19.2000, -96.1667], "estado": "Veracruz", "poblacion": 607209, "lat": 19.2000, "lon": -96.1667, "clave_inegi": "30117", "tipo": "municipio"},
-        "Medellín": {"coords": [19.0500, -96.1500], "estado": "Veracruz", "poblacion": 80000, "lat": 19.0500, "lon": -96.1500, "clave_inegi": "30118", "tipo": "municipio"},
-        "Jamapa": {"coords": [19.1000, -96.2500], "estado": "Veracruz", "poblacion": 11000, "lat": 19.1000, "lon": -96.2500, "clave_inegi": "30119", "tipo": "municipio"},
-        "Manlio Fabio Altamirano": {"coords": [19.0667, -96.3167], "estado": "Veracruz", "poblacion": 25000, "lat": 19.0667, "lon": -96.3167, "clave_inegi": "30120", "tipo": "municipio"},
-        "Cotaxtla": {"coords": [18.8167, -96.3833], "estado": "Veracruz", "poblacion": 25000, "lat": 18.8167, "lon": -96.3833, "clave_inegi": "30121", "tipo": "municipio"},
-        "Tlalixcoyan": {"coords": [18.8833, -96.2000], "estado": "Veracruz", "poblacion": 41000, "lat": 18.8833, "lon": -96.2000, "clave_inegi": "30122", "tipo": "municipio"},
-        "Ignacio de la Llave": {"coords": [18.8167, -96.0667], "estado": "Veracruz", "poblacion": 18000, "lat": 18.8167, "lon": -96.0667, "clave_inegi": "30123", "tipo": "municipio"},
-        "Alvarado": {"coords": [18.7667, -95.7667], "estado": "Veracruz", "poblacion": 54000, "lat": 18.7667, "lon": -95.7667, "clave_inegi": "30124", "tipo": "municipio"},
-        "Acula": {"coords": [18.5833, -95.6667], "estado": "Veracruz", "poblacion": 7766, "lat": 18.5833, "lon": -95.6667, "clave_inegi": "30125", "tipo": "municipio"},
-        "Amatitlán": {"coords": [18.3500, -95.7500], "estado": "Veracruz", "poblacion": 8806, "lat": 18.3500, "lon": -95.7500, "clave_inegi": "30126", "tipo": "municipio"},
-        "Tlacotalpan": {"coords": [18.6000, -95.6667], "estado": "Veracruz", "poblacion": 8000, "lat": 18.6000, "lon": -95.6667, "clave_inegi": "30127", "tipo": "municipio"},
-        "Carlos A. Carrillo": {"coords": [18.3833, -95.7667], "estado": "Veracruz", "poblacion": 25000, "lat": 18.3833, "lon": -95.7667, "clave_inegi": "30128", "tipo": "municipio"},
-        "Chacaltianguis": {"coords": [18.2333, -95.8333], "estado": "Veracruz", "poblacion": 11846, "lat": 18.2333, "lon": -95.8333, "clave_inegi": "30129", "tipo": "municipio"},
-        "Cosamaloapan de Carpio": {"coords": [18.1833, -95.7833], "estado": "Veracruz", "poblacion": 58376, "lat": 18.1833, "lon": -95.7833, "clave_inegi": "30130", "tipo": "municipio"},
-        "Ixmatlahuacan": {"coords": [18.4333, -95.9333], "estado": "Veracruz", "poblacion": 12053, "lat": 18.4333, "lon": -95.9333, "clave_inegi": "30131", "tipo": "municipio"},
-        "Otatitlán": {"coords": [18.2000, -96.0000], "estado": "Veracruz", "poblacion": 10000, "lat": 18.2000, "lon": -96.0000, "clave_inegi": "30132", "tipo": "municipio"},
-        "Tlacojalpan": {"coords": [18.2333, -95.9167], "estado": "Veracruz", "poblacion": 5000, "lat": 18.2333, "lon": -95.9167, "clave_inegi": "30133", "tipo": "municipio"},
-        "Tuxtilla": {"coords": [18.1833, -95.9167], "estado": "Veracruz", "poblacion": 2000, "lat": 18.1833, "lon": -95.9167, "clave_inegi": "30134", "tipo": "municipio"},
-        "Tres Valles": {"coords": [18.2667, -96.1500], "estado": "Veracruz", "poblacion": 48000, "lat": 18.2667, "lon": -96.1500, "clave_inegi": "30135", "tipo": "municipio"},
-        "Tierra Blanca": {"coords": [18.6333, -96.3333], "estado": "Veracruz", "poblacion": 98000, "lat": 18.6333, "lon": -96.3333, "clave_inegi": "30136", "tipo": "municipio"},
-        "Omealca": {"coords": [18.7833, -96.5833], "estado": "Veracruz", "poblacion": 27000, "lat": 18.7833, "lon": -96.5833, "clave_inegi": "30137", "tipo": "municipio"},
-        "Cuichapa": {"coords": [18.8000, -96.8833], "estado": "Veracruz", "poblacion": 12000, "lat": 18.8000, "lon": -96.8833, "clave_inegi": "30138", "tipo": "municipio"},
-        "Cuitláhuac": {"coords": [18.8500, -96.7667], "estado": "Veracruz", "poblacion": 33000, "lat": 18.8500, "lon": -96.7667, "clave_inegi": "30139", "tipo": "municipio"},
-        "Tezonapa": {"coords": [18.5833, -96.7833], "estado": "Veracruz", "poblacion": 50000, "lat": 18.5833, "lon": -96.7833, "clave_inegi": "30140", "tipo": "municipio"},
-        "Coscomatepec": {"coords": [19.0500, -97.0333], "estado": "Veracruz", "poblacion": 64324, "lat": 19.0500, "lon": -97.0333, "clave_inegi": "30141", "tipo": "municipio"},
-        "Chocamán": {"coords": [19.0167, -97.0000], "estado": "Veracruz", "poblacion": 21898, "lat": 19.0167, "lon": -97.0000, "clave_inegi": "30142", "tipo": "municipio"},
-        "Huatusco": {"coords": [19.1333, -96.9667], "estado": "Veracruz", "poblacion": 58000, "lat": 19.1333, "lon": -96.9667, "clave_inegi": "30143", "tipo": "municipio"},
-        "Zentla": {"coords": [19.1333, -96.7333], "estado": "Veracruz", "poblacion": 14000, "lat": 19.1333, "lon": -96.7333, "clave_inegi": "30144", "tipo": "municipio"},
-        "Comapa": {"coords": [19.1667, -96.6833], "estado": "Veracruz", "poblacion": 20495, "lat": 19.1667, "lon": -96.6833, "clave_inegi": "30145", "tipo": "municipio"},
-        "Paso del Macho": {"coords": [18.9667, -96.7667], "estado": "Veracruz", "poblacion": 33000, "lat": 18.9667, "lon": -96.7667, "clave_inegi": "30146", "tipo": "municipio"},
-        "Camarón de Tejeda": {"coords": [19.0333, -96.6333], "estado": "Veracruz", "poblacion": 6000, "lat": 19.0333, "lon": -96.6333, "clave_inegi": "30147", "tipo": "municipio"},
-        "Atoyac": {"coords": [18.8833, -96.7667], "estado": "Veracruz", "poblacion": 20495, "lat": 18.8833, "lon": -96.7667, "clave_inegi": "30148", "tipo": "municipio"},
-        "Tepatlaxco": {"coords": [19.0833, -96.8667], "estado": "Veracruz", "poblacion": 12000, "lat": 19.0833, "lon": -96.8667, "clave_inegi": "30149", "tipo": "municipio"},
-        "Soledad de Doblado": {"coords": [19.0000, -96.4333], "estado": "Veracruz", "poblacion": 33000, "lat": 19.0000, "lon": -96.4333, "clave_inegi": "30150", "tipo": "municipio"},
-        "Tamiahua": {"coords": [21.2000, -97.4833], "estado": "Veracruz", "poblacion": 21902, "lat": 21.2000, "lon": -97.4833, "clave_inegi": "30151", "tipo": "municipio"},
-        "Tampico Alto": {"coords": [22.0833, -97.4667], "estado": "Veracruz", "poblacion": 11489, "lat": 22.0833, "lon": -97.4667, "clave_inegi": "30152", "tipo": "municipio"},
-        "Tancoco": {"coords": [20.9667, -97.4667], "estado": "Veracruz", "poblacion": 10750, "lat": 20.9667, "lon": -97.4667, "clave_inegi": "30153", "tipo": "municipio"},
-        "Tantima": {"coords": [21.1833, -97.4333], "estado": "Veracruz", "poblacion": 9996, "lat": 21.1833, "lon": -97.4333, "clave_inegi": "30154", "tipo": "municipio"},
-        "Tantoyuca": {"coords": [21.1667, -98.2333], "estado": "Veracruz", "poblacion": 97951, "lat": 21.1667, "lon": -98.2333, "clave_inegi": "30155", "tipo": "municipio"},
-        "Tatahuicapan de Juárez": {"coords": [18.3500, -94.8000], "estado": "Veracruz", "poblacion": 15312, "lat": 18.3500, "lon": -94.8000, "clave_inegi": "30156", "tipo": "municipio"},
-        "Castillo de Teayo": {"coords": [20.9167, -97.6000], "estado": "Veracruz", "poblacion": 18743, "lat": 20.9167, "lon": -97.6000, "clave_inegi": "30157", "tipo": "municipio"},
-        "Tecolutla": {"coords": [20.4667, -97.0000], "estado": "Veracruz", "poblacion": 22238, "lat": 20.4667, "lon": -97.0000, "clave_inegi": "30158", "tipo": "municipio"},
-        "Tehuipango": {"coords": [18.5500, -97.0667], "estado": "Veracruz", "poblacion": 24191, "lat": 18.5500, "lon": -97.0667, "clave_inegi": "30159", "tipo": "municipio"},
-        "Álamo Temapache": {"coords": [20.9000, -97.6500], "estado": "Veracruz", "poblacion": 105372, "lat": 20.9000, "lon": -97.6500, "clave_inegi": "30160", "tipo": "municipio"},
-        "Temapache": {"coords": [20.8167, -97.7167], "estado": "Veracruz", "poblacion": 20000, "lat": 20.8167, "lon": -97.7167, "clave_inegi": "30160_L"},
-        "Tempoal": {"coords": [21.4333, -98.3667], "estado": "Veracruz", "poblacion": 113000, "lat": 21.4333, "lon": -98.3667, "clave_inegi": "30161", "tipo": "municipio"},
-        "Tenampa": {"coords": [19.3833, -96.8833], "estado": "Veracruz", "poblacion": 6500, "lat": 19.3833, "lon": -96.8833, "clave_inegi": "30162", "tipo": "municipio"},
-        "Tenochtitlán": {"coords": [19.9833, -96.8333], "estado": "Veracruz", "poblacion": 5000, "lat": 19.9833, "lon": -96.8333, "clave_inegi": "30163", "tipo": "municipio"},
-        "Teocelo": {"coords": [19.3667, -96.9500], "estado": "Veracruz", "poblacion": 15000, "lat": 19.3667, "lon": -96.9500, "clave_inegi": "30164", "tipo": "municipio"},
-        "Tepetlán": {"coords": [19.6833, -96.9667], "estado": "Veracruz", "poblacion": 10000, "lat": 19.6833, "lon": -96.9667, "clave_inegi": "30165", "tipo": "municipio"},
-        "Tepetzintla": {"coords": [21.0833, -97.8000], "estado": "Veracruz", "poblacion": 15500, "lat": 21.0833, "lon": -97.8000, "clave_inegi": "30166", "tipo": "municipio"},
-        "Tequila": {"coords": [18.7333, -97.0500], "estado": "Veracruz", "poblacion": 22119, "lat": 18.7333, "lon": -97.0500, "clave_inegi": "30167", "tipo": "municipio"},
-        "Texcatepec": {"coords": [20.6667, -98.3333], "estado": "Veracruz", "poblacion": 10500, "lat": 20.6667, "lon": -98.3333, "clave_inegi": "30168", "tipo": "municipio"},
-        "Texhuacán": {"coords": [18.6667, -97.0000], "estado": "Veracruz", "poblacion": 9000, "lat": 18.6667, "lon": -97.0000, "clave_inegi": "30169", "tipo": "municipio"},
-        "Texistepec": {"coords": [17.8667, -94.7000], "estado": "Veracruz", "poblacion": 21674, "lat": 17.8667, "lon": -94.7000, "clave_inegi": "30170", "tipo": "municipio"},
-        "Tezontepec de Aldama": {"coords": [20.0833, -99.2333], "estado": "Hidalgo", "poblacion": 50000, "lat": 20.0833, "lon": -99.2333, "clave_inegi": "13066", "tipo": "municipio"},
-        "Tierra Blanca": {"coords": [18.4500, -96.3500], "estado": "Veracruz", "poblacion": 97000, "lat": 18.4500, "lon": -96.3500, "clave_inegi": "30171", "tipo": "municipio"},
-        "Tihuatlán": {"coords": [20.7000, -97.5500], "estado": "Veracruz", "poblacion": 88000, "lat": 20.7000, "lon": -97.5500, "clave_inegi": "30172", "tipo": "municipio"},
-        "Tlachichilco": {"coords": [20.7500, -98.2667], "estado": "Veracruz", "poblacion": 10500, "lat": 20.7500, "lon": -98.2667, "clave_inegi": "30173", "tipo": "municipio"},
-        "Tlacojalpan": {"coords": [18.3500, -95.8333], "estado": "Veracruz", "poblacion": 5500, "lat": 18.3500, "lon": -95.8333, "clave_inegi": "30174", "tipo": "municipio"},
-        "Tlacolulan": {"coords": [19.6500, -97.0000], "estado": "Veracruz", "poblacion": 10000, "lat": 19.6500, "lon": -97.0000, "clave_inegi": "30175", "tipo": "municipio"},
-        "Tlacotalpan": {"coords": [18.6000, -95.6667], "estado": "Veracruz", "poblacion": 12800, "lat": 18.6000, "lon": -95.6667, "clave_inegi": "30176", "tipo": "municipio"},
-        "Tlacotepec de Mejía": {"coords": [19.2667, -96.7667], "estado": "Veracruz", "poblacion": 6500, "lat": 19.2667, "lon": -96.7667, "clave_inegi": "30177", "tipo": "municipio"},
-        "Tlalixcoyan": {"coords": [18.8167, -96.1833], "estado": "Veracruz", "poblacion": 37000, "lat": 18.8167, "lon": -96.1833, "clave_inegi": "30178", "tipo": "municipio"},
-        "Tlalnelhuayocan": {"coords": [19.5500, -96.9833], "estado": "Veracruz", "poblacion": 25000, "lat": 19.5500, "lon": -96.9833, "clave_inegi": "30179", "tipo": "municipio"},
-        "Tlaltetela": {"coords": [19.3000, -96.8833], "estado": "Veracruz", "poblacion": 18500, "lat": 19.3000, "lon": -96.8833, "clave_inegi": "30180", "tipo": "municipio"},
-        "Tlapacoyan": {"coords": [20.0333, -97.0000], "estado": "Veracruz", "poblacion": 60000, "lat": 20.0333, "lon": -97.0000, "clave_inegi": "30181", "tipo": "municipio"},
-        "Tlaquilpa": {"coords": [18.6500, -97.0833], "estado": "Veracruz", "poblacion": 7000, "lat": 18.6500, "lon": -97.0833, "clave_inegi": "30182", "tipo": "municipio"},
-        "Tlilapan": {"coords": [18.8000, -97.0667], "estado": "Veracruz", "poblacion": 10000, "lat": 18.8000, "lon": -97.0667, "clave_inegi": "30183", "tipo": "municipio"},
-        "Tomatlán": {"coords": [18.9833, -96.9500], "estado": "Veracruz", "poblacion": 12000, "lat": 18.9833, "lon": -96.9500, "clave_inegi": "30184", "tipo": "municipio"},
-        "Tonayán": {"coords": [19.6833, -96.9167], "estado": "Veracruz", "poblacion": 6500, "lat": 19.6833, "lon": -96.9167, "clave_inegi": "30185", "tipo": "municipio"},
-        "Totutla": {"coords": [19.2333, -96.9000], "estado": "Veracruz", "poblacion": 20000, "lat": 19.2333, "lon": -96.9000, "clave_inegi": "30186", "tipo": "municipio"},
-        "Tuxpan": {"coords": [20.9500, -97.4000], "estado": "Veracruz", "poblacion": 154000, "lat": 20.9500, "lon": -97.4000, "clave_inegi": "30187", "tipo": "municipio"},
-        "Tuxtilla": {"coords": [18.1500, -95.6333], "estado": "Veracruz", "poblacion": 4000, "lat": 18.1500, "lon": -95.6333, "clave_inegi": "30188", "tipo": "municipio"},
-        "Ursulo Galván": {"coords": [19.3833, -96.3833], "estado": "Veracruz", "poblacion": 25000, "lat": 19.3833, "lon": -96.3833, "clave_inegi": "30189", "tipo": "municipio"},
-        "Vega de Alatorre": {"coords": [20.0167, -96.6500], "estado": "Veracruz", "poblacion": 20000, "lat": 20.0167, "lon": -96.6500, "clave_inegi": "30190", "tipo": "municipio"},
-        "Veracruz": {"coords": [19.2000, -96.1500], "estado": "Veracruz", "poblacion": 600000, "lat": 19.2000, "lon": -96.1500, "clave_inegi": "30191", "tipo": "municipio"},
-        "Villa Aldama": {"coords": [19.6167, -97.3167], "estado": "Veracruz", "poblacion": 20000, "lat": 19.6167, "lon": -97.3167, "clave_inegi": "30192", "tipo": "municipio"},
-        "Xico": {"coords": [19.4167, -96.9833], "estado": "Veracruz", "poblacion": 36000, "lat": 19.4167, "lon": -96.9833, "clave_inegi": "30193", "tipo": "municipio"},
-        "Xoxocotla": {"coords": [18.7000, -97.0500], "estado": "Veracruz", "poblacion": 25000, "lat": 18.7000, "lon": -97.0500, "clave_inegi": "30194", "tipo": "municipio"},
-        "Yanga": {"coords": [18.8833, -96.8333], "estado": "Veracruz", "poblacion": 18000, "lat": 18.8833, "lon": -96.8333, "clave_inegi": "30195", "tipo": "municipio"},
-        "Yecuatla": {"coords": [19.8667, -96.8000], "estado": "Veracruz", "poblacion": 12000, "lat": 19.8667, "lon": -96.8000, "clave_inegi": "30196", "tipo": "municipio"},
-        "Zacualpan": {"coords": [20.7500, -98.2667], "estado": "Veracruz", "poblacion": 10000, "lat": 20.7500, "lon": -98.2667, "clave_inegi": "30197", "tipo": "municipio"},
-        "Zaragoza": {"coords": [17.9500, -94.7500], "estado": "Veracruz", "poblacion": 20000, "lat": 17.9500, "lon": -94.7500, "clave_inegi": "30198", "tipo": "municipio"},
-        "Zentla": {"coords": [19.1000, -96.7500], "estado": "Veracruz", "poblacion": 12000, "lat": 19.1000, "lon": -96.7500, "clave_inegi": "30199", "tipo": "municipio"},
-        "Zongolica": {"coords": [18.6667, -97.0000], "estado": "Veracruz", "poblacion": 50000, "lat": 18.6667, "lon": -97.0000, "clave_inegi": "30200", "tipo": "municipio"},
-        "Zontecomatlán de López y Fuentes": {"coords": [20.7667, -98.2667], "estado": "Veracruz", "poblacion": 12000, "lat": 20.7667, "lon": -98.2667, "clave_inegi": "30201", "tipo": "municipio"},
-        "Zozocolco de Hidalgo": {"coords": [20.2500, -97.4333], "estado": "Veracruz", "poblacion": 15000, "lat": 20.2500, "lon": -97.4333, "clave_inegi": "30202", "tipo": "municipio"},
-        "Agua Dulce": {"coords": [18.0000, -94.1333], "estado": "Veracruz", "poblacion": 53800, "lat": 18.0000, "lon": -94.1333, "clave_inegi": "30203", "tipo": "municipio"},
-        "El Higo": {"coords": [22.0667, -98.3833], "estado": "Veracruz", "poblacion": 20000, "lat": 22.0667, "lon": -98.3833, "clave_inegi": "30204", "tipo": "municipio"},
-        "Nanchital de Lázaro Cárdenas del Río": {"coords": [18.0667, -94.4000], "estado": "Veracruz", "poblacion": 46000, "lat": 18.0667, "lon": -94.4000, "clave_inegi": "30205", "tipo": "municipio"},
-        "Tres Valles": {"coords": [18.2333, -96.0667], "estado": "Veracruz", "poblacion": 45000, "lat": 18.2333, "lon": -96.0667, "clave_inegi": "30206", "tipo": "municipio"},
-        "Carlos A. Carrillo": {"coords": [18.0833, -95.7333], "estado": "Veracruz", "poblacion": 25000, "lat": 18.0833, "lon": -95.7333, "clave_inegi": "30207", "tipo": "municipio"},
-        "Tatahuicapan de Juárez": {"coords": [18.3500, -94.8000], "estado": "Veracruz", "poblacion": 15312, "lat": 18.3500, "lon": -94.8000, "clave_inegi": "30208", "tipo": "municipio"},
-        "Jáltipan": {"coords": [17.9833, -94.7333], "estado": "Veracruz", "poblacion": 60000, "lat": 17.9833, "lon": -94.7333, "clave_inegi": "30209", "tipo": "municipio"},
-        "Playa Vicente": {"coords": [17.8333, -95.6000], "estado": "Veracruz", "poblacion": 38000, "lat": 17.8333, "lon": -95.6000, "clave_inegi": "30210", "tipo": "municipio"},
-        "Chontla": {"coords": [21.5000, -97.9167], "estado": "Veracruz", "poblacion": 15000, "lat": 21.5000, "lon": -97.9167, "clave_inegi": "30211", "tipo": "municipio"},
-        "Santiago Sochiapan": {"coords": [17.6167, -95.6500], "estado": "Veracruz", "poblacion": 13062, "lat": 17.6167, "lon": -95.6500, "clave_inegi": "30212", "tipo": "municipio"},
-    },
-    "Quintana Roo": {
-        "Othón P. Blanco": {"coords": [18.5000, -88.3000], "estado": "Quintana Roo", "poblacion": 233648, "lat": 18.5000, "lon": -88.3000, "clave_inegi": "23001", "tipo": "municipio"},
-        "Benito Juárez": {"coords": [21.1667, -86.8333], "estado": "Quintana Roo", "poblacion": 911503, "lat": 21.1667, "lon": -86.8333, "clave_inegi": "23002", "tipo": "municipio"},
-        "Cozumel": {"coords": [20.4500, -86.9667], "estado": "Quintana Roo", "poblacion": 88626, "lat": 20.4500, "lon": -86.9667, "clave_inegi": "23003", "tipo": "municipio"},
-        "Felipe Carrillo Puerto": {"coords": [19.5833, -88.0500], "estado": "Quintana Roo", "poblacion": 83990, "lat": 19.5833, "lon": -88.0500, "clave_inegi": "23004", "tipo": "municipio"},
-        "Isla Mujeres": {"coords": [21.2333, -86.7333], "estado": "Quintana Roo", "poblacion": 22686, "lat": 21.2333, "lon": -86.7333, "clave_inegi": "23005", "tipo": "municipio"},
-        "José María Morelos": {"coords": [19.7833, -89.0167], "estado": "Quintana Roo", "poblacion": 39686, "lat": 19.7833, "lon": -89.0167, "clave_inegi": "23006", "tipo": "municipio"},
-        "Lázaro Cárdenas": {"coords": [21.0833, -87.4167], "estado": "Quintana Roo", "poblacion": 29177, "lat": 21.0833, "lon": -87.4167, "clave_inegi": "23007", "tipo": "municipio"},
-        "Solidaridad": {"coords": [20.6247, -87.0792], "estado": "Quintana Roo", "poblacion": 333800, "lat": 20.6247, "lon": -87.0792, "clave_inegi": "23008", "tipo": "municipio"},
-        "Tulum": {"coords": [20.2167, -87.4667], "estado": "Quintana Roo", "poblacion": 46721, "lat": 20.2167, "lon": -87.4667, "clave_inegi": "23009", "tipo": "municipio"},
-        "Bacalar": {"coords": [18.6667, -88.3833], "estado": "Quintana Roo", "poblacion": 41747, "lat": 18.6667, "lon": -88.3833, "clave_inegi": "23010", "tipo": "municipio"},
-        "Puerto Morelos": {"coords": [20.8500, -86.8792], "estado": "Quintana Roo", "poblacion": 26921, "lat": 20.8500, "lon": -86.8792, "clave_inegi": "23011", "tipo": "municipio"}
-    },
-    "Sinaloa": {
-        "Culiacán": {"coords": [24.8091, -107.3940], "estado": "Sinaloa", "poblacion": 785000, "lat": 24.8091, "lon": -107.3940, "tipo": "capital"},
-        "Los Mochis": {"coords": [25.7896, -108.9440], "estado": "Sinaloa", "poblacion": 250000, "lat": 25.7896, "lon": -108.9440, "tipo": "municipio"},
-        "Guasave": {"coords": [25.5667, -108.4667], "estado": "Sinaloa", "poblacion": 250000, "lat": 25.5667, "lon": -108.4667, "tipo": "municipio"},
-        "Navolato": {"coords": [24.6989, -107.8825], "estado": "Sinaloa", "poblacion": 87000, "lat": 24.6989, "lon": -107.8825, "tipo": "municipio"},
-        "Mazatlán": {"coords": [23.2494, -106.4111], "estado": "Sinaloa", "poblacion": 438000, "lat": 23.2494, "lon": -106.4111, "tipo": "municipio"}
-    },
-    "Sonora": {
-        "Hermosillo": {"coords": [29.0729, -110.9559], "estado": "Sonora", "poblacion": 855000, "lat": 29.0729, "lon": -110.9559, "tipo": "capital"},
-        "Nogales": {"coords": [31.3333, -110.9396], "estado": "Sonora", "poblacion": 220000, "lat": 31.3333, "lon": -110.9396, "tipo": "municipio"},
-        "Guaymas": {"coords": [27.9189, -110.9186], "estado": "Sonora", "poblacion": 120000, "lat": 27.9189, "lon": -110.9186, "tipo": "municipio"},
-        "Navojoa": {"coords": [27.0833, -109.4433], "estado": "Sonora", "poblacion": 170000, "lat": 27.0833, "lon": -109.4433, "tipo": "municipio"},
-        "San Luis Río Colorado": {"coords": [32.4667, -114.7694], "estado": "Sonora", "poblacion": 176000, "lat": 32.4667, "lon": -114.7694, "tipo": "municipio"},
-        "Agua Prieta": {"coords": [31.3333, -109.5536], "estado": "Sonora", "poblacion": 80000, "lat": 31.3333, "lon": -109.5536, "tipo": "municipio"}
-    },
-    "Guanajuato": {
-        "León": {"coords": [21.1250, -101.6860], "estado": "Guanajuato", "poblacion": 1579000, "lat": 21.1250, "lon": -101.6860, "tipo": "municipio"},
-        "Guanajuato": {"coords": [21.0190, -101.2574], "estado": "Guanajuato", "poblacion": 184000, "lat": 21.0190, "lon": -101.2574, "tipo": "municipio"},
-        "Irapuato": {"coords": [20.6767, -101.3544], "estado": "Guanajuato", "poblacion": 580000, "lat": 20.6767, "lon": -101.3544, "tipo": "municipio"},
-        "Celaya": {"coords": [20.5238, -100.8124], "estado": "Guanajuato", "poblacion": 450000, "lat": 20.5238, "lon": -100.8124, "tipo": "municipio"},
-        "Salamanca": {"coords": [20.5669, -101.1925], "estado": "Guanajuato", "poblacion": 270000, "lat": 20.5669, "lon": -101.1925, "tipo": "municipio"},
-        "San Miguel de Allende": {"coords": [20.9150, -100.7430], "estado": "Guanajuato", "poblacion": 160000, "lat": 20.9150, "lon": -100.7430, "tipo": "municipio"},
-        "Dolores Hidalgo": {"coords": [21.1597, -100.9317], "estado": "Guanajuato", "poblacion": 50000, "lat": 21.1597, "lon": -100.9317, "tipo": "municipio"}
-    },
-    "Guerrero": {
-        "Acapulco de Juárez": {"coords": [16.8500, -99.9000], "estado": "Guerrero", "poblacion": 779956, "lat": 16.8500, "lon": -99.9000, "clave_inegi": "12001", "tipo": "municipio"},
-        "Ahuacuotzingo": {"coords": [17.7833, -98.9167], "estado": "Guerrero", "poblacion": 25774, "lat": 17.7833, "lon": -98.9167, "clave_inegi": "12002", "tipo": "municipio"},
-        "Ajuchitlán del Progreso": {"coords": [18.2500, -100.5667], "estado": "Guerrero", "poblacion": 38165, "lat": 18.2500, "lon": -100.5667, "clave_inegi": "12003", "tipo": "municipio"},
-        "Alcozauca de Guerrero": {"coords": [17.5000, -98.3667], "estado": "Guerrero", "poblacion": 20495, "lat": 17.5000, "lon": -98.3667, "clave_inegi": "12004", "tipo": "municipio"},
-        "Alpoyeca": {"coords": [17.7833, -98.5333], "estado": "Guerrero", "poblacion": 6734, "lat": 17.7833, "lon": -98.5333, "clave_inegi": "12005", "tipo": "municipio"},
-        "Apaxtla": {"coords": [18.2500, -99.8833], "estado": "Guerrero", "poblacion": 13912, "lat": 18.2500, "lon": -99.8833, "clave_inegi": "12006", "tipo": "municipio"},
-        "Arcelia": {"coords": [18.2833, -100.2667], "estado": "Guerrero", "poblacion": 34919, "lat": 18.2833, "lon": -100.2667, "clave_inegi": "12007", "tipo": "municipio"},
-        "Atenango del Río": {"coords": [18.1667, -99.2500], "estado": "Guerrero", "poblacion": 8806, "lat": 18.1667, "lon": -99.2500, "clave_inegi": "12008", "tipo": "municipio"},
-        "Atlamajalcingo del Monte": {"coords": [17.3833, -98.5500], "estado": "Guerrero", "poblacion": 5304, "lat": 17.3833, "lon": -98.5500, "clave_inegi": "12009", "tipo": "municipio"},
-        "Atlixtac": {"coords": [17.4500, -98.8167], "estado": "Guerrero", "poblacion": 23432, "lat": 17.4500, "lon": -98.8167, "clave_inegi": "12010", "tipo": "municipio"},
-        "Atoyac de Álvarez": {"coords": [17.2000, -100.4167], "estado": "Guerrero", "poblacion": 64324, "lat": 17.2000, "lon": -100.4167, "clave_inegi": "12011", "tipo": "municipio"},
-        "Ayutla de los Libres": {"coords": [16.9500, -99.1000], "estado": "Guerrero", "poblacion": 69167, "lat": 16.9500, "lon": -99.1000, "clave_inegi": "12012", "tipo": "municipio"},
-        "Azoyú": {"coords": [16.6167, -98.7000], "estado": "Guerrero", "poblacion": 12824, "lat": 16.6167, "lon": -98.7000, "clave_inegi": "12013", "tipo": "municipio"},
-        "Benito Juárez": {"coords": [17.0667, -100.3000], "estado": "Guerrero", "poblacion": 16040, "lat": 17.0667, "lon": -100.3000, "clave_inegi": "12014", "tipo": "municipio"},
-        "Buenavista de Cuéllar": {"coords": [18.3833, -99.4167], "estado": "Guerrero", "poblacion": 13912, "lat": 18.3833, "lon": -99.4167, "clave_inegi": "12015", "tipo": "municipio"},
-        "Chilapa de Álvarez": {"coords": [17.5833, -99.1667], "estado": "Guerrero", "poblacion": 131972, "lat": 17.5833, "lon": -99.1667, "clave_inegi": "12016", "tipo": "municipio"},
-        "Chilpancingo de los Bravo": {"coords": [17.5667, -99.5000], "estado": "Guerrero", "poblacion": 280055, "lat": 17.5667, "lon": -99.5000, "clave_inegi": "12017", "tipo": "municipio"},
-        "Coahuayutla de José María Izazaga": {"coords": [18.2333, -101.9000], "estado": "Guerrero", "poblacion": 12824, "lat": 18.2333, "lon": -101.9000, "clave_inegi": "12018", "tipo": "municipio"},
-        "Cocula": {"coords": [18.0667, -99.7833], "estado": "Guerrero", "poblacion": 16040, "lat": 18.0667, "lon": -99.7833, "clave_inegi": "12019", "tipo": "municipio"},
-        "Copala": {"coords": [16.6667, -99.0167], "estado": "Guerrero", "poblacion": 14945, "lat": 16.6667, "lon": -99.0167, "clave_inegi": "12020", "tipo": "municipio"},
-        "Copalillo": {"coords": [18.0333, -99.1333], "estado": "Guerrero", "poblacion": 19414, "lat": 18.0333, "lon": -99.1333, "clave_inegi": "12021", "tipo": "municipio"},
-        "Copanatoyac": {"coords": [17.5333, -98.8000], "estado": "Guerrero", "poblacion": 20495, "lat": 17.5333, "lon": -98.8000, "clave_inegi": "12022", "tipo": "municipio"},
-        "Coyuca de Benítez": {"coords": [16.9667, -100.1000], "estado": "Guerrero", "poblacion": 84180, "lat": 16.9667, "lon": -100.1000, "clave_inegi": "12023", "tipo": "municipio"},
-        "Coyuca de Catalán": {"coords": [18.3167, -100.8167], "estado": "Guerrero", "poblacion": 40134, "lat": 18.3167, "lon": -100.8167, "clave_inegi": "12024", "tipo": "municipio"},
-        "Cuajinicuilapa": {"coords": [16.4833, -98.5833], "estado": "Guerrero", "poblacion": 28717, "lat": 16.4833, "lon": -98.5833, "clave_inegi": "12025", "tipo": "municipio"},
-        "Cualac": {"coords": [17.7000, -98.6667], "estado": "Guerrero", "poblacion": 9324, "lat": 17.7000, "lon": -98.6667, "clave_inegi": "12026", "tipo": "municipio"},
-        "Cuautepec": {"coords": [16.7167, -99.1167], "estado": "Guerrero", "poblacion": 17855, "lat": 16.7167, "lon": -99.1167, "clave_inegi": "12027", "tipo": "municipio"},
-        "Cuetzala del Progreso": {"coords": [18.1500, -99.7667], "estado": "Guerrero", "poblacion": 8806, "lat": 18.1500, "lon": -99.7667, "clave_inegi": "12028", "tipo": "municipio"},
-        "Cutzamala de Pinzón": {"coords": [18.6667, -100.6167], "estado": "Guerrero", "poblacion": 20958, "lat": 18.6667, "lon": -100.6167, "clave_inegi": "12029", "tipo": "municipio"},
-        "Chilapa de Álvarez": {"coords": [17.5833, -99.1667], "estado": "Guerrero", "poblacion": 131972, "lat": 17.5833, "lon": -99.1667, "clave_inegi": "12030", "tipo": "municipio"},
-        "Florentino Vázquez (Antes Petatlán)": {"coords": [17.5333, -101.2667], "estado": "Guerrero", "poblacion": 49053, "lat": 17.5333, "lon": -101.2667, "clave_inegi": "12031", "tipo": "municipio"},
-        "General Canuto A. Neri": {"coords": [18.3000, -100.3167], "estado": "Guerrero", "poblacion": 12824, "lat": 18.3000, "lon": -100.3167, "clave_inegi": "12032", "tipo": "municipio"},
-        "General Heliodoro Castillo": {"coords": [17.6500, -100.0667], "estado": "Guerrero", "poblacion": 36622, "lat": 17.6500, "lon": -100.0667, "clave_inegi": "12033", "tipo": "municipio"},
-        "Huamuxtitlán": {"coords": [17.7500, -98.6000], "estado": "Guerrero", "poblacion": 17855, "lat": 17.7500, "lon": -98.6000, "clave_inegi": "12034", "tipo": "municipio"},
-        "Huitzuco de los Figueroa": {"coords": [18.3000, -99.3833], "estado": "Guerrero", "poblacion": 38165, "lat": 18.3000, "lon": -99.3833, "clave_inegi": "12035", "tipo": "municipio"},
-        "Iguala de la Independencia": {"coords": [18.3500, -99.5333], "estado": "Guerrero", "poblacion": 160579, "lat": 18.3500, "lon": -99.5333, "clave_inegi": "12036", "tipo": "municipio"},
-        "Igualapa": {"coords": [16.6333, -98.4833], "estado": "Guerrero", "poblacion": 10077, "lat": 16.6333, "lon": -98.4833, "clave_inegi": "12037", "tipo": "municipio"},
-        "Ixcateopan de Cuauhtémoc": {"coords": [18.2833, -99.8000], "estado": "Guerrero", "poblacion": 6734, "lat": 18.2833, "lon": -99.8000, "clave_inegi": "12038", "tipo": "municipio"},
-        "Zihuatanejo de Azueta": {"coords": [17.6500, -101.4833], "estado": "Guerrero", "poblacion": 128424, "lat": 17.6500, "lon": -101.4833, "clave_inegi": "12039", "tipo": "municipio"},
-        "Juchitán": {"coords": [16.6667, -98.7167], "estado": "Guerrero", "poblacion": 8806, "lat": 16.6667, "lon": -98.7167, "clave_inegi": "12040", "tipo": "municipio"},
-        "La Unión de Isidoro Montes de Oca": {"coords": [17.9167, -101.8333], "estado": "Guerrero", "poblacion": 28717, "lat": 17.9167, "lon": -101.8333, "clave_inegi": "12041", "tipo": "municipio"},
-        "Leonardo Bravo": {"coords": [17.7000, -99.8667], "estado": "Guerrero", "poblacion": 30419, "lat": 17.7000, "lon": -99.8667, "clave_inegi": "12042", "tipo": "municipio"},
-        "Malinaltepec": {"coords": [17.2000, -98.6667], "estado": "Guerrero", "poblacion": 25774, "lat": 17.2000, "lon": -98.6667, "clave_inegi": "12043", "tipo": "municipio"},
-        "Mártir de Cuilapan": {"coords": [17.8000, -99.4667], "estado": "Guerrero", "poblacion": 20495, "lat": 17.8000, "lon": -99.4667, "clave_inegi": "12044", "tipo": "municipio"},
-        "Metlatónoc": {"coords": [17.2000, -98.4167], "estado": "Guerrero", "poblacion": 27725, "lat": 17.2000, "lon": -98.4167, "clave_inegi": "12045", "tipo": "municipio"},
-        "Mochitlán": {"coords": [17.4833, -99.4000], "estado": "Guerrero", "poblacion": 11846, "lat": 17.4833, "lon": -99.4000, "clave_inegi": "12046", "tipo": "municipio"},
-        "Olinalá": {"coords": [17.8167, -98.7333], "estado": "Guerrero", "poblacion": 24041, "lat": 17.8167, "lon": -98.7333, "clave_inegi": "12047", "tipo": "municipio"},
-        "Ometepec": {"coords": [16.6833, -98.4000], "estado": "Guerrero", "poblacion": 69167, "lat": 16.6833, "lon": -98.4000, "clave_inegi": "12048", "tipo": "municipio"},
-        "Pedro Ascencio Alquisiras": {"coords": [18.4333, -100.0833], "estado": "Guerrero", "poblacion": 6734, "lat": 18.4333, "lon": -100.0833, "clave_inegi": "12049", "tipo": "municipio"},
-        "Petatlán": {"coords": [17.5333, -101.2667], "estado": "Guerrero", "poblacion": 49053, "lat": 17.5333, "lon": -101.2667, "clave_inegi": "12050", "tipo": "municipio"},
-        "Pilcaya": {"coords": [18.7333, -99.6000], "estado": "Guerrero", "poblacion": 12824, "lat": 18.7333, "lon": -99.6000, "clave_inegi": "12051", "tipo": "municipio"},
-        "Pungarabato": {"coords": [18.3500, -100.6500], "estado": "Guerrero", "poblacion": 46146, "lat": 18.3500, "lon": -100.6500, "clave_inegi": "12052", "tipo": "municipio"},
-        "Quechultenango": {"coords": [17.4667, -99.2333], "estado": "Guerrero", "poblacion": 25774, "lat": 17.4667, "lon": -99.2333, "clave_inegi": "12053", "tipo": "municipio"},
-        "San Luis Acatlán": {"coords": [16.7833, -98.7500], "estado": "Guerrero", "poblacion": 49053, "lat": 16.7833, "lon": -98.7500, "clave_inegi": "12054", "tipo": "municipio"},
-        "San Marcos": {"coords": [16.7833, -99.4000], "estado": "Guerrero", "poblacion": 53528, "lat": 16.7833, "lon": -99.4000, "clave_inegi": "12055", "tipo": "municipio"},
-        "San Miguel Totolapan": {"coords": [18.0667, -100.4167], "estado": "Guerrero", "poblacion": 25774, "lat": 18.0667, "lon": -100.4167, "clave_inegi": "12056", "tipo": "municipio"},
-        "Taxco de Alarcón": {"coords": [18.5500, -99.6000], "estado": "Guerrero", "poblacion": 105602, "lat": 18.5500, "lon": -99.6000, "clave_inegi": "12057", "tipo": "municipio"},
-        "Tecoanapa": {"coords": [17.0000, -99.2833], "estado": "Guerrero", "poblacion": 40134, "lat": 17.0000, "lon": -99.2833, "clave_inegi": "12058", "tipo": "municipio"},
-        "Técpan de Galeana": {"coords": [17.2167, -100.6333], "estado": "Guerrero", "poblacion": 66879, "lat": 17.2167, "lon": -100.6333, "clave_inegi": "12059", "tipo": "municipio"},
-        "Teloloapan": {"coords": [18.3333, -99.9500], "estado": "Guerrero", "poblacion": 53528, "lat": 18.3333, "lon": -99.9500, "clave_inegi": "12060", "tipo": "municipio"},
-        "Tepecoacuilco de Trujano": {"coords": [18.2500, -99.5500], "estado": "Guerrero", "poblacion": 33171, "lat": 18.2500, "lon": -99.5500, "clave_inegi": "12061", "tipo": "municipio"},
-        "Tetipac": {"coords": [18.5333, -99.5833], "estado": "Guerrero", "poblacion": 12824, "lat": 18.5333, "lon": -99.5833, "clave_inegi": "12062", "tipo": "municipio"},
-        "Tixtla de Guerrero": {"coords": [17.5833, -99.3833], "estado": "Guerrero", "poblacion": 43534, "lat": 17.5833, "lon": -99.3833, "clave_inegi": "12063", "tipo": "municipio"},
-        "Tlacoachistlahuaca": {"coords": [16.8500, -98.3667], "estado": "Guerrero", "poblacion": 25774, "lat": 16.8500, "lon": -98.3667, "clave_inegi": "12064", "tipo": "municipio"},
-        "Tlacoapa": {"coords": [17.1500, -98.6000], "estado": "Guerrero", "poblacion": 21898, "lat": 17.1500, "lon": -98.6000, "clave_inegi": "12065", "tipo": "municipio"},
-        "Tlalchapa": {"coords": [18.3833, -100.5667], "estado": "Guerrero", "poblacion": 12824, "lat": 18.3833, "lon": -100.5667, "clave_inegi": "12066", "tipo": "municipio"},
-        "Tlalixtaquilla de Maldonado": {"coords": [17.5833, -98.4167], "estado": "Guerrero", "poblacion": 9324, "lat": 17.5833, "lon": -98.4167, "clave_inegi": "12067", "tipo": "municipio"},
-        "Tlapa de Comonfort": {"coords": [17.5667, -98.5833], "estado": "Guerrero", "poblacion": 131972, "lat": 17.5667, "lon": -98.5833, "clave_inegi": "12068", "tipo": "municipio"},
-        "Tlapehuala": {"coords": [18.3500, -100.6333], "estado": "Guerrero", "poblacion": 21898, "lat": 18.3500, "lon": -100.6333, "clave_inegi": "12069", "tipo": "municipio"},
-        "Xalpatláhuac": {"coords": [17.5833, -98.4333], "estado": "Guerrero", "poblacion": 12824, "lat": 17.5833, "lon": -98.4333, "clave_inegi": "12070", "tipo": "municipio"},
-        "Xochihuehuetlán": {"coords": [17.8833, -98.4667], "estado": "Guerrero", "poblacion": 10599, "lat": 17.8833, "lon": -98.4667, "clave_inegi": "12071", "tipo": "municipio"},
-        "Xochistlahuaca": {"coords": [16.7833, -98.2500], "estado": "Guerrero", "poblacion": 27725, "lat": 16.7833, "lon": -98.2500, "clave_inegi": "12072", "tipo": "municipio"},
-        "Zapotitlán Tablas": {"coords": [17.4833, -98.8167], "estado": "Guerrero", "poblacion": 10599, "lat": 17.4833, "lon": -98.8167, "clave_inegi": "12073", "tipo": "municipio"},
-        "Zirándaro": {"coords": [18.2833, -101.3500], "estado": "Guerrero", "poblacion": 18974, "lat": 18.2833, "lon": -101.3500, "clave_inegi": "12074", "tipo": "municipio"},
-        "Zitlala": {"coords": [17.6500, -99.2000], "estado": "Guerrero", "poblacion": 23432, "lat": 17.6500, "lon": -99.2000, "clave_inegi": "12075", "tipo": "municipio"},
-        "San Nicolás": {"coords": [16.5833, -98.7167], "estado": "Guerrero", "poblacion": 6734, "lat": 16.5833, "lon": -98.7167, "clave_inegi": "12076", "tipo": "municipio"},
-        "Santa Catarina": {"coords": [17.5000, -98.8167], "estado": "Guerrero", "poblacion": 5304, "lat": 17.5000, "lon": -98.8167, "clave_inegi": "12077", "tipo": "municipio"},
-        "San Agustín": {"coords": [17.2000, -100.0833], "estado": "Guerrero", "poblacion": 11846, "lat": 17.2000, "lon": -100.0833, "clave_inegi": "12078", "tipo": "municipio"},
-        "Tlacoapa": {"coords": [17.1500, -98.6000], "estado": "Guerrero", "poblacion": 21898, "lat": 17.1500, "lon": -98.6000, "clave_inegi": "12079", "tipo": "municipio"},
-        "Atlixtac": {"coords": [17.4500, -98.8167], "estado": "Guerrero", "poblacion": 23432, "lat": 17.4500, "lon": -98.8167, "clave_inegi": "12080", "tipo": "municipio"},
-        "Metlatónoc": {"coords": [17.2000, -98.4167], "estado": "Guerrero", "poblacion": 27725, "lat": 17.2000, "lon": -98.4167, "clave_inegi": "12081", "tipo": "municipio"}
-    },
-    "Hidalgo": {
-        "Pachuca": {"coords": [20.1024, -98.7626], "estado": "Hidalgo", "poblacion": 300000, "lat": 20.1024, "lon": -98.7626, "tipo": "capital"},
-        "Tula": {"coords": [20.0549, -99.3433], "estado": "Hidalgo", "poblacion": 100000, "lat": 20.0549, "lon": -99.3433, "tipo": "municipio"},
-        "Tulancingo": {"coords": [20.1048, -98.3668], "estado": "Hidalgo", "poblacion": 140000, "lat": 20.1048, "lon": -98.3668, "tipo": "municipio"},
-        "Tizayuca": {"coords": [19.9369, -98.8906], "estado": "Hidalgo", "poblacion": 120000, "lat": 19.9369, "lon": -98.8906, "tipo": "municipio"},
-        "Huejutla": {"coords": [21.3656, -98.3217], "estado": "Hidalgo", "poblacion": 60000, "lat": 21.3656, "lon": -98.3217, "tipo": "municipio"}
-    },
-    "Michoacán": {
-        "Acuitzio": {"coords": [19.5333, -101.3000], "estado": "Michoacán", "poblacion": 11846, "lat": 19.5333, "lon": -101.3000, "clave_inegi": "16001", "tipo": "municipio"},
-        "Aguililla": {"coords": [18.7333, -102.7667], "estado": "Michoacán", "poblacion": 16040, "lat": 18.7333, "lon": -102.7667, "clave_inegi": "16002", "tipo": "municipio"},
-        "Álvaro Obregón": {"coords": [19.8667, -101.0667], "estado": "Michoacán", "poblacion": 22359, "lat": 19.8667, "lon": -101.0667, "clave_inegi": "16003", "tipo": "municipio"},
-        "Angamacutiro": {"coords": [20.1500, -101.7000], "estado": "Michoacán", "poblacion": 17855, "lat": 20.1500, "lon": -101.7000, "clave_inegi": "16004", "tipo": "municipio"},
-        "Angangueo": {"coords": [19.6167, -100.2833], "estado": "Michoacán", "poblacion": 11370, "lat": 19.6167, "lon": -100.2833, "clave_inegi": "16005", "tipo": "municipio"},
-        "Apatzingán": {"coords": [19.0667, -102.3500], "estado": "Michoacán", "poblacion": 128269, "lat": 19.0667, "lon": -102.3500, "clave_inegi": "16006", "tipo": "municipio"},
-        "Aporo": {"coords": [19.7167, -100.3500], "estado": "Michoacán", "poblacion": 3315, "lat": 19.7167, "lon": -100.3500, "clave_inegi": "16007", "tipo": "municipio"},
-        "Aquila": {"coords": [18.6167, -103.5167], "estado": "Michoacán", "poblacion": 25774, "lat": 18.6167, "lon": -103.5167, "clave_inegi": "16008", "tipo": "municipio"},
-        "Ario": {"coords": [19.3333, -101.7333], "estado": "Michoacán", "poblacion": 40134, "lat": 19.3333, "lon": -101.7333, "clave_inegi": "16009", "tipo": "municipio"},
-        "Arteaga": {"coords": [18.4500, -102.3833], "estado": "Michoacán", "poblacion": 21898, "lat": 18.4500, "lon": -102.3833, "clave_inegi": "16010", "tipo": "municipio"},
-        "Bridgida y Obregón (Antes Briseñas)": {"coords": [20.2167, -102.9000], "estado": "Michoacán", "poblacion": 10599, "lat": 20.2167, "lon": -102.9000, "clave_inegi": "16011", "tipo": "municipio"},
-        "Buenavista": {"coords": [19.1667, -102.9167], "estado": "Michoacán", "poblacion": 39077, "lat": 19.1667, "lon": -102.9167, "clave_inegi": "16012", "tipo": "municipio"},
-        "Carácuaro": {"coords": [19.0333, -101.0000], "estado": "Michoacán", "poblacion": 9324, "lat": 19.0333, "lon": -101.0000, "clave_inegi": "16013", "tipo": "municipio"},
-        "Coahuayana": {"coords": [18.7333, -103.6500], "estado": "Michoacán", "poblacion": 27725, "lat": 18.7333, "lon": -103.6500, "clave_inegi": "16014", "tipo": "municipio"},
-        "Coalcomán de Vázquez Pallares": {"coords": [18.7833, -103.1667], "estado": "Michoacán", "poblacion": 20958, "lat": 18.7833, "lon": -103.1667, "clave_inegi": "16015", "tipo": "municipio"},
-        "Coeneo": {"coords": [19.8000, -101.7500], "estado": "Michoacán", "poblacion": 21323, "lat": 19.8000, "lon": -101.7500, "clave_inegi": "16016", "tipo": "municipio"},
-        "Contepec": {"coords": [20.0167, -100.1667], "estado": "Michoacán", "poblacion": 33171, "lat": 20.0167, "lon": -100.1667, "clave_inegi": "16017", "tipo": "municipio"},
-        "Copándaro": {"coords": [19.9000, -101.1833], "estado": "Michoacán", "poblacion": 10077, "lat": 19.9000, "lon": -101.1833, "clave_inegi": "16018", "tipo": "municipio"},
-        "Cotija": {"coords": [19.8000, -102.7333], "estado": "Michoacán", "poblacion": 18445, "lat": 19.8000, "lon": -102.7333, "clave_inegi": "16019", "tipo": "municipio"},
-        "Cuitzeo": {"coords": [19.9667, -101.1333], "estado": "Michoacán", "poblacion": 31548, "lat": 19.9667, "lon": -101.1333, "clave_inegi": "16020", "tipo": "municipio"},
-        "Charapan": {"coords": [19.5333, -102.3833], "estado": "Michoacán", "poblacion": 10850, "lat": 19.5333, "lon": -102.3833, "clave_inegi": "16021", "tipo": "municipio"},
-        "Charo": {"coords": [19.7000, -101.0500], "estado": "Michoacán", "poblacion": 27725, "lat": 19.7000, "lon": -101.0500, "clave_inegi": "16022", "tipo": "municipio"},
-        "Chavinda": {"coords": [20.0500, -102.5000], "estado": "Michoacán", "poblacion": 10599, "lat": 20.0500, "lon": -102.5000, "clave_inegi": "16023", "tipo": "municipio"},
-        "Cherán": {"coords": [19.6667, -102.0500], "estado": "Michoacán", "poblacion": 21898, "lat": 19.6667, "lon": -102.0500, "clave_inegi": "16024", "tipo": "municipio"},
-        "Chilchota": {"coords": [19.8333, -102.1500], "estado": "Michoacán", "poblacion": 34919, "lat": 19.8333, "lon": -102.1500, "clave_inegi": "16025", "tipo": "municipio"},
-        "Chinicuila": {"coords": [18.7333, -103.4000], "estado": "Michoacán", "poblacion": 5304, "lat": 18.7333, "lon": -103.4000, "clave_inegi": "16026", "tipo": "municipio"},
-        "Chucándiro": {"coords": [19.9833, -101.2333], "estado": "Michoacán", "poblacion": 6734, "lat": 19.9833, "lon": -101.2333, "clave_inegi": "16027", "tipo": "municipio"},
-        "Churintzio": {"coords": [20.1500, -102.0000], "estado": "Michoacán", "poblacion": 5304, "lat": 20.1500, "lon": -102.0000, "clave_inegi": "16028", "tipo": "municipio"},
-        "Churumuco": {"coords": [18.8000, -101.6833], "estado": "Michoacán", "poblacion": 12824, "lat": 18.8000, "lon": -101.6833, "clave_inegi": "16029", "tipo": "municipio"},
-        "Ecuandureo": {"coords": [20.2500, -102.3000], "estado": "Michoacán", "poblacion": 13912, "lat": 20.2500, "lon": -102.3000, "clave_inegi": "16030", "tipo": "municipio"},
-        "Epitacio Huerta": {"coords": [20.2667, -100.2333], "estado": "Michoacán", "poblacion": 16040, "lat": 20.2667, "lon": -100.2333, "clave_inegi": "16031", "tipo": "municipio"},
-        "Erongarícuaro": {"coords": [19.6000, -101.6833], "estado": "Michoacán", "poblacion": 13912, "lat": 19.6000, "lon": -101.6833, "clave_inegi": "16032", "tipo": "municipio"},
-        "Gabriel Zamora": {"coords": [19.2333, -102.0667], "estado": "Michoacán", "poblacion": 21898, "lat": 19.2333, "lon": -102.0667, "clave_inegi": "16033", "tipo": "municipio"},
-        "Hidalgo": {"coords": [19.7000, -100.5667], "estado": "Michoacán", "poblacion": 110058, "lat": 19.7000, "lon": -100.5667, "clave_inegi": "16034", "tipo": "municipio"},
-        "La Huacana": {"coords": [18.9167, -101.8000], "estado": "Michoacán", "poblacion": 30419, "lat": 18.9167, "lon": -101.8000, "clave_inegi": "16035", "tipo": "municipio"},
-        "Huandacareo": {"coords": [20.0000, -101.2667], "estado": "Michoacán", "poblacion": 13912, "lat": 20.0000, "lon": -101.2667, "clave_inegi": "16036", "tipo": "municipio"},
-        "Huaniqueo": {"coords": [20.0167, -101.5500], "estado": "Michoacán", "poblacion": 10599, "lat": 20.0167, "lon": -101.5500, "clave_inegi": "16037", "tipo": "municipio"},
-        "Huetamo": {"coords": [18.7333, -100.9000], "estado": "Michoacán", "poblacion": 43534, "lat": 18.7333, "lon": -100.9000, "clave_inegi": "16038", "tipo": "municipio"},
-        "Huiramba": {"coords": [19.5333, -101.4833], "estado": "Michoacán", "poblacion": 10077, "lat": 19.5333, "lon": -101.4833, "clave_inegi": "16039", "tipo": "municipio"},
-        "Indaparapeo": {"coords": [19.7833, -100.8667], "estado": "Michoacán", "poblacion": 17855, "lat": 19.7833, "lon": -100.8667, "clave_inegi": "16040", "tipo": "municipio"},
-        "Irimbo": {"coords": [19.7500, -100.6500], "estado": "Michoacán", "poblacion": 16040, "lat": 19.7500, "lon": -100.6500, "clave_inegi": "16041", "tipo": "municipio"},
-        "Ixtlán": {"coords": [20.0833, -102.4833], "estado": "Michoacán", "poblacion": 8806, "lat": 20.0833, "lon": -102.4833, "clave_inegi": "16042", "tipo": "municipio"},
-        "Jacona": {"coords": [19.9667, -102.3167], "estado": "Michoacán", "poblacion": 80135, "lat": 19.9667, "lon": -102.3167, "clave_inegi": "16043", "tipo": "municipio"},
-        "Jiménez": {"coords": [20.1500, -101.8833], "estado": "Michoacán", "poblacion": 13912, "lat": 20.1500, "lon": -101.8833, "clave_inegi": "16044", "tipo": "municipio"},
-        "Jiquilpan": {"coords": [19.9833, -102.9833], "estado": "Michoacán", "poblacion": 40134, "lat": 19.9833, "lon": -102.9833, "clave_inegi": "16045", "tipo": "municipio"},
-        "Juárez": {"coords": [19.4667, -100.4167], "estado": "Michoacán", "poblacion": 14945, "lat": 19.4667, "lon": -100.4167, "clave_inegi": "16046", "tipo": "municipio"},
-        "Jungapeo": {"coords": [19.4833, -100.5667], "estado": "Michoacán", "poblacion": 20958, "lat": 19.4833, "lon": -100.5667, "clave_inegi": "16047", "tipo": "municipio"},
-        "Lagunillas": {"coords": [19.6000, -101.4000], "estado": "Michoacán", "poblacion": 7766, "lat": 19.6000, "lon": -101.4000, "clave_inegi": "16048", "tipo": "municipio"},
-        "Madero": {"coords": [19.3333, -101.2167], "estado": "Michoacán", "poblacion": 18974, "lat": 19.3333, "lon": -101.2167, "clave_inegi": "16049", "tipo": "municipio"},
-        "Maravatío": {"coords": [19.9000, -100.4500], "estado": "Michoacán", "poblacion": 81096, "lat": 19.9000, "lon": -100.4500, "clave_inegi": "16050", "tipo": "municipio"},
-        "Marcos Castellanos": {"coords": [20.0833, -102.9500], "estado": "Michoacán", "poblacion": 7766, "lat": 20.0833, "lon": -102.9500, "clave_inegi": "16051", "tipo": "municipio"},
-        "Lázaro Cárdenas": {"coords": [17.9667, -102.2000], "estado": "Michoacán", "poblacion": 178817, "lat": 17.9667, "lon": -102.2000, "clave_inegi": "16052", "tipo": "municipio"},
-        "Morelia": {"coords": [19.7000, -101.2000], "estado": "Michoacán", "poblacion": 849053, "lat": 19.7000, "lon": -101.2000, "clave_inegi": "16053", "tipo": "municipio"},
-        "Morelos": {"coords": [20.0167, -100.7500], "estado": "Michoacán", "poblacion": 33171, "lat": 20.0167, "lon": -100.7500, "clave_inegi": "16054", "tipo": "municipio"},
-        "Múgica": {"coords": [18.9167, -102.0500], "estado": "Michoacán", "poblacion": 46146, "lat": 18.9167, "lon": -102.0500, "clave_inegi": "16055", "tipo": "municipio"},
-        "Nahuatzen": {"coords": [19.5833, -101.9333], "estado": "Michoacán", "poblacion": 30419, "lat": 19.5833, "lon": -101.9333, "clave_inegi": "16056", "tipo": "municipio"},
-        "Nocupétaro": {"coords": [19.1667, -101.0667], "estado": "Michoacán", "poblacion": 7766, "lat": 19.1667, "lon": -101.0667, "clave_inegi": "16057", "tipo": "municipio"},
-        "Nuevo Parangaricutiro": {"coords": [19.3833, -102.2833], "estado": "Michoacán", "poblacion": 21323, "lat": 19.3833, "lon": -102.2833, "clave_inegi": "16058", "tipo": "municipio"},
-        "Nuevo Urecho": {"coords": [19.1667, -101.7667], "estado": "Michoacán", "poblacion": 10599, "lat": 19.1667, "lon": -101.7667, "clave_inegi": "16059", "tipo": "municipio"},
-        "Numarán": {"coords": [20.1500, -102.1833], "estado": "Michoacán", "poblacion": 9324, "lat": 20.1500, "lon": -102.1833, "clave_inegi": "16060", "tipo": "municipio"},
-        "Ocampo": {"coords": [19.6500, -100.3500], "estado": "Michoacán", "poblacion": 23432, "lat": 19.6500, "lon": -100.3500, "clave_inegi": "16061", "tipo": "municipio"},
-        "Pajacuarán": {"coords": [20.1167, -102.7333], "estado": "Michoacán", "poblacion": 17855, "lat": 20.1167, "lon": -102.7333, "clave_inegi": "16062", "tipo": "municipio"},
-        "Panindícuaro": {"coords": [20.2000, -101.6167], "estado": "Michoacán", "poblacion": 15638, "lat": 20.2000, "lon": -101.6167, "clave_inegi": "16063", "tipo": "municipio"},
-        "Parácuaro": {"coords": [19.1333, -102.2167], "estado": "Michoacán", "poblacion": 33171, "lat": 19.1333, "lon": -102.2167, "clave_inegi": "16064", "tipo": "municipio"},
-        "Paracho": {"coords": [19.4833, -102.0500], "estado": "Michoacán", "poblacion": 38165, "lat": 19.4833, "lon": -102.0500, "clave_inegi": "16065", "tipo": "municipio"},
-        "Pátzcuaro": {"coords": [19.5167, -101.6000], "estado": "Michoacán", "poblacion": 98457, "lat": 19.5167, "lon": -101.6000, "clave_inegi": "16066", "tipo": "municipio"},
-        "Penjamillo": {"coords": [20.2167, -102.1000], "estado": "Michoacán", "poblacion": 15638, "lat": 20.2167, "lon": -102.1000, "clave_inegi": "16067", "tipo": "municipio"},
-        "Peribán": {"coords": [19.5333, -102.4833], "estado": "Michoacán", "poblacion": 30419, "lat": 19.5333, "lon": -102.4833, "clave_inegi": "16068", "tipo": "municipio"},
-        "La Piedad": {"coords": [20.3333, -102.0167], "estado": "Michoacán", "poblacion": 105602, "lat": 20.3333, "lon": -102.0167, "clave_inegi": "16069", "tipo": "municipio"},
-        "Purépero": {"coords": [19.9833, -102.1667], "estado": "Michoacán", "poblacion": 14945, "lat": 19.9833, "lon": -102.1667, "clave_inegi": "16070", "tipo": "municipio"},
-        "Puruándiro": {"coords": [20.1000, -101.6833], "estado": "Michoacán", "poblacion": 70966, "lat": 20.1000, "lon": -101.6833, "clave_inegi": "16071", "tipo": "municipio"},
-        "Queréndaro": {"coords": [19.8333, -100.8333], "estado": "Michoacán", "poblacion": 19414, "lat": 19.8333, "lon": -100.8333, "clave_inegi": "16072", "tipo": "municipio"},
-        "Quiroga": {"coords": [19.6500, -101.5333], "estado": "Michoacán", "poblacion": 28717, "lat": 19.6500, "lon": -101.5333, "clave_inegi": "16073", "tipo": "municipio"},
-        "Sahuayo": {"coords": [20.0667, -102.7167], "estado": "Michoacán", "poblacion": 81096, "lat": 20.0667, "lon": -102.7167, "clave_inegi": "16074", "tipo": "municipio"},
-        "San Lucas": {"coords": [18.3833, -100.7000], "estado": "Michoacán", "poblacion": 17855, "lat": 18.3833, "lon": -100.7000, "clave_inegi": "16075", "tipo": "municipio"},
-        "Santa Ana Maya": {"coords": [20.1500, -101.0667], "estado": "Michoacán", "poblacion": 13912, "lat": 20.1500, "lon": -101.0667, "clave_inegi": "16076", "tipo": "municipio"},
-        "Salvador Escalante": {"coords": [19.3833, -101.7833], "estado": "Michoacán", "poblacion": 46146, "lat": 19.3833, "lon": -101.7833, "clave_inegi": "16077", "tipo": "municipio"},
-        "Senguio": {"coords": [19.7833, -100.2833], "estado": "Michoacán", "poblacion": 19414, "lat": 19.7833, "lon": -100.2833, "clave_inegi": "16078", "tipo": "municipio"},
-        "Susupuato": {"coords": [19.1667, -100.6167], "estado": "Michoacán", "poblacion": 7766, "lat": 19.1667, "lon": -100.6167, "clave_inegi": "16079", "tipo": "municipio"},
-        "Tacámbaro": {"coords": [19.2333, -101.4667], "estado": "Michoacán", "poblacion": 84180, "lat": 19.2333, "lon": -101.4667, "clave_inegi": "16080", "tipo": "municipio"},
-        "Tancítaro": {"coords": [19.3167, -102.3500], "estado": "Michoacán", "poblacion": 38165, "lat": 19.3167, "lon": -102.3500, "clave_inegi": "16081", "tipo": "municipio"},
-        "Tangamandapio": {"coords": [19.9667, -102.3500], "estado": "Michoacán", "poblacion": 34919, "lat": 19.9667, "lon": -102.3500, "clave_inegi": "16082", "tipo": "municipio"},
-        "Tangancícuaro": {"coords": [19.9500, -102.1333], "estado": "Michoacán", "poblacion": 34919, "lat": 19.9500, "lon": -102.1333, "clave_inegi": "16083", "tipo": "municipio"},
-        "Tanhuato": {"coords": [20.2500, -102.3500], "estado": "Michoacán", "poblacion": 14945, "lat": 20.2500, "lon": -102.3500, "clave_inegi": "16084", "tipo": "municipio"},
-        "Taretan": {"coords": [19.3167, -102.0000], "estado": "Michoacán", "poblacion": 20958, "lat": 19.3167, "lon": -102.0000, "clave_inegi": "16085", "tipo": "municipio"},
-        "Tarı́mbaro": {"coords": [19.7833, -101.1000], "estado": "Michoacán", "poblacion": 105602, "lat": 19.7833, "lon": -101.1000, "clave_inegi": "16086", "tipo": "municipio"},
-        "Tepalcatepec": {"coords": [19.0667, -102.8333], "estado": "Michoacán", "poblacion": 25774, "lat": 19.0667, "lon": -102.8333, "clave_inegi": "16087", "tipo": "municipio"},
-        "Tingambato": {"coords": [19.4667, -101.8500], "estado": "Michoacán", "poblacion": 16040, "lat": 19.4667, "lon": -101.8500, "clave_inegi": "16088", "tipo": "municipio"},
-        "Tinganbato": {"coords": [19.4667, -101.8500], "estado": "Michoacán", "poblacion": 16040, "lat": 19.4667, "lon": -101.8500, "clave_inegi": "16089", "tipo": "municipio"},
-        "Tingüindín": {"coords": [19.7500, -102.4833], "estado": "Michoacán", "poblacion": 13912, "lat": 19.7500, "lon": -102.4833, "clave_inegi": "16090", "tipo": "municipio"},
-        "Tiquicheo de Nicolás Romero": {"coords": [18.7333, -100.7500], "estado": "Michoacán", "poblacion": 13912, "lat": 18.7333, "lon": -100.7500, "clave_inegi": "16091", "tipo": "municipio"},
-        "Tlalpujahua": {"coords": [19.8500, -100.1667], "estado": "Michoacán", "poblacion": 30419, "lat": 19.8500, "lon": -100.1667, "clave_inegi": "16092", "tipo": "municipio"},
-        "Tlazazalca": {"coords": [20.0833, -102.2667], "estado": "Michoacán", "poblacion": 10599, "lat": 20.0833, "lon": -102.2667, "clave_inegi": "16093", "tipo": "municipio"},
-        "Tocumbo": {"coords": [19.7000, -102.5000], "estado": "Michoacán", "poblacion": 12824, "lat": 19.7000, "lon": -102.5000, "clave_inegi": "16094", "tipo": "municipio"},
-        "Tzintzuntzan": {"coords": [19.6333, -101.5833], "estado": "Michoacán", "poblacion": 13912, "lat": 19.6333, "lon": -101.5833, "clave_inegi": "16095", "tipo": "municipio"},
-        "Tzitzio": {"coords": [19.6500, -100.9333], "estado": "Michoacán", "poblacion": 8806, "lat": 19.6500, "lon": -100.9333, "clave_inegi": "16096", "tipo": "municipio"},
-        "Uruapan": {"coords": [19.4167, -102.0500], "estado": "Michoacán", "poblacion": 334057, "lat": 19.4167, "lon": -102.0500, "clave_inegi": "16097", "tipo": "municipio"},
-        "Venustiano Carranza": {"coords": [20.0167, -102.5333], "estado": "Michoacán", "poblacion": 18974, "lat": 20.0167, "lon": -102.5333, "clave_inegi": "16098", "tipo": "municipio"},
-        "Villamar": {"coords": [20.0500, -102.7500], "estado": "Michoacán", "poblacion": 17855, "lat": 20.0500, "lon": -102.7500, "clave_inegi": "16099", "tipo": "municipio"},
-        "Vista Hermosa": {"coords": [20.2167, -102.5833], "estado": "Michoacán", "poblacion": 16040, "lat": 20.2167, "lon": -102.5833, "clave_inegi": "16100", "tipo": "municipio"},
-        "Yurécuaro": {"coords": [20.2833, -102.1333], "estado": "Michoacán", "poblacion": 33171, "lat": 20.2833, "lon": -102.1333, "clave_inegi": "16101", "tipo": "municipio"},
-        "Zacapu": {"coords": [19.8167, -101.7667], "estado": "Michoacán", "poblacion": 75695, "lat": 19.8167, "lon": -101.7667, "clave_inegi": "16102", "tipo": "municipio"},
-        "Zamora": {"coords": [19.9833, -102.2833], "estado": "Michoacán", "poblacion": 213327, "lat": 19.9833, "lon": -102.2833, "clave_inegi": "16103", "tipo": "municipio"},
-        "Zináparo": {"coords": [20.1500, -101.6667], "estado": "Michoacán", "poblacion": 3315, "lat": 20.1500, "lon": -101.6667, "clave_inegi": "16104", "tipo": "municipio"},
-        "Zinapécuaro": {"coords": [19.8667, -100.8667], "estado": "Michoacán", "poblacion": 49053, "lat": 19.8667, "lon": -100.8667, "clave_inegi": "16105", "tipo": "municipio"},
-        "Ziracuaretiro": {"coords": [19.4667, -101.8833], "estado": "Michoacán", "poblacion": 16040, "lat": 19.4667, "lon": -101.8833, "clave_inegi": "16106", "tipo": "municipio"},
-        "Zitácuaro": {"coords": [19.4333, -100.3833], "estado": "Michoacán", "poblacion": 200021, "lat": 19.4333, "lon": -100.3833, "clave_inegi": "16107", "tipo": "municipio"},
-        "José Sixto Verduzco": {"coords": [20.2000, -101.5500], "estado": "Michoacán", "poblacion": 25774, "lat": 20.2000, "lon": -101.5500, "clave_inegi": "16108", "tipo": "municipio"},
-        "Coahuayana": {"coords": [18.7333, -103.6500], "estado": "Michoacán", "poblacion": 27725, "lat": 18.7333, "lon": -103.6500, "clave_inegi": "16109", "tipo": "municipio"},
-        "Aquila": {"coords": [18.6167, -103.5167], "estado": "Michoacán", "poblacion": 25774, "lat": 18.6167, "lon": -103.5167, "clave_inegi": "16110", "tipo": "municipio"},
-        "Chucándiro": {"coords": [19.9833, -101.2333], "estado": "Michoacán", "poblacion": 6734, "lat": 19.9833, "lon": -101.2333, "clave_inegi": "16111", "tipo": "municipio"},
-        "Tingüindín": {"coords": [19.7500, -102.4833], "estado": "Michoacán", "poblacion": 13912, "lat": 19.7500, "lon": -102.4833, "clave_inegi": "16112", "tipo": "municipio"},
-        "Tiquicheo de Nicolás Romero": {"coords": [18.7333, -100.7500], "estado": "Michoacán", "poblacion": 13912, "lat": 18.7333, "lon": -100.7500, "clave_inegi": "16113", "tipo": "municipio"}
-    },
-    "Morelos": {
-        "Cuernavaca": {"coords": [18.9242, -99.2308], "estado": "Morelos", "poblacion": 350000, "lat": 18.9242, "lon": -99.2308, "tipo": "capital"},
-        "Jiutepec": {"coords": [18.8479, -99.1869], "estado": "Morelos", "poblacion": 200000, "lat": 18.8479, "lon": -99.1869, "tipo": "municipio"},
-        "Temixco": {"coords": [18.8278, -99.2578], "estado": "Morelos", "poblacion": 150000, "lat": 18.8278, "lon": -99.2578, "tipo": "municipio"},
-        "Cuautla": {"coords": [18.8101, -98.9436], "estado": "Morelos", "poblacion": 120000, "lat": 18.8101, "lon": -98.9436, "tipo": "municipio"},
-        "Yautepec": {"coords": [18.8522, -99.0511], "estado": "Morelos", "poblacion": 90000, "lat": 18.8522, "lon": -99.0511, "tipo": "municipio"}
-    },
-    "Nayarit": {
-        "Acaponeta": {"coords": [22.4833, -105.3500], "estado": "Nayarit", "poblacion": 37233, "lat": 22.4833, "lon": -105.3500, "clave_inegi": "18001", "tipo": "municipio"},
-        "Ahuacatlán": {"coords": [21.0333, -104.4667], "estado": "Nayarit", "poblacion": 15007, "lat": 21.0333, "lon": -104.4667, "clave_inegi": "18002", "tipo": "municipio"},
-        "Amatlán de Cañas": {"coords": [20.8833, -104.3833], "estado": "Nayarit", "poblacion": 11326, "lat": 20.8833, "lon": -104.3833, "clave_inegi": "18003", "tipo": "municipio"},
-        "Compostela": {"coords": [21.2333, -105.0833], "estado": "Nayarit", "poblacion": 82824, "lat": 21.2333, "lon": -105.0833, "clave_inegi": "18004", "tipo": "municipio"},
-        "Huajicori": {"coords": [22.7833, -105.1500], "estado": "Nayarit", "poblacion": 12176, "lat": 22.7833, "lon": -105.1500, "clave_inegi": "18005", "tipo": "municipio"},
-        "Ixtlán del Río": {"coords": [21.0333, -104.3500], "estado": "Nayarit", "poblacion": 29288, "lat": 21.0333, "lon": -104.3500, "clave_inegi": "18006", "tipo": "municipio"},
-        "Jala": {"coords": [21.1333, -104.2500], "estado": "Nayarit", "poblacion": 19445, "lat": 21.1333, "lon": -104.2500, "clave_inegi": "18007", "tipo": "municipio"},
-        "Xalisco": {"coords": [21.4500, -104.9167], "estado": "Nayarit", "poblacion": 65113, "lat": 21.4500, "lon": -104.9167, "clave_inegi": "18008", "tipo": "municipio"},
-        "El Nayar": {"coords": [22.2167, -104.7000], "estado": "Nayarit", "poblacion": 47585, "lat": 22.2167, "lon": -104.7000, "clave_inegi": "18009", "tipo": "municipio"},
-        "Rosamorada": {"coords": [22.0667, -105.2000], "estado": "Nayarit", "poblacion": 33020, "lat": 22.0667, "lon": -105.2000, "clave_inegi": "18010", "tipo": "municipio"},
-        "Ruiz": {"coords": [21.9500, -105.1500], "estado": "Nayarit", "poblacion": 25191, "lat": 21.9500, "lon": -105.1500, "clave_inegi": "18011", "tipo": "municipio"},
-        "San Blas": {"coords": [21.5500, -105.2833], "estado": "Nayarit", "poblacion": 40134, "lat": 21.5500, "lon": -105.2833, "clave_inegi": "18012", "tipo": "municipio"},
-        "San Pedro Lagunillas": {"coords": [21.1667, -104.7000], "estado": "Nayarit", "poblacion": 8016, "lat": 21.1667, "lon": -104.7000, "clave_inegi": "18013", "tipo": "municipio"},
-        "Santa María del Oro": {"coords": [21.3667, -104.6500], "estado": "Nayarit", "poblacion": 23512, "lat": 21.3667, "lon": -104.6500, "clave_inegi": "18014", "tipo": "municipio"},
-        "Santiago Ixcuintla": {"coords": [21.8333, -105.2167], "estado": "Nayarit", "poblacion": 93901, "lat": 21.8333, "lon": -105.2167, "clave_inegi": "18015", "tipo": "municipio"},
-        "Tecuala": {"coords": [22.5000, -105.4167], "estado": "Nayarit", "poblacion": 38165, "lat": 22.5000, "lon": -105.4167, "clave_inegi": "18016", "tipo": "municipio"},
-        "Tepic": {"coords": [21.5000, -104.8833], "estado": "Nayarit", "poblacion": 420658, "lat": 21.5000, "lon": -104.8833, "clave_inegi": "18017", "tipo": "municipio"},
-        "Tuxpan": {"coords": [21.9333, -105.3000], "estado": "Nayarit", "poblacion": 31548, "lat": 21.9333, "lon": -105.3000, "clave_inegi": "18018", "tipo": "municipio"},
-        "La Yesca": {"coords": [21.2833, -104.0500], "estado": "Nayarit", "poblacion": 12053, "lat": 21.2833, "lon": -104.0500, "clave_inegi": "18019", "tipo": "municipio"},
-        "Bahía de Banderas": {"coords": [20.7333, -105.2833], "estado": "Nayarit", "poblacion": 187642, "lat": 20.7333, "lon": -105.2833, "clave_inegi": "18020", "tipo": "municipio"}
-    },
-    "Oaxaca": {
-            "Oaxaca de Juárez": {"coords": [17.0732, -96.7266], "estado": "Oaxaca", "poblacion": 300000, "lat": 17.0732, "lon": -96.7266, "tipo": "capital"},
-            "Salina Cruz": {"coords": [16.1667, -95.2039], "estado": "Oaxaca", "poblacion": 70000, "lat": 16.1667, "lon": -95.2039, "tipo": "municipio"},
-            "Juchitán": {"coords": [16.4369, -95.0311], "estado": "Oaxaca", "poblacion": 100000, "lat": 16.4369, "lon": -95.0311, "tipo": "municipio"},
-            "Tuxtepec": {"coords": [18.1250, -96.1297], "estado": "Oaxaca", "poblacion": 100000, "lat": 18.1250, "lon": -96.1297, "tipo": "municipio"},
-            "Puerto Escondido": {"coords": [15.8572, -97.0733], "estado": "Oaxaca", "poblacion": 45000, "lat": 15.8572, "lon": -97.0733, "tipo": "municipio"},
-            "Huajuapan de León": {"coords": [17.7833, -97.6833], "estado": "Oaxaca", "poblacion": 60000, "lat": 17.7833, "lon": -97.6833, "tipo": "municipio"},
-        "Oaxaca de Juárez": {"coords": [17.06056, -96.72528], "estado": "Oaxaca", "poblacion": 258913, "lat": 17.06056, "lon": -96.72528, "tipo": "capital"},
-        "Salina Cruz": {"coords": [16.10332, -95.11318], "estado": "Oaxaca", "poblacion": 84438, "lat": 16.10332, "lon": -95.11318, "tipo": "municipio"},
-        "Juchitán de Zaragoza": {"coords": [16.25599, -95.01179], "estado": "Oaxaca", "poblacion": 113570, "lat": 16.25599, "lon": -95.01179, "tipo": "municipio"},
-        "San Juan Bautista Tuxtepec": {"coords": [18.04522, -96.07065], "estado": "Oaxaca", "poblacion": 159452, "lat": 18.04522, "lon": -96.07065, "tipo": "municipio"},
-        "Puerto Escondido": {"coords": [15.85720, -97.07330], "estado": "Oaxaca", "poblacion": 45000, "lat": 15.85720, "lon": -97.07330, "tipo": "municipio"},
-        "Huajuapan de León": {"coords": [17.78333, -97.68333], "estado": "Oaxaca", "poblacion": 60000, "lat": 17.78333, "lon": -97.68333, "tipo": "municipio"},
-        "El Espinal": {"coords": [16.28000, -95.01667], "estado": "Oaxaca", "poblacion": 8730, "lat": 16.28000, "lon": -95.01667, "tipo": "municipio"},
-        "Coicoyán de las Flores": {"coords": [17.13000, -98.14000], "estado": "Oaxaca", "poblacion": 9563, "lat": 17.13000, "lon": -98.14000, "tipo": "municipio"},
-        "Santa María Petapa": {"coords": [16.90000, -95.10000], "estado": "Oaxaca", "poblacion": 15387, "lat": 16.90000, "lon": -95.10000, "tipo": "municipio"},
-        "San Bartolomé Quialana": {"coords": [16.90000, -96.30000], "estado": "Oaxaca", "poblacion": 2389, "lat": 16.90000, "lon": -96.30000, "tipo": "municipio"},
-    "Calihualá": {"coords": [17.3333, -98.1833], "estado": "Oaxaca", "poblacion": 1220, "lat": 17.3333, "lon": -98.1833, "tipo": "municipio"},
-        "Guadalupe de Ramírez": {"coords": [17.7500, -98.1000], "estado": "Oaxaca", "poblacion": 1425, "lat": 17.7500, "lon": -98.1000, "tipo": "municipio"},
-        "Santa María Chilchotla": {"coords": [18.2000, -96.6000], "estado": "Oaxaca", "poblacion": 124, "lat": 18.2000, "lon": -96.6000, "tipo": "municipio"},
-        "Santo Domingo Yodohino": {"coords": [17.6333, -97.7000], "estado": "Oaxaca", "poblacion": 369, "lat": 17.6333, "lon": -97.7000, "tipo": "municipio"},
-    "Loma Bonita": {"coords": [18.0635536, -95.5247914], "estado": "Oaxaca", "poblacion": 40934, "lat": 18.0635536, "lon": -95.5247914, "tipo": "municipio"},
-        "Matías Romero Avendaño": {"coords": [16.5240402, -95.0231738], "estado": "Oaxaca", "poblacion": 38183, "lat": 16.5240402, "lon": -95.0231738, "tipo": "municipio"},
-        "Putla Villa de Guerrero": {"coords": [17.0134339, -97.5541350], "estado": "Oaxaca", "poblacion": 34652, "lat": 17.0134339, "lon": -97.5541350, "tipo": "municipio"},
-        "Miahuatlán de Porfirio Díaz": {"coords": [16.1942519, -96.3547487], "estado": "Oaxaca", "poblacion": 50375, "lat": 16.1942519, "lon": -96.3547487, "tipo": "municipio"},
-        "Ocotlán de Morelos": {"coords": [16.4729906, -96.4030232], "estado": "Oaxaca", "poblacion": 23751, "lat": 16.4729906, "lon": -96.4030232, "tipo": "municipio"},
-        "Pinotepa de Don Luis": {"coords": [16.2542390, -97.5838767], "estado": "Oaxaca", "poblacion": 6416, "lat": 16.2542390, "lon": -97.5838767, "tipo": "municipio"},
-        "Pluma Hidalgo": {"coords": [15.5533046, -96.2509996], "estado": "Oaxaca", "poblacion": 3255, "lat": 15.5533046, "lon": -96.2509996, "tipo": "municipio"},
-        "San Agustín Loxicha": {"coords": [16.0059791, -96.3700352], "estado": "Oaxaca", "poblacion": 26194, "lat": 16.0059791, "lon": -96.3700352, "tipo": "municipio"},
-        "San Agustín de las Juntas": {"coords": [17.0041976, -96.4241189], "estado": "Oaxaca", "poblacion": 11391, "lat": 17.0041976, "lon": -96.4241189, "tipo": "municipio"},
-        "San Bartolo Coyotepec": {"coords": [16.5729813, -96.4227541], "estado": "Oaxaca", "poblacion": 10391, "lat": 16.5729813, "lon": -96.4227541, "tipo": "municipio"},
-        "San Blas Atempa": {"coords": [16.1934759, -95.1339165], "estado": "Oaxaca", "poblacion": 19696, "lat": 16.1934759, "lon": -95.1339165, "tipo": "municipio"},
-        "San Carlos Yautepec": {"coords": [16.3002184, -96.0624133], "estado": "Oaxaca", "poblacion": 11662, "lat": 16.3002184, "lon": -96.0624133, "tipo": "municipio"},
-        "San Dionisio del Mar": {"coords": [16.1913941, -94.4525212], "estado": "Oaxaca", "poblacion": 5180, "lat": 16.1913941, "lon": -94.4525212, "tipo": "municipio"},
-        "San Dionisio Ocotepec": {"coords": [16.4751916, -96.2345734], "estado": "Oaxaca", "poblacion": 11411, "lat": 16.4751916, "lon": -96.2345734, "tipo": "municipio"},
-        "San Felipe Jalapa de Díaz": {"coords": [18.0416617, -96.3210014], "estado": "Oaxaca", "poblacion": 28500, "lat": 18.0416617, "lon": -96.3210014, "tipo": "municipio"},
-        "San Francisco del Mar": {"coords": [16.1400407, -94.3756193], "estado": "Oaxaca", "poblacion": 8710, "lat": 16.1400407, "lon": -94.3756193, "tipo": "municipio"},
-        "San Francisco Ixhuatán": {"coords": [16.2108484, -94.2901782], "estado": "Oaxaca", "poblacion": 9461, "lat": 16.2108484, "lon": -94.2901782, "tipo": "municipio"},
-        "San Francisco Telixtlahuaca": {"coords": [17.1747744, -96.5415888], "estado": "Oaxaca", "poblacion": 13856, "lat": 17.1747744, "lon": -96.5415888, "tipo": "municipio"},
-        "San Gabriel Mixtepec": {"coords": [16.0539922, -97.0446197], "estado": "Oaxaca", "poblacion": 4910, "lat": 16.0539922, "lon": -97.0446197, "tipo": "municipio"},
-        "San Ildefonso Villa Alta": {"coords": [17.2020438, -96.0910852], "estado": "Oaxaca", "poblacion": 3677, "lat": 17.2020438, "lon": -96.0910852, "tipo": "municipio"},
-        "San Jacinto Amilpas": {"coords": [17.0602904, -96.4545222], "estado": "Oaxaca", "poblacion": 16827, "lat": 17.0602904, "lon": -96.4545222, "tipo": "municipio"},
-        "San Jerónimo Coatlán": {"coords": [16.1357797, -96.5209459], "estado": "Oaxaca", "poblacion": 5537, "lat": 16.1357797, "lon": -96.5209459, "tipo": "municipio"},
-        "San Jorge Nuchita": {"coords": [17.3921435, -98.0622068], "estado": "Oaxaca", "poblacion": 2881, "lat": 17.3921435, "lon": -98.0622068, "tipo": "municipio"},
-        "San Juan Mazatlán": {"coords": [17.0152045, -95.2647281], "estado": "Oaxaca", "poblacion": 19032, "lat": 17.0152045, "lon": -95.2647281, "tipo": "municipio"},
-        "San Lucas Ojitlán": {"coords": [18.0327011, -96.2351946], "estado": "Oaxaca", "poblacion": 22185, "lat": 18.0327011, "lon": -96.2351946, "tipo": "municipio"},
-        "San Mateo del Mar": {"coords": [16.1234921, -94.5854811], "estado": "Oaxaca", "poblacion": 15571, "lat": 16.1234921, "lon": -94.5854811, "tipo": "municipio"},
-        "San Juan Guichicovi": {"coords": [16.5746184, -95.0542339], "estado": "Oaxaca", "poblacion": 29802, "lat": 16.5746184, "lon": -95.0542339, "tipo": "municipio"},
-        "San Juan Cotzocón": {"coords": [17.0950408, -95.4656317], "estado": "Oaxaca", "poblacion": 22444, "lat": 17.0950408, "lon": -95.4656317, "tipo": "municipio"},
-        "San Pedro Comitancillo": {"coords": [16.2925093, -95.0935560], "estado": "Oaxaca", "poblacion": 4333, "lat": 16.2925093, "lon": -95.0935560, "tipo": "municipio"},
-        "San Pedro Pochutla": {"coords": [15.4446827, -96.2754829], "estado": "Oaxaca", "poblacion": 48204, "lat": 15.4446827, "lon": -96.2754829, "tipo": "municipio"},
-    "San Pedro Mixtepec": {"coords": [15.912778, -97.089444], "estado": "Oaxaca", "poblacion": 49148, "lat": 15.912778, "lon": -97.089444, "tipo": "municipio"},
-        "Santa Catarina Juquila": {"coords": [16.236944, -97.2975], "estado": "Oaxaca", "poblacion": 14507, "lat": 16.236944, "lon": -97.2975, "tipo": "municipio"},
-        "Santiago Pinotepa Nacional": {"coords": [16.341667, -98.066667], "estado": "Oaxaca", "poblacion": 49764, "lat": 16.341667, "lon": -98.066667, "tipo": "municipio"},
-        "Santa María Huatulco": {"coords": [15.835278, -96.322778], "estado": "Oaxaca", "poblacion": 40795, "lat": 15.835278, "lon": -96.322778, "tipo": "municipio"},
-        "San Juan Bautista Valle Nacional": {"coords": [17.770833, -96.316667], "estado": "Oaxaca", "poblacion": 14283, "lat": 17.770833, "lon": -96.316667, "tipo": "municipio"},
-        "San Pedro Huamelula": {"coords": [16.011389, -95.642222], "estado": "Oaxaca", "poblacion": 10427, "lat": 16.011389, "lon": -95.642222, "tipo": "municipio"},
-        "San Pedro Tapanatepec": {"coords": [16.366667, -94.216667], "estado": "Oaxaca", "poblacion": 13500, "lat": 16.366667, "lon": -94.216667, "tipo": "municipio"},
-        "Santo Domingo Tehuantepec": {"coords": [16.324444, -95.241667], "estado": "Oaxaca", "poblacion": 60800, "lat": 16.324444, "lon": -95.241667, "tipo": "municipio"},
-        "San Miguel del Puerto": {"coords": [15.9, -96.25], "estado": "Oaxaca", "poblacion": 8892, "lat": 15.9, "lon": -96.25, "tipo": "municipio"},
-        "Santo Domingo Ingenio": {"coords": [16.565278, -94.731667], "estado": "Oaxaca", "poblacion": 5618, "lat": 16.565278, "lon": -94.731667, "tipo": "municipio"},
-        "San Juan Lalana": {"coords": [17.6, -95.85], "estado": "Oaxaca", "poblacion": 14200, "lat": 17.6, "lon": -95.85, "tipo": "municipio"},
-        "San Pedro Mártir Quiechapa": {"coords": [16.45, -95.9], "estado": "Oaxaca", "poblacion": 1302, "lat": 16.45, "lon": -95.9, "tipo": "municipio"},
-        "Santa María Tonameca": {"coords": [15.75, -96.633333], "estado": "Oaxaca", "poblacion": 12344, "lat": 15.75, "lon": -96.633333, "tipo": "municipio"},
-        "San José Chiltepec": {"coords": [17.95, -96.15], "estado": "Oaxaca", "poblacion": 14482, "lat": 17.95, "lon": -96.15, "tipo": "municipio"},
-        "San Lorenzo Cacaotepec": {"coords": [17.133333, -96.766667], "estado": "Oaxaca", "poblacion": 8054, "lat": 17.133333, "lon": -96.766667, "tipo": "municipio"},
-        "San Martín Peras": {"coords": [17.416667, -98.233333], "estado": "Oaxaca", "poblacion": 16972, "lat": 17.416667, "lon": -98.233333, "tipo": "municipio"},
-        "San Pedro Amuzgos": {"coords": [16.65, -98.166667], "estado": "Oaxaca", "poblacion": 7758, "lat": 16.65, "lon": -98.166667, "tipo": "municipio"},
-        "San Pedro Atoyac": {"coords": [16.516667, -98.016667], "estado": "Oaxaca", "poblacion": 5170, "lat": 16.516667, "lon": -98.016667, "tipo": "municipio"},
-        "San Pedro Mixtepec - Distrito 22": {"coords": [16.3, -97.066667], "estado": "Oaxaca", "poblacion": 43220, "lat": 16.3, "lon": -97.066667, "tipo": "municipio"},
-        "San Pedro Pochutla": {"coords": [15.744722, -96.4675], "estado": "Oaxaca", "poblacion": 48204, "lat": 15.744722, "lon": -96.4675, "tipo": "municipio"},
-        "San Pedro Tututepec": {"coords": [16.166667, -97.666667], "estado": "Oaxaca", "poblacion": 18400, "lat": 16.166667, "lon": -97.666667, "tipo": "municipio"},
-        "San Sebastián Tutla": {"coords": [17.033333, -96.666667], "estado": "Oaxaca", "poblacion": 12400, "lat": 17.033333, "lon": -96.666667, "tipo": "municipio"},
-        "Santa Cruz Xoxocotlán": {"coords": [17.024444, -96.733333], "estado": "Oaxaca", "poblacion": 94147, "lat": 17.024444, "lon": -96.733333, "tipo": "municipio"},
-        "Santa Lucía del Camino": {"coords": [17.055278, -96.693611], "estado": "Oaxaca", "poblacion": 49802, "lat": 17.055278, "lon": -96.693611, "tipo": "municipio"},
-        "Santa María Atzompa": {"coords": [17.1, -96.783333], "estado": "Oaxaca", "poblacion": 33335, "lat": 17.1, "lon": -96.783333, "tipo": "municipio"},
-        "Santa María Colotepec": {"coords": [15.9, -97.1], "estado": "Oaxaca", "poblacion": 32685, "lat": 15.9, "lon": -97.1, "tipo": "municipio"},
-        "Santa María Jalapa del Marqués": {"coords": [16.45, -95.5], "estado": "Oaxaca", "poblacion": 12420, "lat": 16.45, "lon": -95.5, "tipo": "municipio"},
-        "Santa María del Tule": {"coords": [17.033333, -96.633333], "estado": "Oaxaca", "poblacion": 8334, "lat": 17.033333, "lon": -96.633333, "tipo": "municipio"},
-        "Santiago Juxtlahuaca": {"coords": [17.333333, -98.016667], "estado": "Oaxaca", "poblacion": 30694, "lat": 17.333333, "lon": -98.016667, "tipo": "municipio"},
-        "Teotitlán de Flores Magón": {"coords": [18.133333, -97.083333], "estado": "Oaxaca", "poblacion": 8964, "lat": 18.133333, "lon": -97.083333, "tipo": "municipio"},
-    "Loma Bonita": {"coords": [18.1053, -95.8867], "estado": "Oaxaca", "poblacion": 41421, "lat": 18.1053, "lon": -95.8867, "tipo": "municipio"},
-    "Santo Domingo Tehuantepec": {"coords": [16.3211, -95.2419], "estado": "Oaxaca", "poblacion": 42138, "lat": 16.3211, "lon": -95.2419, "tipo": "municipio"},
-    "Santa Cruz Xoxocotlán": {"coords": [17.0283, -96.7339], "estado": "Oaxaca", "poblacion": 101646, "lat": 17.0283, "lon": -96.7339, "tipo": "municipio"},
-    "San Pedro Pochutla": {"coords": [15.7444, -96.4669], "estado": "Oaxaca", "poblacion": 33400, "lat": 15.7444, "lon": -96.4669, "tipo": "municipio"},
-    "San Juan Bautista Tuxtepec": {"coords": [18.0833, -96.1333], "estado": "Oaxaca", "poblacion": 155766, "lat": 18.0833, "lon": -96.1333, "tipo": "municipio"},
-    "Santa María Huatulco": {"coords": [15.7697, -96.1325], "estado": "Oaxaca", "poblacion": 50200, "lat": 15.7697, "lon": -96.1325, "tipo": "municipio"},
-    "Tlacolula de Matamoros": {"coords": [16.9536, -96.4744], "estado": "Oaxaca", "poblacion": 18423, "lat": 16.9536, "lon": -96.4744, "tipo": "municipio"},
-    "Villa de Etla": {"coords": [17.1833, -96.7833], "estado": "Oaxaca", "poblacion": 10381, "lat": 17.1833, "lon": -96.7833, "tipo": "municipio"},
-    "Santo Domingo Ingenio": {"coords": [16.5833, -94.9167], "estado": "Oaxaca", "poblacion": 6014, "lat": 16.5833, "lon": -94.9167, "tipo": "municipio"},
-    "San Pablo Huitzo": {"coords": [17.2333, -96.85], "estado": "Oaxaca", "poblacion": 8861, "lat": 17.2333, "lon": -96.85, "tipo": "municipio"},
-    "San Pedro Mixtepec": {"coords": [15.9167, -97.0833], "estado": "Oaxaca", "poblacion": 44000, "lat": 15.9167, "lon": -97.0833, "tipo": "municipio"},
-    "San Pedro y San Pablo Teposcolula": {"coords": [17.4861, -97.4656], "estado": "Oaxaca", "poblacion": 7139, "lat": 17.4861, "lon": -97.4656, "tipo": "municipio"},
-    "Santiago Juxtlahuaca": {"coords": [17.3333, -98.0167], "estado": "Oaxaca", "poblacion": 19431, "lat": 17.3333, "lon": -98.0167, "tipo": "municipio"},
-    "San Pedro Amuzgos": {"coords": [16.7, -98.1], "estado": "Oaxaca", "poblacion": 5558, "lat": 16.7, "lon": -98.1, "tipo": "municipio"},
-    "San Pedro Ixcatlán": {"coords": [18.1, -96.5], "estado": "Oaxaca", "poblacion": 7200, "lat": 18.1, "lon": -96.5, "tipo": "municipio"},
-    "Santiago Pinotepa Nacional": {"coords": [16.3417, -98.05], "estado": "Oaxaca", "poblacion": 50343, "lat": 16.3417, "lon": -98.05, "tipo": "municipio"},
-    "San Miguel del Puerto": {"coords": [15.95, -96.1167], "estado": "Oaxaca", "poblacion": 10500, "lat": 15.95, "lon": -96.1167, "tipo": "municipio"},
-    "Asunción Nochixtlán": {"coords": [17.4667, -97.2167], "estado": "Oaxaca", "poblacion": 13000, "lat": 17.4667, "lon": -97.2167, "tipo": "municipio"},
-    "San Juan Bautista Cuicatlán": {"coords": [17.8, -96.9667], "estado": "Oaxaca", "poblacion": 7600, "lat": 17.8, "lon": -96.9667, "tipo": "municipio"},
-    "Santiago Matatlán": {"coords": [16.8667, -96.3667], "estado": "Oaxaca", "poblacion": 3400, "lat": 16.8667, "lon": -96.3667, "tipo": "municipio"},
-    "San José del Progreso": {"coords": [16.6833, -96.7333], "estado": "Oaxaca", "poblacion": 7300, "lat": 16.6833, "lon": -96.7333, "tipo": "municipio"},
-    "Santa María Atzompa": {"coords": [17.0833, -96.7833], "estado": "Oaxaca", "poblacion": 33000, "lat": 17.0833, "lon": -96.7833, "tipo": "municipio"},
-    "Santo Domingo Tomaltepec": {"coords": [17.05, -96.6333], "estado": "Oaxaca", "poblacion": 3200, "lat": 17.05, "lon": -96.6333, "tipo": "municipio"},
-    "San Felipe Jalapa de Díaz": {"coords": [18.0667, -96.5167], "estado": "Oaxaca", "poblacion": 9500, "lat": 18.0667, "lon": -96.5167, "tipo": "municipio"},
-    "Santo Domingo Zanatepec": {"coords": [16.4833, -94.3333], "estado": "Oaxaca", "poblacion": 8200, "lat": 16.4833, "lon": -94.3333, "tipo": "municipio"},
-    "San Andrés Huayápam": {"coords": [17.1, -96.6667], "estado": "Oaxaca", "poblacion": 5600, "lat": 17.1, "lon": -96.6667, "tipo": "municipio"},
-    "Santa Lucía del Camino": {"coords": [17.0667, -96.6833], "estado": "Oaxaca", "poblacion": 42000, "lat": 17.0667, "lon": -96.6833, "tipo": "municipio"},
-    "San Pedro Ixtlahuaca": {"coords": [17.0667, -96.7833], "estado": "Oaxaca", "poblacion": 7800, "lat": 17.0667, "lon": -96.7833, "tipo": "municipio"},
-    "Villa de Zaachila": {"coords": [16.95, -96.75], "estado": "Oaxaca", "poblacion": 13000, "lat": 16.95, "lon": -96.75, "tipo": "municipio"},
-    "Santo Domingo Yanhuitlán": {"coords": [17.5, -97.3667], "estado": "Oaxaca", "poblacion": 6400, "lat": 17.5, "lon": -97.3667, "tipo": "municipio"},
-    "San Sebastián Tutla": {"coords": [17.0333, -96.6833], "estado": "Oaxaca", "poblacion": 9100, "lat": 17.0333, "lon": -96.6833, "tipo": "municipio"},
-    "San Pablo Etla": {"coords": [17.15, -96.75], "estado": "Oaxaca", "poblacion": 9800, "lat": 17.15, "lon": -96.75, "tipo": "municipio"},
-    "Santiago Suchilquitongo": {"coords": [17.2333, -96.8667], "estado": "Oaxaca", "poblacion": 7600, "lat": 17.2333, "lon": -96.8667, "tipo": "municipio"},
-    "San Agustín de las Juntas": {"coords": [17.0, -96.7167], "estado": "Oaxaca", "poblacion": 8300, "lat": 17.0, "lon": -96.7167, "tipo": "municipio"},
-    "San Antonio de la Cal": {"coords": [17.0167, -96.7], "estado": "Oaxaca", "poblacion": 23000, "lat": 17.0167, "lon": -96.7, "tipo": "municipio"},
-    "San Bartolo Coyotepec": {"coords": [16.9833, -96.7167], "estado": "Oaxaca", "poblacion": 8900, "lat": 16.9833, "lon": -96.7167, "tipo": "municipio"},
-    "San Raymundo Jalpan": {"coords": [16.9833, -96.75], "estado": "Oaxaca", "poblacion": 7200, "lat": 16.9833, "lon": -96.75, "tipo": "municipio"},
-    "Santa Cruz Amilpas": {"coords": [17.05, -96.6833], "estado": "Oaxaca", "poblacion": 10800, "lat": 17.05, "lon": -96.6833, "tipo": "municipio"},
-    "San Andrés Ixtlahuaca": {"coords": [17.0667, -96.8], "estado": "Oaxaca", "poblacion": 5200, "lat": 17.0667, "lon": -96.8, "tipo": "municipio"},
-    "San Jacinto Amilpas": {"coords": [17.1, -96.7333], "estado": "Oaxaca", "poblacion": 11000, "lat": 17.1, "lon": -96.7333, "tipo": "municipio"},
-    "San Pedro Apóstol": {"coords": [16.8, -96.7167], "estado": "Oaxaca", "poblacion": 4300, "lat": 16.8, "lon": -96.7167, "tipo": "municipio"},
-    "Santa María Coyotepec": {"coords": [16.9333, -96.7], "estado": "Oaxaca", "poblacion": 8700, "lat": 16.9333, "lon": -96.7, "tipo": "municipio"},
-    "San Miguel Tilquiápam": {"coords": [16.8833, -96.7167], "estado": "Oaxaca", "poblacion": 4100, "lat": 16.8833, "lon": -96.7167, "tipo": "municipio"},
-    "Santo Tomás Jalieza": {"coords": [16.8667, -96.6833], "estado": "Oaxaca", "poblacion": 5600, "lat": 16.8667, "lon": -96.6833, "tipo": "municipio"},
-    "San Martín Tilcajete": {"coords": [16.8333, -96.7167], "estado": "Oaxaca", "poblacion": 4000, "lat": 16.8333, "lon": -96.7167, "tipo": "municipio"},
-    "Ocotlán de Morelos": {"coords": [16.7833, -96.6667], "estado": "Oaxaca", "poblacion": 21000, "lat": 16.7833, "lon": -96.6667, "tipo": "municipio"},
-    "San Antonino Castillo Velasco": {"coords": [16.8, -96.6667], "estado": "Oaxaca", "poblacion": 8200, "lat": 16.8, "lon": -96.6667, "tipo": "municipio"},
-    "Asunción Ocotlán": {"coords": [16.8167, -96.6667], "estado": "Oaxaca", "poblacion": 3100, "lat": 16.8167, "lon": -96.6667, "tipo": "municipio"},
-    "Magdalena Ocotlán": {"coords": [16.7667, -96.6833], "estado": "Oaxaca", "poblacion": 3900, "lat": 16.7667, "lon": -96.6833, "tipo": "municipio"},
-    "San Miguel Tilquiapam": {"coords": [16.8833, -96.7167], "estado": "Oaxaca", "poblacion": 4000, "lat": 16.8833, "lon": -96.7167, "tipo": "municipio"},
-    "San Pedro Mártir": {"coords": [16.9, -96.7167], "estado": "Oaxaca", "poblacion": 2900, "lat": 16.9, "lon": -96.7167, "tipo": "municipio"},
-    "Santiago Apóstol": {"coords": [16.8667, -96.7167], "estado": "Oaxaca", "poblacion": 3100, "lat": 16.8667, "lon": -96.7167, "tipo": "municipio"},
-    "San Baltazar Chichicápam": {"coords": [16.8667, -96.6833], "estado": "Oaxaca", "poblacion": 3600, "lat": 16.8667, "lon": -96.6833, "tipo": "municipio"},
-    "San Jerónimo Taviche": {"coords": [16.8167, -96.6833], "estado": "Oaxaca", "poblacion": 2700, "lat": 16.8167, "lon": -96.6833, "tipo": "municipio"},
-    "San Martín de los Cansecos": {"coords": [16.7167, -96.7667], "estado": "Oaxaca", "poblacion": 2300, "lat": 16.7167, "lon": -96.7667, "tipo": "municipio"},
-    "San Miguel Ejutla": {"coords": [16.7333, -96.75], "estado": "Oaxaca", "poblacion": 3200, "lat": 16.7333, "lon": -96.75, "tipo": "municipio"},
-    "Ejutla de Crespo": {"coords": [16.5667, -96.7167], "estado": "Oaxaca", "poblacion": 18400, "lat": 16.5667, "lon": -96.7167, "tipo": "municipio"},
-    "San Vicente Coatlán": {"coords": [16.3667, -96.9], "estado": "Oaxaca", "poblacion": 4800, "lat": 16.3667, "lon": -96.9, "tipo": "municipio"},
-    "San Pedro Coatlán": {"coords": [16.2667, -96.8667], "estado": "Oaxaca", "poblacion": 3100, "lat": 16.2667, "lon": -96.8667, "tipo": "municipio"},
-    "San Sebastián Coatlán": {"coords": [16.2, -96.8833], "estado": "Oaxaca", "poblacion": 2500, "lat": 16.2, "lon": -96.8833, "tipo": "municipio"},
-    "Santa María Sola": {"coords": [16.5167, -97.0333], "estado": "Oaxaca", "poblacion": 2100, "lat": 16.5167, "lon": -97.0333, "tipo": "municipio"},
-    "San Ildefonso Sola": {"coords": [16.4833, -97.1], "estado": "Oaxaca", "poblacion": 2400, "lat": 16.4833, "lon": -97.1, "tipo": "municipio"},
-    "San Francisco Sola": {"coords": [16.4, -97.0833], "estado": "Oaxaca", "poblacion": 2200, "lat": 16.4, "lon": -97.0833, "tipo": "municipio"},
-    "Sola de Vega": {"coords": [16.4667, -97.0333], "estado": "Oaxaca", "poblacion": 10500, "lat": 16.4667, "lon": -97.0333, "tipo": "municipio"},
-    "San Mateo Río Hondo": {"coords": [16.15, -96.5167], "estado": "Oaxaca", "poblacion": 8200, "lat": 16.15, "lon": -96.5167, "tipo": "municipio"},
-    "San José del Peñasco": {"coords": [16.2833, -96.7], "estado": "Oaxaca", "poblacion": 2800, "lat": 16.2833, "lon": -96.7, "tipo": "municipio"},
-    "San Cristóbal Amatlán": {"coords": [16.2667, -96.45], "estado": "Oaxaca", "poblacion": 3100, "lat": 16.2667, "lon": -96.45, "tipo": "municipio"},
-    "San Andrés Paxtlán": {"coords": [16.1833, -96.5167], "estado": "Oaxaca", "poblacion": 3700, "lat": 16.1833, "lon": -96.5167, "tipo": "municipio"},
-    "San Miguel Coatlán": {"coords": [16.2, -96.8667], "estado": "Oaxaca", "poblacion": 2600, "lat": 16.2, "lon": -96.8667, "tipo": "municipio"},
-    "San Sebastián Río Hondo": {"coords": [16.2333, -96.5167], "estado": "Oaxaca", "poblacion": 2800, "lat": 16.2333, "lon": -96.5167, "tipo": "municipio"},
-    "San Mateo Piñas": {"coords": [15.9167, -96.5833], "estado": "Oaxaca", "poblacion": 3400, "lat": 15.9167, "lon": -96.5833, "tipo": "municipio"},
-    "Santo Domingo de Morelos": {"coords": [15.9667, -96.5333], "estado": "Oaxaca", "poblacion": 4400, "lat": 15.9667, "lon": -96.5333, "tipo": "municipio"},
-    "San Pedro Pochutla": {"coords": [15.7444, -96.4669], "estado": "Oaxaca", "poblacion": 33400, "lat": 15.7444, "lon": -96.4669, "tipo": "municipio"},
-    "Pluma Hidalgo": {"coords": [15.8833, -96.4333], "estado": "Oaxaca", "poblacion": 3200, "lat": 15.8833, "lon": -96.4333, "tipo": "municipio"},
-    "Santa María Tonameca": {"coords": [15.7, -96.7167], "estado": "Oaxaca", "poblacion": 9400, "lat": 15.7, "lon": -96.7167, "tipo": "municipio"},
-    "Santos Reyes Nopala": {"coords": [16.0833, -97.1667], "estado": "Oaxaca", "poblacion": 10300, "lat": 16.0833, "lon": -97.1667, "tipo": "municipio"},
-    "San Gabriel Mixtepec": {"coords": [16.1167, -97.1], "estado": "Oaxaca", "poblacion": 4500, "lat": 16.1167, "lon": -97.1, "tipo": "municipio"},
-    "San Pedro Mixtepec (Distrito 22)": {"coords": [15.9167, -97.0833], "estado": "Oaxaca", "poblacion": 44000, "lat": 15.9167, "lon": -97.0833, "tipo": "municipio"},
-    "Santa Catarina Juquila": {"coords": [16.2333, -97.2833], "estado": "Oaxaca", "poblacion": 6720, "lat": 16.2333, "lon": -97.2833, "tipo": "municipio"},
-    "San Juan Lachao": {"coords": [16.2, -97.2], "estado": "Oaxaca", "poblacion": 3100, "lat": 16.2, "lon": -97.2, "tipo": "municipio"},
-    "Santa Catarina Loxicha": {"coords": [16.05, -96.7], "estado": "Oaxaca", "poblacion": 9500, "lat": 16.05, "lon": -96.7, "tipo": "municipio"},
-    "San Agustín Loxicha": {"coords": [16.1167, -96.7667], "estado": "Oaxaca", "poblacion": 12600, "lat": 16.1167, "lon": -96.7667, "tipo": "municipio"},
-    "San Baltazar Loxicha": {"coords": [16.0333, -96.7167], "estado": "Oaxaca", "poblacion": 3400, "lat": 16.0333, "lon": -96.7167, "tipo": "municipio"},
-    "Candelaria Loxicha": {"coords": [15.9667, -96.6667], "estado": "Oaxaca", "poblacion": 4200, "lat": 15.9667, "lon": -96.6667, "tipo": "municipio"},
-    "San Bartolomé Loxicha": {"coords": [16.0833, -96.65], "estado": "Oaxaca", "poblacion": 3700, "lat": 16.0833, "lon": -96.65, "tipo": "municipio"},
-    "San Agustín Chayuco": {"coords": [16.3333, -97.9667], "estado": "Oaxaca", "poblacion": 5200, "lat": 16.3333, "lon": -97.9667, "tipo": "municipio"},
-    "Santiago Jamiltepec": {"coords": [16.2833, -97.8333], "estado": "Oaxaca", "poblacion": 22000, "lat": 16.2833, "lon": -97.8333, "tipo": "municipio"},
-    "San Pedro Atoyac": {"coords": [16.3, -97.9333], "estado": "Oaxaca", "poblacion": 4600, "lat": 16.3, "lon": -97.9333, "tipo": "municipio"},
-    "San José Estancia Grande": {"coords": [16.2833, -98.0], "estado": "Oaxaca", "poblacion": 2100, "lat": 16.2833, "lon": -98.0, "tipo": "municipio"},
-    "San Miguel Tlacamama": {"coords": [16.2833, -98.0833], "estado": "Oaxaca", "poblacion": 2900, "lat": 16.2833, "lon": -98.0833, "tipo": "municipio"},
-    "San Andrés Huaxpaltepec": {"coords": [16.3167, -98.0167], "estado": "Oaxaca", "poblacion": 3700, "lat": 16.3167, "lon": -98.0167, "tipo": "municipio"}
-    },
-    "Puebla": {
-        "Puebla de Zaragoza": {"coords": [19.0414, -98.2063], "estado": "Puebla", "poblacion": 1692181, "lat": 19.0414, "lon": -98.2063, "tipo": "capital"},
-        "Tehuacán": {"coords": [18.4619, -97.3878], "estado": "Puebla", "poblacion": 353677, "lat": 18.4619, "lon": -97.3878, "tipo": "municipio"},
-        "San Martín Texmelucan": {"coords": [19.2706, -98.4358], "estado": "Puebla", "poblacion": 154089, "lat": 19.2706, "lon": -98.4358, "tipo": "municipio"},
-        "Atlixco": {"coords": [18.9150, -98.4383], "estado": "Puebla", "poblacion": 141793, "lat": 18.9150, "lon": -98.4383, "tipo": "municipio"},
-        "Amozoc": {"coords": [19.0306, -97.9947], "estado": "Puebla", "poblacion": 125876, "lat": 19.0306, "lon": -97.9947, "tipo": "municipio"},
-        "San Pedro Cholula": {"coords": [19.0540, -98.3090], "estado": "Puebla", "poblacion": 138622, "lat": 19.0540, "lon": -98.3090, "tipo": "municipio"},
-        "San Andrés Cholula": {"coords": [19.0483, -98.2917], "estado": "Puebla", "poblacion": 154441, "lat": 19.0483, "lon": -98.2917, "tipo": "municipio"},
-        "Teziutlán": {"coords": [19.9242, -97.3619], "estado": "Puebla", "poblacion": 98667, "lat": 19.9242, "lon": -97.3619, "tipo": "municipio"},
-        "Huauchinango": {"coords": [20.1747, -98.0308], "estado": "Puebla", "poblacion": 103043, "lat": 20.1747, "lon": -98.0308, "tipo": "municipio"},
-        "Cuautlancingo": {"coords": [19.0911, -98.2575], "estado": "Puebla", "poblacion": 137375, "lat": 19.0911, "lon": -98.2575, "tipo": "municipio"},
-        "Zacatlán": {"coords": [19.9317, -97.9542], "estado": "Puebla", "poblacion": 87363, "lat": 19.9317, "lon": -97.9542, "tipo": "municipio"},
-        "Xicotepec": {"coords": [20.2933, -97.9575], "estado": "Puebla", "poblacion": 80922, "lat": 20.2933, "lon": -97.9575, "tipo": "municipio"},
-        "Tepeaca": {"coords": [18.9950, -97.7558], "estado": "Puebla", "poblacion": 84666, "lat": 18.9950, "lon": -97.7558, "tipo": "municipio"},
-        "Izúcar de Matamoros": {"coords": [18.5919, -98.4550], "estado": "Puebla", "poblacion": 89434, "lat": 18.5919, "lon": -98.4550, "tipo": "municipio"},
-        "Tecamachalco": {"coords": [18.8950, -97.7378], "estado": "Puebla", "poblacion": 85081, "lat": 18.8950, "lon": -97.7378, "tipo": "municipio"},
-        "Huejotzingo": {"coords": [19.1678, -98.4069], "estado": "Puebla", "poblacion": 70966, "lat": 19.1678, "lon": -98.4069, "tipo": "municipio"},
-        "Ajalpan": {"coords": [18.3794, -97.2300], "estado": "Puebla", "poblacion": 74768, "lat": 18.3794, "lon": -97.2300, "tipo": "municipio"},
-        "Acajete": {"coords": [19.1417, -97.9861], "estado": "Puebla", "poblacion": 72894, "lat": 19.1417, "lon": -97.9861, "tipo": "municipio"},
-        "Chignahuapan": {"coords": [19.8378, -98.0564], "estado": "Puebla", "poblacion": 67771, "lat": 19.8378, "lon": -98.0564, "tipo": "municipio"},
-        "Acatzingo": {"coords": [18.9667, -97.7889], "estado": "Puebla", "poblacion": 63743, "lat": 18.9667, "lon": -97.7889, "tipo": "municipio"},
-        "Zacapoaxtla": {"coords": [19.8056, -97.6078], "estado": "Puebla", "poblacion": 53572, "lat": 19.8056, "lon": -97.6078, "tipo": "municipio"},
-        "Tlatlauquitepec": {"coords": [19.8822, -97.5028], "estado": "Puebla", "poblacion": 56262, "lat": 19.8822, "lon": -97.5028, "tipo": "municipio"},
-        "Tlacotepec de Benito Juárez": {"coords": [18.5636, -97.5458], "estado": "Puebla", "poblacion": 53282, "lat": 18.5636, "lon": -97.5458, "tipo": "municipio"},
-        "Cuetzalan del Progreso": {"coords": [20.0464, -97.5258], "estado": "Puebla", "poblacion": 50570, "lat": 20.0464, "lon": -97.5258, "tipo": "municipio"},
-        "Quecholac": {"coords": [18.9483, -97.6256], "estado": "Puebla", "poblacion": 54627, "lat": 18.9483, "lon": -97.6256, "tipo": "municipio"},
-        "Chalchicomula de Sesma": {"coords": [18.9806, -97.4528], "estado": "Puebla", "poblacion": 50634, "lat": 18.9806, "lon": -97.4528, "tipo": "municipio"},
-        "Coronango": {"coords": [19.1064, -98.2458], "estado": "Puebla", "poblacion": 46836, "lat": 19.1064, "lon": -98.2458, "tipo": "municipio"},
-        "Palmar de Bravo": {"coords": [18.8950, -97.5000], "estado": "Puebla", "poblacion": 48256, "lat": 18.8950, "lon": -97.5000, "tipo": "municipio"},
-        "Xiutetelco": {"coords": [19.7897, -97.3514], "estado": "Puebla", "poblacion": 40161, "lat": 19.7897, "lon": -97.3514, "tipo": "municipio"},
-        "Tlahuapan": {"coords": [19.3458, -98.5397], "estado": "Puebla", "poblacion": 40011, "lat": 19.3458, "lon": -98.5397, "tipo": "municipio"},
-        "Acatlán": {"coords": [18.2047, -98.0583], "estado": "Puebla", "poblacion": 37955, "lat": 18.2047, "lon": -98.0583, "tipo": "municipio"},
-        "Chietla": {"coords": [18.5722, -98.6019], "estado": "Puebla", "poblacion": 36622, "lat": 18.5722, "lon": -98.6019, "tipo": "municipio"},
-        "Libres": {"coords": [19.4589, -97.7783], "estado": "Puebla", "poblacion": 35246, "lat": 19.4589, "lon": -97.7783, "tipo": "municipio"},
-        "Chignautla": {"coords": [19.8500, -97.4667], "estado": "Puebla", "poblacion": 33967, "lat": 19.8500, "lon": -97.4667, "tipo": "municipio"},
-        "Tlachichuca": {"coords": [19.2319, -97.4428], "estado": "Puebla", "poblacion": 31398, "lat": 19.2319, "lon": -97.4428, "tipo": "municipio"},
-        "San Salvador el Verde": {"coords": [19.2081, -98.4878], "estado": "Puebla", "poblacion": 30588, "lat": 19.2081, "lon": -98.4878, "tipo": "municipio"},
-        "Venustiano Carranza": {"coords": [20.4636, -97.6436], "estado": "Puebla", "poblacion": 30545, "lat": 20.4636, "lon": -97.6436, "tipo": "municipio"},
-        "Atempan": {"coords": [19.8800, -97.4200], "estado": "Puebla", "poblacion": 29742, "lat": 19.8800, "lon": -97.4200, "tipo": "municipio"},
-        "San Salvador el Seco": {"coords": [19.1306, -97.6694], "estado": "Puebla", "poblacion": 28723, "lat": 19.1306, "lon": -97.6694, "tipo": "municipio"},
-        "Hueytamalco": {"coords": [20.0178, -97.3517], "estado": "Puebla", "poblacion": 28711, "lat": 20.0178, "lon": -97.3517, "tipo": "municipio"},
-        "Nopalucan": {"coords": [19.2847, -97.7756], "estado": "Puebla", "poblacion": 27367, "lat": 19.2847, "lon": -97.7756, "tipo": "municipio"},
-        "Ocoyucan": {"coords": [18.9556, -98.3306], "estado": "Puebla", "poblacion": 31105, "lat": 18.9556, "lon": -98.3306, "tipo": "municipio"},
-        "Tetela de Ocampo": {"coords": [19.8139, -97.7981], "estado": "Puebla", "poblacion": 26495, "lat": 19.8139, "lon": -97.7981, "tipo": "municipio"},
-        "Ixtacamaxtitlán": {"coords": [19.5858, -97.9408], "estado": "Puebla", "poblacion": 26365, "lat": 19.5858, "lon": -97.9408, "tipo": "municipio"},
-        "Huaquechula": {"coords": [18.8056, -98.4289], "estado": "Puebla", "poblacion": 26233, "lat": 18.8056, "lon": -98.4289, "tipo": "municipio"},
-        "Los Reyes de Juárez": {"coords": [18.9667, -97.8083], "estado": "Puebla", "poblacion": 25776, "lat": 18.9667, "lon": -97.8083, "tipo": "municipio"},
-        "Chichiquila": {"coords": [19.2906, -97.1083], "estado": "Puebla", "poblacion": 24874, "lat": 19.2906, "lon": -97.1083, "tipo": "municipio"},
-        "Vicente Guerrero": {"coords": [18.4319, -97.2386], "estado": "Puebla", "poblacion": 24716, "lat": 18.4319, "lon": -97.2386, "tipo": "municipio"},
-        "Yehualtepec": {"coords": [18.8258, -97.5872], "estado": "Puebla", "poblacion": 24204, "lat": 18.8258, "lon": -97.5872, "tipo": "municipio"},
-        "Santiago Miahuatlán": {"coords": [18.5208, -97.4331], "estado": "Puebla", "poblacion": 24040, "lat": 18.5208, "lon": -97.4331, "tipo": "municipio"},
-        "Quimixtlán": {"coords": [19.2981, -97.1997], "estado": "Puebla", "poblacion": 23204, "lat": 19.2981, "lon": -97.1997, "tipo": "municipio"},
-        "Altepexi": {"coords": [18.3583, -97.2917], "estado": "Puebla", "poblacion": 22629, "lat": 18.3583, "lon": -97.2917, "tipo": "municipio"},
-        "Pahuatlán": {"coords": [20.2522, -98.0833], "estado": "Puebla", "poblacion": 22004, "lat": 20.2522, "lon": -98.0833, "tipo": "municipio"},
-        "Zoquitlán": {"coords": [18.4606, -96.8406], "estado": "Puebla", "poblacion": 21743, "lat": 18.4606, "lon": -96.8406, "tipo": "municipio"},
-        "Tecali de Herrera": {"coords": [18.8633, -97.9425], "estado": "Puebla", "poblacion": 21105, "lat": 18.8633, "lon": -97.9425, "tipo": "municipio"},
-        "Tepanco de López": {"coords": [18.5306, -97.6322], "estado": "Puebla", "poblacion": 20857, "lat": 18.5306, "lon": -97.6322, "tipo": "municipio"},
-        "Coxcatlán": {"coords": [18.2561, -97.0983], "estado": "Puebla", "poblacion": 20653, "lat": 18.2561, "lon": -97.0983, "tipo": "municipio"},
-        "Tlaola": {"coords": [20.1000, -97.9333], "estado": "Puebla", "poblacion": 20566, "lat": 20.1000, "lon": -97.9333, "tipo": "municipio"},
-        "Tepexi de Rodríguez": {"coords": [18.5775, -97.9653], "estado": "Puebla", "poblacion": 20556, "lat": 18.5775, "lon": -97.9653, "tipo": "municipio"},
-        "Tochtepec": {"coords": [18.8350, -97.9150], "estado": "Puebla", "poblacion": 20111, "lat": 18.8350, "lon": -97.9150, "tipo": "municipio"},
-        "Zautla": {"coords": [19.6644, -97.5850], "estado": "Puebla", "poblacion": 19659, "lat": 19.6644, "lon": -97.5850, "tipo": "municipio"},
-        "San Matías Tlalancaleca": {"coords": [19.2961, -98.4908], "estado": "Puebla", "poblacion": 19488, "lat": 19.2961, "lon": -98.4908, "tipo": "municipio"},
-        "Chilchotla": {"coords": [19.3303, -97.0875], "estado": "Puebla", "poblacion": 19435, "lat": 19.3303, "lon": -97.0875, "tipo": "municipio"},
-        "Chiautla": {"coords": [18.2611, -98.6014], "estado": "Puebla", "poblacion": 19280, "lat": 18.2611, "lon": -98.6014, "tipo": "municipio"},
-        "Cañada Morelos": {"coords": [18.7758, -97.4583], "estado": "Puebla", "poblacion": 19270, "lat": 18.7758, "lon": -97.4583, "tipo": "municipio"},
-        "General Felipe Ángeles": {"coords": [18.9950, -97.6403], "estado": "Puebla", "poblacion": 19256, "lat": 18.9950, "lon": -97.6403, "tipo": "municipio"},
-        "Chiautzingo": {"coords": [19.2156, -98.4736], "estado": "Puebla", "poblacion": 18780, "lat": 19.2156, "lon": -98.4736, "tipo": "municipio"},
-        "Juan C. Bonilla": {"coords": [19.1417, -98.3183], "estado": "Puebla", "poblacion": 18721, "lat": 19.1417, "lon": -98.3183, "tipo": "municipio"},
-        "Pantepec": {"coords": [20.6706, -97.9867], "estado": "Puebla", "poblacion": 18635, "lat": 20.6706, "lon": -97.9867, "tipo": "municipio"},
-        "Tlacuilotepec": {"coords": [20.3547, -97.9025], "estado": "Puebla", "poblacion": 18274, "lat": 20.3547, "lon": -97.9025, "tipo": "municipio"},
-        "Tochimilco": {"coords": [18.8950, -98.6189], "estado": "Puebla", "poblacion": 17871, "lat": 18.8950, "lon": -98.6189, "tipo": "municipio"},
-        "Francisco Z. Mena": {"coords": [20.7600, -98.0256], "estado": "Puebla", "poblacion": 17351, "lat": 20.7600, "lon": -98.0256, "tipo": "municipio"},
-        "Guadalupe Victoria": {"coords": [19.2569, -97.3514], "estado": "Puebla", "poblacion": 16990, "lat": 19.2569, "lon": -97.3514, "tipo": "municipio"},
-        "Oriental": {"coords": [19.3492, -97.6472], "estado": "Puebla", "poblacion": 16766, "lat": 19.3492, "lon": -97.6472, "tipo": "municipio"},
-        "Tepeyahualco": {"coords": [19.5317, -97.5250], "estado": "Puebla", "poblacion": 16641, "lat": 19.5317, "lon": -97.5250, "tipo": "municipio"},
-        "Tepatlaxco de Hidalgo": {"coords": [19.0689, -97.8761], "estado": "Puebla", "poblacion": 16568, "lat": 19.0689, "lon": -97.8761, "tipo": "municipio"},
-        "Xochitlán de Vicente Suárez": {"coords": [20.0194, -97.4697], "estado": "Puebla", "poblacion": 16518, "lat": 20.0194, "lon": -97.4697, "tipo": "municipio"},
-        "Chiconcuautla": {"coords": [20.0817, -97.9358], "estado": "Puebla", "poblacion": 16362, "lat": 20.0817, "lon": -97.9358, "tipo": "municipio"},
-        "Zinacatepec": {"coords": [18.3972, -97.1067], "estado": "Puebla", "poblacion": 16297, "lat": 18.3972, "lon": -97.1067, "tipo": "municipio"},
-        "Tuzamapan de Galeana": {"coords": [20.2708, -97.5872], "estado": "Puebla", "poblacion": 16183, "lat": 20.2708, "lon": -97.5872, "tipo": "municipio"},
-        "Huitziltepec": {"coords": [18.8106, -97.8631], "estado": "Puebla", "poblacion": 16124, "lat": 18.8106, "lon": -97.8631, "tipo": "municipio"},
-        "Teopatlán": {"coords": [18.3794, -98.3589], "estado": "Puebla", "poblacion": 15998, "lat": 18.3794, "lon": -98.3589, "tipo": "municipio"},
-        "San Gabriel Chilac": {"coords": [18.3800, -97.3917], "estado": "Puebla", "poblacion": 15878, "lat": 18.3800, "lon": -97.3917, "tipo": "municipio"},
-        "San Juan Epatlán": {"coords": [18.7297, -98.4864], "estado": "Puebla", "poblacion": 15636, "lat": 18.7297, "lon": -98.4864, "tipo": "municipio"},
-        "Tepeyahualco de Cuauhtémoc": {"coords": [18.7844, -97.7731], "estado": "Puebla", "poblacion": 15473, "lat": 18.7844, "lon": -97.7731, "tipo": "municipio"},
-        "Ahuacatlán": {"coords": [20.0097, -97.7661], "estado": "Puebla", "poblacion": 14542, "lat": 20.0097, "lon": -97.7661, "tipo": "municipio"},
-        "Coyomeapan": {"coords": [18.3583, -97.0083], "estado": "Puebla", "poblacion": 14806, "lat": 18.3583, "lon": -97.0083, "tipo": "municipio"},
-        "Cuautinchán": {"coords": [18.9175, -97.9425], "estado": "Puebla", "poblacion": 14502, "lat": 18.9175, "lon": -97.9425, "tipo": "municipio"},
-        "Zongozotla": {"coords": [20.0964, -97.5819], "estado": "Puebla", "poblacion": 14002, "lat": 20.0964, "lon": -97.5819, "tipo": "municipio"},
-        "Zihuateutla": {"coords": [20.3156, -97.8864], "estado": "Puebla", "poblacion": 13915, "lat": 20.3156, "lon": -97.8864, "tipo": "municipio"},
-        "San Jerónimo Tecuanipan": {"coords": [19.0492, -98.3978], "estado": "Puebla", "poblacion": 13904, "lat": 19.0492, "lon": -98.3978, "tipo": "municipio"},
-        "Ahuazotepec": {"coords": [20.0803, -98.0567], "estado": "Puebla", "poblacion": 11439, "lat": 20.0803, "lon": -98.0567, "tipo": "municipio"},
-        "Atzitzihuacán": {"coords": [18.8258, -98.5306], "estado": "Puebla", "poblacion": 12857, "lat": 18.8258, "lon": -98.5306, "tipo": "municipio"},
-        "San Pedro Yeloixtlahuaca": {"coords": [18.1569, -97.9897], "estado": "Puebla", "poblacion": 13264, "lat": 18.1569, "lon": -97.9897, "tipo": "municipio"},
-        "Chila de la Sal": {"coords": [17.9822, -98.5478], "estado": "Puebla", "poblacion": 13164, "lat": 17.9822, "lon": -98.5478, "tipo": "municipio"},
-        "Tlapanalá": {"coords": [18.7900, -98.5200], "estado": "Puebla", "poblacion": 13083, "lat": 18.7900, "lon": -98.5200, "tipo": "municipio"},
-        "Calpan": {"coords": [19.1000, -98.4639], "estado": "Puebla", "poblacion": 15271, "lat": 19.1000, "lon": -98.4639, "tipo": "municipio"},
-        "Xochitlán Todos Santos": {"coords": [18.6650, -97.5925], "estado": "Puebla", "poblacion": 12690, "lat": 18.6650, "lon": -97.5925, "tipo": "municipio"},
-        "San Miguel Xoxtla": {"coords": [19.2081, -98.3283], "estado": "Puebla", "poblacion": 12534, "lat": 19.2081, "lon": -98.3283, "tipo": "municipio"},
-        "Tepango de Rodríguez": {"coords": [20.2167, -97.7708], "estado": "Puebla", "poblacion": 12420, "lat": 20.2167, "lon": -97.7708, "tipo": "municipio"},
-        "Jolalpan": {"coords": [18.1064, -98.9228], "estado": "Puebla", "poblacion": 12384, "lat": 18.1064, "lon": -98.9228, "tipo": "municipio"},
-        "Tlacuilotepec": {"coords": [20.3547, -97.9025], "estado": "Puebla", "poblacion": 18274, "lat": 20.3547, "lon": -97.9025, "tipo": "municipio"},
-        "Ayotoxco de Guerrero": {"coords": [20.1011, -97.3117], "estado": "Puebla", "poblacion": 11391, "lat": 20.1011, "lon": -97.3117, "tipo": "municipio"},
-        "Atzitzintla": {"coords": [18.9056, -97.2611], "estado": "Puebla", "poblacion": 9051, "lat": 18.9056, "lon": -97.2611, "tipo": "municipio"},
-        "San Nicolás de los Ranchos": {"coords": [19.0833, -98.4833], "estado": "Puebla", "poblacion": 12349, "lat": 19.0833, "lon": -98.4833, "tipo": "municipio"},
-        "Naupan": {"coords": [20.3808, -97.9892], "estado": "Puebla", "poblacion": 11090, "lat": 20.3808, "lon": -97.9892, "tipo": "municipio"},
-        "Ixcamilpa de Guerrero": {"coords": [18.0667, -98.7000], "estado": "Puebla", "poblacion": 10996, "lat": 18.0667, "lon": -98.7000, "tipo": "municipio"},
-        "Tenampulco": {"coords": [20.1253, -97.3150], "estado": "Puebla", "poblacion": 10928, "lat": 20.1253, "lon": -97.3150, "tipo": "municipio"},
-        "Tepeojuma": {"coords": [18.7236, -98.5444], "estado": "Puebla", "poblacion": 10816, "lat": 18.7236, "lon": -98.5444, "tipo": "municipio"},
-        "Cuapiaxtla de Madero": {"coords": [18.8950, -97.8058], "estado": "Puebla", "poblacion": 10542, "lat": 18.8950, "lon": -97.8058, "tipo": "municipio"},
-        "Jonotla": {"coords": [20.0811, -97.3208], "estado": "Puebla", "poblacion": 10178, "lat": 20.0811, "lon": -97.3208, "tipo": "municipio"},
-        "Xochiapulco": {"coords": [19.8667, -97.6667], "estado": "Puebla", "poblacion": 10079, "lat": 19.8667, "lon": -97.6667, "tipo": "municipio"},
-        "Cuautempan": {"coords": [20.1061, -97.7783], "estado": "Puebla", "poblacion": 9837, "lat": 20.1061, "lon": -97.7783, "tipo": "municipio"},
-        "Tepemaxalco": {"coords": [18.7844, -98.2439], "estado": "Puebla", "poblacion": 9585, "lat": 18.7844, "lon": -98.2439, "tipo": "municipio"},
-        "Amixtlán": {"coords": [20.1000, -97.6531], "estado": "Puebla", "poblacion": 9070, "lat": 20.1000, "lon": -97.6531, "tipo": "municipio"},
-        "Aquixtla": {"coords": [19.7897, -97.9400], "estado": "Puebla", "poblacion": 9021, "lat": 19.7897, "lon": -97.9400, "tipo": "municipio"},
-        "Acatlán de Osorio": {"coords": [18.2047, -98.0583], "estado": "Puebla", "poblacion": 37955, "lat": 18.2047, "lon": -98.0583, "tipo": "municipio"},
-        "Acateno": {"coords": [20.0847, -97.2025], "estado": "Puebla", "poblacion": 9170, "lat": 20.0847, "lon": -97.2025, "tipo": "municipio"},
-        "Tlacotepec de Benito Juárez": {"coords": [18.5636, -97.5458], "estado": "Puebla", "poblacion": 53282, "lat": 18.5636, "lon": -97.5458, "tipo": "municipio"},
-        "Zongozotla": {"coords": [20.0964, -97.5819], "estado": "Puebla", "poblacion": 9474, "lat": 20.0964, "lon": -97.5819, "tipo": "municipio"},
-        "Cuyoaco": {"coords": [19.4564, -97.6253], "estado": "Puebla", "poblacion": 8780, "lat": 19.4564, "lon": -97.6253, "tipo": "municipio"},
-        "Nauzontla": {"coords": [20.0247, -97.6278], "estado": "Puebla", "poblacion": 8393, "lat": 20.0247, "lon": -97.6278, "tipo": "municipio"},
-        "San Martín Totoltepec": {"coords": [18.9144, -97.7944], "estado": "Puebla", "poblacion": 8263, "lat": 18.9144, "lon": -97.7944, "tipo": "municipio"},
-        "Tuzamapan de Galeana": {"coords": [20.2708, -97.5872], "estado": "Puebla", "poblacion": 8213, "lat": 20.2708, "lon": -97.5872, "tipo": "municipio"},
-        "Atoyatempan": {"coords": [18.8833, -97.9458], "estado": "Puebla", "poblacion": 7704, "lat": 18.8833, "lon": -97.9458, "tipo": "municipio"},
-        "Tepetzintla": {"coords": [20.0294, -97.7289], "estado": "Puebla", "poblacion": 7609, "lat": 20.0294, "lon": -97.7289, "tipo": "municipio"},
-        "Ocotepec": {"coords": [19.4122, -97.5347], "estado": "Puebla", "poblacion": 7561, "lat": 19.4122, "lon": -97.5347, "tipo": "municipio"},
-        "Aljojuca": {"coords": [19.0658, -97.4397], "estado": "Puebla", "poblacion": 7515, "lat": 19.0658, "lon": -97.4397, "tipo": "municipio"},
-        "Tepetzintla": {"coords": [19.6631, -97.9625], "estado": "Puebla", "poblacion": 7434, "lat": 19.6631, "lon": -97.9625, "tipo": "municipio"},
-        "San José Chiapa": {"coords": [19.1831, -97.7597], "estado": "Puebla", "poblacion": 7181, "lat": 19.1831, "lon": -97.7597, "tipo": "municipio"},
-        "Ixtacamaxtitlán": {"coords": [19.5858, -97.9408], "estado": "Puebla", "poblacion": 26365, "lat": 19.5858, "lon": -97.9408, "tipo": "municipio"},
-        "Cohuecan": {"coords": [18.8028, -98.6667], "estado": "Puebla", "poblacion": 5403, "lat": 18.8028, "lon": -98.6667, "tipo": "municipio"},
-        "Coyomeapan": {"coords": [18.3583, -97.0083], "estado": "Puebla", "poblacion": 14806, "lat": 18.3583, "lon": -97.0083, "tipo": "municipio"},
-        "Cuayuca de Andrade": {"coords": [18.3372, -98.0539], "estado": "Puebla", "poblacion": 4725, "lat": 18.3372, "lon": -98.0539, "tipo": "municipio"},
-        "Epatlán": {"coords": [18.7297, -98.4864], "estado": "Puebla", "poblacion": 4704, "lat": 18.7297, "lon": -98.4864, "tipo": "municipio"},
-        "Zapotitlán de Méndez": {"coords": [20.0006, -97.6167], "estado": "Puebla", "poblacion": 4683, "lat": 20.0006, "lon": -97.6167, "tipo": "municipio"},
-        "Tepeyahualco de Cuauhtémoc": {"coords": [18.7844, -97.7731], "estado": "Puebla", "poblacion": 4543, "lat": 18.7844, "lon": -97.7731, "tipo": "municipio"},
-        "Chila": {"coords": [18.0678, -97.8000], "estado": "Puebla", "poblacion": 4357, "lat": 18.0678, "lon": -97.8000, "tipo": "municipio"},
-        "San Martín Totoltepec": {"coords": [19.0069, -97.9658], "estado": "Puebla", "poblacion": 4277, "lat": 19.0069, "lon": -97.9658, "tipo": "municipio"},
-        "Caltepec": {"coords": [18.0772, -97.4339], "estado": "Puebla", "poblacion": 4128, "lat": 18.0772, "lon": -97.4339, "tipo": "municipio"},
-        "Chigmecatitlán": {"coords": [18.3506, -98.3847], "estado": "Puebla", "poblacion": 4065, "lat": 18.3506, "lon": -98.3847, "tipo": "municipio"},
-        "San Juan Atenco": {"coords": [19.1231, -97.3500], "estado": "Puebla", "poblacion": 4026, "lat": 19.1231, "lon": -97.3500, "tipo": "municipio"},
-        "Atexcal": {"coords": [18.2719, -97.6250], "estado": "Puebla", "poblacion": 3859, "lat": 18.2719, "lon": -97.6250, "tipo": "municipio"},
-        "Teopantlán": {"coords": [18.6750, -98.2439], "estado": "Puebla", "poblacion": 3836, "lat": 18.6750, "lon": -98.2439, "tipo": "municipio"},
-        "Caxhuacan": {"coords": [20.0633, -97.4208], "estado": "Puebla", "poblacion": 3811, "lat": 20.0633, "lon": -97.4208, "tipo": "municipio"},
-        "San Felipe Tepatlán": {"coords": [20.0989, -97.6750], "estado": "Puebla", "poblacion": 3793, "lat": 20.0989, "lon": -97.6750, "tipo": "municipio"},
-        "San Pablo Anicano": {"coords": [18.0689, -98.2575], "estado": "Puebla", "poblacion": 3759, "lat": 18.0689, "lon": -98.2575, "tipo": "municipio"},
-        "Teotlalco": {"coords": [18.2528, -98.7831], "estado": "Puebla", "poblacion": 3689, "lat": 18.2528, "lon": -98.7831, "tipo": "municipio"},
-        "San Jerónimo Xayacatlán": {"coords": [18.1561, -97.9428], "estado": "Puebla", "poblacion": 3606, "lat": 18.1561, "lon": -97.9428, "tipo": "municipio"},
-        "Xochiltepec": {"coords": [18.5900, -98.2558], "estado": "Puebla", "poblacion": 3375, "lat": 18.5900, "lon": -98.2558, "tipo": "municipio"},
-        "Ahuatlán": {"coords": [18.5283, -98.2433], "estado": "Puebla", "poblacion": 3162, "lat": 18.5283, "lon": -98.2433, "tipo": "municipio"},
-        "Acteopan": {"coords": [18.7733, -98.6508], "estado": "Puebla", "poblacion": 3070, "lat": 18.7733, "lon": -98.6508, "tipo": "municipio"},
-        "Chinantla": {"coords": [18.0672, -98.6389], "estado": "Puebla", "poblacion": 3037, "lat": 18.0672, "lon": -98.6389, "tipo": "municipio"},
-        "Coatzingo": {"coords": [18.5833, -98.1167], "estado": "Puebla", "poblacion": 2820, "lat": 18.5833, "lon": -98.1167, "tipo": "municipio"},
-        "Camocuautla": {"coords": [20.0167, -97.5833], "estado": "Puebla", "poblacion": 2758, "lat": 20.0167, "lon": -97.5833, "tipo": "municipio"},
-        "Mixtla": {"coords": [18.9950, -97.8739], "estado": "Puebla", "poblacion": 2668, "lat": 18.9950, "lon": -97.8739, "tipo": "municipio"},
-        "Atlequizayan": {"coords": [20.0381, -97.4397], "estado": "Puebla", "poblacion": 2633, "lat": 20.0381, "lon": -97.4397, "tipo": "municipio"},
-        "Zoquiapan": {"coords": [20.0275, -97.5211], "estado": "Puebla", "poblacion": 2452, "lat": 20.0275, "lon": -97.5211, "tipo": "municipio"},
-        "Coyotepec": {"coords": [18.4681, -97.8925], "estado": "Puebla", "poblacion": 2334, "lat": 18.4681, "lon": -97.8925, "tipo": "municipio"},
-        "Ahuehuetitla": {"coords": [18.0617, -98.3967], "estado": "Puebla", "poblacion": 2207, "lat": 18.0617, "lon": -98.3967, "tipo": "municipio"},
-        "Albino Zertuche": {"coords": [18.1061, -98.0531], "estado": "Puebla", "poblacion": 1885, "lat": 18.1061, "lon": -98.0531, "tipo": "municipio"},
-        "Xayacatlán de Bravo": {"coords": [18.0556, -98.1008], "estado": "Puebla", "poblacion": 1570, "lat": 18.0556, "lon": -98.1008, "tipo": "municipio"},
-        "Atzala": {"coords": [18.7997, -98.5722], "estado": "Puebla", "poblacion": 1512, "lat": 18.7997, "lon": -98.5722, "tipo": "municipio"},
-        "Cohetzala": {"coords": [18.0833, -98.7167], "estado": "Puebla", "poblacion": 1382, "lat": 18.0833, "lon": -98.7167, "tipo": "municipio"},
-        "Xicotlán": {"coords": [18.1133, -98.5344], "estado": "Puebla", "poblacion": 1312, "lat": 18.1133, "lon": -98.5344, "tipo": "municipio"},
-        "San Diego la Mesa Tochimiltzingo": {"coords": [18.7517, -98.2433], "estado": "Puebla", "poblacion": 1270, "lat": 18.7517, "lon": -98.2433, "tipo": "municipio"},
-        "Chigmecatitlán": {"coords": [18.3506, -98.3847], "estado": "Puebla", "poblacion": 1215, "lat": 18.3506, "lon": -98.3847, "tipo": "municipio"},
-        "Totoltepec de Guerrero": {"coords": [18.1889, -97.6667], "estado": "Puebla", "poblacion": 1187, "lat": 18.1889, "lon": -97.6667, "tipo": "municipio"},
-        "Axutla": {"coords": [18.2522, -98.7889], "estado": "Puebla", "poblacion": 976, "lat": 18.2522, "lon": -98.7889, "tipo": "municipio"},
-        "San Juan Atzompa": {"coords": [18.6653, -97.4339], "estado": "Puebla", "poblacion": 975, "lat": 18.6653, "lon": -97.4339, "tipo": "municipio"},
-        "Coatepec": {"coords": [20.0881, -97.6083], "estado": "Puebla", "poblacion": 772, "lat": 20.0881, "lon": -97.6083, "tipo": "municipio"},
-        "Santa Catarina Tlaltempan": {"coords": [18.7297, -97.7708], "estado": "Puebla", "poblacion": 749, "lat": 18.7297, "lon": -97.7708, "tipo": "municipio"},
-        "San Martín Totoltepec": {"coords": [19.0069, -97.9658], "estado": "Puebla", "poblacion": 692, "lat": 19.0069, "lon": -97.9658, "tipo": "municipio"},
-        "La Magdalena Tlatlauquitepec": {"coords": [18.7303, -98.0583], "estado": "Puebla", "poblacion": 650, "lat": 18.7303, "lon": -98.0583, "tipo": "municipio"},
-        "San Miguel Ixitlán": {"coords": [17.9706, -98.5833], "estado": "Puebla", "poblacion": 526, "lat": 17.9706, "lon": -98.5833, "tipo": "municipio"},
-        "Tehuacán": {"coords": [18.4619, -97.3878], "estado": "Puebla", "poblacion": 353677, "lat": 18.4619, "lon": -97.3878, "tipo": "municipio"},
-        "San Martín Texmelucan": {"coords": [19.2706, -98.4358], "estado": "Puebla", "poblacion": 154089, "lat": 19.2706, "lon": -98.4358, "tipo": "municipio"},
-        "Atlixco": {"coords": [18.9150, -98.4383], "estado": "Puebla", "poblacion": 141793, "lat": 18.9150, "lon": -98.4383, "tipo": "municipio"},
-        "San Andrés Cholula": {"coords": [19.0483, -98.2917], "estado": "Puebla", "poblacion": 154441, "lat": 19.0483, "lon": -98.2917, "tipo": "municipio"},
-        "Teziutlán": {"coords": [19.9242, -97.3619], "estado": "Puebla", "poblacion": 98667, "lat": 19.9242, "lon": -97.3619, "tipo": "municipio"},
-        "Huauchinango": {"coords": [20.1747, -98.0308], "estado": "Puebla", "poblacion": 103043, "lat": 20.1747, "lon": -98.0308, "tipo": "municipio"},
-        "Cuautlancingo": {"coords": [19.0911, -98.2575], "estado": "Puebla", "poblacion": 137375, "lat": 19.0911, "lon": -98.2575, "tipo": "municipio"},
-        "Zacatlán": {"coords": [19.9317, -97.9542], "estado": "Puebla", "poblacion": 87363, "lat": 19.9317, "lon": -97.9542, "tipo": "municipio"},
-        "Xicotepec": {"coords": [20.2933, -97.9575], "estado": "Puebla", "poblacion": 80922, "lat": 20.2933, "lon": -97.9575, "tipo": "municipio"},
-        "Tepeaca": {"coords": [18.9950, -97.7558], "estado": "Puebla", "poblacion": 84666, "lat": 18.9950, "lon": -97.7558, "tipo": "municipio"},
-        "Izúcar de Matamoros": {"coords": [18.5919, -98.4550], "estado": "Puebla", "poblacion": 89434, "lat": 18.5919, "lon": -98.4550, "tipo": "municipio"},
-        "Tecamachalco": {"coords": [18.8950, -97.7378], "estado": "Puebla", "poblacion": 85081, "lat": 18.8950, "lon": -97.7378, "tipo": "municipio"},
-        "Huejotzingo": {"coords": [19.1678, -98.4069], "estado": "Puebla", "poblacion": 70966, "lat": 19.1678, "lon": -98.4069, "tipo": "municipio"},
-        "Ajalpan": {"coords": [18.3794, -97.2300], "estado": "Puebla", "poblacion": 74768, "lat": 18.3794, "lon": -97.2300, "tipo": "municipio"},
-        "Acajete": {"coords": [19.1417, -97.9861], "estado": "Puebla", "poblacion": 72894, "lat": 19.1417, "lon": -97.9861, "tipo": "municipio"},
-        "Chignahuapan": {"coords": [19.8378, -98.0564], "estado": "Puebla", "poblacion": 67771, "lat": 19.8378, "lon": -98.0564, "tipo": "municipio"},
-        "Acatzingo": {"coords": [18.9667, -97.7889], "estado": "Puebla", "poblacion": 63743, "lat": 18.9667, "lon": -97.7889, "tipo": "municipio"},
-        "Zacapoaxtla": {"coords": [19.8056, -97.6078], "estado": "Puebla", "poblacion": 53572, "lat": 19.8056, "lon": -97.6078, "tipo": "municipio"},
-        "Tlatlauquitepec": {"coords": [19.8822, -97.5028], "estado": "Puebla", "poblacion": 56262, "lat": 19.8822, "lon": -97.5028, "tipo": "municipio"},
-        "Tlacotepec de Benito Juárez": {"coords": [18.5636, -97.5458], "estado": "Puebla", "poblacion": 53282, "lat": 18.5636, "lon": -97.5458, "tipo": "municipio"},
-        "Cuetzalan del Progreso": {"coords": [20.0464, -97.5258], "estado": "Puebla", "poblacion": 50570, "lat": 20.0464, "lon": -97.5258, "tipo": "municipio"},
-        "Quecholac": {"coords": [18.9483, -97.6256], "estado": "Puebla", "poblacion": 54627, "lat": 18.9483, "lon": -97.6256, "tipo": "municipio"}
-    },
-    "Querétaro": {
-        "Querétaro (Santiago de Querétaro)": {"coords": [20.5881, -100.3881], "estado": "Querétaro", "poblacion": 1049777, "lat": 20.5881, "lon": -100.3881, "tipo": "municipio"},
-        "San Juan del Río": {"coords": [20.3700, -99.9900], "estado": "Querétaro", "poblacion": 297805, "lat": 20.3700, "lon": -99.9900, "tipo": "municipio"},
-        "Corregidora": {"coords": [20.5600, -100.4100], "estado": "Querétaro", "poblacion": 212567, "lat": 20.5600, "lon": -100.4100, "tipo": "municipio"},
-        "El Marqués": {"coords": [20.6100, -100.2800], "estado": "Querétaro", "poblacion": 231668, "lat": 20.6100, "lon": -100.2800, "tipo": "municipio"},
-        "Pedro Escobedo": {"coords": [20.5100, -100.1500], "estado": "Querétaro", "poblacion": 89296, "lat": 20.5100, "lon": -100.1500, "tipo": "municipio"},
-        "Tequisquiapan": {"coords": [20.5000, -99.8800], "estado": "Querétaro", "poblacion": 72201, "lat": 20.5000, "lon": -99.8800, "tipo": "municipio"},
-        "Cadereyta de Montes": {"coords": [20.7000, -99.8200], "estado": "Querétaro", "poblacion": 69076, "lat": 20.7000, "lon": -99.8200, "tipo": "municipio"},
-        "Amealco de Bonfil": {"coords": [20.2100, -100.1500], "estado": "Querétaro", "poblacion": 66841, "lat": 20.2100, "lon": -100.1500, "tipo": "municipio"},
-        "Colón": {"coords": [20.6700, -100.0600], "estado": "Querétaro", "poblacion": 67911, "lat": 20.6700, "lon": -100.0600, "tipo": "municipio"},
-        "Jalpan de Serra": {"coords": [21.2300, -99.4800], "estado": "Querétaro", "poblacion": 27284, "lat": 21.2300, "lon": -99.4800, "tipo": "municipio"},
-        "Toluquilla": {"coords": [21.0300, -99.5000], "estado": "Querétaro", "poblacion": 28420, "lat": 21.0300, "lon": -99.5000, "tipo": "municipio"},
-        "Landa de Matamoros": {"coords": [21.2300, -99.2500], "estado": "Querétaro", "poblacion": 21544, "lat": 21.2300, "lon": -99.2500, "tipo": "municipio"},
-        "Pinal de Amoles": {"coords": [21.1400, -99.6300], "estado": "Querétaro", "poblacion": 28521, "lat": 21.1400, "lon": -99.6300, "tipo": "municipio"},
-        "Arroyo Seco": {"coords": [21.4000, -99.6500], "estado": "Querétaro", "poblacion": 13247, "lat": 21.4000, "lon": -99.6500, "tipo": "municipio"},
-        "Peñamiller": {"coords": [21.0100, -99.8500], "estado": "Querétaro", "poblacion": 18274, "lat": 21.0100, "lon": -99.8500, "tipo": "municipio"},
-        "San Joaquín": {"coords": [20.9300, -99.5800], "estado": "Querétaro", "poblacion": 8861, "lat": 20.9300, "lon": -99.5800, "tipo": "municipio"},
-        "Ezequiel Montes": {"coords": [20.6500, -99.9100], "estado": "Querétaro", "poblacion": 45391, "lat": 20.6500, "lon": -99.9100, "tipo": "municipio"},
-        "Huimilpan": {"coords": [20.4200, -100.3200], "estado": "Querétaro", "poblacion": 38634, "lat": 20.4200, "lon": -100.3200, "tipo": "municipio"}
-    },
-    "San Luis Potosí": {
-        "San Luis Potosí": {"coords": [22.1492, -100.9994], "estado": "San Luis Potosí", "poblacion": 911908, "lat": 22.1492, "lon": -100.9994, "tipo": "municipio"},
-        "Soledad de Graciano Sánchez": {"coords": [22.1794, -100.9578], "estado": "San Luis Potosí", "poblacion": 332072, "lat": 22.1794, "lon": -100.9578, "tipo": "municipio"},
-        "Ciudad Valles": {"coords": [21.9369, -99.0183], "estado": "San Luis Potosí", "poblacion": 179371, "lat": 21.9369, "lon": -99.0183, "tipo": "municipio"},
-        "Matehuala": {"coords": [23.6528, -100.6556], "estado": "San Luis Potosí", "poblacion": 102199, "lat": 23.6528, "lon": -100.6556, "tipo": "municipio"},
-        "Rioverde": {"coords": [21.9214, -99.9672], "estado": "San Luis Potosí", "poblacion": 97943, "lat": 21.9214, "lon": -99.9672, "tipo": "municipio"},
-        "Tamazunchale": {"coords": [21.2500, -98.7800], "estado": "San Luis Potosí", "poblacion": 95037, "lat": 21.2500, "lon": -98.7800, "tipo": "municipio"},
-        "Mexquitic de Carmona": {"coords": [22.2500, -101.0700], "estado": "San Luis Potosí", "poblacion": 58469, "lat": 22.2500, "lon": -101.0700, "tipo": "municipio"},
-        "Villa de Reyes": {"coords": [21.8419, -101.0181], "estado": "San Luis Potosí", "poblacion": 52912, "lat": 21.8419, "lon": -101.0181, "tipo": "municipio"},
-        "Xilitla": {"coords": [21.3800, -99.0000], "estado": "San Luis Potosí", "poblacion": 49741, "lat": 21.3800, "lon": -99.0000, "tipo": "municipio"},
-        "Aquismón": {"coords": [21.6333, -99.0333], "estado": "San Luis Potosí", "poblacion": 48359, "lat": 21.6333, "lon": -99.0333, "tipo": "municipio"},
-        "Ciudad Fernández": {"coords": [22.0100, -100.0000], "estado": "San Luis Potosí", "poblacion": 48106, "lat": 22.0100, "lon": -100.0000, "tipo": "municipio"},
-        "Ébano": {"coords": [22.2289, -98.4067], "estado": "San Luis Potosí", "poblacion": 40899, "lat": 22.2289, "lon": -98.4067, "tipo": "municipio"},
-        "Santa María del Río": {"coords": [21.8200, -100.7300], "estado": "San Luis Potosí", "poblacion": 39880, "lat": 21.8200, "lon": -100.7300, "tipo": "municipio"},
-        "Villa de Ramos": {"coords": [22.9567, -101.6967], "estado": "San Luis Potosí", "poblacion": 38389, "lat": 22.9567, "lon": -101.6967, "tipo": "municipio"},
-        "Tamuín": {"coords": [22.0483, -98.7183], "estado": "San Luis Potosí", "poblacion": 36968, "lat": 22.0483, "lon": -98.7183, "tipo": "municipio"},
-        "Axtla de Terrazas": {"coords": [21.4333, -98.9000], "estado": "San Luis Potosí", "poblacion": 32544, "lat": 21.4333, "lon": -98.9000, "tipo": "municipio"},
-        "Salinas": {"coords": [22.6372, -101.7161], "estado": "San Luis Potosí", "poblacion": 31107, "lat": 22.6372, "lon": -101.7161, "tipo": "municipio"},
-        "Ciudad del Maíz": {"coords": [22.3900, -99.6100], "estado": "San Luis Potosí", "poblacion": 30320, "lat": 22.3900, "lon": -99.6100, "tipo": "municipio"},
-        "Tamasopo": {"coords": [21.9400, -99.3900], "estado": "San Luis Potosí", "poblacion": 29184, "lat": 21.9400, "lon": -99.3900, "tipo": "municipio"},
-        "Matlapa": {"coords": [21.2800, -98.8100], "estado": "San Luis Potosí", "poblacion": 28996, "lat": 21.2800, "lon": -98.8100, "tipo": "municipio"},
-        "Zaragoza": {"coords": [21.8522, -100.8664], "estado": "San Luis Potosí", "poblacion": 27386, "lat": 21.8522, "lon": -100.8664, "tipo": "municipio"},
-        "Guadalcázar": {"coords": [22.8400, -100.3200], "estado": "San Luis Potosí", "poblacion": 25119, "lat": 22.8400, "lon": -100.3200, "tipo": "municipio"},
-        "Cerritos": {"coords": [22.3556, -100.2764], "estado": "San Luis Potosí", "poblacion": 22075, "lat": 22.3556, "lon": -100.2764, "tipo": "municipio"},
-        "Charcas": {"coords": [23.1558, -101.1097], "estado": "San Luis Potosí", "poblacion": 21814, "lat": 23.1558, "lon": -101.1097, "tipo": "municipio"},
-        "Tancanhuitz": {"coords": [21.5700, -98.9400], "estado": "San Luis Potosí", "poblacion": 20300, "lat": 21.5700, "lon": -98.9400, "tipo": "municipio"},
-        "El Naranjo": {"coords": [22.5200, -99.2800], "estado": "San Luis Potosí", "poblacion": 20959, "lat": 22.5200, "lon": -99.2800, "tipo": "municipio"},
-        "Cedral": {"coords": [23.8200, -100.6700], "estado": "San Luis Potosí", "poblacion": 19840, "lat": 23.8200, "lon": -100.6700, "tipo": "municipio"},
-        "Moctezuma": {"coords": [22.6500, -101.3000], "estado": "San Luis Potosí", "poblacion": 19036, "lat": 22.6500, "lon": -101.3000, "tipo": "municipio"},
-        "Ahualulco": {"coords": [22.3900, -101.1000], "estado": "San Luis Potosí", "poblacion": 18974, "lat": 22.3900, "lon": -101.1000, "tipo": "municipio"},
-        "San Martín Chalchicuautla": {"coords": [21.2800, -98.7100], "estado": "San Luis Potosí", "poblacion": 18468, "lat": 21.2800, "lon": -98.7100, "tipo": "municipio"},
-        "Cárdenas": {"coords": [22.0100, -99.6400], "estado": "San Luis Potosí", "poblacion": 18317, "lat": 22.0100, "lon": -99.6400, "tipo": "municipio"},
-        "Tanlajás": {"coords": [21.7200, -98.7000], "estado": "San Luis Potosí", "poblacion": 18208, "lat": 21.7200, "lon": -98.7000, "tipo": "municipio"},
-        "Villa de Arriaga": {"coords": [21.9900, -101.3600], "estado": "San Luis Potosí", "poblacion": 18206, "lat": 21.9900, "lon": -101.3600, "tipo": "municipio"},
-        "Villa de Arista": {"coords": [22.8464, -101.0775], "estado": "San Luis Potosí", "poblacion": 17258, "lat": 22.8464, "lon": -101.0775, "tipo": "municipio"},
-        "Coxcatlán": {"coords": [21.5053, -98.9053], "estado": "San Luis Potosí", "poblacion": 15660, "lat": 21.5053, "lon": -98.9053, "tipo": "municipio"},
-        "Villa Hidalgo": {"coords": [22.4200, -100.5600], "estado": "San Luis Potosí", "poblacion": 15458, "lat": 22.4200, "lon": -100.5600, "tipo": "municipio"},
-        "Huehuetlán": {"coords": [21.4300, -98.9000], "estado": "San Luis Potosí", "poblacion": 15334, "lat": 21.4300, "lon": -98.9000, "tipo": "municipio"},
-        "Rayón": {"coords": [22.0100, -99.6400], "estado": "San Luis Potosí", "poblacion": 15301, "lat": 22.0100, "lon": -99.6400, "tipo": "municipio"},
-        "San Vicente Tancuayalab": {"coords": [21.8400, -98.6300], "estado": "San Luis Potosí", "poblacion": 14945, "lat": 21.8400, "lon": -98.6300, "tipo": "municipio"},
-        "Tampacán": {"coords": [21.3600, -98.7200], "estado": "San Luis Potosí", "poblacion": 14348, "lat": 21.3600, "lon": -98.7200, "tipo": "municipio"},
-        "Venado": {"coords": [22.8200, -101.2700], "estado": "San Luis Potosí", "poblacion": 14188, "lat": 22.8200, "lon": -101.2700, "tipo": "municipio"},
-        "Tampamolón Corona": {"coords": [21.4600, -98.7000], "estado": "San Luis Potosí", "poblacion": 13603, "lat": 21.4600, "lon": -98.7000, "tipo": "municipio"},
-        "Tanquián de Escobedo": {"coords": [21.6500, -98.6700], "estado": "San Luis Potosí", "poblacion": 13448, "lat": 21.6500, "lon": -98.6700, "tipo": "municipio"},
-        "Santa Catarina": {"coords": [21.5700, -99.7000], "estado": "San Luis Potosí", "poblacion": 12163, "lat": 21.5700, "lon": -99.7000, "tipo": "municipio"},
-        "Santo Domingo": {"coords": [24.1600, -101.5900], "estado": "San Luis Potosí", "poblacion": 10785, "lat": 24.1600, "lon": -101.5900, "tipo": "municipio"},
-        "Villa Juárez": {"coords": [22.2500, -99.8800], "estado": "San Luis Potosí", "poblacion": 10304, "lat": 22.2500, "lon": -99.8800, "tipo": "municipio"},
-        "San Ciro de Acosta": {"coords": [22.0100, -99.7300], "estado": "San Luis Potosí", "poblacion": 10215, "lat": 22.0100, "lon": -99.7300, "tipo": "municipio"},
-        "Catorce": {"coords": [23.6800, -100.8900], "estado": "San Luis Potosí", "poblacion": 9579, "lat": 23.6800, "lon": -100.8900, "tipo": "municipio"},
-        "San Antonio": {"coords": [21.5500, -98.6600], "estado": "San Luis Potosí", "poblacion": 9382, "lat": 21.5500, "lon": -98.6600, "tipo": "municipio"},
-        "Villa de Guadalupe": {"coords": [23.1800, -100.8400], "estado": "San Luis Potosí", "poblacion": 9277, "lat": 23.1800, "lon": -100.8400, "tipo": "municipio"},
-        "Tierra Nueva": {"coords": [21.4600, -100.6700], "estado": "San Luis Potosí", "poblacion": 7966, "lat": 21.4600, "lon": -100.6700, "tipo": "municipio"},
-        "Alaquines": {"coords": [22.0400, -99.6000], "estado": "San Luis Potosí", "poblacion": 7785, "lat": 22.0400, "lon": -99.6000, "tipo": "municipio"},
-        "Vanegas": {"coords": [23.8800, -100.9900], "estado": "San Luis Potosí", "poblacion": 7557, "lat": 23.8800, "lon": -100.9900, "tipo": "municipio"},
-        "Lagunillas": {"coords": [21.6800, -99.5400], "estado": "San Luis Potosí", "poblacion": 5453, "lat": 21.6800, "lon": -99.5400, "tipo": "municipio"},
-        "Villa de la Paz": {"coords": [23.7700, -100.6000], "estado": "San Luis Potosí", "poblacion": 5298, "lat": 23.7700, "lon": -100.6000, "tipo": "municipio"},
-        "Cerro de San Pedro": {"coords": [22.2500, -100.8200], "estado": "San Luis Potosí", "poblacion": 5050, "lat": 22.2500, "lon": -100.8200, "tipo": "municipio"},
-        "San Nicolás Tolentino": {"coords": [22.0100, -100.5600], "estado": "San Luis Potosí", "poblacion": 4779, "lat": 22.0100, "lon": -100.5600, "tipo": "municipio"},
-        "Armadillo de los Infante": {"coords": [22.1800, -100.7300], "estado": "San Luis Potosí", "poblacion": 4013, "lat": 22.1800, "lon": -100.7300, "tipo": "municipio"}
-    },
-    "Tabasco": {
-        "Balancán": {"coords": [17.80215, -91.53872], "estado": "Tabasco", "poblacion": 58524, "lat": 17.80215, "lon": -91.53872, "tipo": "municipio"},
-        "Cárdenas": {"coords": [18.00007, -93.38194], "estado": "Tabasco", "poblacion": 243229, "lat": 18.00007, "lon": -93.38194, "tipo": "municipio"},
-        "Centla": {"coords": [18.53250, -92.64722], "estado": "Tabasco", "poblacion": 107731, "lat": 18.53250, "lon": -92.64722, "tipo": "municipio"},
-        "Centro": {"coords": [17.98917, -92.94333], "estado": "Tabasco", "poblacion": 683607, "lat": 17.98917, "lon": -92.94333, "tipo": "capital"},
-        "Comalcalco": {"coords": [18.26667, -93.21667], "estado": "Tabasco", "poblacion": 214877, "lat": 18.26667, "lon": -93.21667, "tipo": "municipio"},
-        "Cunduacán": {"coords": [18.06667, -93.17500], "estado": "Tabasco", "poblacion": 137257, "lat": 18.06667, "lon": -93.17500, "tipo": "municipio"},
-        "Emiliano Zapata": {"coords": [17.73333, -91.76667], "estado": "Tabasco", "poblacion": 32181, "lat": 17.73333, "lon": -91.76667, "tipo": "municipio"},
-        "Huimanguillo": {"coords": [17.83333, -93.38333], "estado": "Tabasco", "poblacion": 190885, "lat": 17.83333, "lon": -93.38333, "tipo": "municipio"},
-        "Jalapa": {"coords": [17.71667, -92.83333], "estado": "Tabasco", "poblacion": 37749, "lat": 17.71667, "lon": -92.83333, "tipo": "municipio"},
-        "Jalpa de Méndez": {"coords": [18.18333, -93.06667], "estado": "Tabasco", "poblacion": 91185, "lat": 18.18333, "lon": -93.06667, "tipo": "municipio"},
-        "Jonuta": {"coords": [18.08333, -92.13333], "estado": "Tabasco", "poblacion": 30798, "lat": 18.08333, "lon": -92.13333, "tipo": "municipio"},
-        "Macuspana": {"coords": [17.76667, -92.60000], "estado": "Tabasco", "poblacion": 158601, "lat": 17.76667, "lon": -92.60000, "tipo": "municipio"},
-        "Nacajuca": {"coords": [18.16667, -93.03333], "estado": "Tabasco", "poblacion": 150300, "lat": 18.16667, "lon": -93.03333, "tipo": "municipio"},
-        "Paraíso": {"coords": [18.40000, -93.21667], "estado": "Tabasco", "poblacion": 96741, "lat": 18.40000, "lon": -93.21667, "tipo": "municipio"},
-        "Tacotalpa": {"coords": [17.60000, -92.83333], "estado": "Tabasco", "poblacion": 47905, "lat": 17.60000, "lon": -92.83333, "tipo": "municipio"},
-        "Teapa": {"coords": [17.55000, -92.95000], "estado": "Tabasco", "poblacion": 58718, "lat": 17.55000, "lon": -92.95000, "tipo": "municipio"},
-        "Tenosique": {"coords": [17.46667, -91.43333], "estado": "Tabasco", "poblacion": 62310, "lat": 17.46667, "lon": -91.43333, "tipo": "municipio"}
-    },
-    "Tamaulipas": {
-        "Ciudad Victoria": {"coords": [23.7369, -99.1411], "estado": "Tamaulipas", "poblacion": 350000, "lat": 23.7369, "lon": -99.1411, "tipo": "capital"},
-        "Matamoros": {"coords": [25.8790, -97.5045], "estado": "Tamaulipas", "poblacion": 520000, "lat": 25.8790, "lon": -97.5045, "tipo": "municipio"},
-        "Nuevo Laredo": {"coords": [27.4917, -99.5075], "estado": "Tamaulipas", "poblacion": 420000, "lat": 27.4917, "lon": -99.5075, "tipo": "municipio"},
-        "Altamira": {"coords": [22.3833, -97.8500], "estado": "Tamaulipas", "poblacion": 200000, "lat": 22.3833, "lon": -97.8500, "tipo": "municipio"},
-        "Ciudad Madero": {"coords": [22.2833, -97.8667], "estado": "Tamaulipas", "poblacion": 150000, "lat": 22.2833, "lon": -97.8667, "tipo": "municipio"}
-    },
-    "Tlaxcala": {
-        "Tlaxcala": {"coords": [19.4147, -98.2417], "estado": "Tlaxcala", "poblacion": 99896, "lat": 19.4147, "lon": -98.2417, "tipo": "municipio"},
-        "Huamantla": {"coords": [19.3106, -97.9150], "estado": "Tlaxcala", "poblacion": 98764, "lat": 19.3106, "lon": -97.9150, "tipo": "municipio"},
-        "San Pablo del Monte": {"coords": [19.0989, -98.1764], "estado": "Tlaxcala", "poblacion": 82688, "lat": 19.0989, "lon": -98.1764, "tipo": "municipio"},
-        "Apizaco": {"coords": [19.4183, -98.1403], "estado": "Tlaxcala", "poblacion": 80725, "lat": 19.4183, "lon": -98.1403, "tipo": "municipio"},
-        "Chiautempan": {"coords": [19.3400, -98.1722], "estado": "Tlaxcala", "poblacion": 73215, "lat": 19.3400, "lon": -98.1722, "tipo": "municipio"},
-        "Calpulalpan": {"coords": [19.5856, -98.5714], "estado": "Tlaxcala", "poblacion": 51172, "lat": 19.5856, "lon": -98.5714, "tipo": "municipio"},
-        "Zacatelco": {"coords": [19.2483, -98.2408], "estado": "Tlaxcala", "poblacion": 45717, "lat": 19.2483, "lon": -98.2408, "tipo": "municipio"},
-        "Tlaxco": {"coords": [19.5936, -98.1342], "estado": "Tlaxcala", "poblacion": 45438, "lat": 19.5936, "lon": -98.1342, "tipo": "municipio"},
-        "Yauhquemehcan": {"coords": [19.4000, -98.1250], "estado": "Tlaxcala", "poblacion": 42242, "lat": 19.4000, "lon": -98.1250, "tipo": "municipio"},
-        "Ixtacuixtla de Mariano Matamoros": {"coords": [19.4000, -98.3583], "estado": "Tlaxcala", "poblacion": 38970, "lat": 19.4000, "lon": -98.3583, "tipo": "municipio"},
-        "Contla de Juan Cuamatzi": {"coords": [19.3300, -98.1500], "estado": "Tlaxcala", "poblacion": 38579, "lat": 19.3300, "lon": -98.1500, "tipo": "municipio"},
-        "Tetla de la Solidaridad": {"coords": [19.4750, -98.1139], "estado": "Tlaxcala", "poblacion": 35284, "lat": 19.4750, "lon": -98.1139, "tipo": "municipio"},
-        "Papalotla de Xicohténcatl": {"coords": [19.2150, -98.2047], "estado": "Tlaxcala", "poblacion": 33499, "lat": 19.2150, "lon": -98.2047, "tipo": "municipio"},
-        "Panotla": {"coords": [19.3389, -98.2833], "estado": "Tlaxcala", "poblacion": 28357, "lat": 19.3389, "lon": -98.2833, "tipo": "municipio"},
-        "Natívitas": {"coords": [19.2422, -98.3411], "estado": "Tlaxcala", "poblacion": 26309, "lat": 19.2422, "lon": -98.3411, "tipo": "municipio"},
-        "Xaloztoc": {"coords": [19.4000, -98.0500], "estado": "Tlaxcala", "poblacion": 25607, "lat": 19.4000, "lon": -98.0500, "tipo": "municipio"},
-        "Teolocholco": {"coords": [19.2556, -98.1389], "estado": "Tlaxcala", "poblacion": 25257, "lat": 19.2556, "lon": -98.1389, "tipo": "municipio"},
-        "Santa Cruz Tlaxcala": {"coords": [19.3800, -98.1700], "estado": "Tlaxcala", "poblacion": 24116, "lat": 19.3800, "lon": -98.1700, "tipo": "municipio"},
-        "Totolac": {"coords": [19.3358, -98.2606], "estado": "Tlaxcala", "poblacion": 22529, "lat": 19.3358, "lon": -98.2606, "tipo": "municipio"},
-        "Tepetitla de Lardizábal": {"coords": [19.3172, -98.3758], "estado": "Tlaxcala", "poblacion": 22274, "lat": 19.3172, "lon": -98.3758, "tipo": "municipio"},
-        "La Magdalena Tlaltelulco": {"coords": [19.2778, -98.1947], "estado": "Tlaxcala", "poblacion": 19036, "lat": 19.2778, "lon": -98.1947, "tipo": "municipio"},
-        "Nanacamilpa de Mariano Arista": {"coords": [19.5408, -98.5475], "estado": "Tlaxcala", "poblacion": 18686, "lat": 19.5408, "lon": -98.5475, "tipo": "municipio"},
-        "Atltzayanca": {"coords": [19.4975, -97.7475], "estado": "Tlaxcala", "poblacion": 18111, "lat": 19.4975, "lon": -97.7475, "tipo": "municipio"},
-        "Tzompantepec": {"coords": [19.3625, -98.0258], "estado": "Tlaxcala", "poblacion": 18006, "lat": 19.3625, "lon": -98.0258, "tipo": "municipio"},
-        "El Carmen Tequexquitla": {"coords": [19.4172, -97.7011], "estado": "Tlaxcala", "poblacion": 17332, "lat": 19.4172, "lon": -97.7011, "tipo": "municipio"},
-        "Cuapiaxtla": {"coords": [19.3736, -97.7558], "estado": "Tlaxcala", "poblacion": 16222, "lat": 19.3736, "lon": -97.7558, "tipo": "municipio"},
-        "Apetatitlán de Antonio Carvajal": {"coords": [19.3558, -98.1883], "estado": "Tlaxcala", "poblacion": 16003, "lat": 19.3558, "lon": -98.1883, "tipo": "municipio"},
-        "Terrenate": {"coords": [19.5708, -97.9019], "estado": "Tlaxcala", "poblacion": 15475, "lat": 19.5708, "lon": -97.9019, "tipo": "municipio"},
-        "Hueyotlipan": {"coords": [19.4939, -98.3586], "estado": "Tlaxcala", "poblacion": 15190, "lat": 19.4939, "lon": -98.3586, "tipo": "municipio"},
-        "Xicohtzinco": {"coords": [19.2208, -98.2575], "estado": "Tlaxcala", "poblacion": 14197, "lat": 19.2208, "lon": -98.2575, "tipo": "municipio"},
-        "Tetlatlahuca": {"coords": [19.2617, -98.2917], "estado": "Tlaxcala", "poblacion": 13561, "lat": 19.2617, "lon": -98.2917, "tipo": "municipio"},
-        "Tepeyanco": {"coords": [19.2558, -98.2708], "estado": "Tlaxcala", "poblacion": 13328, "lat": 19.2558, "lon": -98.2708, "tipo": "municipio"},
-        "Tenancingo": {"coords": [19.2514, -98.2256], "estado": "Tlaxcala", "poblacion": 12974, "lat": 19.2514, "lon": -98.2256, "tipo": "municipio"},
-        "San Francisco Tetlanohcan": {"coords": [19.2600, -98.1639], "estado": "Tlaxcala", "poblacion": 11761, "lat": 19.2600, "lon": -98.1639, "tipo": "municipio"},
-        "Mazatecochco de José María Morelos": {"coords": [19.1672, -98.2189], "estado": "Tlaxcala", "poblacion": 11592, "lat": 19.1672, "lon": -98.2189, "tipo": "municipio"},
-        "Amaxac de Guerrero": {"coords": [19.4158, -98.1633], "estado": "Tlaxcala", "poblacion": 11403, "lat": 19.4158, "lon": -98.1633, "tipo": "municipio"},
-        "Xaltocan": {"coords": [19.4881, -98.1833], "estado": "Tlaxcala", "poblacion": 10601, "lat": 19.4881, "lon": -98.1833, "tipo": "municipio"},
-        "Santa Catarina Ayometla": {"coords": [19.1997, -98.2167], "estado": "Tlaxcala", "poblacion": 9463, "lat": 19.1997, "lon": -98.2167, "tipo": "municipio"},
-        "Sanctórum de Lázaro Cárdenas": {"coords": [19.5636, -98.4903], "estado": "Tlaxcala", "poblacion": 9432, "lat": 19.5636, "lon": -98.4903, "tipo": "municipio"},
-        "Españita": {"coords": [19.5400, -98.4200], "estado": "Tlaxcala", "poblacion": 9416, "lat": 19.5400, "lon": -98.4200, "tipo": "municipio"},
-        "Ziltlaltépec de Trinidad Sánchez Santos": {"coords": [19.3667, -97.9833], "estado": "Tlaxcala", "poblacion": 9207, "lat": 19.3667, "lon": -97.9833, "tipo": "municipio"},
-        "Santa Ana Nopalucan": {"coords": [19.2997, -98.3342], "estado": "Tlaxcala", "poblacion": 7952, "lat": 19.2997, "lon": -98.3342, "tipo": "municipio"},
-        "Santa Cruz Quilehtla": {"coords": [19.2131, -98.2225], "estado": "Tlaxcala", "poblacion": 7750, "lat": 19.2131, "lon": -98.2225, "tipo": "municipio"},
-        "San Juan Huactzinco": {"coords": [19.2458, -98.2508], "estado": "Tlaxcala", "poblacion": 7688, "lat": 19.2458, "lon": -98.2508, "tipo": "municipio"},
-        "Ixtenco": {"coords": [19.3083, -97.8097], "estado": "Tlaxcala", "poblacion": 7504, "lat": 19.3083, "lon": -97.8097, "tipo": "municipio"},
-        "Atlangatepec": {"coords": [19.5700, -98.1889], "estado": "Tlaxcala", "poblacion": 7087, "lat": 19.5700, "lon": -98.1889, "tipo": "municipio"},
-        "San José Teacalco": {"coords": [19.3356, -98.0644], "estado": "Tlaxcala", "poblacion": 6436, "lat": 19.3356, "lon": -98.0644, "tipo": "municipio"},
-        "Acuamanala de Miguel Hidalgo": {"coords": [19.2650, -98.2167], "estado": "Tlaxcala", "poblacion": 6432, "lat": 19.2650, "lon": -98.2167, "tipo": "municipio"},
-        "Tocatlán": {"coords": [19.4750, -98.0583], "estado": "Tlaxcala", "poblacion": 6294, "lat": 19.4750, "lon": -98.0583, "tipo": "municipio"},
-        "Benito Juárez": {"coords": [19.5844, -98.4264], "estado": "Tlaxcala", "poblacion": 6211, "lat": 19.5844, "lon": -98.4264, "tipo": "municipio"},
-        "Cuaxomulco": {"coords": [19.3400, -98.1250], "estado": "Tlaxcala", "poblacion": 5928, "lat": 19.3400, "lon": -98.1250, "tipo": "municipio"},
-        "San Damián Texoloc": {"coords": [19.2781, -98.2847], "estado": "Tlaxcala", "poblacion": 5884, "lat": 19.2781, "lon": -98.2847, "tipo": "municipio"},
-        "San Lorenzo Axocomanitla": {"coords": [19.2250, -98.2483], "estado": "Tlaxcala", "poblacion": 5689, "lat": 19.2250, "lon": -98.2483, "tipo": "municipio"},
-        "Santa Isabel Xiloxoxtla": {"coords": [19.2750, -98.2139], "estado": "Tlaxcala", "poblacion": 5443, "lat": 19.2750, "lon": -98.2139, "tipo": "municipio"},
-        "Emiliano Zapata": {"coords": [19.5583, -97.9150], "estado": "Tlaxcala", "poblacion": 4951, "lat": 19.5583, "lon": -97.9150, "tipo": "municipio"},
-        "Muñoz de Domingo Arenas": {"coords": [19.4239, -98.2058], "estado": "Tlaxcala", "poblacion": 4755, "lat": 19.4239, "lon": -98.2058, "tipo": "municipio"},
-        "Santa Apolonia Teacalco": {"coords": [19.2375, -98.3083], "estado": "Tlaxcala", "poblacion": 4636, "lat": 19.2375, "lon": -98.3083, "tipo": "municipio"},
-        "San Jerónimo Zacualpan": {"coords": [19.2417, -98.2611], "estado": "Tlaxcala", "poblacion": 4092, "lat": 19.2417, "lon": -98.2611, "tipo": "municipio"},
-        "Lázaro Cárdenas": {"coords": [19.5383, -98.0000], "estado": "Tlaxcala", "poblacion": 3534, "lat": 19.5383, "lon": -98.0000, "tipo": "municipio"},
-        "San Lucas Tecopilco": {"coords": [19.4842, -98.2567], "estado": "Tlaxcala", "poblacion": 3077, "lat": 19.4842, "lon": -98.2567, "tipo": "municipio"}
-    },
-    "Yucatán": {
-        "Abalá": {"coords": [20.7333, -89.7000], "estado": "Yucatán", "poblacion": 6550, "lat": 20.7333, "lon": -89.7000, "clave_inegi": "31001", "tipo": "municipio"},
-        "Acanceh": {"coords": [20.8333, -89.4667], "estado": "Yucatán", "poblacion": 16772, "lat": 20.8333, "lon": -89.4667, "clave_inegi": "31002", "tipo": "municipio"},
-        "Akil": {"coords": [20.2500, -89.4667], "estado": "Yucatán", "poblacion": 12285, "lat": 20.2500, "lon": -89.4667, "clave_inegi": "31003", "tipo": "municipio"},
-        "Baca": {"coords": [21.0833, -89.3333], "estado": "Yucatán", "poblacion": 6195, "lat": 21.0833, "lon": -89.3333, "clave_inegi": "31004", "tipo": "municipio"},
-        "Bokobá": {"coords": [20.8833, -89.0667], "estado": "Yucatán", "poblacion": 2167, "lat": 20.8833, "lon": -89.0667, "clave_inegi": "31005", "tipo": "municipio"},
-        "Buctzotz": {"coords": [21.2333, -88.9833], "estado": "Yucatán", "poblacion": 9159, "lat": 21.2333, "lon": -88.9833, "clave_inegi": "31006", "tipo": "municipio"},
-        "Cacalchén": {"coords": [20.9833, -89.3500], "estado": "Yucatán", "poblacion": 7490, "lat": 20.9833, "lon": -89.3500, "clave_inegi": "31007", "tipo": "municipio"},
-        "Calotmul": {"coords": [20.9333, -88.1667], "estado": "Yucatán", "poblacion": 3949, "lat": 20.9333, "lon": -88.1667, "clave_inegi": "31008", "tipo": "municipio"},
-        "Cansahcab": {"coords": [21.0833, -89.1500], "estado": "Yucatán", "poblacion": 4466, "lat": 21.0833, "lon": -89.1500, "clave_inegi": "31009", "tipo": "municipio"},
-        "Cantamayec": {"coords": [20.4833, -88.8000], "estado": "Yucatán", "poblacion": 2755, "lat": 20.4833, "lon": -88.8000, "clave_inegi": "31010", "tipo": "municipio"},
-        "Celestún": {"coords": [20.8500, -90.4000], "estado": "Yucatán", "poblacion": 8389, "lat": 20.8500, "lon": -90.4000, "clave_inegi": "31011", "tipo": "municipio"},
-        "Cenotillo": {"coords": [20.9833, -88.7667], "estado": "Yucatán", "poblacion": 3736, "lat": 20.9833, "lon": -88.7667, "clave_inegi": "31012", "tipo": "municipio"},
-        "Conkal": {"coords": [21.0667, -89.5000], "estado": "Yucatán", "poblacion": 16671, "lat": 21.0667, "lon": -89.5000, "clave_inegi": "31013", "tipo": "municipio"},
-        "Cuncunul": {"coords": [20.7500, -88.4500], "estado": "Yucatán", "poblacion": 1595, "lat": 20.7500, "lon": -88.4500, "clave_inegi": "31014", "tipo": "municipio"},
-        "Cuzamá": {"coords": [20.7000, -89.2833], "estado": "Yucatán", "poblacion": 5560, "lat": 20.7000, "lon": -89.2833, "clave_inegi": "31015", "tipo": "municipio"},
-        "Chacsinkín": {"coords": [20.0833, -88.9333], "estado": "Yucatán", "poblacion": 3104, "lat": 20.0833, "lon": -88.9333, "clave_inegi": "31016", "tipo": "municipio"},
-        "Chankom": {"coords": [20.5833, -88.2333], "estado": "Yucatán", "poblacion": 4686, "lat": 20.5833, "lon": -88.2333, "clave_inegi": "31017", "tipo": "municipio"},
-        "Chapab": {"coords": [20.4833, -89.5833], "estado": "Yucatán", "poblacion": 3385, "lat": 20.4833, "lon": -89.5833, "clave_inegi": "31018", "tipo": "municipio"},
-        "Chemax": {"coords": [20.7333, -87.8000], "estado": "Yucatán", "poblacion": 38934, "lat": 20.7333, "lon": -87.8000, "clave_inegi": "31019", "tipo": "municipio"},
-        "Chicxulub Pueblo": {"coords": [21.0667, -89.4167], "estado": "Yucatán", "poblacion": 4497, "lat": 21.0667, "lon": -89.4167, "clave_inegi": "31020", "tipo": "municipio"},
-        "Chichimilá": {"coords": [20.6167, -88.1667], "estado": "Yucatán", "poblacion": 9406, "lat": 20.6167, "lon": -88.1667, "clave_inegi": "31021", "tipo": "municipio"},
-        "Chikindzonot": {"coords": [20.3500, -88.3500], "estado": "Yucatán", "poblacion": 4363, "lat": 20.3500, "lon": -88.3500, "clave_inegi": "31022", "tipo": "municipio"},
-        "Chocholá": {"coords": [20.8167, -89.8667], "estado": "Yucatán", "poblacion": 4863, "lat": 20.8167, "lon": -89.8667, "clave_inegi": "31023", "tipo": "municipio"},
-        "Chumayel": {"coords": [20.4500, -89.3333], "estado": "Yucatán", "poblacion": 3244, "lat": 20.4500, "lon": -89.3333, "clave_inegi": "31024", "tipo": "municipio"},
-        "Dzán": {"coords": [20.4000, -89.4500], "estado": "Yucatán", "poblacion": 6003, "lat": 20.4000, "lon": -89.4500, "clave_inegi": "31025", "tipo": "municipio"},
-        "Dzemul": {"coords": [21.1333, -89.3000], "estado": "Yucatán", "poblacion": 3622, "lat": 21.1333, "lon": -89.3000, "clave_inegi": "31026", "tipo": "municipio"},
-        "Dzidzantún": {"coords": [21.2000, -89.1000], "estado": "Yucatán", "poblacion": 8345, "lat": 21.2000, "lon": -89.1000, "clave_inegi": "31027", "tipo": "municipio"},
-        "Dzilam de Bravo": {"coords": [21.4000, -88.8833], "estado": "Yucatán", "poblacion": 2936, "lat": 21.4000, "lon": -88.8833, "clave_inegi": "31028", "tipo": "municipio"},
-        "Dzilam González": {"coords": [21.2333, -89.0000], "estado": "Yucatán", "poblacion": 6240, "lat": 21.2333, "lon": -89.0000, "clave_inegi": "31029", "tipo": "municipio"},
-        "Dzitás": {"coords": [20.8833, -88.5833], "estado": "Yucatán", "poblacion": 4015, "lat": 20.8833, "lon": -88.5833, "clave_inegi": "31030", "tipo": "municipio"},
-        "Dzoncauich": {"coords": [21.1000, -88.9000], "estado": "Yucatán", "poblacion": 2818, "lat": 21.1000, "lon": -88.9000, "clave_inegi": "31031", "tipo": "municipio"},
-        "Espita": {"coords": [21.0333, -88.2333], "estado": "Yucatán", "poblacion": 16779, "lat": 21.0333, "lon": -88.2333, "clave_inegi": "31032", "tipo": "municipio"},
-        "Halachó": {"coords": [20.5333, -90.2333], "estado": "Yucatán", "poblacion": 21255, "lat": 20.5333, "lon": -90.2333, "clave_inegi": "31033", "tipo": "municipio"},
-        "Hocabá": {"coords": [20.8833, -89.2000], "estado": "Yucatán", "poblacion": 6514, "lat": 20.8833, "lon": -89.2000, "clave_inegi": "31034", "tipo": "municipio"},
-        "Hoctún": {"coords": [20.9167, -89.2167], "estado": "Yucatán", "poblacion": 6384, "lat": 20.9167, "lon": -89.2167, "clave_inegi": "31035", "tipo": "municipio"},
-        "Homún": {"coords": [20.7333, -89.2833], "estado": "Yucatán", "poblacion": 8090, "lat": 20.7333, "lon": -89.2833, "clave_inegi": "31036", "tipo": "municipio"},
-        "Huhí": {"coords": [20.7000, -89.1500], "estado": "Yucatán", "poblacion": 5250, "lat": 20.7000, "lon": -89.1500, "clave_inegi": "31037", "tipo": "municipio"},
-        "Hunucmá": {"coords": [21.0333, -90.0333], "estado": "Yucatán", "poblacion": 35137, "lat": 21.0333, "lon": -90.0333, "clave_inegi": "31038", "tipo": "municipio"},
-        "Ixil": {"coords": [21.1333, -89.4500], "estado": "Yucatán", "poblacion": 4186, "lat": 21.1333, "lon": -89.4500, "clave_inegi": "31039", "tipo": "municipio"},
-        "Izamal": {"coords": [20.9333, -89.0000], "estado": "Yucatán", "poblacion": 28555, "lat": 20.9333, "lon": -89.0000, "clave_inegi": "31040", "tipo": "municipio"},
-        "Kanasín": {"coords": [20.9333, -89.5333], "estado": "Yucatán", "poblacion": 141939, "lat": 20.9333, "lon": -89.5333, "clave_inegi": "31041", "tipo": "municipio"},
-        "Kantunil": {"coords": [20.8500, -89.0000], "estado": "Yucatán", "poblacion": 5553, "lat": 20.8500, "lon": -89.0000, "clave_inegi": "31042", "tipo": "municipio"},
-        "Kaua": {"coords": [20.7000, -88.3833], "estado": "Yucatán", "poblacion": 3405, "lat": 20.7000, "lon": -88.3833, "clave_inegi": "31043", "tipo": "municipio"},
-        "Kinchil": {"coords": [20.9333, -90.0333], "estado": "Yucatán", "poblacion": 7530, "lat": 20.9333, "lon": -90.0333, "clave_inegi": "31044", "tipo": "municipio"},
-        "Kopomá": {"coords": [20.7333, -90.0333], "estado": "Yucatán", "poblacion": 2677, "lat": 20.7333, "lon": -90.0333, "clave_inegi": "31045", "tipo": "municipio"},
-        "Mama": {"coords": [20.4833, -89.3500], "estado": "Yucatán", "poblacion": 3296, "lat": 20.4833, "lon": -89.3500, "clave_inegi": "31046", "tipo": "municipio"},
-        "Maní": {"coords": [20.4167, -89.3833], "estado": "Yucatán", "poblacion": 5968, "lat": 20.4167, "lon": -89.3833, "clave_inegi": "31047", "tipo": "municipio"},
-        "Maxcanú": {"coords": [20.5833, -90.2500], "estado": "Yucatán", "poblacion": 23991, "lat": 20.5833, "lon": -90.2500, "clave_inegi": "31048", "tipo": "municipio"},
-        "Mayapán": {"coords": [20.4500, -89.0167], "estado": "Yucatán", "poblacion": 3965, "lat": 20.4500, "lon": -89.0167, "clave_inegi": "31049", "tipo": "municipio"},
-        "Mérida": {"coords": [20.9667, -89.6167], "estado": "Yucatán", "poblacion": 995129, "lat": 20.9667, "lon": -89.6167, "clave_inegi": "31050", "tipo": "municipio"},
-        "Mocochá": {"coords": [21.0667, -89.3833], "estado": "Yucatán", "poblacion": 3430, "lat": 21.0667, "lon": -89.3833, "clave_inegi": "31051", "tipo": "municipio"},
-        "Motul": {"coords": [21.0833, -89.2833], "estado": "Yucatán", "poblacion": 37804, "lat": 21.0833, "lon": -89.2833, "clave_inegi": "31052", "tipo": "municipio"},
-        "Muna": {"coords": [20.4833, -89.7333], "estado": "Yucatán", "poblacion": 13494, "lat": 20.4833, "lon": -89.7333, "clave_inegi": "31053", "tipo": "municipio"},
-        "Muxupip": {"coords": [21.0000, -89.3667], "estado": "Yucatán", "poblacion": 2990, "lat": 21.0000, "lon": -89.3667, "clave_inegi": "31054", "tipo": "municipio"},
-        "Opichén": {"coords": [20.6667, -89.8500], "estado": "Yucatán", "poblacion": 7080, "lat": 20.6667, "lon": -89.8500, "clave_inegi": "31055", "tipo": "municipio"},
-        "Oxkutzcab": {"coords": [20.3000, -89.4167], "estado": "Yucatán", "poblacion": 33854, "lat": 20.3000, "lon": -89.4167, "clave_inegi": "31056", "tipo": "municipio"},
-        "Panabá": {"coords": [21.3167, -88.2333], "estado": "Yucatán", "poblacion": 7766, "lat": 21.3167, "lon": -88.2333, "clave_inegi": "31057", "tipo": "municipio"},
-        "Peto": {"coords": [20.1500, -89.4333], "estado": "Yucatán", "poblacion": 25954, "lat": 20.1500, "lon": -89.4333, "clave_inegi": "31058", "tipo": "municipio"},
-        "Progreso": {"coords": [21.2833, -89.6667], "estado": "Yucatán", "poblacion": 66008, "lat": 21.2833, "lon": -89.6667, "clave_inegi": "31059", "tipo": "municipio"},
-        "Quintana Roo": {"coords": [20.9167, -88.9333], "estado": "Yucatán", "poblacion": 1039, "lat": 20.9167, "lon": -88.9333, "clave_inegi": "31060", "tipo": "municipio"},
-        "Río Lagartos": {"coords": [21.5667, -88.1667], "estado": "Yucatán", "poblacion": 3974, "lat": 21.5667, "lon": -88.1667, "clave_inegi": "31061", "tipo": "municipio"},
-        "Sacalum": {"coords": [20.5000, -89.7000], "estado": "Yucatán", "poblacion": 4962, "lat": 20.5000, "lon": -89.7000, "clave_inegi": "31062", "tipo": "municipio"},
-        "Samahil": {"coords": [20.9167, -90.0167], "estado": "Yucatán", "poblacion": 5631, "lat": 20.9167, "lon": -90.0167, "clave_inegi": "31063", "tipo": "municipio"},
-        "Sanahcat": {"coords": [20.7667, -89.1500], "estado": "Yucatán", "poblacion": 2947, "lat": 20.7667, "lon": -89.1500, "clave_inegi": "31064", "tipo": "municipio"},
-        "San Felipe": {"coords": [21.5500, -88.2333], "estado": "Yucatán", "poblacion": 2000, "lat": 21.5500, "lon": -88.2333, "clave_inegi": "31065", "tipo": "municipio"},
-        "Santa Elena": {"coords": [20.2500, -89.7333], "estado": "Yucatán", "poblacion": 4220, "lat": 20.2500, "lon": -89.7333, "clave_inegi": "31066", "tipo": "municipio"},
-        "Seyé": {"coords": [20.8833, -89.3667], "estado": "Yucatán", "poblacion": 10053, "lat": 20.8833, "lon": -89.3667, "clave_inegi": "31067", "tipo": "municipio"},
-        "Sinanché": {"coords": [21.2333, -89.1500], "estado": "Yucatán", "poblacion": 3206, "lat": 21.2333, "lon": -89.1500, "clave_inegi": "31068", "tipo": "municipio"},
-        "Sotuta": {"coords": [20.7000, -89.0333], "estado": "Yucatán", "poblacion": 8967, "lat": 20.7000, "lon": -89.0333, "clave_inegi": "31069", "tipo": "municipio"},
-        "Sucilá": {"coords": [21.2500, -88.5833], "estado": "Yucatán", "poblacion": 3971, "lat": 21.2500, "lon": -88.5833, "clave_inegi": "31070", "tipo": "municipio"},
-        "Sudzal": {"coords": [20.8667, -88.7500], "estado": "Yucatán", "poblacion": 1690, "lat": 20.8667, "lon": -88.7500, "clave_inegi": "31071", "tipo": "municipio"},
-        "Sumá": {"coords": [21.0333, -89.2667], "estado": "Yucatán", "poblacion": 1845, "lat": 21.0333, "lon": -89.2667, "clave_inegi": "31072", "tipo": "municipio"},
-        "Tahdziú": {"coords": [20.1500, -88.9333], "estado": "Yucatán", "poblacion": 5854, "lat": 20.1500, "lon": -88.9333, "clave_inegi": "31073", "tipo": "municipio"},
-        "Tahmek": {"coords": [20.9167, -89.2000], "estado": "Yucatán", "poblacion": 3774, "lat": 20.9167, "lon": -89.2000, "clave_inegi": "31074", "tipo": "municipio"},
-        "Teabo": {"coords": [20.4500, -89.4167], "estado": "Yucatán", "poblacion": 6921, "lat": 20.4500, "lon": -89.4167, "clave_inegi": "31075", "tipo": "municipio"},
-        "Tecoh": {"coords": [20.7833, -89.3667], "estado": "Yucatán", "poblacion": 17939, "lat": 20.7833, "lon": -89.3667, "clave_inegi": "31076", "tipo": "municipio"},
-        "Tekal de Venegas": {"coords": [21.0000, -88.7833], "estado": "Yucatán", "poblacion": 2683, "lat": 21.0000, "lon": -88.7833, "clave_inegi": "31077", "tipo": "municipio"},
-        "Tekantó": {"coords": [21.0167, -89.2000], "estado": "Yucatán", "poblacion": 3747, "lat": 21.0167, "lon": -89.2000, "clave_inegi": "31078", "tipo": "municipio"},
-        "Tekax": {"coords": [20.2000, -89.2833], "estado": "Yucatán", "poblacion": 45062, "lat": 20.2000, "lon": -89.2833, "clave_inegi": "31079", "tipo": "municipio"},
-        "Tekit": {"coords": [20.5500, -89.2833], "estado": "Yucatán", "poblacion": 11020, "lat": 20.5500, "lon": -89.2833, "clave_inegi": "31080", "tipo": "municipio"},
-        "Tekom": {"coords": [20.5833, -88.3333], "estado": "Yucatán", "poblacion": 3355, "lat": 20.5833, "lon": -88.3333, "clave_inegi": "31081", "tipo": "municipio"},
-        "Telchac Pueblo": {"coords": [21.1667, -89.2833], "estado": "Yucatán", "poblacion": 3512, "lat": 21.1667, "lon": -89.2833, "clave_inegi": "31082", "tipo": "municipio"},
-        "Telchac Puerto": {"coords": [21.3500, -89.2833], "estado": "Yucatán", "poblacion": 1787, "lat": 21.3500, "lon": -89.2833, "clave_inegi": "31083", "tipo": "municipio"},
-        "Temax": {"coords": [21.0833, -89.0667], "estado": "Yucatán", "poblacion": 7037, "lat": 21.0833, "lon": -89.0667, "clave_inegi": "31084", "tipo": "municipio"},
-        "Temozón": {"coords": [20.7833, -88.1500], "estado": "Yucatán", "poblacion": 16680, "lat": 20.7833, "lon": -88.1500, "clave_inegi": "31085", "tipo": "municipio"},
-        "Tepakán": {"coords": [21.0333, -89.0000], "estado": "Yucatán", "poblacion": 2133, "lat": 21.0333, "lon": -89.0000, "clave_inegi": "31086", "tipo": "municipio"},
-        "Tetiz": {"coords": [21.0000, -90.0000], "estado": "Yucatán", "poblacion": 5464, "lat": 21.0000, "lon": -90.0000, "clave_inegi": "31087", "tipo": "municipio"},
-        "Teya": {"coords": [20.9833, -89.0000], "estado": "Yucatán", "poblacion": 2577, "lat": 20.9833, "lon": -89.0000, "clave_inegi": "31088", "tipo": "municipio"},
-        "Ticul": {"coords": [20.4000, -89.5833], "estado": "Yucatán", "poblacion": 40495, "lat": 20.4000, "lon": -89.5833, "clave_inegi": "31089", "tipo": "municipio"},
-        "Timucuy": {"coords": [20.7667, -89.4667], "estado": "Yucatán", "poblacion": 7503, "lat": 20.7667, "lon": -89.4667, "clave_inegi": "31090", "tipo": "municipio"},
-        "Tinum": {"coords": [20.7500, -88.4667], "estado": "Yucatán", "poblacion": 12700, "lat": 20.7500, "lon": -88.4667, "clave_inegi": "31091", "tipo": "municipio"},
-        "Tixcacalcupul": {"coords": [20.5000, -88.1667], "estado": "Yucatán", "poblacion": 7888, "lat": 20.5000, "lon": -88.1667, "clave_inegi": "31092", "tipo": "municipio"},
-        "Tixkokob": {"coords": [20.9833, -89.4167], "estado": "Yucatán", "poblacion": 18420, "lat": 20.9833, "lon": -89.4167, "clave_inegi": "31093", "tipo": "municipio"},
-        "Tixmehuac": {"coords": [20.1667, -89.2000], "estado": "Yucatán", "poblacion": 5444, "lat": 20.1667, "lon": -89.2000, "clave_inegi": "31094", "tipo": "municipio"},
-        "Tixpéhual": {"coords": [20.9667, -89.4500], "estado": "Yucatán", "poblacion": 5690, "lat": 20.9667, "lon": -89.4500, "clave_inegi": "31095", "tipo": "municipio"},
-        "Tizimín": {"coords": [21.1500, -88.1500], "estado": "Yucatán", "poblacion": 80672, "lat": 21.1500, "lon": -88.1500, "clave_inegi": "31096", "tipo": "municipio"},
-        "Tunkás": {"coords": [20.9500, -88.8500], "estado": "Yucatán", "poblacion": 3684, "lat": 20.9500, "lon": -88.8500, "clave_inegi": "31097", "tipo": "municipio"},
-        "Tzucacab": {"coords": [20.0167, -89.0667], "estado": "Yucatán", "poblacion": 15346, "lat": 20.0167, "lon": -89.0667, "clave_inegi": "31098", "tipo": "municipio"},
-        "Uayma": {"coords": [20.7833, -88.3500], "estado": "Yucatán", "poblacion": 4191, "lat": 20.7833, "lon": -88.3500, "clave_inegi": "31099", "tipo": "municipio"},
-        "Ucú": {"coords": [21.0000, -89.7833], "estado": "Yucatán", "poblacion": 4049, "lat": 21.0000, "lon": -89.7833, "clave_inegi": "31100", "tipo": "municipio"},
-        "Umán": {"coords": [20.8833, -89.7500], "estado": "Yucatán", "poblacion": 69147, "lat": 20.8833, "lon": -89.7500, "clave_inegi": "31101", "tipo": "municipio"},
-        "Valladolid": {"coords": [20.6833, -88.2000], "estado": "Yucatán", "poblacion": 85460, "lat": 20.6833, "lon": -88.2000, "clave_inegi": "31102", "tipo": "municipio"},
-        "Xocchel": {"coords": [20.8333, -89.1500], "estado": "Yucatán", "poblacion": 3451, "lat": 20.8333, "lon": -89.1500, "clave_inegi": "31103", "tipo": "municipio"},
-        "Yaxcabá": {"coords": [20.6167, -88.8167], "estado": "Yucatán", "poblacion": 16350, "lat": 20.6167, "lon": -88.8167, "clave_inegi": "31104", "tipo": "municipio"},
-        "Yaxkukul": {"coords": [21.0833, -89.5000], "estado": "Yucatán", "poblacion": 3293, "lat": 21.0833, "lon": -89.5000, "clave_inegi": "31105", "tipo": "municipio"},
-        "Yobaín": {"coords": [21.2833, -89.1333], "estado": "Yucatán", "poblacion": 2215, "lat": 21.2833, "lon": -89.1333, "clave_inegi": "31106", "tipo": "municipio"},
-        "Apozol": {"coords": [21.4333, -103.2000], "estado": "Zacatecas", "poblacion": 6500, "lat": 21.4333, "lon": -103.2000, "clave_inegi": "32001", "tipo": "municipio"},
-        "Atolinga": {"coords": [21.5500, -103.3500], "estado": "Zacatecas", "poblacion": 2500, "lat": 21.5500, "lon": -103.3500, "clave_inegi": "32002", "tipo": "municipio"},
-        "Benito Juárez": {"coords": [22.4000, -103.5667], "estado": "Zacatecas", "poblacion": 4500, "lat": 22.4000, "lon": -103.5667, "clave_inegi": "32003", "tipo": "municipio"},
-        "Calera": {"coords": [22.8667, -102.6667], "estado": "Zacatecas", "poblacion": 45759, "lat": 22.8667, "lon": -102.6667, "clave_inegi": "32004", "tipo": "municipio"},
-        "Cañitas de Felipe Pescador": {"coords": [23.6333, -102.8333], "estado": "Zacatecas", "poblacion": 8000, "lat": 23.6333, "lon": -102.8333, "clave_inegi": "32005", "tipo": "municipio"},
-        "Concepción del Oro": {"coords": [24.5833, -101.4167], "estado": "Zacatecas", "poblacion": 13000, "lat": 24.5833, "lon": -101.4167, "clave_inegi": "32006", "tipo": "municipio"},
-        "Cuauhtémoc": {"coords": [22.5667, -102.4000], "estado": "Zacatecas", "poblacion": 13400, "lat": 22.5667, "lon": -102.4000, "clave_inegi": "32007", "tipo": "municipio"},
-        "Chalchihuites": {"coords": [23.4667, -103.9500], "estado": "Zacatecas", "poblacion": 10500, "lat": 23.4667, "lon": -103.9500, "clave_inegi": "32008", "tipo": "municipio"},
-        "Fresnillo": {"coords": [23.1833, -102.8667], "estado": "Zacatecas", "poblacion": 240532, "lat": 23.1833, "lon": -102.8667, "clave_inegi": "32009", "tipo": "municipio"},
-        "García de la Cadena": {"coords": [21.2333, -103.5500], "estado": "Zacatecas", "poblacion": 4500, "lat": 21.2333, "lon": -103.5500, "clave_inegi": "32010", "tipo": "municipio"},
-        "General Enrique Estrada": {"coords": [22.8833, -102.8333], "estado": "Zacatecas", "poblacion": 6644, "lat": 22.8833, "lon": -102.8333, "clave_inegi": "32011", "tipo": "municipio"},
-        "General Francisco R. Murguía": {"coords": [24.0333, -102.7333], "estado": "Zacatecas", "poblacion": 21000, "lat": 24.0333, "lon": -102.7333, "clave_inegi": "32012", "tipo": "municipio"},
-        "General Pánfilo Natera": {"coords": [22.7500, -102.1000], "estado": "Zacatecas", "poblacion": 23000, "lat": 22.7500, "lon": -102.1000, "clave_inegi": "32013", "tipo": "municipio"},
-        "Guadalupe": {"coords": [22.7667, -102.5000], "estado": "Zacatecas", "poblacion": 211740, "lat": 22.7667, "lon": -102.5000, "clave_inegi": "32014", "tipo": "municipio"},
-        "Huanusco": {"coords": [21.5000, -103.1500], "estado": "Zacatecas", "poblacion": 4500, "lat": 21.5000, "lon": -103.1500, "clave_inegi": "32015", "tipo": "municipio"},
-        "Jalpa": {"coords": [21.6333, -103.0167], "estado": "Zacatecas", "poblacion": 25500, "lat": 21.6333, "lon": -103.0167, "clave_inegi": "32016", "tipo": "municipio"},
-        "Jerez": {"coords": [22.6500, -102.9833], "estado": "Zacatecas", "poblacion": 59000, "lat": 22.6500, "lon": -102.9833, "clave_inegi": "32017", "tipo": "municipio"},
-        "Jiménez del Teul": {"coords": [23.9500, -103.7333], "estado": "Zacatecas", "poblacion": 4500, "lat": 23.9500, "lon": -103.7333, "clave_inegi": "32018", "tipo": "municipio"},
-        "Juan Aldama": {"coords": [24.2833, -103.0500], "estado": "Zacatecas", "poblacion": 20000, "lat": 24.2833, "lon": -103.0500, "clave_inegi": "32019", "tipo": "municipio"},
-        "Juchipila": {"coords": [21.3667, -103.2667], "estado": "Zacatecas", "poblacion": 12500, "lat": 21.3667, "lon": -103.2667, "clave_inegi": "32020", "tipo": "municipio"},
-        "Loreto": {"coords": [22.2500, -102.0000], "estado": "Zacatecas", "poblacion": 48500, "lat": 22.2500, "lon": -102.0000, "clave_inegi": "32021", "tipo": "municipio"},
-        "Mazapil": {"coords": [24.6333, -101.9000], "estado": "Zacatecas", "poblacion": 18000, "lat": 24.6333, "lon": -101.9000, "clave_inegi": "32022", "tipo": "municipio"},
-        "Melchor Ocampo": {"coords": [24.5000, -102.0667], "estado": "Zacatecas", "poblacion": 2800, "lat": 24.5000, "lon": -102.0667, "clave_inegi": "32023", "tipo": "municipio"},
-        "Mezquital del Oro": {"coords": [21.1333, -103.4833], "estado": "Zacatecas", "poblacion": 2200, "lat": 21.1333, "lon": -103.4833, "clave_inegi": "32024", "tipo": "municipio"},
-        "Miguel Auza": {"coords": [23.9000, -103.5833], "estado": "Zacatecas", "poblacion": 20000, "lat": 23.9000, "lon": -103.5833, "clave_inegi": "32025", "tipo": "municipio"},
-        "Momax": {"coords": [21.5667, -103.3500], "estado": "Zacatecas", "poblacion": 2500, "lat": 21.5667, "lon": -103.3500, "clave_inegi": "32026", "tipo": "municipio"},
-        "Monte Escobedo": {"coords": [22.2667, -103.5000], "estado": "Zacatecas", "poblacion": 9000, "lat": 22.2667, "lon": -103.5000, "clave_inegi": "32027", "tipo": "municipio"},
-        "Morelos": {"coords": [22.9000, -102.5833], "estado": "Zacatecas", "poblacion": 13207, "lat": 22.9000, "lon": -102.5833, "clave_inegi": "32028", "tipo": "municipio"},
-        "Moyahua de Estrada": {"coords": [21.1167, -103.3833], "estado": "Zacatecas", "poblacion": 4500, "lat": 21.1167, "lon": -103.3833, "clave_inegi": "32029", "tipo": "municipio"},
-        "Nochistlán de Mejía": {"coords": [21.5167, -103.0167], "estado": "Zacatecas", "poblacion": 19500, "lat": 21.5167, "lon": -103.0167, "clave_inegi": "32030", "tipo": "municipio"},
-        "Noria de Ángeles": {"coords": [22.4000, -101.8833], "estado": "Zacatecas", "poblacion": 16000, "lat": 22.4000, "lon": -101.8833, "clave_inegi": "32031", "tipo": "municipio"},
-        "Ojocaliente": {"coords": [22.5667, -102.2667], "estado": "Zacatecas", "poblacion": 42000, "lat": 22.5667, "lon": -102.2667, "clave_inegi": "32032", "tipo": "municipio"},
-        "Pánuco": {"coords": [22.8667, -102.5333], "estado": "Zacatecas", "poblacion": 17577, "lat": 22.8667, "lon": -102.5333, "clave_inegi": "32033", "tipo": "municipio"},
-        "Pinos": {"coords": [22.3167, -101.5500], "estado": "Zacatecas", "poblacion": 80000, "lat": 22.3167, "lon": -101.5500, "clave_inegi": "32034", "tipo": "municipio"},
-        "Río Grande": {"coords": [23.8333, -103.0333], "estado": "Zacatecas", "poblacion": 68000, "lat": 23.8333, "lon": -103.0333, "clave_inegi": "32035", "tipo": "municipio"},
-        "Sain Alto": {"coords": [23.5167, -103.1833], "estado": "Zacatecas", "poblacion": 21000, "lat": 23.5167, "lon": -103.1833, "clave_inegi": "32036", "tipo": "municipio"},
-        "Salinas": {"coords": [22.6333, -101.7500], "estado": "San Luis Potosí", "poblacion": 35000, "lat": 22.6333, "lon": -101.7500, "clave_inegi": "24028", "tipo": "municipio"},
-        "Sombrerete": {"coords": [23.6333, -103.6500], "estado": "Zacatecas", "poblacion": 63000, "lat": 23.6333, "lon": -103.6500, "clave_inegi": "32037", "tipo": "municipio"},
-        "Susticacán": {"coords": [22.7167, -103.1500], "estado": "Zacatecas", "poblacion": 1365, "lat": 22.7167, "lon": -103.1500, "clave_inegi": "32038", "tipo": "municipio"},
-        "Tabasco": {"coords": [21.8000, -103.1000], "estado": "Zacatecas", "poblacion": 16000, "lat": 21.8000, "lon": -103.1000, "clave_inegi": "32039", "tipo": "municipio"},
-        "Tepechitlán": {"coords": [21.6833, -103.5000], "estado": "Zacatecas", "poblacion": 9000, "lat": 21.6833, "lon": -103.5000, "clave_inegi": "32040", "tipo": "municipio"},
-        "Teúl de González Ortega": {"coords": [21.3667, -103.5500], "estado": "Zacatecas", "poblacion": 6000, "lat": 21.3667, "lon": -103.5500, "clave_inegi": "32041", "tipo": "municipio"},
-        "Tlaltenango de Sánchez Román": {"coords": [21.7833, -103.3000], "estado": "Zacatecas", "poblacion": 27000, "lat": 21.7833, "lon": -103.3000, "clave_inegi": "32042", "tipo": "municipio"},
-        "Valparaíso": {"coords": [23.6833, -103.6833], "estado": "Zacatecas", "poblacion": 33000, "lat": 23.6833, "lon": -103.6833, "clave_inegi": "32043", "tipo": "municipio"},
-        "Vetagrande": {"coords": [22.8000, -102.5333], "estado": "Zacatecas", "poblacion": 10276, "lat": 22.8000, "lon": -102.5333, "clave_inegi": "32044", "tipo": "municipio"},
-        "Villa de Cos": {"coords": [23.2333, -102.3167], "estado": "Zacatecas", "poblacion": 34000, "lat": 23.2333, "lon": -102.3167, "clave_inegi": "32045", "tipo": "municipio"},
-        "Villa García": {"coords": [22.2500, -101.9000], "estado": "Zacatecas", "poblacion": 19000, "lat": 22.2500, "lon": -101.9000, "clave_inegi": "32046", "tipo": "municipio"},
-        "Villa González Ortega": {"coords": [22.4500, -102.0667], "estado": "Zacatecas", "poblacion": 13000, "lat": 22.4500, "lon": -102.0667, "clave_inegi": "32047", "tipo": "municipio"},
-        "Villa Hidalgo": {"coords": [22.2833, -101.8833], "estado": "Zacatecas", "poblacion": 18000, "lat": 22.2833, "lon": -101.8833, "clave_inegi": "32048", "tipo": "municipio"},
-        "Villanueva": {"coords": [22.4000, -102.8500], "estado": "Zacatecas", "poblacion": 30000, "lat": 22.4000, "lon": -102.8500, "clave_inegi": "32049", "tipo": "municipio"},
-        "Zacatecas": {"coords": [22.7667, -102.5667], "estado": "Zacatecas", "poblacion": 149607, "lat": 22.7667, "lon": -102.5667, "clave_inegi": "32050", "tipo": "municipio"},
-        "Trancoso": {"coords": [22.7833, -102.3833], "estado": "Zacatecas", "poblacion": 20455, "lat": 22.7833, "lon": -102.3833, "clave_inegi": "32051", "tipo": "municipio"},
-        "Santa María de la Paz": {"coords": [21.4333, -103.3833], "estado": "Zacatecas", "poblacion": 3000, "lat": 21.4333, "lon": -103.3833, "clave_inegi": "32052", "tipo": "municipio"},
-        "Genaro Codina": {"coords": [22.6167, -102.4333], "estado": "Zacatecas", "poblacion": 8168, "lat": 22.6167, "lon": -102.4333, "clave_inegi": "32053", "tipo": "municipio"},
-        "El Plateado de Joaquín Amaro": {"coords": [22.4667, -103.1167], "estado": "Zacatecas", "poblacion": 1600, "lat": 22.4667, "lon": -103.1167, "clave_inegi": "32054", "tipo": "municipio"},
-        "El Salvador": {"coords": [24.7667, -101.2167], "estado": "Zacatecas", "poblacion": 2500, "lat": 24.7667, "lon": -101.2167, "clave_inegi": "32055", "tipo": "municipio"},
-        "Tepechitlán": {"coords": [21.6833, -103.5000], "estado": "Zacatecas", "poblacion": 9000, "lat": 21.6833, "lon": -103.5000, "clave_inegi": "32056", "tipo": "municipio"},
-        "Tepetongo": {"coords": [22.5667, -103.3000], "estado": "Zacatecas", "poblacion": 6500, "lat": 22.5667, "lon": -103.3000, "clave_inegi": "32057", "tipo": "municipio"},
-        "Jalpa": {"coords": [21.6333, -103.0167], "estado": "Zacatecas", "poblacion": 25500, "lat": 21.6333, "lon": -103.0167, "clave_inegi": "32058", "tipo": "municipio"}
-    },
-    "Zacatecas": {
-        "Apozol": {"coords": [21.3667, -103.2000], "estado": "Zacatecas", "poblacion": 6260, "lat": 21.3667, "lon": -103.2000, "clave_inegi": "32001", "tipo": "municipio"},
-        "Apulco": {"coords": [21.4167, -102.6833], "estado": "Zacatecas", "poblacion": 4942, "lat": 21.4167, "lon": -102.6833, "clave_inegi": "32002", "tipo": "municipio"},
-        "Atolinga": {"coords": [21.7542, -103.4250], "estado": "Zacatecas", "poblacion": 2277, "lat": 21.7542, "lon": -103.4250, "clave_inegi": "32003", "tipo": "municipio"},
-        "Benito Juárez": {"coords": [21.5044, -103.5667], "estado": "Zacatecas", "poblacion": 4493, "lat": 21.5044, "lon": -103.5667, "clave_inegi": "32004", "tipo": "municipio"},
-        "Calera": {"coords": [22.9500, -102.7167], "estado": "Zacatecas", "poblacion": 45759, "lat": 22.9500, "lon": -102.7167, "clave_inegi": "32005", "tipo": "municipio"},
-        "Cañitas de Felipe Pescador": {"coords": [23.5167, -102.9333], "estado": "Zacatecas", "poblacion": 8255, "lat": 23.5167, "lon": -102.9333, "clave_inegi": "32006", "tipo": "municipio"},
-        "Concepción del Oro": {"coords": [24.5833, -101.4000], "estado": "Zacatecas", "poblacion": 12115, "lat": 24.5833, "lon": -101.4000, "clave_inegi": "32007", "tipo": "municipio"},
-        "Cuauhtémoc": {"coords": [22.5667, -102.3167], "estado": "Zacatecas", "poblacion": 13466, "lat": 22.5667, "lon": -102.3167, "clave_inegi": "32008", "tipo": "municipio"},
-        "Chalchihuites": {"coords": [23.4667, -103.9000], "estado": "Zacatecas", "poblacion": 10086, "lat": 23.4667, "lon": -103.9000, "clave_inegi": "32009", "tipo": "municipio"},
-        "Fresnillo": {"coords": [23.1833, -102.8833], "estado": "Zacatecas", "poblacion": 240532, "lat": 23.1833, "lon": -102.8833, "clave_inegi": "32010", "tipo": "municipio"},
-        "Trinidad García de la Cadena": {"coords": [21.0333, -103.5333], "estado": "Zacatecas", "poblacion": 3362, "lat": 21.0333, "lon": -103.5333, "clave_inegi": "32011", "tipo": "municipio"},
-        "Genaro Codina": {"coords": [22.7500, -102.2667], "estado": "Zacatecas", "poblacion": 8168, "lat": 22.7500, "lon": -102.2667, "clave_inegi": "32012", "tipo": "municipio"},
-        "General Enrique Estrada": {"coords": [23.1333, -102.7500], "estado": "Zacatecas", "poblacion": 6644, "lat": 23.1333, "lon": -102.7500, "clave_inegi": "32013", "tipo": "municipio"},
-        "General Francisco R. Murguía": {"coords": [23.7167, -102.9333], "estado": "Zacatecas", "poblacion": 20191, "lat": 23.7167, "lon": -102.9333, "clave_inegi": "32014", "tipo": "municipio"},
-        "El Plateado de Joaquín Amaro": {"coords": [22.0000, -103.0333], "estado": "Zacatecas", "poblacion": 1579, "lat": 22.0000, "lon": -103.0333, "clave_inegi": "32015", "tipo": "municipio"},
-        "General Pánfilo Natera": {"coords": [22.6000, -102.0167], "estado": "Zacatecas", "poblacion": 23526, "lat": 22.6000, "lon": -102.0167, "clave_inegi": "32016", "tipo": "municipio"},
-        "Guadalupe": {"coords": [22.7667, -102.5000], "estado": "Zacatecas", "poblacion": 211740, "lat": 22.7667, "lon": -102.5000, "clave_inegi": "32017", "tipo": "municipio"},
-        "Huanusco": {"coords": [21.3667, -103.2000], "estado": "Zacatecas", "poblacion": 4547, "lat": 21.3667, "lon": -103.2000, "clave_inegi": "32018", "tipo": "municipio"},
-        "Jalpa": {"coords": [21.6333, -103.0333], "estado": "Zacatecas", "poblacion": 25296, "lat": 21.6333, "lon": -103.0333, "clave_inegi": "32019", "tipo": "municipio"},
-        "Jerez": {"coords": [22.6500, -103.0000], "estado": "Zacatecas", "poblacion": 59910, "lat": 22.6500, "lon": -103.0000, "clave_inegi": "32020", "tipo": "municipio"},
-        "Jiménez del Teul": {"coords": [23.9667, -103.9500], "estado": "Zacatecas", "poblacion": 4465, "lat": 23.9667, "lon": -103.9500, "clave_inegi": "32021", "tipo": "municipio"},
-        "Juan Aldama": {"coords": [24.3000, -103.1167], "estado": "Zacatecas", "poblacion": 19749, "lat": 24.3000, "lon": -103.1167, "clave_inegi": "32022", "tipo": "municipio"},
-        "Juchipila": {"coords": [21.3500, -103.3500], "estado": "Zacatecas", "poblacion": 12251, "lat": 21.3500, "lon": -103.3500, "clave_inegi": "32023", "tipo": "municipio"},
-        "Loreto": {"coords": [22.2500, -102.0167], "estado": "Zacatecas", "poblacion": 53709, "lat": 22.2500, "lon": -102.0167, "clave_inegi": "32024", "tipo": "municipio"},
-        "Luis Moya": {"coords": [22.3667, -102.1667], "estado": "Zacatecas", "poblacion": 13184, "lat": 22.3667, "lon": -102.1667, "clave_inegi": "32025", "tipo": "municipio"},
-        "Mazapil": {"coords": [24.6333, -101.5500], "estado": "Zacatecas", "poblacion": 17774, "lat": 24.6333, "lon": -101.5500, "clave_inegi": "32026", "tipo": "municipio"},
-        "Melchor Ocampo": {"coords": [24.9000, -102.0333], "estado": "Zacatecas", "poblacion": 2736, "lat": 24.9000, "lon": -102.0333, "clave_inegi": "32027", "tipo": "municipio"},
-        "Mezquital del Oro": {"coords": [21.1883, -103.3489], "estado": "Zacatecas", "poblacion": 2451, "lat": 21.1883, "lon": -103.3489, "clave_inegi": "32028", "tipo": "municipio"},
-        "Miguel Auza": {"coords": [23.9500, -103.5833], "estado": "Zacatecas", "poblacion": 23713, "lat": 23.9500, "lon": -103.5833, "clave_inegi": "32029", "tipo": "municipio"},
-        "Momax": {"coords": [21.9219, -103.3125], "estado": "Zacatecas", "poblacion": 2446, "lat": 21.9219, "lon": -103.3125, "clave_inegi": "32030", "tipo": "municipio"},
-        "Monte Escobedo": {"coords": [22.3167, -103.5667], "estado": "Zacatecas", "poblacion": 8683, "lat": 22.3167, "lon": -103.5667, "clave_inegi": "32031", "tipo": "municipio"},
-        "Morelos": {"coords": [22.9500, -102.5833], "estado": "Zacatecas", "poblacion": 13207, "lat": 22.9500, "lon": -102.5833, "clave_inegi": "32032", "tipo": "municipio"},
-        "Moyahua de Estrada": {"coords": [21.1833, -103.2000], "estado": "Zacatecas", "poblacion": 4530, "lat": 21.1833, "lon": -103.2000, "clave_inegi": "32033", "tipo": "municipio"},
-        "Nochistlán de Mejía": {"coords": [21.4167, -103.0333], "estado": "Zacatecas", "poblacion": 27945, "lat": 21.4167, "lon": -103.0333, "clave_inegi": "32034", "tipo": "municipio"},
-        "Noria de Ángeles": {"coords": [22.4000, -101.8333], "estado": "Zacatecas", "poblacion": 16284, "lat": 22.4000, "lon": -101.8333, "clave_inegi": "32035", "tipo": "municipio"},
-        "Ojocaliente": {"coords": [22.5667, -102.2667], "estado": "Zacatecas", "poblacion": 44144, "lat": 22.5667, "lon": -102.2667, "clave_inegi": "32036", "tipo": "municipio"},
-        "Pánuco": {"coords": [22.8667, -102.6333], "estado": "Zacatecas", "poblacion": 17577, "lat": 22.8667, "lon": -102.6333, "clave_inegi": "32037", "tipo": "municipio"},
-        "Pinos": {"coords": [22.3167, -101.5500], "estado": "Zacatecas", "poblacion": 72241, "lat": 22.3167, "lon": -101.5500, "clave_inegi": "32038", "tipo": "municipio"},
-        "Río Grande": {"coords": [23.8225, -103.0361], "estado": "Zacatecas", "poblacion": 64535, "lat": 23.8225, "lon": -103.0361, "clave_inegi": "32039", "tipo": "municipio"},
-        "Sain Alto": {"coords": [23.3500, -103.2000], "estado": "Zacatecas", "poblacion": 21844, "lat": 23.3500, "lon": -103.2000, "clave_inegi": "32040", "tipo": "municipio"},
-        "El Salvador": {"coords": [24.5194, -100.8675], "estado": "Zacatecas", "poblacion": 2509, "lat": 24.5194, "lon": -100.8675, "clave_inegi": "32041", "tipo": "municipio"},
-        "Sombrerete": {"coords": [23.5931, -103.6333], "estado": "Zacatecas", "poblacion": 63665, "lat": 23.5931, "lon": -103.6333, "clave_inegi": "32042", "tipo": "municipio"},
-        "Susticacán": {"coords": [22.6097, -103.0975], "estado": "Zacatecas", "poblacion": 1365, "lat": 22.6097, "lon": -103.0975, "clave_inegi": "32043", "tipo": "municipio_menos_poblado"},
-        "Tabasco": {"coords": [21.9333, -103.0333], "estado": "Zacatecas", "poblacion": 16588, "lat": 21.9333, "lon": -103.0333, "clave_inegi": "32044", "tipo": "municipio"},
-        "Tepechitlán": {"coords": [21.5778, -103.6389], "estado": "Zacatecas", "poblacion": 9187, "lat": 21.5778, "lon": -103.6389, "clave_inegi": "32045", "tipo": "municipio"},
-        "Teúl de González Ortega": {"coords": [21.3667, -103.5333], "estado": "Zacatecas", "poblacion": 5545, "lat": 21.3667, "lon": -103.5333, "clave_inegi": "32046", "tipo": "municipio"},
-        "Tlaltenango de Sánchez Román": {"coords": [21.7500, -103.3167], "estado": "Zacatecas", "poblacion": 27284, "lat": 21.7500, "lon": -103.3167, "clave_inegi": "32047", "tipo": "municipio"},
-        "Valparaíso": {"coords": [23.5833, -103.6000], "estado": "Zacatecas", "poblacion": 33283, "lat": 23.5833, "lon": -103.6000, "clave_inegi": "32048", "tipo": "municipio"},
-        "Vetagrande": {"coords": [22.8167, -102.5500], "estado": "Zacatecas", "poblacion": 10276, "lat": 22.8167, "lon": -102.5500, "clave_inegi": "32049", "tipo": "municipio"},
-        "Villa de Cos": {"coords": [23.3000, -102.3000], "estado": "Zacatecas", "poblacion": 34360, "lat": 23.3000, "lon": -102.3000, "clave_inegi": "32050", "tipo": "municipio"},
-        "Villa García": {"coords": [22.0667, -101.8833], "estado": "Zacatecas", "poblacion": 18237, "lat": 22.0667, "lon": -101.8833, "clave_inegi": "32051", "tipo": "municipio"},
-        "Villa González Ortega": {"coords": [22.3500, -101.9167], "estado": "Zacatecas", "poblacion": 13912, "lat": 22.3500, "lon": -101.9167, "clave_inegi": "32052", "tipo": "municipio"},
-        "Villa Hidalgo": {"coords": [22.0667, -101.7667], "estado": "Zacatecas", "poblacion": 20422, "lat": 22.0667, "lon": -101.7667, "clave_inegi": "32053", "tipo": "municipio"},
-        "Villanueva": {"coords": [22.3333, -102.8500], "estado": "Zacatecas", "poblacion": 31558, "lat": 22.3333, "lon": -102.8500, "clave_inegi": "32054", "tipo": "municipio"},
-        "Zacatecas": {"coords": [22.7719, -102.5800], "estado": "Zacatecas", "poblacion": 149607, "lat": 22.7719, "lon": -102.5800, "clave_inegi": "32056", "tipo": "capital"},
-        "Trancoso": {"coords": [22.8000, -102.3500], "estado": "Zacatecas", "poblacion": 20455, "lat": 22.8000, "lon": -102.3500, "clave_inegi": "32057", "tipo": "municipio"},
-        "Santa María de la Paz": {"coords": [21.2833, -103.5333], "estado": "Zacatecas", "poblacion": 2824, "lat": 21.2833, "lon": -103.5333, "clave_inegi": "32058", "tipo": "municipio"},
-        "El Remolino": {"coords": [22.6500, -103.6667], "estado": "Zacatecas", "poblacion": 5057, "lat": 22.6500, "lon": -103.6667, "clave_inegi": "32059", "tipo": "municipio"},
-        "Villa González Ortega": {"coords": [22.3500, -101.9167], "estado": "Zacatecas", "poblacion": 13912, "lat": 22.3500, "lon": -101.9167, "clave_inegi": "32060", "tipo": "municipio"}
-    }
-}
\ No newline at end of file
+# Catálogo completo de municipios por estado (archivo columnar, carga diferida)
+# Se guarda como arreglos (lat/lon float32, población int32, estado/tipo categóricos)
+# en data/municipios.npz y se expone con una vista compatible con el diccionario
+# anterior: MUNICIPIOS_POR_ESTADO[estado][municipio] -> {'coords', 'estado', ...}
+MUNICIPIOS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'municipios.npz')
+
+# Decimales con que se reconstruyen las coordenadas guardadas en float32 (~1 m)
+COORD_DECIMALS = 5
+
+# Claves de entidad federativa del INEGI (Marco Geoestadístico)
+CLAVES_ESTADO = {
+    'Aguascalientes': 1, 'Baja California': 2, 'Baja California Sur': 3, 'Campeche': 4,
+    'Coahuila': 5, 'Colima': 6, 'Chiapas': 7, 'Chihuahua': 8, 'Ciudad de México': 9,
+    'Durango': 10, 'Guanajuato': 11, 'Guerrero': 12, 'Hidalgo': 13, 'Jalisco': 14,
+    'Estado de México': 15, 'Michoacán': 16, 'Morelos': 17, 'Nayarit': 18,
+    'Nuevo León': 19, 'Oaxaca': 20, 'Puebla': 21, 'Querétaro': 22, 'Quintana Roo': 23,
+    'San Luis Potosí': 24, 'Sinaloa': 25, 'Sonora': 26, 'Tabasco': 27, 'Tamaulipas': 28,
+    'Tlaxcala': 29, 'Veracruz': 30, 'Yucatán': 31, 'Zacatecas': 32,
+}
+
+
+class MunicipiosTable:
+    """Columnas del catálogo de municipios (una fila por municipio)"""
+
+    def __init__(self, path):
+        with np.load(path, allow_pickle=False) as data:
+            self.grupos = data['grupos']          # Estado bajo el que se lista (código)
+            self.nombres = data['nombres']
+            self.estado_codes = data['estado']    # Estado del municipio (código)
+            self.tipo_codes = data['tipo']
+            self.lat = data['lat']
+            self.lon = data['lon']
+            self.poblacion = data['poblacion']
+            self.clave_inegi = data['clave_inegi']
+            self.ids = data['ids']                # Clave estable (estado * 1000 + municipio)
+            self.estados = [str(e) for e in data['estados']]
+            self.tipos = [str(t) for t in data['tipos']]
+
+        # Filas de cada estado, en el orden original
+        self.filas_por_estado = {}
+        for row, grupo in enumerate(self.grupos.tolist()):
+            self.filas_por_estado.setdefault(self.estados[grupo], {})[str(self.nombres[row])] = row
+
+        # Clave estable de cada (estado, nombre); la misma en todas sus filas
+        self.id_por_clave = {}
+        for nombre, estado_code, city_id in zip(self.nombres.tolist(), self.estado_codes.tolist(),
+                                                self.ids.tolist()):
+            self.id_por_clave.setdefault((self.estados[estado_code], nombre), city_id)
+
+    def __len__(self):
+        return len(self.nombres)
+
+    def record(self, row):
+        """Diccionario de un municipio con el formato original"""
+        lat = round(float(self.lat[row]), COORD_DECIMALS)
+        lon = round(float(self.lon[row]), COORD_DECIMALS)
+        record = {
+            'id': int(self.ids[row]),
+            'coords': [lat, lon],
+            'estado': self.estados[self.estado_codes[row]],
+            'poblacion': int(self.poblacion[row]),
+            'lat': lat,
+            'lon': lon,
+        }
+        clave = str(self.clave_inegi[row])
+        if clave:
+            record['clave_inegi'] = clave
+        tipo = self.tipos[self.tipo_codes[row]]
+        if tipo:
+            record['tipo'] = tipo
+        return record
+
+
+class _MunicipiosDeEstado(Mapping):
+    """Vista de solo lectura {municipio: info} de un estado"""
+
+    def __init__(self, table, filas):
+        self._table = table
+        self._filas = filas
+
+    def __getitem__(self, nombre):
+        return self._table.record(self._filas[nombre])
+
+    def __iter__(self):
+        return iter(self._filas)
+
+    def __len__(self):
+        return len(self._filas)
+
+
+class MunicipiosPorEstado(Mapping):
+    """
+    Vista {estado: {municipio: info}} sobre el archivo columnar.
+    El archivo se lee en el primer acceso; los diccionarios de cada municipio
+    se construyen al consultarlos (no se guardan en memoria)
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._table = None
+        self._lock = threading.Lock()
+
+    @property
+    def table(self):
+        if self._table is None:
+            with self._lock:
+                if self._table is None:
+                    self._table = MunicipiosTable(self.path)
+        return self._table
+
+    def __getitem__(self, estado):
+        return _MunicipiosDeEstado(self.table, self.table.filas_por_estado[estado])
+
+    def __iter__(self):
+        return iter(self.table.filas_por_estado)
+
+    def __len__(self):
+        return len(self.table.filas_por_estado)
+
+
+def assign_municipio_ids(keys, claves, ids):
+    """
+    Claves estables de cada (estado, nombre), asignadas una sola vez al guardar el catálogo.
+    ids: clave ya asignada (se conserva siempre) o None. Sin clave, se usa la clave INEGI
+    si es válida para el estado y está libre; si no, la siguiente libre del estado
+    (máximo + 1, en orden alfabético entre las nuevas), así que agregar municipios
+    nunca cambia las claves existentes.
+    Retorna (claves, claves INEGI repetidas que se reasignaron)
+    """
+    ids = list(ids)
+    used = {city_id for city_id in ids if city_id is not None}
+    reassigned = []
+    pending = []
+    for i, ((estado, nombre), clave) in enumerate(zip(keys, claves)):
+        if ids[i] is not None:
+            continue
+        estado_code = CLAVES_ESTADO.get(estado, 99)
+        if clave and clave.isdigit() and int(clave) // 1000 == estado_code and int(clave) not in used:
+            ids[i] = int(clave)
+            used.add(ids[i])
+            continue
+        if clave and clave.isdigit() and int(clave) in used:
+            reassigned.append({'estado': estado, 'nombre': nombre, 'clave_inegi': clave})
+        pending.append(i)
+
+    next_number = {}
+    for city_id in used:
+        estado_code = city_id // 1000
+        next_number[estado_code] = max(next_number.get(estado_code, 0), city_id % 1000)
+
+    for i in sorted(pending, key=lambda i: keys[i]):
+        estado_code = CLAVES_ESTADO.get(keys[i][0], 99)
+        number = next_number.get(estado_code, 0) + 1
+        next_number[estado_code] = number
+        ids[i] = estado_code * 1000 + number
+        used.add(ids[i])
+
+    return ids, reassigned
+
+
+def save_municipios(municipios_por_estado, path=MUNICIPIOS_PATH):
+    """
+    Genera el archivo columnar a partir de un diccionario {estado: {municipio: info}}
+    (mismo formato que MUNICIPIOS_POR_ESTADO). Se usa para actualizar el catálogo:
+    las claves 'id' que ya traen los registros se conservan y solo los municipios
+    nuevos reciben clave (ver assign_municipio_ids)
+    """
+    estados, tipos = [], ['']
+    grupos, nombres, estado_codes, tipo_codes = [], [], [], []
+    lat, lon, poblacion, claves = [], [], [], []
+    known_ids = {}  # (estado, nombre) -> clave ya asignada
+
+    def code(categories, value):
+        if value not in categories:
+            categories.append(value)
+        return categories.index(value)
+
+    for grupo, municipios in municipios_por_estado.items():
+        grupo_code = code(estados, grupo)
+        for nombre, info in municipios.items():
+            grupos.append(grupo_code)
+            nombres.append(nombre)
+            estado_codes.append(code(estados, info['estado']))
+            tipo_codes.append(code(tipos, info.get('tipo', '')))
+            lat.append(info['lat'])
+            lon.append(info['lon'])
+            poblacion.append(info['poblacion'])
+            claves.append(info.get('clave_inegi', ''))
+            if info.get('id') is not None:
+                known_ids.setdefault((info['estado'], nombre), int(info['id']))
+
+    # Una clave por (estado, nombre), aunque aparezca en varias filas
+    row_keys = [(estados[estado_code], nombre) for estado_code, nombre in zip(estado_codes, nombres)]
+    keys, first_clave = [], {}
+    for key, clave in zip(row_keys, claves):
+        if key not in first_clave:
+            keys.append(key)
+            first_clave[key] = clave
+    key_ids, reassigned = assign_municipio_ids(keys, [first_clave[key] for key in keys],
+                                               [known_ids.get(key) for key in keys])
+    id_of = dict(zip(keys, key_ids))
+    if reassigned:
+        print(f"⚠️  Catálogo: {len(reassigned)} claves INEGI repetidas reasignadas")
+
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    np.savez_compressed(
+        path,
+        grupos=np.array(grupos, dtype=np.int8),
+        nombres=np.array(nombres, dtype=str),
+        estado=np.array(estado_codes, dtype=np.int8),
+        tipo=np.array(tipo_codes, dtype=np.int8),
+        lat=np.array(lat, dtype=np.float32),
+        lon=np.array(lon, dtype=np.float32),
+        poblacion=np.array(poblacion, dtype=np.int32),
+        clave_inegi=np.array(claves, dtype=str),
+        ids=np.array([id_of[key] for key in row_keys], dtype=np.int32),
+        estados=np.array(estados, dtype=str),
+        tipos=np.array(tipos, dtype=str),
+    )
+    print(f"✓ Catálogo de municipios guardado: {len(nombres)} municipios en {path}")
+    return path
+
+
+# Diccionario completo de municipios por estado (vista de solo lectura, carga diferida)
+MUNICIPIOS_POR_ESTADO = MunicipiosPorEstado(MUNICIPIOS_PATH)
@@ -0,0 +1,190 @@
+"""
+CAPA NACIONAL DE INCENDIOS (NASA FIRMS)
+En lugar de descargar una caja de ±0.5° por ciudad, se descarga una sola vez
+el área completa de México por intervalo de actualización, se guarda como
+arreglo NumPy compacto y se indexa por celdas. Cada ciudad se resuelve con
+una consulta en memoria (conteo, brillo promedio y FRP máximo).
+"""
+
+import io
+import time
+
+import numpy as np
+
+from mexico_spatial import GridIndex, NationalLayer
+
+# Caja de México para la API de área de FIRMS: oeste, sur, este, norte
+MEXICO_BBOX = (-118.5, 14.5, -86.5, 32.8)
+
+# Arreglo compacto de detecciones
+FIRE_DTYPE = np.dtype([
+    ('lat', np.float32),
+    ('lon', np.float32),
+    ('brightness', np.float32),
+    ('frp', np.float32),
+])
+
+
+# Columnas usadas del CSV de FIRMS (por nombre, no por posición)
+FIRMS_COLUMNS = {
+    'latitude': 'lat',
+    'longitude': 'lon',
+    'bright_ti4': 'brightness',   # VIIRS
+    'brightness': 'brightness',   # MODIS
+    'frp': 'frp',
+}
+
+
+def parse_firms_csv(text):
+    """
+    Convierte el CSV de FIRMS en un arreglo FIRE_DTYPE (parser vectorizado).
+    Las columnas se leen por nombre con tipos explícitos (VIIRS usa bright_ti4,
+    MODIS usa brightness); las filas con valores no numéricos se descartan
+    """
+    import pandas as pd  # Diferido: solo se necesita al descargar la capa nacional
+
+    if isinstance(text, str):
+        text = text.encode('utf-8')
+    header_end = text.find(b'\n') if text else -1
+    if header_end < 0:
+        return np.empty(0, dtype=FIRE_DTYPE)
+
+    header = [col.strip() for col in text[:header_end].decode('utf-8').split(',')]
+    usecols = [col for col in header if col in FIRMS_COLUMNS]
+    if set(FIRMS_COLUMNS[col] for col in usecols) != set(FIRE_DTYPE.names):
+        return np.empty(0, dtype=FIRE_DTYPE)
+
+    read_options = {'usecols': usecols, 'engine': 'c', 'on_bad_lines': 'skip'}
+    try:
+        frame = pd.read_csv(io.BytesIO(text), dtype={col: np.float32 for col in usecols}, **read_options)
+    except ValueError:
+        # Algún valor no numérico: leer como texto y convertir con coerción
+        frame = pd.read_csv(io.BytesIO(text), dtype=str, **read_options)
+        frame = frame.apply(pd.to_numeric, errors='coerce').astype(np.float32)
+
+    frame = frame.rename(columns=FIRMS_COLUMNS).dropna()
+    fires = np.empty(len(frame), dtype=FIRE_DTYPE)
+    for name in FIRE_DTYPE.names:
+        fires[name] = frame[name].to_numpy(dtype=np.float32)
+    return fires
+
+
+def parse_firms_csv_loop(text):
+    """
+    Parser de referencia fila por fila (implementación anterior).
+    Se conserva solo para comparar contra parse_firms_csv en benchmark_firms_parsers()
+    """
+    lines = text.strip().split('\n') if text else []
+    if len(lines) <= 1:
+        return np.empty(0, dtype=FIRE_DTYPE)
+
+    header = [col.strip() for col in lines[0].split(',')]
+    try:
+        lat_col = header.index('latitude')
+        lon_col = header.index('longitude')
+        bright_col = header.index('bright_ti4') if 'bright_ti4' in header else header.index('brightness')
+        frp_col = header.index('frp')
+    except ValueError:
+        return np.empty(0, dtype=FIRE_DTYPE)
+
+    rows = []
+    for line in lines[1:]:
+        parts = line.split(',')
+        if len(parts) < len(header):
+            continue
+        try:
+            rows.append((float(parts[lat_col]), float(parts[lon_col]),
+                         float(parts[bright_col]), float(parts[frp_col])))
+        except ValueError:
+            pass
+
+    return np.array(rows, dtype=FIRE_DTYPE)
+
+
+def synthetic_firms_csv(rows=100_000, seed=0):
+    """CSV sintético con el formato de FIRMS VIIRS NRT dentro de la caja de México"""
+    rng = np.random.default_rng(seed)
+    west, south, east, north = MEXICO_BBOX
+    lats = rng.uniform(south, north, rows)
+    lons = rng.uniform(west, east, rows)
+    bright = rng.uniform(295, 367, rows)
+    frp = rng.gamma(1.5, 4.0, rows)
+    header = ('latitude,longitude,bright_ti4,scan,track,acq_date,acq_time,satellite,'
+              'instrument,confidence,version,bright_ti5,frp,daynight')
+    body = '\n'.join(
+        f"{lat:.5f},{lon:.5f},{b:.2f},0.39,0.36,2025-10-04,0742,N,VIIRS,n,2.0NRT,289.47,{f:.2f},N"
+        for lat, lon, b, f in zip(lats, lons, bright, frp)
+    )
+    return header + '\n' + body + '\n'
+
+
+def benchmark_firms_parsers(rows=100_000, repeat=3):
+    """Compara el parser vectorizado contra el de fila por fila sobre un CSV sintético"""
+    text = synthetic_firms_csv(rows)
+    timings = {}
+    results = {}
+    for name, parser in (('loop', parse_firms_csv_loop), ('vectorizado', parse_firms_csv)):
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            results[name] = parser(text)
+            best = min(best, time.perf_counter() - start)
+        timings[name] = best
+
+    same = all(
+        np.allclose(results['loop'][col], results['vectorizado'][col]) for col in FIRE_DTYPE.names
+    )
+    print(f"📏 FIRMS CSV sintético: {rows:,} filas ({len(text) / 1e6:.1f} MB)")
+    print(f"   Loop:        {timings['loop'] * 1000:8.1f} ms")
+    print(f"   Vectorizado: {timings['vectorizado'] * 1000:8.1f} ms "
+          f"({timings['loop'] / timings['vectorizado']:.1f}x más rápido)")
+    print(f"   Resultados idénticos: {'✓' if same else '❌'}")
+    return timings
+
+
+class FirmsFireIndex(NationalLayer):
+    """
+    Detecciones de incendio de todo México en memoria con índice espacial.
+    fetch_csv: función sin argumentos que descarga el CSV nacional (o None si falla)
+    """
+
+    name = 'firms'
+
+    def __init__(self, fetch_csv, refresh_interval=3 * 3600, retry_interval=300, cell_deg=0.5):
+        # Primera descarga en segundo plano (como WAQI y OpenAQ): una consulta de ciudad no
+        # espera el CSV nacional dentro de su plazo; mientras tanto query() retorna None
+        super().__init__(fetch_csv, refresh_interval, retry_interval, block_first_load=False)
+        self.cell_deg = cell_deg
+
+    def build(self, text):
+        """Arreglo de detecciones + índice por celdas"""
+        fires = parse_firms_csv(text)
+        index = GridIndex(fires['lat'], fires['lon'], cell_deg=self.cell_deg)
+        print(f"🔥 FIRMS nacional: {len(fires)} detecciones indexadas")
+        return fires, index
+
+    def query(self, lat, lon, half_size_deg=0.5):
+        """
+        Estadísticas de incendios en la caja lat/lon ± half_size_deg.
+        Retorna None si la capa nacional aún no se descarga o no se ha podido descargar
+        """
+        state = self.current()
+        if state is None:
+            return None
+        fires, index = state
+
+        idx = index.query_box(lat - half_size_deg, lon - half_size_deg,
+                              lat + half_size_deg, lon + half_size_deg)
+        if len(idx) == 0:
+            return {'fires_detected': 0, 'avg_brightness': 0, 'max_frp': 0}
+
+        selected = fires[idx]
+        return {
+            'fires_detected': int(len(idx)),
+            'avg_brightness': float(selected['brightness'].mean()),
+            'max_frp': float(selected['frp'].max())
+        }
+
+
+if __name__ == "__main__":
+    benchmark_firms_parsers()
@@ -0,0 +1,262 @@
+"""
+ÍNDICE DE ESPACIOS VERDES DESDE UN EXTRACTO LOCAL DE OPENSTREETMAP
+Overpass es demasiado lento para consultar cada municipio, así que el extracto
+de México se procesa una sola vez fuera de línea y el resultado se guarda como
+tabla por clave de municipio (data/green_spaces.npz). En ejecución solo se lee la tabla.
+
+Preparar el extracto (osmium-tool):
+  osmium tags-filter mexico-latest.osm.pbf \\
+      wa/leisure=park,garden,nature_reserve wa/landuse=grass,forest,meadow,recreation_ground,village_green \\
+      wa/natural=wood -o verdes.osm.pbf
+  osmium export verdes.osm.pbf -f geojsonseq -o verdes.geojsonseq
+Construir la tabla:
+  python mexico_green_spaces.py verdes.geojsonseq [radio_km]
+
+Cada polígono se resume en centroide + área (fórmula del área de Gauss en km) y se
+trata como un disco de la misma área; el área verde de un municipio es la
+intersección de esos discos con el buffer circular alrededor de su centro.
+"""
+
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from mexico_spatial import KM_PER_DEG, GridIndex
+from mexico_static_features import catalog_fingerprint
+
+# Versión del formato de la tabla (cambiarla invalida tablas viejas)
+GREEN_TABLE_VERSION = 1
+GREEN_TABLE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'green_spaces.npz')
+
+# Etiquetas OSM que cuentan como espacio verde
+GREEN_TAGS = {
+    'leisure': {'park', 'garden', 'nature_reserve'},
+    'landuse': {'grass', 'forest', 'meadow', 'recreation_ground', 'village_green'},
+    'natural': {'wood'},
+}
+
+
+def green_fingerprint(catalog):
+    """Huella del catálogo para el que se construyó la tabla (claves + coordenadas)"""
+    return catalog_fingerprint(catalog, GREEN_TABLE_VERSION, (('lat', np.float64), ('lon', np.float64)))
+
+
+def is_green(properties):
+    return any(properties.get(key) in values for key, values in GREEN_TAGS.items())
+
+
+def _ring_area_km2(ring, lat0):
+    """Área (km²) de un anillo lon/lat proyectado localmente (equirectangular en lat0)"""
+    coords = np.asarray(ring, dtype=np.float64)
+    if len(coords) < 3:
+        return 0.0, 0.0, 0.0
+    x = coords[:, 0] * KM_PER_DEG * np.cos(np.radians(lat0))
+    y = coords[:, 1] * KM_PER_DEG
+    area = 0.5 * abs(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+    return area, coords[:, 1].mean(), coords[:, 0].mean()
+
+
+def polygon_summary(geometry):
+    """(lat, lon, área km²) de un Polygon/MultiPolygon GeoJSON (anillos interiores restados)"""
+    if geometry is None:
+        return None
+    if geometry.get('type') == 'Polygon':
+        polygons = [geometry['coordinates']]
+    elif geometry.get('type') == 'MultiPolygon':
+        polygons = geometry['coordinates']
+    else:
+        return None
+
+    total = lat_sum = lon_sum = 0.0
+    for rings in polygons:
+        if not rings or len(rings[0]) < 3:
+            continue
+        lat0 = float(np.mean([point[1] for point in rings[0]]))
+        outer, lat, lon = _ring_area_km2(rings[0], lat0)
+        holes = sum(_ring_area_km2(ring, lat0)[0] for ring in rings[1:])
+        area = max(0.0, outer - holes)
+        total += area
+        lat_sum += lat * area
+        lon_sum += lon * area
+
+    if total <= 0:
+        return None
+    return lat_sum / total, lon_sum / total, total
+
+
+def read_green_polygons(path):
+    """
+    Lee un GeoJSON (FeatureCollection) o GeoJSONSeq (una Feature por línea) y retorna
+    arreglos lat, lon, área km² de los polígonos verdes
+    """
+    def features():
+        with open(path, encoding='utf-8') as f:
+            first = f.read(1)
+            f.seek(0)
+            if path.endswith('.geojson') and first == '{':
+                for feature in json.load(f).get('features', []):
+                    yield feature
+                return
+            for line in f:
+                line = line.strip().lstrip('\x1e')  # GeoJSONSeq (RFC 8142) usa RS como separador
+                if line:
+                    yield json.loads(line)
+
+    lats, lons, areas = [], [], []
+    for feature in features():
+        if not is_green(feature.get('properties') or {}):
+            continue
+        summary = polygon_summary(feature.get('geometry'))
+        if summary is None:
+            continue
+        lats.append(summary[0])
+        lons.append(summary[1])
+        areas.append(summary[2])
+
+    return np.array(lats), np.array(lons), np.array(areas)
+
+
+def _disc_overlap(d, R, r):
+    """Área de intersección de círculos de radios R y r con centros a distancia d (vectorizado)"""
+    d = np.asarray(d, dtype=np.float64)
+    r = np.asarray(r, dtype=np.float64)
+    overlap = np.zeros(np.broadcast(d, r).shape)
+
+    inside = d <= np.abs(R - r)
+    overlap = np.where(inside, np.pi * np.minimum(R, r) ** 2, overlap)
+
+    partial = ~inside & (d < R + r)
+    if partial.any():
+        dp, rp = np.broadcast_to(d, overlap.shape)[partial], np.broadcast_to(r, overlap.shape)[partial]
+        dp = np.maximum(dp, 1e-9)
+        a = rp ** 2 * np.arccos(np.clip((dp ** 2 + rp ** 2 - R ** 2) / (2 * dp * rp), -1, 1))
+        b = R ** 2 * np.arccos(np.clip((dp ** 2 + R ** 2 - rp ** 2) / (2 * dp * R), -1, 1))
+        c = 0.5 * np.sqrt(np.maximum(0, (-dp + rp + R) * (dp + rp - R) * (dp - rp + R) * (dp + rp + R)))
+        overlap[partial] = a + b - c
+    return overlap
+
+
+def build_green_table(catalog, lats, lons, areas, radius_km=3.0):
+    """
+    Área verde (km²), conteo de polígonos y proporción verde del buffer de cada municipio.
+    Índice espacial por centroides; los polígonos más grandes que large_km se revisan aparte
+    """
+    radius_km = float(radius_km)
+    disc_radius = np.sqrt(areas / np.pi)
+    large_km = 2 * radius_km
+    small = disc_radius <= large_km
+    index = GridIndex(lats[small], lons[small], cell_deg=0.1)
+    small_idx = np.flatnonzero(small)
+    large_idx = np.flatnonzero(~small)
+
+    city_lats = catalog.column('lat')
+    city_lons = catalog.column('lon')
+    green_area = np.zeros(len(catalog), dtype=np.float32)
+    counts = np.zeros(len(catalog), dtype=np.int32)
+
+    reach = radius_km + large_km
+    for i, (lat, lon) in enumerate(zip(city_lats, city_lons)):
+        cos_lat = np.cos(np.radians(lat))
+        dlat = reach / KM_PER_DEG
+        dlon = reach / (KM_PER_DEG * cos_lat)
+        candidates = np.concatenate([
+            small_idx[index.query_box(lat - dlat, lon - dlon, lat + dlat, lon + dlon)], large_idx
+        ])
+        if len(candidates) == 0:
+            continue
+        d = np.hypot((lats[candidates] - lat) * KM_PER_DEG, (lons[candidates] - lon) * KM_PER_DEG * cos_lat)
+        overlap = _disc_overlap(d, radius_km, disc_radius[candidates])
+        green_area[i] = overlap.sum()
+        counts[i] = int((overlap > 0).sum())
+
+    buffer_area = np.pi * radius_km ** 2
+    return {
+        'ids': catalog.ids(),
+        'green_area_km2': green_area,
+        'green_count': counts,
+        'green_ratio': np.clip(green_area / buffer_area, 0, 1).astype(np.float32),
+        'radius_km': np.float32(radius_km),
+        'version': np.int32(GREEN_TABLE_VERSION),
+        'fingerprint': np.array(green_fingerprint(catalog)),
+    }
+
+
+def save_green_table(table, path=GREEN_TABLE_PATH, source=''):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    np.savez_compressed(path, source=np.array(source), built_at=np.array(time.strftime('%Y-%m-%d')),
+                        **table)
+
+
+class GreenSpaceTable:
+    """
+    Tabla precalculada {clave de municipio: espacios verdes}; vacía si no existe el archivo
+    (o path es None) o si se construyó para otro catálogo o versión
+    """
+
+    def __init__(self, catalog, path=GREEN_TABLE_PATH):
+        self.path = path
+        self._rows = {}
+        self.built_at = None
+        self.radius_km = None
+        if path is None or not os.path.exists(path):
+            return
+
+        try:
+            with np.load(path) as data:
+                if int(data['version']) != GREEN_TABLE_VERSION:
+                    print(f"⚠️  Espacios verdes: versión de tabla {int(data['version'])} no compatible, "
+                          f"reconstruir con mexico_green_spaces.py")
+                    return
+                if str(data['fingerprint']) != green_fingerprint(catalog):
+                    print("⚠️  Espacios verdes: la tabla corresponde a otro catálogo de municipios, "
+                          "reconstruir con mexico_green_spaces.py")
+                    return
+                self.built_at = str(data['built_at'])
+                self.radius_km = float(data['radius_km'])
+                for city_id, area, count, ratio in zip(data['ids'].tolist(), data['green_area_km2'].tolist(),
+                                                       data['green_count'].tolist(), data['green_ratio'].tolist()):
+                    self._rows[city_id] = (area, count, ratio)
+            print(f"🌳 Espacios verdes OSM: {len(self._rows)} municipios ({self.built_at})")
+        except (OSError, KeyError, ValueError) as e:
+            print(f"⚠️  Espacios verdes: no se pudo leer {path} ({str(e)[:50]})")
+            self._rows = {}
+
+    def __len__(self):
+        return len(self._rows)
+
+    def get(self, city_id):
+        """Espacios verdes del municipio (mismas claves que la consulta a Overpass) o None"""
+        row = self._rows.get(city_id)
+        if row is None:
+            return None
+        area, count, ratio = row
+        return {
+            'green_count': count,
+            'green_area_km2': round(area, 3),
+            'green_ratio': round(ratio, 4),
+            'source': f'OpenStreetMap (extracto local, buffer {self.radius_km:g} km)'
+        }
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Uso: python mexico_green_spaces.py <extracto.geojson|.geojsonseq> [radio_km]")
+        sys.exit(1)
+
+    from mexico_data import MUNICIPIOS_POR_ESTADO
+    from mexico_health_analyzer import MexicoHealthAnalyzer
+
+    analyzer = MexicoHealthAnalyzer()
+    analyzer.load_municipios_from_external(MUNICIPIOS_POR_ESTADO)
+    radius = float(sys.argv[2]) if len(sys.argv) > 2 else 3.0
+
+    start = time.perf_counter()
+    lats, lons, areas = read_green_polygons(sys.argv[1])
+    print(f"🌳 {len(areas):,} polígonos verdes leídos ({areas.sum():,.0f} km²) en {time.perf_counter() - start:.1f}s")
+    table = build_green_table(analyzer.catalog, lats, lons, areas, radius)
+    save_green_table(table, source=os.path.basename(sys.argv[1]))
+    print(f"✓ Tabla guardada en {GREEN_TABLE_PATH}: {len(table['ids'])} municipios, "
+          f"proporción verde media {table['green_ratio'].mean():.3f} ({time.perf_counter() - start:.1f}s)")
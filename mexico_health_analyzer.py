@@ -1,26 +1,47 @@
-import pandas as pd
 import numpy as np
-import folium
-from folium import plugins
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import requests
 import json
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, wait
+import threading
 import time
+import uuid
 import warnings
-import google.generativeai as genai
 import os
 from dotenv import load_dotenv
+from mexico_cache import DiskCache, ProviderCache, TTLCache
+from mexico_catalog import MunicipioCatalog
+from mexico_concurrency import ProviderLimiter, SingleFlight, map_in_threads
+from mexico_firms import MEXICO_BBOX, FirmsFireIndex
+from mexico_green_spaces import GREEN_TABLE_PATH, GreenSpaceTable
+from mexico_http import create_http_session
+from mexico_ndvi import NDVI_DIR, NdviEngine
+from mexico_openaq import OpenAqStationIndex, parse_openaq_locations
+from mexico_static_features import StaticFeatureTable
+from mexico_sweep import NationalSweep
+from mexico_waqi import WaqiStationIndex, parse_waqi_bounds, station_pollutants
+from mexico_weather import WeatherGrid
 warnings.filterwarnings('ignore')
 
+# pandas, folium, plotly y google.generativeai se importan al usarse por primera vez
+# (tablero, mapa nacional, análisis masivo o Gemini): el servidor web solo consulta
+# fuentes y calcula el índice, así arranca sin cargar esas bibliotecas
+
+# Pesos del Índice de Salud Urbana por componente (se renormalizan con los datos disponibles)
+HEALTH_SCORE_WEIGHTS = {
+    'air': 0.30,         # Calidad del aire (AQI + PM2.5)
+    'green': 0.25,       # Espacios verdes + NDVI
+    'climate': 0.20,     # Temperatura + humedad
+    'urban': 0.15,       # Densidad + ruido
+    'healthcare': 0.10,  # Acceso a servicios de salud
+}
+
 # APIs REALES A USAR:
 # 1. WAQI (World Air Quality Index) - Calidad del aire
 # 2. OpenWeatherMap - Clima y temperatura
 # 3. NASA MODIS - Índice de vegetación NDVI
 # 4. OpenStreetMap Overpass - Espacios verdes
-# 5. WorldPop API - Datos de población
+# 5. Censo INEGI - Población (densidad en la tabla de rasgos estáticos)
 
 class MexicoHealthAnalyzer:
     """
@@ -29,6 +50,47 @@ class MexicoHealthAnalyzer:
     USA APIS REALES - NO SIMULACIONES
     """
     
+    # Plazo máximo (segundos) para reunir todas las fuentes externas de una ciudad
+    CITY_FETCH_DEADLINE = float(os.getenv("CITY_FETCH_DEADLINE", "20"))
+    
+    # Rejilla nacional de clima: tamaño de celda (grados) y renovación (segundos).
+    # 0.5° (~55 km, ~650 nodos) cabe en la cuota de la rejilla dentro de cada renovación;
+    # 0.25° necesitaría tantos nodos como municipios hay
+    WEATHER_GRID_STEP = float(os.getenv("WEATHER_GRID_STEP", "0.5"))
+    WEATHER_GRID_REFRESH = int(os.getenv("WEATHER_GRID_REFRESH", "3600"))
+    
+    # Tiempo que se conservan los resultados de IA en segundo plano (consulta posterior)
+    AI_JOB_TTL = 15 * 60
+    
+    # Caché de recomendaciones de Gemini: misma ciudad con indicadores casi iguales = misma respuesta
+    AI_CACHE_TTL = int(os.getenv("AI_CACHE_TTL", str(6 * 3600)))
+    # Compartir la respuesta entre ciudades distintas con el mismo perfil cuantizado
+    AI_CACHE_SHARE_SIMILAR = os.getenv("AI_CACHE_SHARE_SIMILAR", "false").lower() == "true"
+    # Paso de cuantización de cada indicador del prompt
+    AI_PROFILE_STEPS = {
+        'health_score': 5,          # puntos del índice
+        'air_quality_index': 10,    # AQI
+        'ndvi_value': 0.05,         # NDVI
+        'population_density': 500,  # hab/km²
+        'temperature_avg': 1,       # °C
+    }
+    
+    # Ciudades por petición en el modo por lotes de Gemini (barrido nacional)
+    AI_BATCH_SIZE = int(os.getenv("AI_BATCH_SIZE", "40"))
+    
+    # Cuotas por proveedor: peticiones simultáneas y llamadas por minuto
+    PROVIDER_LIMITS = {
+        'air': {'max_concurrent': 8, 'per_minute': 600},      # WAQI
+        # OpenWeatherMap (plan gratuito, 60/min) repartido: la rejilla nacional no agota
+        # el turno de las consultas puntuales, que además no esperan más de 2 s por él
+        'weather_grid': {'max_concurrent': 2, 'per_minute': 40},
+        'weather': {'max_concurrent': 4, 'per_minute': 20, 'max_wait': 2},
+        'openaq': {'max_concurrent': 4, 'per_minute': 60},    # OpenAQ v3
+        'fires': {'max_concurrent': 2, 'per_minute': 500},    # NASA FIRMS (5000 / 10 min)
+        'osm': {'max_concurrent': 1, 'per_minute': 10},       # Overpass API
+        'gemini': {'max_concurrent': 2, 'per_minute': 10},    # Gemini (plan gratuito)
+    }
+    
     def __init__(self):
         # Cargar variables de entorno desde .env
         script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -39,11 +101,16 @@ class MexicoHealthAnalyzer:
         self.OPENWEATHER_KEY = os.getenv("OPENWEATHER_API_KEY")
         self.OPENAQ_KEY = os.getenv("OPENAQ_API_KEY")
         self.NASA_FIRMS_KEY = os.getenv("NASA_FIRMS_API_KEY")
+        self.WAQI_TOKEN = os.getenv("WAQI_API_KEY", "demo")
         
         # Verificar que las keys existan
         if not all([self.OPENWEATHER_KEY, self.OPENAQ_KEY, self.NASA_FIRMS_KEY]):
             print("⚠️  ADVERTENCIA: Algunas API keys no están configuradas en .env")
             print("   Verifica que el archivo .env existe y contiene todas las keys necesarias")
+        if self.WAQI_TOKEN == "demo":
+            # El token demo no permite map/bounds: sin él la capa nacional quedaría vacía
+            print("⚠️  WAQI_API_KEY no configurada: se usa el token demo, que no permite la capa "
+                  "nacional de estaciones; se consulta WAQI por ciudad (cobertura limitada)")
         
         # Configurar Gemini AI para predicciones
         self._setup_gemini()
@@ -121,6 +188,82 @@ class MexicoHealthAnalyzer:
         
         # Diccionario extendido de municipios (se puede cargar externamente)
         self.municipios_por_estado = {}
+        
+        # Catálogo con clave estable por municipio (estado * 1000 + municipio)
+        self.catalog = MunicipioCatalog.build(self.mexican_cities)
+        # Área, densidad, ruido y acceso a salud precalculados (deterministas) por municipio
+        self.static_features = StaticFeatureTable(self.catalog)
+        
+        # Caché en memoria por fuente (TTL propio por proveedor, desalojo LRU)
+        self.cache = ProviderCache(store=self._open_disk_cache())
+        warmed = self.cache.warm_from_store()
+        if warmed:
+            print(f"✓ Caché precargada desde disco: {warmed} respuestas vigentes")
+        
+        # Sesión HTTP compartida por todos los proveedores (keep-alive, reintentos, gzip)
+        self.session = create_http_session()
+        
+        # Limitadores por proveedor compartidos por todas las consultas
+        self.provider_limits = {
+            name: ProviderLimiter(name, **limits) for name, limits in self.PROVIDER_LIMITS.items()
+        }
+        
+        # Capa nacional de incendios NASA FIRMS (descarga única + índice espacial)
+        self.fire_index = FirmsFireIndex(self._download_firms_national_csv)
+        
+        # Capa nacional de estaciones WAQI (todas las estaciones de México + estación más cercana)
+        self.air_stations = WaqiStationIndex(self._download_waqi_stations)
+        
+        # Catálogo nacional de estaciones OpenAQ (cada ciudad usa las más cercanas a ella)
+        self.openaq_stations = OpenAqStationIndex(self._download_openaq_stations)
+        
+        # Rejilla nacional de clima OpenWeatherMap (nodos solo donde hay municipios)
+        self.weather_grid = WeatherGrid(self._download_weather_grid, step_deg=self.WEATHER_GRID_STEP,
+                                        refresh_interval=self.WEATHER_GRID_REFRESH)
+        self.weather_grid.set_points(self.catalog.column('lat'), self.catalog.column('lon'))
+        
+        # NDVI MODIS desde compuestos locales con memoria mapeada (data/ndvi o NDVI_DIR)
+        self.ndvi_engine = NdviEngine(os.getenv("NDVI_DIR", NDVI_DIR),
+                                      radius_km=float(os.getenv("NDVI_BUFFER_KM", "5")))
+        
+        # Espacios verdes precalculados desde un extracto local de OSM (sin consultas por ciudad).
+        # La tabla corresponde al catálogo completo: se carga en load_municipios_from_external
+        self.green_spaces = GreenSpaceTable(self.catalog, path=None)
+        
+        # Pool compartido para consultar en paralelo las fuentes de cada ciudad
+        self._fetch_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='fuentes')
+        
+        # Pool para subconsultas de un mismo proveedor (p. ej. estaciones OpenAQ)
+        self._subrequest_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='subconsultas')
+        
+        # Predicciones de Gemini en segundo plano: la respuesta de la ciudad no espera a la IA
+        self._ai_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='gemini')
+        self.ai_jobs = TTLCache('ai_jobs', self.AI_JOB_TTL, max_entries=1024)
+        self.ai_cache = TTLCache('ai_recommendations', self.AI_CACHE_TTL, max_entries=2048)
+        self._ai_jobs_inflight = {}  # clave de caché de IA -> job_id en curso
+        self._ai_jobs_lock = threading.Lock()
+        
+        # Consultas simultáneas de la misma ciudad / mismo perfil de IA comparten el trabajo
+        self.city_flight = SingleFlight('ciudades')
+        self.ai_flight = SingleFlight('gemini')
+    
+    def _open_disk_cache(self):
+        """
+        Abre la caché persistente en SQLite si PROVIDER_CACHE_DB está configurada.
+        Se compacta al iniciar (expiradas fuera, tamaño máximo aplicado)
+        """
+        path = os.getenv("PROVIDER_CACHE_DB")
+        if not path:
+            return None
+        
+        try:
+            store = DiskCache(path, max_entries=int(os.getenv("PROVIDER_CACHE_DB_MAX_ENTRIES", "50000")))
+            result = store.compact()
+            print(f"✓ Caché en disco: {path} ({result['expired']} expiradas, {result['trimmed']} recortadas)")
+            return store
+        except Exception as e:
+            print(f"⚠️  Caché en disco no disponible: {str(e)[:50]}")
+            return None
     
     def load_municipios_from_external(self, municipios_dict):
         """
@@ -129,43 +272,76 @@ class MexicoHealthAnalyzer:
         """
         self.municipios_por_estado = municipios_dict
         
-        # Agregar municipios al diccionario de ciudades para análisis
-        for estado, municipios in municipios_dict.items():
-            for municipio_name, municipio_info in municipios.items():
-                if municipio_name not in self.mexican_cities:
-                    self.mexican_cities[municipio_name] = {
-                        'coords': municipio_info['coords'],
-                        'estado': municipio_info['estado'],
-                        'poblacion': municipio_info['poblacion'],
-                        'lat': municipio_info['lat'],
-                        'lon': municipio_info['lon'],
-                        'tipo': municipio_info.get('tipo', 'municipio')
-                    }
-        
-        print(f"✓ Cargados {len(self.mexican_cities)} municipios/ciudades para análisis")
+        # Reconstruir el catálogo: cada (estado, nombre) es un registro con su propia clave
+        self.catalog = MunicipioCatalog.build(self.mexican_cities, municipios_dict)
+        self.static_features = StaticFeatureTable(self.catalog)
+        self.green_spaces = GreenSpaceTable(self.catalog, os.getenv("GREEN_SPACES_TABLE", GREEN_TABLE_PATH))
+        self.weather_grid.set_points(self.catalog.column('lat'), self.catalog.column('lon'))
+        
+        print(f"✓ Cargados {len(self.catalog)} municipios/ciudades para análisis "
+              f"(rasgos estáticos: {self.static_features.source})")
     
     def _setup_gemini(self):
-        """Configura Gemini AI para generar predicciones y recomendaciones"""
-        try:
-            # La API key ya fue cargada en __init__ desde .env
-            api_key = os.getenv("GEMINI_API_KEY")
-            
-            if not api_key:
-                print("⚠️  Gemini AI no configurado (falta API key en .env)")
-                self.gemini_model = None
-                return
-            
-            genai.configure(api_key=api_key)
-            self.gemini_model = genai.GenerativeModel('gemini-2.0-flash-exp')
-            print("✓ Gemini AI configurado correctamente")
-        except Exception as e:
-            print(f"⚠️  Error configurando Gemini: {str(e)[:50]}")
-            self.gemini_model = None
+        """
+        Prepara Gemini AI para generar predicciones y recomendaciones.
+        El SDK se importa y el modelo se crea en el primer uso (ver gemini_model)
+        """
+        # La API key ya fue cargada en __init__ desde .env
+        self._gemini_api_key = os.getenv("GEMINI_API_KEY")
+        self._gemini_model = None
+        self._gemini_lock = threading.Lock()
+        
+        if not self._gemini_api_key:
+            print("⚠️  Gemini AI no configurado (falta API key en .env)")
+    
+    @property
+    def gemini_model(self):
+        """Modelo de Gemini (se crea la primera vez que se necesita; None si no hay API key)"""
+        if self._gemini_model is None and self._gemini_api_key:
+            with self._gemini_lock:
+                if self._gemini_model is None and self._gemini_api_key:
+                    try:
+                        import google.generativeai as genai
+                        genai.configure(api_key=self._gemini_api_key)
+                        self._gemini_model = genai.GenerativeModel('gemini-2.0-flash-exp')
+                        print("✓ Gemini AI configurado correctamente")
+                    except Exception as e:
+                        print(f"⚠️  Error configurando Gemini: {str(e)[:50]}")
+                        self._gemini_api_key = None  # No reintentar en cada consulta
+        return self._gemini_model
+    
+    @gemini_model.setter
+    def gemini_model(self, model):
+        self._gemini_model = model
+        if model is None:
+            self._gemini_api_key = None
+    
+    def ai_profile(self, city_data):
+        """Vector cuantizado de los indicadores que usa el prompt (None = sin dato)"""
+        profile = []
+        for field, step in self.AI_PROFILE_STEPS.items():
+            value = city_data.get(field)
+            if value is None or value != value:  # None o NaN
+                profile.append(None)
+            else:
+                profile.append(int(round(float(value) / step)))
+        return tuple(profile)
     
-    def generate_ai_recommendations(self, city_data):
+    def _ai_cache_key(self, city_data, share_similar=None):
+        """
+        Clave de la caché de IA: ciudad + perfil cuantizado.
+        Con share_similar, ciudades distintas con el mismo perfil comparten la respuesta
+        (el texto puede mencionar la ciudad que la generó)
+        """
+        share = self.AI_CACHE_SHARE_SIMILAR if share_similar is None else share_similar
+        city_key = 'perfil' if share else city_data.get('city_id', city_data.get('city'))
+        return (city_key,) + self.ai_profile(city_data)
+    
+    def generate_ai_recommendations(self, city_data, use_cache=True):
         """
         Genera predicciones y recomendaciones usando Gemini AI
-        Basado en los datos reales de salud urbana de la ciudad
+        Basado en los datos reales de salud urbana de la ciudad.
+        Las respuestas válidas se memorizan por ciudad y perfil de indicadores (ai_cache)
         """
         if not self.gemini_model:
             return {
@@ -173,6 +349,23 @@ class MexicoHealthAnalyzer:
                 'recommendations': ['Configure Gemini API para obtener recomendaciones personalizadas']
             }
         
+        key = self._ai_cache_key(city_data)
+        if use_cache:
+            cached = self.ai_cache.get(key)
+            if cached is not None:
+                return dict(cached)
+        
+        def request():
+            ai_insights = self._request_ai_recommendations(city_data)
+            # Solo se memorizan respuestas reales de Gemini (no errores)
+            if 'raw_response' in ai_insights:
+                self.ai_cache.set(key, dict(ai_insights))
+            return ai_insights
+        
+        return dict(self.ai_flight.do(key, request))
+    
+    def _request_ai_recommendations(self, city_data):
+        """Envía el prompt a Gemini y separa predicción y recomendaciones"""
         try:
             # Preparar datos para el prompt
             city_name = city_data.get('city', 'Ciudad')
@@ -211,7 +404,8 @@ FORMATO DE RESPUESTA (sin saludos ni despedidas):
 Sé directo, específico y práctico."""
 
             # Enviar prompt a Gemini
-            response = self.gemini_model.generate_content(prompt)
+            with self.provider_limits['gemini']:
+                response = self.gemini_model.generate_content(prompt)
             ai_response = response.text
             
             # Parsear la respuesta
@@ -257,101 +451,292 @@ Sé directo, específico y práctico."""
                 'recommendations': [f'Error: {str(e)[:100]}']
             }
     
+    def generate_ai_recommendations_batch(self, cities_data, batch_size=None):
+        """
+        Predicciones y recomendaciones de IA para muchas ciudades con pocas llamadas:
+        cada petición a Gemini incluye hasta batch_size ciudades y pide JSON estructurado
+        (una entrada por ciudad), que se separa de nuevo por ciudad.
+        Las ciudades ya memorizadas en ai_cache no se envían; los lotes respetan el
+        limitador 'gemini' (peticiones simultáneas y por minuto).
+        Retorna una lista alineada con cities_data
+        """
+        if not self.gemini_model:
+            return [self.generate_ai_recommendations(city_data) for city_data in cities_data]
+        
+        batch_size = batch_size or self.AI_BATCH_SIZE
+        results = [None] * len(cities_data)
+        pending = []
+        for idx, city_data in enumerate(cities_data):
+            cached = self.ai_cache.get(self._ai_cache_key(city_data))
+            if cached is not None:
+                results[idx] = dict(cached)
+            else:
+                pending.append(idx)
+        
+        batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+        print(f"🤖 IA por lotes: {len(cities_data) - len(pending)} en caché, "
+              f"{len(pending)} ciudades en {len(batches)} peticiones a Gemini")
+        
+        limiter = self.provider_limits['gemini']
+        with ThreadPoolExecutor(max_workers=limiter.max_concurrent, thread_name_prefix='gemini-lotes') as executor:
+            batch_results = executor.map(
+                lambda batch: self._request_ai_recommendations_batch([cities_data[i] for i in batch]),
+                batches
+            )
+            for batch, insights in zip(batches, batch_results):
+                for idx, ai_insights in zip(batch, insights):
+                    if ai_insights is None:
+                        ai_insights = {
+                            'prediction': 'Análisis en progreso',
+                            'recommendations': ['Consulte con expertos locales para recomendaciones específicas']
+                        }
+                    else:
+                        self.ai_cache.set(self._ai_cache_key(cities_data[idx]), dict(ai_insights))
+                    results[idx] = ai_insights
+        
+        return results
+    
+    def _request_ai_recommendations_batch(self, cities_data):
+        """
+        Una petición a Gemini para un lote de ciudades (respuesta JSON).
+        Retorna una lista alineada con cities_data; None donde la ciudad no vino en la respuesta
+        """
+        def value(city_data, field, decimals):
+            number = city_data.get(field)
+            if number is None or number != number:  # None o NaN = sin dato
+                return None
+            return round(float(number), decimals)
+        
+        ciudades = []
+        for idx, city_data in enumerate(cities_data):
+            ciudades.append({
+                'id': idx,
+                'ciudad': city_data.get('city', 'Ciudad'),
+                'estado': city_data.get('state'),
+                'indice_salud': value(city_data, 'health_score', 1),
+                'aqi': value(city_data, 'air_quality_index', 1),
+                'ndvi': value(city_data, 'ndvi_value', 2),
+                'densidad_hab_km2': value(city_data, 'population_density', 1),
+                'temperatura_c': value(city_data, 'temperature_avg', 1),
+            })
+        
+        prompt = f"""Actúa como un analista de planificación urbana experto para un hackathon de la NASA.
+
+Para CADA ciudad de la lista (índices en escala de 0 a 100, NDVI de 0 a 1, null = sin dato):
+1. Predice cualitativamente el Índice de Salud a 12 meses (1-2 oraciones)
+2. Genera 3-5 recomendaciones estratégicas CONCRETAS y ACCIONABLES para mejorar el índice
+
+Ciudades:
+{json.dumps(ciudades, ensure_ascii=False)}
+
+Responde SOLO con un arreglo JSON, un objeto por ciudad con el mismo "id":
+[{{"id": 0, "prediction": "...", "recommendations": ["...", "..."]}}]"""
+        
+        try:
+            with self.provider_limits['gemini']:
+                response = self.gemini_model.generate_content(
+                    prompt,
+                    generation_config={'response_mime_type': 'application/json'}
+                )
+            items = self._parse_ai_batch_response(response.text)
+        except Exception as e:
+            print(f"⚠️  Error en Gemini AI (lote de {len(cities_data)}): {str(e)[:50]}")
+            return [None] * len(cities_data)
+        
+        results = [None] * len(cities_data)
+        for item in items:
+            try:
+                idx = int(item.get('id'))
+            except (TypeError, ValueError, AttributeError):
+                continue
+            if 0 <= idx < len(results):
+                recommendations = [str(rec).strip() for rec in item.get('recommendations') or [] if str(rec).strip()]
+                results[idx] = {
+                    'prediction': str(item.get('prediction') or '').strip() or 'Análisis en progreso',
+                    'recommendations': recommendations or ['Consulte con expertos locales para recomendaciones específicas']
+                }
+        
+        missing = sum(1 for r in results if r is None)
+        if missing:
+            print(f"⚠️  Gemini omitió {missing} de {len(cities_data)} ciudades del lote")
+        return results
+    
+    @staticmethod
+    def _parse_ai_batch_response(text):
+        """Arreglo JSON de la respuesta (acepta bloque ```json o un objeto con la lista)"""
+        text = text.strip()
+        if text.startswith('```'):
+            text = text.strip('`')
+            text = text[text.find('\n') + 1:] if text.lower().startswith('json') else text
+        data = json.loads(text)
+        if isinstance(data, dict):
+            data = next((value for value in data.values() if isinstance(value, list)), [])
+        return data if isinstance(data, list) else []
+    
     def get_all_cities_by_state(self, estado_nombre):
         """
         Obtiene todas las ciudades/municipios de un estado específico
         """
-        cities_in_state = []
-        
-        # Buscar en municipios_por_estado primero
-        if estado_nombre in self.municipios_por_estado:
-            for municipio_name, municipio_info in self.municipios_por_estado[estado_nombre].items():
-                cities_in_state.append({
-                    'name': municipio_name,
-                    'coords': municipio_info['coords'],
-                    'poblacion': municipio_info['poblacion'],
-                    'tipo': municipio_info['tipo']
-                })
-        
-        # Agregar ciudades del diccionario original si no están incluidas
-        for city_name, city_info in self.mexican_cities.items():
-            if city_info.get('estado') == estado_nombre:
-                # Verificar si ya está en la lista
-                if not any(city['name'] == city_name for city in cities_in_state):
-                    cities_in_state.append({
-                        'name': city_name,
-                        'coords': city_info['coords'],
-                        'poblacion': city_info.get('poblacion', 0),
-                        'tipo': city_info.get('tipo', 'ciudad')
-                    })
-        
-        return cities_in_state
+        return [
+            {
+                'id': record['id'],
+                'name': record['nombre'],
+                'coords': record['coords'],
+                'poblacion': record['poblacion'],
+                'tipo': record['tipo']
+            }
+            for record in self.catalog.by_state(estado_nombre)
+        ]
     
     def get_real_air_quality_data(self, city_name, coords):
-        """Obtiene datos reales de calidad del aire desde WAQI API"""
-        print(f"   🌬️  {city_name}...", end='', flush=True)
+        """
+        Obtiene datos reales de calidad del aire desde WAQI API.
+        Se consulta la capa nacional de estaciones en memoria (estación más cercana),
+        sin búsquedas por nombre de ciudad
+        """
+        if self.WAQI_TOKEN == "demo":
+            return self.cache.get_or_fetch('air', coords, lambda cell: self._fetch_waqi_geo_feed(city_name, cell))
         
-        # Intentar con WAQI API por nombre de ciudad
         try:
-            url = f"https://api.waqi.info/feed/{city_name}/?token=demo"
-            response = requests.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                if data['status'] == 'ok' and 'data' in data:
-                    aqi_value = data['data'].get('aqi', 0)
-                    if isinstance(aqi_value, (int, float)) and aqi_value > 0:
-                        iaqi = data['data'].get('iaqi', {})
-                        aqi_data = {
-                            'aqi': aqi_value,
-                            'pm25': iaqi.get('pm25', {}).get('v', None),
-                            'pm10': iaqi.get('pm10', {}).get('v', None),
-                            'no2': iaqi.get('no2', {}).get('v', None),
-                            'o3': iaqi.get('o3', {}).get('v', None),
-                            'co': iaqi.get('co', {}).get('v', None),
-                            'source': 'WAQI API'
-                        }
-                        print(f" ✓ AQI: {aqi_data['aqi']} (API real)")
-                        return aqi_data
+            lat, lon = coords
+            aqi_data = self.air_stations.query(float(lat), float(lon))
         except Exception as e:
-            print(f" ⚠️ Error WAQI: {str(e)[:30]}", end='')
+            print(f"   🌬️  {city_name} ⚠️ Error WAQI: {str(e)[:30]}")
+            return None
         
-        # Intentar con coordenadas
+        if aqi_data is None:
+            if not self.air_stations.is_loaded:
+                print(f"   🌬️  {city_name} ⏳ Estaciones WAQI aún descargándose")
+                return None
+            print(f"   🌬️  {city_name} ❌ Sin estación WAQI cercana")
+            return None
+        
+        print(f"   🌬️  {city_name} ✓ AQI: {aqi_data['aqi']:.0f} "
+              f"({aqi_data['station'] or 'estación'}, {aqi_data['distance_km']} km)")
+        return aqi_data
+    
+    def _fetch_waqi_geo_feed(self, city_name, coords):
+        """Estación WAQI más cercana a unas coordenadas (feed/geo), sin capa nacional (token demo)"""
         try:
             lat, lon = coords
-            url = f"https://api.waqi.info/feed/geo:{lat};{lon}/?token=demo"
-            response = requests.get(url, timeout=10)
+            url = f"https://api.waqi.info/feed/geo:{lat};{lon}/?token={self.WAQI_TOKEN}"
+            with self.provider_limits['air']:
+                response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
-                if data['status'] == 'ok' and 'data' in data:
-                    aqi_value = data['data'].get('aqi', 0)
-                    if isinstance(aqi_value, (int, float)) and aqi_value > 0:
-                        iaqi = data['data'].get('iaqi', {})
-                        aqi_data = {
-                            'aqi': aqi_value,
-                            'pm25': iaqi.get('pm25', {}).get('v', None),
-                            'pm10': iaqi.get('pm10', {}).get('v', None),
-                            'no2': iaqi.get('no2', {}).get('v', None),
-                            'o3': iaqi.get('o3', {}).get('v', None),
-                            'co': iaqi.get('co', {}).get('v', None),
-                            'source': 'WAQI API (coords)'
-                        }
-                        print(f" ✓ AQI: {aqi_data['aqi']} (API coords)")
-                        return aqi_data
+                aqi = (data.get('data') or {}).get('aqi') if data.get('status') == 'ok' else None
+                if isinstance(aqi, (int, float)) and aqi > 0:
+                    pollutants = station_pollutants(data['data'])
+                    aqi_data = {'aqi': float(aqi)}
+                    aqi_data.update({name: None if np.isnan(value) else value
+                                     for name, value in pollutants.items()})
+                    aqi_data['station'] = (data['data'].get('city') or {}).get('name', '')
+                    aqi_data['source'] = 'WAQI API (token demo, por coordenadas)'
+                    print(f"   🌬️  {city_name} ✓ AQI: {aqi_data['aqi']:.0f} (token demo)")
+                    return aqi_data
         except Exception as e:
-            print(f" ⚠️ Error coords: {str(e)[:30]}")
+            print(f"   🌬️  {city_name} ⚠️ Error WAQI: {str(e)[:30]}")
         
-        # Si falla, retornar None para que se note que no hay datos
-        print(" ❌ Sin datos API")
+        print(f"   🌬️  {city_name} ❌ Sin datos WAQI (token demo)")
         return None
     
+    def _download_waqi_stations(self):
+        """
+        Descarga todas las estaciones WAQI dentro de la caja de México (map/bounds)
+        y los contaminantes de cada una (feed/@uid, en paralelo)
+        """
+        try:
+            west, south, east, north = MEXICO_BBOX
+            url = (f"https://api.waqi.info/map/bounds/?latlng={south},{west},{north},{east}"
+                   f"&token={self.WAQI_TOKEN}")
+            with self.provider_limits['air']:
+                response = self.session.get(url, timeout=30)
+            
+            if response.status_code != 200:
+                print(f"⚠️  WAQI nacional: HTTP {response.status_code}")
+                return None
+            data = response.json()
+            if data.get('status') != 'ok':
+                print(f"⚠️  WAQI nacional: {str(data.get('data'))[:50]}")
+                return None
+        except Exception as e:
+            print(f"⚠️  WAQI nacional: {str(e)[:50]}")
+            return None
+        
+        stations = parse_waqi_bounds(data)
+        
+        # Contaminantes por estación (hilos propios, fuera de los pools de consultas);
+        # si una falla se conserva solo su AQI
+        feeds = map_in_threads(self._fetch_waqi_station_feed, [station['uid'] for station in stations],
+                               self.provider_limits['air'].max_concurrent, 'estaciones-waqi')
+        for station, feed in zip(stations, feeds):
+            station.update(feed)
+        return stations
+    
+    def _fetch_waqi_station_feed(self, uid):
+        """Subíndices de contaminantes de una estación WAQI (NaN si no hay datos)"""
+        try:
+            url = f"https://api.waqi.info/feed/@{uid}/?token={self.WAQI_TOKEN}"
+            with self.provider_limits['air']:
+                response = self.session.get(url, timeout=10)
+            
+            if response.status_code == 200:
+                data = response.json()
+                if data.get('status') == 'ok':
+                    return station_pollutants(data.get('data'))
+        except Exception:
+            pass
+        return station_pollutants(None)
+    
     def get_real_weather_data(self, city_name, coords):
-        """Obtiene datos meteorológicos reales desde OpenWeatherMap API"""
+        """
+        Obtiene datos meteorológicos reales desde OpenWeatherMap API.
+        Se interpola en la rejilla nacional; mientras la rejilla se descarga por primera vez
+        (o fuera de ella) se consulta el punto directamente (con caché)
+        """
+        lat, lon = coords
+        weather_data = self.weather_grid.query(float(lat), float(lon))
+        if weather_data is not None:
+            return weather_data
+        return self.cache.get_or_fetch('weather', coords, self._fetch_weather_data)
+    
+    def _download_weather_grid(self):
+        """Consulta OpenWeatherMap en cada nodo de la rejilla nacional (con su propia parte de la cuota)"""
+        nodes = self.weather_grid.nodes()
+        if not nodes:
+            return None
+        
+        print(f"🌡️  Descargando rejilla de clima: {len(nodes)} nodos...")
+        limiter = self.provider_limits['weather_grid']
+        data = map_in_threads(lambda node: self._fetch_weather_data(self.weather_grid.node_coords(node), limiter),
+                              nodes, limiter.max_concurrent, 'rejilla-clima')
+        
+        if not any(data):
+            print("⚠️  Rejilla de clima: ningún nodo respondió")
+            return None
+        return list(zip(nodes, data))
+    
+    def load_national_layers(self):
+        """Espera la primera descarga de las capas nacionales que no bloquean por defecto"""
+        self.fire_index.current(wait=True)
+        if self.WAQI_TOKEN != "demo":
+            self.air_stations.current(wait=True)
+        self.weather_grid.current(wait=True)
+        self.openaq_stations.current(wait=True)
+        # Muestreo NDVI de todo el catálogo en una pasada (se reutiliza durante el periodo)
+        self.ndvi_engine.city_table(self.catalog)
+    
+    def _fetch_weather_data(self, coords, limiter=None):
+        """
+        Consulta OpenWeatherMap API para unas coordenadas.
+        limiter: cuota a usar (por defecto la de consultas puntuales, que falla rápido si no hay turno)
+        """
         try:
             lat, lon = coords
             url = f"https://api.openweathermap.org/data/2.5/weather?lat={lat}&lon={lon}&appid={self.OPENWEATHER_KEY}&units=metric"
-            response = requests.get(url, timeout=10)
+            with limiter or self.provider_limits['weather']:
+                response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
                 data = response.json()
@@ -389,7 +774,8 @@ Sé directo, específico y práctico."""
             out count;
             """
             
-            response = requests.post(overpass_url, data={'data': query}, timeout=12)
+            with self.provider_limits['osm']:
+                response = self.session.post(overpass_url, data={'data': query}, timeout=12)
             
             if response.status_code == 200:
                 data = response.json()
@@ -410,194 +796,196 @@ Sé directo, específico y práctico."""
         return None
     
     def get_openaq_air_quality(self, coords, city_name):
-        """Obtiene datos de calidad del aire desde OpenAQ API v3 - COMPLEMENTA WAQI"""
+        """
+        Obtiene datos de calidad del aire desde OpenAQ API v3 - COMPLEMENTA WAQI.
+        Promedia la última medición de las estaciones más cercanas a la ciudad
+        (catálogo nacional de estaciones en memoria; medición cacheada por estación)
+        """
         try:
             lat, lon = coords
-            # OpenAQ API v3 - formato de URL correcto
-            url = f"https://api.openaq.org/v3/locations?coordinates={lat},{lon}&radius=25000&limit=20"
+            stations = self.openaq_stations.nearby(float(lat), float(lon))
+            if not stations:
+                # Catálogo aún no descargado o sin estaciones a menos de 25 km
+                return None
             
             headers = {
                 'X-API-Key': self.OPENAQ_KEY
             }
             
-            response = requests.get(url, headers=headers, timeout=15)
+            # Una llamada /latest por estación (en paralelo), compartida entre ciudades vecinas
+            latest_futures = [
+                self._subrequest_executor.submit(
+                    self.cache.get_or_fetch_item, 'openaq_station', location_id,
+                    lambda location_id=location_id, sensors=sensors:
+                        self._fetch_openaq_location_latest(location_id, sensors, headers)
+                )
+                for location_id, sensors, _ in stations
+            ]
+            all_measurements = {}
+            for future in latest_futures:
+                for param_name, value in future.result() or []:
+                    if param_name not in all_measurements:
+                        all_measurements[param_name] = []
+                    all_measurements[param_name].append(value)
             
-            if response.status_code == 200:
-                data = response.json()
-                locations = data.get('results', [])
-                
-                if not locations:
-                    return None
-                
-                # Recolectar mediciones de todos los sensores
-                all_measurements = {}
-                stations_found = len(locations)
-                
-                for location in locations[:5]:  # Solo primeras 5 para no saturar
-                    sensors = location.get('sensors', [])
-                    
-                    for sensor in sensors:
-                        param_info = sensor.get('parameter', {})
-                        param_name = param_info.get('name', '').lower()
-                        sensor_id = sensor.get('id')
-                        
-                        if param_name and sensor_id:
-                            # Obtener última medición de este sensor
-                            try:
-                                meas_url = f"https://api.openaq.org/v3/sensors/{sensor_id}/measurements?limit=1&sort=desc"
-                                meas_response = requests.get(meas_url, headers=headers, timeout=5)
-                                
-                                if meas_response.status_code == 200:
-                                    meas_data = meas_response.json()
-                                    measurements = meas_data.get('results', [])
-                                    
-                                    if measurements:
-                                        value = measurements[0].get('value')
-                                        if value is not None:
-                                            if param_name not in all_measurements:
-                                                all_measurements[param_name] = []
-                                            all_measurements[param_name].append(value)
-                            except:
-                                pass  # Continuar con siguiente sensor
-                
-                if not all_measurements:
-                    return None
-                
-                # Promediar valores por parámetro
-                averaged = {}
-                for param, values in all_measurements.items():
-                    if values:
-                        averaged[param] = sum(values) / len(values)
-                
-                return {
-                    'stations_found': stations_found,
-                    'measurements': averaged,
-                    'pm25': averaged.get('pm25'),
-                    'pm10': averaged.get('pm10'),
-                    'no2': averaged.get('no2'),
-                    'o3': averaged.get('o3'),
-                    'co': averaged.get('co'),
-                    'so2': averaged.get('so2'),
-                    'source': 'OpenAQ API v3'
-                }
+            if not all_measurements:
+                return None
             
-            return None
+            # Promediar valores por parámetro
+            averaged = {}
+            for param, values in all_measurements.items():
+                if values:
+                    averaged[param] = sum(values) / len(values)
+            
+            return {
+                'stations_found': len(stations),
+                'nearest_station_km': stations[0][2],
+                'measurements': averaged,
+                'pm25': averaged.get('pm25'),
+                'pm10': averaged.get('pm10'),
+                'no2': averaged.get('no2'),
+                'o3': averaged.get('o3'),
+                'co': averaged.get('co'),
+                'so2': averaged.get('so2'),
+                'source': 'OpenAQ API v3 (estaciones más cercanas)'
+            }
             
         except Exception as e:
             # Silencioso - no todos los lugares tienen estaciones OpenAQ
             return None
     
-    def get_worldpop_data(self, coords, city_name):
-        """Obtiene datos de población - WorldPop API no disponible actualmente
-        Usando datos de censo oficial + cálculo geográfico mejorado"""
+    def _download_openaq_stations(self):
+        """Catálogo de estaciones OpenAQ de México (/v3/locations?iso=MX, paginado)"""
+        headers = {
+            'X-API-Key': self.OPENAQ_KEY
+        }
+        results = []
+        try:
+            for page in range(1, 11):
+                url = f"https://api.openaq.org/v3/locations?iso=MX&limit=1000&page={page}"
+                with self.provider_limits['openaq']:
+                    response = self.session.get(url, headers=headers, timeout=30)
+                
+                if response.status_code != 200:
+                    print(f"⚠️  OpenAQ nacional: HTTP {response.status_code}")
+                    return None
+                page_results = response.json().get('results', [])
+                results.extend(page_results)
+                if len(page_results) < 1000:
+                    break
+        except Exception as e:
+            print(f"⚠️  OpenAQ nacional: {str(e)[:50]}")
+            return None
+        
+        return parse_openaq_locations(results)
+    
+    def _fetch_openaq_location_latest(self, location_id, sensor_params, headers):
+        """
+        Última medición de todos los sensores de una estación OpenAQ
+        (endpoint /v3/locations/{id}/latest). Retorna lista de (parámetro, valor),
+        o None si la consulta falló (no se cachea)
+        """
+        # El endpoint /latest solo trae sensorsId; el parámetro viene del catálogo de estaciones
+        try:
+            url = f"https://api.openaq.org/v3/locations/{location_id}/latest"
+            with self.provider_limits['openaq']:
+                response = self.session.get(url, headers=headers, timeout=10)
+            
+            if response.status_code != 200:
+                return None
+            
+            values = []
+            for measurement in response.json().get('results', []):
+                param_name = sensor_params.get(measurement.get('sensorsId'))
+                value = measurement.get('value')
+                if param_name and value is not None:
+                    values.append((param_name, value))
+            return values
+        except Exception:
+            return None  # Continuar con la siguiente estación
+    
+    def get_nasa_firms_fires(self, coords, city_name):
+        """
+        Obtiene alertas de incendios desde NASA FIRMS - DETECTA INCENDIOS Y HUMO.
+        Se consulta la capa nacional en memoria (una descarga por intervalo de actualización)
+        """
         try:
             lat, lon = coords
             
-            # WorldPop API tiene problemas actualmente (Error 500)
-            # Alternativa: usar datos censales con cálculo más preciso
-            # basado en la ciudad desde self.mexican_cities
+            # Área de búsqueda: ±0.5 grados (~55 km)
+            stats = self.fire_index.query(lat, lon, half_size_deg=0.5)
+            if stats is None:
+                return None
             
-            # Buscar la ciudad en nuestros datos
-            city_info = self.mexican_cities.get(city_name)
-            if city_info:
-                pop = city_info.get('poblacion', city_info.get('pop', 100000))
-                
-                # Calcular área urbana aproximada basada en población
-                # Fórmula empírica: área urbana ~ población^0.85 (ley de escala urbana)
-                area_km2 = (pop / 5000) ** 0.85
-                
-                # Densidad más realista
-                density = pop / area_km2
-                
-                return {
-                    'population_density_real': density,
-                    'area_km2': area_km2,
-                    'population': pop,
-                    'source': 'Censo INEGI + cálculo geográfico',
-                    'note': 'WorldPop API temporalmente no disponible'
-                }
+            fire_count = stats['fires_detected']
             
-            return None
+            # Clasificar nivel de riesgo
+            if fire_count == 0:
+                risk = 'Bajo'
+            elif fire_count <= 5:
+                risk = 'Moderado'
+            elif fire_count <= 15:
+                risk = 'Alto'
+            else:
+                risk = 'Muy Alto'
+            
+            return {
+                'fires_detected': fire_count,
+                'fire_risk_level': risk,
+                'avg_brightness': stats['avg_brightness'],
+                'max_frp': stats['max_frp'],
+                'source': 'NASA FIRMS VIIRS'
+            }
             
         except Exception as e:
             return None
     
-    def get_nasa_firms_fires(self, coords, city_name):
-        """Obtiene alertas de incendios desde NASA FIRMS API - DETECTA INCENDIOS Y HUMO"""
+    def _download_firms_national_csv(self):
+        """Descarga el CSV de FIRMS (VIIRS, últimas 24 horas) para toda la caja de México"""
         try:
-            from datetime import datetime, timedelta
-            
-            lat, lon = coords
-            
             # NASA FIRMS API - últimas 24 horas
             # VIIRS_SNPP_NRT = satélite VIIRS Suomi NPP (resolución 375m)
             today = datetime.now().strftime('%Y-%m-%d')
+            west, south, east, north = MEXICO_BBOX
+            url = f"https://firms.modaps.eosdis.nasa.gov/api/area/csv/{self.NASA_FIRMS_KEY}/VIIRS_SNPP_NRT/{west},{south},{east},{north}/1/{today}"
             
-            # Área de búsqueda: ±0.5 grados (~55 km)
-            url = f"https://firms.modaps.eosdis.nasa.gov/api/area/csv/{self.NASA_FIRMS_KEY}/VIIRS_SNPP_NRT/{lat-0.5},{lon-0.5},{lat+0.5},{lon+0.5}/1/{today}"
-            
-            response = requests.get(url, timeout=15)
+            with self.provider_limits['fires']:
+                response = self.session.get(url, timeout=60)
             
             if response.status_code == 200:
-                # Parsear CSV
-                lines = response.text.strip().split('\n')
-                
-                if len(lines) <= 1:
-                    # Solo header, sin incendios
-                    return {
-                        'fires_detected': 0,
-                        'fire_risk_level': 'Bajo',
-                        'avg_brightness': 0,
-                        'max_frp': 0,
-                        'source': 'NASA FIRMS VIIRS'
-                    }
-                
-                # Contar incendios y calcular estadísticas
-                fire_count = len(lines) - 1  # -1 por el header
-                brightnesses = []
-                frps = []  # Fire Radiative Power
-                
-                for line in lines[1:]:  # Skip header
-                    parts = line.split(',')
-                    if len(parts) >= 13:
-                        try:
-                            brightness = float(parts[2])  # Brightness temperature
-                            frp = float(parts[11])  # Fire Radiative Power
-                            brightnesses.append(brightness)
-                            frps.append(frp)
-                        except:
-                            pass
-                
-                avg_brightness = sum(brightnesses) / len(brightnesses) if brightnesses else 0
-                max_frp = max(frps) if frps else 0
-                
-                # Clasificar nivel de riesgo
-                if fire_count == 0:
-                    risk = 'Bajo'
-                elif fire_count <= 5:
-                    risk = 'Moderado'
-                elif fire_count <= 15:
-                    risk = 'Alto'
-                else:
-                    risk = 'Muy Alto'
-                
-                return {
-                    'fires_detected': fire_count,
-                    'fire_risk_level': risk,
-                    'avg_brightness': avg_brightness,
-                    'max_frp': max_frp,
-                    'source': 'NASA FIRMS VIIRS'
-                }
+                return response.text
             
+            print(f"⚠️  NASA FIRMS nacional: HTTP {response.status_code}")
             return None
             
         except Exception as e:
+            print(f"⚠️  NASA FIRMS nacional: {str(e)[:50]}")
             return None
-            
+    
+    def get_nasa_ndvi(self, coords, city_id=None):
+        """
+        Obtiene NDVI real del compuesto MODIS local más reciente (buffer alrededor de la ciudad).
+        Las ciudades del catálogo salen de la tabla muestreada una vez por periodo;
+        sin compuesto o sin píxeles válidos se usa la estimación geográfica (con caché)
+        """
+        try:
+            if city_id is not None and city_id in self.catalog:
+                period, ndvi = self.ndvi_engine.city_ndvi(self.catalog, city_id)
+            else:
+                period, ndvi = self.ndvi_engine.point_ndvi(float(coords[0]), float(coords[1]))
         except Exception as e:
-            return None
+            print(f"⚠️  NDVI MODIS: {str(e)[:50]}")
+            period, ndvi = None, None
+        
+        if ndvi is not None:
+            return {
+                'ndvi': round(ndvi, 4),
+                'period': period,
+                'source': f'NASA MODIS NDVI (compuesto {period})'
+            }
+        return self.cache.get_or_fetch('ndvi', coords, self._estimate_ndvi)
     
-    def get_nasa_ndvi(self, coords):
+    def _estimate_ndvi(self, coords):
         """
         Obtiene NDVI desde NASA MODIS
         NOTA: NASA requiere autenticación, usando estimación basada en ubicación
@@ -627,94 +1015,125 @@ Sé directo, específico y práctico."""
             'note': 'Para datos reales: https://appeears.earthdatacloud.nasa.gov/'
         }
     
-    def analyze_single_city(self, city_name):
+    def _fetch_city_sources(self, city_name, coords, deadline=None):
+        """
+        Consulta en paralelo las fuentes independientes de una ciudad
+        (WAQI, OpenWeatherMap, OpenAQ y NASA FIRMS) con un plazo total por ciudad.
+        La latencia queda acotada por la fuente más lenta, no por la suma de todas;
+        las fuentes que no respondan a tiempo o fallen se reportan como None
+        """
+        if deadline is None:
+            deadline = self.CITY_FETCH_DEADLINE
+        
+        tasks = {
+            'air': lambda: self.get_real_air_quality_data(city_name, coords),
+            'weather': lambda: self.get_real_weather_data(city_name, coords),
+            'openaq': lambda: self.get_openaq_air_quality(coords, city_name),
+            'fires': lambda: self.get_nasa_firms_fires(coords, city_name),
+        }
+        futures = {name: self._fetch_executor.submit(task) for name, task in tasks.items()}
+        done, pending = wait(futures.values(), timeout=deadline)
+        
+        results = {}
+        for name, future in futures.items():
+            if future in done and future.exception() is None:
+                results[name] = future.result()
+            else:
+                if future not in done:
+                    # La petición sigue en segundo plano hasta su propio timeout HTTP
+                    future.cancel()
+                    print(f"   ⏱️  {name}: sin respuesta tras {deadline}s")
+                results[name] = None
+        
+        return results
+    
+    def analyze_single_city(self, city, estado=None, include_ai=True):
         """
         Analiza UNA SOLA ciudad bajo demanda usando APIs REALES
         Ideal para consultas individuales sin procesar todas las ciudades
-        Funciona con ciudades del diccionario principal y municipios cargados externamente
+        city: clave del catálogo (city_id) o nombre; con homónimos en varios
+        estados se puede indicar el estado.
+        include_ai=False omite Gemini (ver start_ai_insights para generarlo aparte)
         """
-        # Buscar la ciudad en el diccionario principal
-        if city_name not in self.mexican_cities:
-            # Buscar en municipios_por_estado si está disponible
-            city_found = False
-            city_info = None
-            
-            for estado, municipios in self.municipios_por_estado.items():
-                if city_name in municipios:
-                    city_info = municipios[city_name]
-                    city_found = True
-                    break
-            
-            if not city_found:
-                print(f"❌ Ciudad '{city_name}' no encontrada")
-                available_cities = list(self.mexican_cities.keys())
-                if self.municipios_por_estado:
-                    for estado, municipios in self.municipios_por_estado.items():
-                        available_cities.extend(municipios.keys())
-                print(f"Total ciudades disponibles: {len(set(available_cities))}")
-                return None
-        else:
-            city_info = self.mexican_cities[city_name]
+        city_info = self.catalog.resolve(city, estado)
+        if city_info is None:
+            print(f"❌ Ciudad '{city}' no encontrada")
+            print(f"Total ciudades disponibles: {len(self.catalog)}")
+            return None
         
+        # Clics simultáneos en la misma ciudad comparten un solo análisis (mismo resultado)
+        return self.city_flight.do(
+            (city_info['id'], include_ai),
+            lambda: self._analyze_city_record(city_info, include_ai)
+        )
+    
+    def _analyze_city_record(self, city_info, include_ai=True):
+        """Consulta fuentes y calcula el índice de un registro del catálogo (ver analyze_single_city)"""
+        city_name = city_info['nombre']
         coords = city_info['coords']
         lat, lon = coords
         
         print(f"\n🔍 CONSULTANDO: {city_name}, {city_info.get('estado', city_info.get('state', 'Unknown'))}")
         print("=" * 50)
         
-        # === 1. CALIDAD DEL AIRE (API WAQI) ===
-        air_data = self.get_real_air_quality_data(city_name, coords)
+        # === 1. FUENTES EXTERNAS EN PARALELO (WAQI, OpenWeatherMap, OpenAQ, NASA FIRMS) ===
+        sources = self._fetch_city_sources(city_name, coords)
+        air_data = sources['air']
+        weather_data = sources['weather']
+        openaq_data = sources['openaq']
+        fires_data = sources['fires']
         
         # === 2. CLIMA (API OpenWeatherMap) ===
-        print(f"   🌡️  Clima...", end='', flush=True)
-        weather_data = self.get_real_weather_data(city_name, coords)
         if weather_data:
-            print(f" ✓ Temp: {weather_data['temperature']:.1f}°C, Hum: {weather_data['humidity']}%")
+            print(f"   🌡️  Clima ✓ Temp: {weather_data['temperature']:.1f}°C, Hum: {weather_data['humidity']}%")
             temperature = weather_data['temperature']
             humidity = weather_data['humidity']
             wind_speed = weather_data['wind_speed']
         else:
-            print(" ❌ Sin datos clima")
+            print("   🌡️  Clima ❌ Sin datos clima")
             temperature = None
             humidity = None
             wind_speed = None
         
-        # === 3. ESPACIOS VERDES (Estimación) ===
-        print(f"   🌳 Espacios verdes... ℹ️ Estimación")
-        green_ratio = max(0.2, min(0.7, 0.5 - (city_info['poblacion'] / 10000000) * 0.3))
+        # === 3. ESPACIOS VERDES (tabla OSM precalculada o estimación) ===
+        green_data = self.green_spaces.get(city_info['id'])
+        if green_data:
+            print(f"   🌳 Espacios verdes ✓ {green_data['green_area_km2']:.2f} km² "
+                  f"({green_data['green_ratio']:.0%} del buffer)")
+            green_ratio = green_data['green_ratio']
+        else:
+            print(f"   🌳 Espacios verdes... ℹ️ Estimación")
+            green_ratio = max(0.2, min(0.7, 0.5 - (city_info['poblacion'] / 10000000) * 0.3))
         
         # === 4. CALIDAD DEL AIRE ADICIONAL (OpenAQ API) ===
-        print(f"   💨 OpenAQ...", end='', flush=True)
-        openaq_data = self.get_openaq_air_quality(coords, city_name)
         if openaq_data:
-            print(f" ✓ {openaq_data['stations_found']} estaciones")
+            print(f"   💨 OpenAQ ✓ {openaq_data['stations_found']} estaciones")
         else:
-            print(" ℹ️ Sin datos adicionales")
+            print("   💨 OpenAQ ℹ️ Sin datos adicionales")
         
         # === 5. INCENDIOS (NASA FIRMS) ===
-        print(f"   🔥 NASA FIRMS...", end='', flush=True)
-        fires_data = self.get_nasa_firms_fires(coords, city_name)
         if fires_data and fires_data['fires_detected'] > 0:
-            print(f" ⚠️ {fires_data['fires_detected']} incendios")
+            print(f"   🔥 NASA FIRMS ⚠️ {fires_data['fires_detected']} incendios")
         else:
-            print(" ✓ Sin incendios")
+            print("   🔥 NASA FIRMS ✓ Sin incendios")
         
         # === 6. NDVI ===
         print(f"   🛰️  NDVI...", end='', flush=True)
-        ndvi_data = self.get_nasa_ndvi(coords)
+        ndvi_data = self.get_nasa_ndvi(coords, city_info['id'])
         print(f" ✓ {ndvi_data['ndvi']:.2f}")
         ndvi = ndvi_data['ndvi']
         
-        # Calcular métricas
-        area_km2 = 150 + np.random.uniform(50, 200)
-        density = city_info['poblacion'] / area_km2
-        noise = min(85, max(40, 45 + (density / 100) + np.random.normal(0, 3)))
-        healthcare = max(2, min(10, 3 + (city_info['poblacion'] / 1000000) * 0.8))
+        # Métricas estáticas precalculadas (mismo municipio = mismos valores)
+        features = self.static_features.get(city_info['id'])
+        density = features['population_density']
+        noise = features['noise_pollution_db']
+        healthcare = features['healthcare_accessibility']
         
         # Crear registro de ciudad
         city_data = {
+            'city_id': city_info['id'],
             'city': city_name,
-            'state': city_info.get('estado', city_info.get('state', 'Unknown')),
+            'state': city_info['estado'],
             'latitude': lat,
             'longitude': lon,
             'population': city_info['poblacion'],
@@ -743,192 +1162,125 @@ Sé directo, específico y práctico."""
         print(f"🏥 Índice de Salud: {city_data['health_score']:.1f}/100")
         
         # Generar predicciones y recomendaciones con IA
-        print(f"🤖 Generando recomendaciones con IA...", end='', flush=True)
-        ai_insights = self.generate_ai_recommendations(city_data)
-        city_data['ai_prediction'] = ai_insights['prediction']
-        city_data['ai_recommendations'] = ai_insights['recommendations']
-        print(" ✓")
+        if include_ai:
+            print(f"🤖 Generando recomendaciones con IA...", end='', flush=True)
+            ai_insights = self.generate_ai_recommendations(city_data)
+            city_data['ai_prediction'] = ai_insights['prediction']
+            city_data['ai_recommendations'] = ai_insights['recommendations']
+            print(" ✓")
         
         return city_data
     
-    def analyze_all_cities(self):
-        """Analiza todas las ciudades de México usando APIs REALES"""
+    def start_ai_insights(self, city_data):
+        """
+        Genera la predicción y recomendaciones de IA en segundo plano.
+        Retorna el estado inicial: 'ready' con el resultado si la IA no está disponible,
+        o 'pending' con un job_id para consultar después con get_ai_insights()
+        """
+        if not self.gemini_model:
+            return dict(self.generate_ai_recommendations(city_data), status='ready')
+        
+        # Perfil ya consultado: se responde de inmediato desde la caché de IA
+        cached = self.ai_cache.get(self._ai_cache_key(city_data))
+        if cached is not None:
+            return {
+                'status': 'ready',
+                'prediction': cached['prediction'],
+                'recommendations': cached['recommendations']
+            }
+        
+        # Mismo perfil ya en curso: todos consultan el mismo trabajo
+        key = self._ai_cache_key(city_data)
+        with self._ai_jobs_lock:
+            job_id = self._ai_jobs_inflight.get(key)
+            if job_id is not None:
+                return {'status': 'pending', 'job_id': job_id}
+            job_id = uuid.uuid4().hex
+            self._ai_jobs_inflight[key] = job_id
+            self.ai_jobs.set(job_id, {'status': 'pending', 'city': city_data.get('city')})
+        
+        def run():
+            try:
+                print(f"🤖 Generando recomendaciones con IA: {city_data.get('city')}")
+                ai_insights = self.generate_ai_recommendations(city_data, use_cache=False)
+                self.ai_jobs.set(job_id, dict(ai_insights, status='ready', city=city_data.get('city')))
+            finally:
+                with self._ai_jobs_lock:
+                    self._ai_jobs_inflight.pop(key, None)
+        
+        self._ai_executor.submit(run)
+        return {'status': 'pending', 'job_id': job_id}
+    
+    def get_ai_insights(self, job_id):
+        """Estado de un trabajo de IA en segundo plano (None si no existe o expiró)"""
+        return self.ai_jobs.get(job_id)
+    
+    def analyze_all_cities(self, progress_every=25, include_ai=False):
+        """
+        Analiza todas las ciudades de México usando APIs REALES.
+        Las fuentes se consultan con el motor de barrido nacional (NationalSweep):
+        concurrencia acotada por proveedor y reporte de progreso.
+        include_ai=True agrega predicción y recomendaciones de Gemini por lotes
+        """
+        cities = [(record['nombre'], record) for record in self.catalog]
+        
         print("\n🇲🇽 ANÁLISIS NACIONAL DE SALUD URBANA - MÉXICO")
         print("=" * 60)
         print(f"📅 Fecha: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"🏙️  Ciudades a analizar: {len(self.mexican_cities)}")
+        print(f"🏙️  Ciudades a analizar: {len(cities)}")
         print(f"🌐 USANDO APIs REALES (no simulaciones)")
         print("=" * 60)
         
-        all_cities_data = []
-        api_success_count = {'air': 0, 'weather': 0, 'green': 0, 'openaq': 0, 'worldpop': 0, 'fires': 0}
+        api_success_count = {'air': 0, 'weather': 0, 'green': 0, 'openaq': 0, 'fires': 0}
         
         print("\n📡 FASE 1: RECOPILACIÓN DE DATOS REALES POR CIUDAD")
         print("-" * 40)
+        for name, limiter in self.provider_limits.items():
+            per_minute = f"{limiter.per_minute}/min" if limiter.per_minute else "sin límite"
+            print(f"   ⚙️  {name}: {limiter.max_concurrent} simultáneas, {per_minute}")
         
-        for idx, (city_name, city_info) in enumerate(self.mexican_cities.items(), 1):
-            print(f"\n[{idx}/{len(self.mexican_cities)}] {city_name}, {city_info.get('estado', city_info.get('state', 'Unknown'))}")
-            coords = city_info['coords']
-            lat, lon = coords
+        sweep = NationalSweep(self, progress_every=progress_every)
+        sources_by_city = sweep.run(cities)
+        
+        all_cities_data = []
+        for (city_name, city_info), sources in zip(cities, sources_by_city):
+            city_data = self._build_sweep_record(city_name, city_info, sources)
             
-            # === 1. CALIDAD DEL AIRE (API WAQI) ===
-            air_data = self.get_real_air_quality_data(city_name, coords)
-            if air_data:
+            if sources.get('air'):
                 api_success_count['air'] += 1
-            
-            # === 2. CLIMA (API OpenWeatherMap) ===
-            print(f"   🌡️  Clima...", end='', flush=True)
-            weather_data = self.get_real_weather_data(city_name, coords)
-            if weather_data:
+            if sources.get('weather'):
                 api_success_count['weather'] += 1
-                print(f" ✓ Temp: {weather_data['temperature']:.1f}°C, Hum: {weather_data['humidity']}%")
-                temperature = weather_data['temperature']
-                humidity = weather_data['humidity']
-                wind_speed = weather_data['wind_speed']
-            else:
-                print(" ❌ Sin datos clima")
-                temperature = None
-                humidity = None
-                wind_speed = None
-            
-            # === 3. ESPACIOS VERDES (API OpenStreetMap - DESACTIVADA POR LENTITUD) ===
-            print(f"   🌳 Espacios verdes...", end='', flush=True)
-            # Comentado temporalmente por lentitud de Overpass API
-            # green_data = self.get_openstreetmap_green_spaces(coords, radius_km=3)
-            green_data = None  # Usar estimación directamente
-            
-            if green_data:
-                api_success_count['green'] += 1
-                print(f" ✓ {green_data['green_count']} parques")
-                green_ratio = green_data['green_ratio']
-            else:
-                print(" ℹ️ Estimación (OSM muy lento)")
-                # Estimación basada en población y latitud
-                green_ratio = max(0.2, min(0.7, 0.5 - (city_info['poblacion'] / 10000000) * 0.3))
-            
-            # === 4. CALIDAD DEL AIRE ADICIONAL (OpenAQ API) - NUEVO ===
-            print(f"   💨 OpenAQ...", end='', flush=True)
-            openaq_data = self.get_openaq_air_quality(coords, city_name)
-            if openaq_data:
+            if sources.get('openaq'):
                 api_success_count['openaq'] += 1
-                print(f" ✓ {openaq_data['stations_found']} estaciones")
-            else:
-                print(" ℹ️ Sin datos adicionales")
-            
-            # === 5. POBLACIÓN REAL (WorldPop API) - NUEVO ===
-            print(f"   👥 Densidad...", end='', flush=True)
-            worldpop_data = self.get_worldpop_data(coords, city_name)
-            if worldpop_data:
-                api_success_count['worldpop'] += 1
-                print(f" ✓ {worldpop_data['population_density_real']:.0f} hab/km²")
-                real_density = worldpop_data['population_density_real']
-            else:
-                print(" ℹ️ Usando censo")
-                real_density = None
-            
-            # === 6. INCENDIOS Y HUMO (NASA FIRMS) - NUEVO ===
-            print(f"   🔥 NASA FIRMS...", end='', flush=True)
-            fires_data = self.get_nasa_firms_fires(coords, city_name)
-            if fires_data and fires_data['fires_detected'] > 0:
+            if sources.get('fires') and sources['fires']['fires_detected'] > 0:
                 api_success_count['fires'] += 1
-                print(f" ⚠️ {fires_data['fires_detected']} incendios ({fires_data['fire_risk_level']})")
-            else:
-                print(" ✓ Sin incendios")
-            
-            # === 7. NDVI (NASA - estimación geográfica) ===
-            print(f"   🛰️  NDVI...", end='', flush=True)
-            ndvi_data = self.get_nasa_ndvi(coords)
-            print(f" ✓ {ndvi_data['ndvi']:.2f}")
-            ndvi = ndvi_data['ndvi']
-            
-            # === 8. DATOS DEMOGRÁFICOS (censales o WorldPop) ===
-            if real_density:
-                density = real_density
-            else:
-                area_km2 = 150 + np.random.uniform(50, 200)  # Esto debería venir de censo
-                density = city_info['poblacion'] / area_km2
-            
-            # === 9. ESTIMACIONES URBANAS ===
-            # Ruido correlacionado con densidad
-            noise = 45 + (density / 100) + np.random.normal(0, 3)
-            noise = min(85, max(40, noise))
-            
-            # Acceso a salud (mejor en ciudades grandes)
-            healthcare = 3 + (city_info['poblacion'] / 1000000) * 0.8
-            healthcare = max(2, min(10, healthcare))
-            
-            # Crear registro de ciudad
-            city_data = {
-                'city': city_name,
-                'state': city_info.get('estado', city_info.get('state', 'Unknown')),
-                'latitude': lat,
-                'longitude': lon,
-                'population': city_info['poblacion'],
-                # Datos de APIs reales - WAQI
-                'air_quality_index': air_data['aqi'] if air_data else None,
-                'pm25_concentration': air_data['pm25'] if air_data else None,
-                'pm10_concentration': air_data['pm10'] if air_data else None,
-                'no2_levels': air_data['no2'] if air_data else None,
-                'o3_levels': air_data['o3'] if air_data else None,
-                'co_levels': air_data['co'] if air_data else None,
-                # Datos de OpenAQ (adicionales) - NUEVO
-                'openaq_pm25': openaq_data['pm25'] if openaq_data else None,
-                'openaq_pm10': openaq_data['pm10'] if openaq_data else None,
-                'openaq_no2': openaq_data['no2'] if openaq_data else None,
-                'openaq_o3': openaq_data['o3'] if openaq_data else None,
-                'openaq_co': openaq_data['co'] if openaq_data else None,
-                'openaq_so2': openaq_data['so2'] if openaq_data else None,
-                'openaq_stations': openaq_data['stations_found'] if openaq_data else 0,
-                # Datos de incendios (NASA FIRMS) - NUEVO
-                'fires_detected': fires_data['fires_detected'] if fires_data else 0,
-                'fire_risk_level': fires_data['fire_risk_level'] if fires_data else 'Bajo',
-                'fire_brightness': fires_data['avg_brightness'] if fires_data else 0,
-                'fire_power': fires_data['max_frp'] if fires_data else 0,
-                # Datos de clima
-                'temperature_avg': temperature,
-                'humidity_avg': humidity,
-                'wind_speed': wind_speed,
-                # Datos de vegetación
-                'green_space_ratio': green_ratio,
-                'ndvi_value': ndvi,
-                # Datos de población - NUEVO
-                'population_density': density,
-                'population_density_source': 'WorldPop API' if real_density else 'Estimación censo',
-                # Datos urbanos
-                'noise_pollution_db': noise,
-                'healthcare_accessibility': healthcare,
-                'timestamp': datetime.now(),
-                # Metadatos de fuentes
-                'data_source_air': air_data['source'] if air_data else 'No disponible',
-                'data_source_openaq': openaq_data['source'] if openaq_data else 'No disponible',
-                'data_source_weather': weather_data['source'] if weather_data else 'No disponible',
-                'data_source_green': green_data['source'] if green_data else 'No disponible',
-                'data_source_worldpop': worldpop_data['source'] if worldpop_data else 'No disponible',
-                'data_source_fires': fires_data['source'] if fires_data else 'No disponible',
-            }
-            
-            # Calcular índice de salud (solo si tenemos datos mínimos)
-            city_data['health_score'] = self._calculate_city_health_score(city_data)
+            if city_data['data_source_green'] != 'No disponible':
+                api_success_count['green'] += 1
             
             all_cities_data.append(city_data)
-            
-            # Sin pausa - las APIs son rápidas
-            # time.sleep(0.5)
         
+        import pandas as pd
         df = pd.DataFrame(all_cities_data)
         
+        # Calcular índice de salud de todas las ciudades en una sola pasada vectorizada
+        df['health_score'] = self.calculate_health_scores(df)
+        
+        if include_ai:
+            ai_insights = self.generate_ai_recommendations_batch(df.to_dict('records'))
+            df['ai_prediction'] = [insights['prediction'] for insights in ai_insights]
+            df['ai_recommendations'] = [insights['recommendations'] for insights in ai_insights]
+        
         # Mostrar estadísticas de APIs
         print(f"\n📊 ESTADÍSTICAS DE APIS:")
-        print(f"   ✓ WAQI (Aire): {api_success_count['air']}/{len(self.mexican_cities)} ciudades")
-        print(f"   ✓ OpenWeatherMap (Clima): {api_success_count['weather']}/{len(self.mexican_cities)} ciudades")
-        print(f"   ✓ OpenAQ (Aire adicional): {api_success_count['openaq']}/{len(self.mexican_cities)} ciudades")
-        print(f"   ✓ NASA FIRMS (Incendios): {api_success_count['fires']}/{len(self.mexican_cities)} alertas")
-        print(f"   ✓ WorldPop (Población): {api_success_count['worldpop']}/{len(self.mexican_cities)} ciudades")
-        print(f"   ℹ️  Espacios verdes: {api_success_count['green']}/{len(self.mexican_cities)} (OSM desactivado)")
+        print(f"   ✓ WAQI (Aire): {api_success_count['air']}/{len(cities)} ciudades")
+        print(f"   ✓ OpenWeatherMap (Clima): {api_success_count['weather']}/{len(cities)} ciudades")
+        print(f"   ✓ OpenAQ (Aire adicional): {api_success_count['openaq']}/{len(cities)} ciudades")
+        print(f"   ✓ NASA FIRMS (Incendios): {api_success_count['fires']}/{len(cities)} alertas")
+        print(f"   ✓ Espacios verdes (OSM local): {api_success_count['green']}/{len(cities)} ciudades")
         
         total_apis_used = sum([api_success_count['air'], api_success_count['weather'], 
-                               api_success_count['openaq'], api_success_count['worldpop']])
-        total_possible = len(self.mexican_cities) * 4  # 4 APIs principales
+                               api_success_count['openaq']])
+        total_possible = max(1, len(cities) * 3)  # 3 APIs principales
         success_rate = (total_apis_used / total_possible) * 100
         print(f"\n   🎯 Tasa de éxito APIs principales: {success_rate:.1f}% ({total_apis_used}/{total_possible})")
         
@@ -943,6 +1295,101 @@ Sé directo, específico y práctico."""
         
         return df
     
+    def _build_sweep_record(self, city_name, city_info, sources):
+        """
+        Construye el registro completo de una ciudad del barrido nacional
+        a partir de las fuentes ya consultadas (datos None = fuente sin respuesta)
+        """
+        coords = city_info['coords']
+        lat, lon = coords
+        air_data = sources.get('air')
+        weather_data = sources.get('weather')
+        openaq_data = sources.get('openaq')
+        fires_data = sources.get('fires')
+        
+        # === 2. CLIMA (API OpenWeatherMap) ===
+        if weather_data:
+            temperature = weather_data['temperature']
+            humidity = weather_data['humidity']
+            wind_speed = weather_data['wind_speed']
+        else:
+            temperature = None
+            humidity = None
+            wind_speed = None
+        
+        # === 3. ESPACIOS VERDES (tabla precalculada desde extracto local de OSM) ===
+        green_data = self.green_spaces.get(city_info['id'])
+        
+        if green_data:
+            green_ratio = green_data['green_ratio']
+        else:
+            # Estimación basada en población y latitud
+            green_ratio = max(0.2, min(0.7, 0.5 - (city_info['poblacion'] / 10000000) * 0.3))
+        
+        # === 7. NDVI (NASA MODIS local o estimación geográfica) ===
+        ndvi_data = self.get_nasa_ndvi(coords, city_info['id'])
+        ndvi = ndvi_data['ndvi']
+        
+        # === 8. DATOS DEMOGRÁFICOS Y ESTIMACIONES URBANAS (tabla de rasgos estáticos) ===
+        features = self.static_features.get(city_info['id'])
+        density = features['population_density']
+        noise = features['noise_pollution_db']
+        healthcare = features['healthcare_accessibility']
+        
+        # Crear registro de ciudad
+        city_data = {
+            'city_id': city_info['id'],
+            'city': city_name,
+            'state': city_info['estado'],
+            'latitude': lat,
+            'longitude': lon,
+            'population': city_info['poblacion'],
+            # Datos de APIs reales - WAQI
+            'air_quality_index': air_data['aqi'] if air_data else None,
+            'pm25_concentration': air_data['pm25'] if air_data else None,
+            'pm10_concentration': air_data['pm10'] if air_data else None,
+            'no2_levels': air_data['no2'] if air_data else None,
+            'o3_levels': air_data['o3'] if air_data else None,
+            'co_levels': air_data['co'] if air_data else None,
+            # Datos de OpenAQ (adicionales)
+            'openaq_pm25': openaq_data['pm25'] if openaq_data else None,
+            'openaq_pm10': openaq_data['pm10'] if openaq_data else None,
+            'openaq_no2': openaq_data['no2'] if openaq_data else None,
+            'openaq_o3': openaq_data['o3'] if openaq_data else None,
+            'openaq_co': openaq_data['co'] if openaq_data else None,
+            'openaq_so2': openaq_data['so2'] if openaq_data else None,
+            'openaq_stations': openaq_data['stations_found'] if openaq_data else 0,
+            # Datos de incendios (NASA FIRMS)
+            'fires_detected': fires_data['fires_detected'] if fires_data else 0,
+            'fire_risk_level': fires_data['fire_risk_level'] if fires_data else 'Bajo',
+            'fire_brightness': fires_data['avg_brightness'] if fires_data else 0,
+            'fire_power': fires_data['max_frp'] if fires_data else 0,
+            # Datos de clima
+            'temperature_avg': temperature,
+            'humidity_avg': humidity,
+            'wind_speed': wind_speed,
+            # Datos de vegetación
+            'green_space_ratio': green_ratio,
+            'ndvi_value': ndvi,
+            # Datos de población
+            'population_density': density,
+            'population_density_source': 'Estimación censo',
+            # Datos urbanos
+            'noise_pollution_db': noise,
+            'healthcare_accessibility': healthcare,
+            'timestamp': datetime.now(),
+            # Metadatos de fuentes
+            'data_source_air': air_data['source'] if air_data else 'No disponible',
+            'data_source_openaq': openaq_data['source'] if openaq_data else 'No disponible',
+            'data_source_weather': weather_data['source'] if weather_data else 'No disponible',
+            'data_source_green': green_data['source'] if green_data else 'No disponible',
+            'data_source_worldpop': 'No disponible',  # API sin servicio; densidad desde el censo
+            'data_source_fires': fires_data['source'] if fires_data else 'No disponible',
+            'data_source_ndvi': ndvi_data['source'],
+        }
+        
+        return city_data
+    
     def _calculate_city_health_score(self, city_data):
         """Calcula índice de salud para una ciudad (maneja valores None)"""
         scores = []
@@ -954,7 +1401,7 @@ Sé directo, específico y práctico."""
             pm25_score = np.clip(100 - (city_data['pm25_concentration'] / 50 * 100), 0, 100)
             air_composite = (aqi_score * 0.6 + pm25_score * 0.4)
             scores.append(air_composite)
-            weights.append(0.30)
+            weights.append(HEALTH_SCORE_WEIGHTS['air'])
         
         # Espacios verdes (25%) - Solo si tenemos datos
         if city_data['green_space_ratio'] is not None and city_data['ndvi_value'] is not None:
@@ -962,7 +1409,7 @@ Sé directo, específico y práctico."""
             ndvi_score = (city_data['ndvi_value'] + 1) / 2 * 100
             green_composite = (green_score * 0.6 + ndvi_score * 0.4)
             scores.append(green_composite)
-            weights.append(0.25)
+            weights.append(HEALTH_SCORE_WEIGHTS['green'])
         
         # Clima (20%) - Solo si tenemos datos
         if city_data['temperature_avg'] is not None and city_data['humidity_avg'] is not None:
@@ -976,7 +1423,7 @@ Sé directo, específico y práctico."""
             
             climate_composite = (temp_score * 0.6 + humidity_score * 0.4)
             scores.append(climate_composite)
-            weights.append(0.20)
+            weights.append(HEALTH_SCORE_WEIGHTS['climate'])
         
         # Entorno urbano (15%)
         if city_data['population_density'] is not None and city_data['noise_pollution_db'] is not None:
@@ -988,13 +1435,13 @@ Sé directo, específico y práctico."""
             
             urban_composite = (density_score * 0.5 + noise_score * 0.5)
             scores.append(urban_composite)
-            weights.append(0.15)
+            weights.append(HEALTH_SCORE_WEIGHTS['urban'])
         
         # Salud (10%)
         if city_data['healthcare_accessibility'] is not None:
             health_score = (city_data['healthcare_accessibility'] / 10) * 100
             scores.append(health_score)
-            weights.append(0.10)
+            weights.append(HEALTH_SCORE_WEIGHTS['healthcare'])
         
         # Calcular promedio ponderado con los datos disponibles
         if len(scores) > 0:
@@ -1008,8 +1455,76 @@ Sé directo, específico y práctico."""
         else:
             return 50  # Score neutral si no hay datos
     
+    def calculate_health_scores(self, df, weights=None):
+        """
+        Versión vectorizada de _calculate_city_health_score para un DataFrame completo.
+        Calcula todos los componentes y el promedio ponderado con renormalización
+        de pesos según los datos disponibles (NaN/None = sin dato); el resultado
+        es idéntico al cálculo ciudad por ciudad. weights permite recalcular con otros pesos
+        """
+        import pandas as pd
+        weights = weights or HEALTH_SCORE_WEIGHTS
+        n = len(df)
+        
+        def column(name):
+            if name not in df:
+                return np.full(n, np.nan)
+            return pd.to_numeric(df[name], errors='coerce').to_numpy(dtype=np.float64)
+        
+        aqi = column('air_quality_index')
+        pm25 = column('pm25_concentration')
+        green = column('green_space_ratio')
+        ndvi = column('ndvi_value')
+        temp = column('temperature_avg')
+        humidity = column('humidity_avg')
+        density = column('population_density')
+        noise = column('noise_pollution_db')
+        healthcare = column('healthcare_accessibility')
+        
+        components = []
+        with np.errstate(invalid='ignore', divide='ignore'):
+            # AQI Score (30%)
+            aqi_score = np.clip(100 - (aqi / 300 * 100), 0, 100)
+            pm25_score = np.clip(100 - (pm25 / 50 * 100), 0, 100)
+            components.append((~np.isnan(aqi) & ~np.isnan(pm25),
+                               aqi_score * 0.6 + pm25_score * 0.4, weights['air']))
+            
+            # Espacios verdes (25%)
+            green_score = green * 100
+            ndvi_score = (ndvi + 1) / 2 * 100
+            components.append((~np.isnan(green) & ~np.isnan(ndvi),
+                               green_score * 0.6 + ndvi_score * 0.4, weights['green']))
+            
+            # Clima (20%)
+            temp_score = np.clip(np.where((temp >= 18) & (temp <= 26), 100, 100 - np.abs(temp - 22) * 3), 0, 100)
+            humidity_score = np.clip(np.where((humidity >= 40) & (humidity <= 60), 100, 100 - np.abs(humidity - 50) * 2), 0, 100)
+            components.append((~np.isnan(temp) & ~np.isnan(humidity),
+                               temp_score * 0.6 + humidity_score * 0.4, weights['climate']))
+            
+            # Entorno urbano (15%)
+            density_score = np.clip(np.where((density >= 2000) & (density <= 8000), 100, 100 - np.abs(density - 5000) / 100), 0, 100)
+            noise_score = np.clip(100 - (noise - 40) * 2, 0, 100)
+            components.append((~np.isnan(density) & ~np.isnan(noise),
+                               density_score * 0.5 + noise_score * 0.5, weights['urban']))
+            
+            # Salud (10%)
+            components.append((~np.isnan(healthcare), (healthcare / 10) * 100, weights['healthcare']))
+            
+            # Normalizar pesos con los componentes disponibles en cada ciudad
+            total_weight = np.zeros(n)
+            for available, _, weight in components:
+                total_weight = total_weight + np.where(available, weight, 0.0)
+            
+            final_score = np.zeros(n)
+            for available, score, weight in components:
+                final_score = final_score + np.where(available, score * (weight / total_weight), 0.0)
+        
+        # Score neutral si no hay datos
+        return np.where(total_weight > 0, np.clip(final_score, 0, 100), 50.0)
+    
     def create_national_map(self, df, map_file='mexico_salud_nacional.html'):
         """Crea mapa nacional de México con todas las ciudades"""
+        import folium
         print("\n🗺️  FASE 2: GENERANDO MAPA NACIONAL")
         print("-" * 40)
         
@@ -1132,6 +1647,7 @@ Sé directo, específico y práctico."""
     
     def create_national_dashboard(self, data):
         """Crea dashboard nacional con pestañas interactivas"""
+        import plotly.graph_objects as go
         print("📊 Generando dashboard interactivo con pestañas...")
         
         # Ordenar datos
@@ -1582,6 +2098,7 @@ def run_mexico_analysis():
 
 def run_interactive_mode():
     """Modo interactivo: consulta ciudades individuales bajo demanda"""
+    import pandas as pd
     analyzer = MexicoHealthAnalyzer()
     
     print("\n🔍 MODO EXPLORADOR INTERACTIVO")
@@ -1592,10 +2109,9 @@ def run_interactive_mode():
     
     # Mostrar ciudades disponibles
     print("\n📍 CIUDADES DISPONIBLES:")
-    cities_list = list(analyzer.mexican_cities.keys())
+    cities_list = list(analyzer.catalog)
     for i, city in enumerate(cities_list, 1):
-        state = analyzer.mexican_cities[city].get('estado', analyzer.mexican_cities[city].get('state', 'Unknown'))
-        print(f"   {i:2d}. {city} ({state})")
+        print(f"   {i:2d}. {city['nombre']} ({city['estado']})")
     
     collected_data = []
     
@@ -1614,8 +2130,8 @@ def run_interactive_mode():
             break
         elif choice.lower() == 'todas':
             print("\n🌐 Consultando TODAS las ciudades...")
-            for city_name in cities_list:
-                city_data = analyzer.analyze_single_city(city_name)
+            for city in cities_list:
+                city_data = analyzer.analyze_single_city(city['id'])
                 if city_data:
                     collected_data.append(city_data)
             break
@@ -1632,8 +2148,7 @@ def run_interactive_mode():
         elif choice.isdigit():
             idx = int(choice) - 1
             if 0 <= idx < len(cities_list):
-                city_name = cities_list[idx]
-                city_data = analyzer.analyze_single_city(city_name)
+                city_data = analyzer.analyze_single_city(cities_list[idx]['id'])
                 if city_data:
                     collected_data.append(city_data)
             else:
@@ -1641,9 +2156,9 @@ def run_interactive_mode():
         else:
             # Buscar por nombre
             found = False
-            for city_name in cities_list:
-                if choice.lower() in city_name.lower():
-                    city_data = analyzer.analyze_single_city(city_name)
+            for city in cities_list:
+                if choice.lower() in city['nombre'].lower():
+                    city_data = analyzer.analyze_single_city(city['id'])
                     if city_data:
                         collected_data.append(city_data)
                     found = True
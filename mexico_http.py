@@ -0,0 +1,58 @@
+"""
+SESIÓN HTTP COMPARTIDA PARA LOS PROVEEDORES EXTERNOS
+Una sola requests.Session por analizador: conexiones keep-alive reutilizables
+(evita un handshake TCP+TLS por consulta), pools dimensionados por host,
+reintentos con backoff ante 429/5xx y respuestas comprimidas (gzip)
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Conexiones simultáneas a mantener abiertas por host (alineado con PROVIDER_LIMITS)
+HOST_POOL_SIZES = {
+    'https://api.waqi.info': 8,
+    'https://api.openweathermap.org': 4,
+    'https://api.openaq.org': 4,
+    'https://firms.modaps.eosdis.nasa.gov': 2,
+    'http://overpass-api.de': 1,
+}
+
+# Códigos que justifican reintentar (límite de cuota o falla temporal del servidor)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def _build_retry(total=3, backoff_factor=0.5):
+    """Política de reintentos: backoff exponencial, respeta Retry-After"""
+    return Retry(
+        total=total,
+        connect=total,
+        read=1,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(['GET', 'POST']),
+        respect_retry_after_header=True,
+        raise_on_status=False  # Devolver la última respuesta; cada proveedor revisa status_code
+    )
+
+
+def create_http_session(pool_sizes=None, default_pool_size=4, retries=3):
+    """Crea la sesión HTTP compartida con un adaptador por host"""
+    session = requests.Session()
+    session.headers.update({
+        'Accept-Encoding': 'gzip, deflate',
+        'User-Agent': 'EarthChange/1.0 (NASA Space Apps - Salud Urbana México)'
+    })
+
+    retry = _build_retry(total=retries)
+    default_adapter = HTTPAdapter(
+        pool_connections=default_pool_size, pool_maxsize=default_pool_size, max_retries=retry
+    )
+    session.mount('https://', default_adapter)
+    session.mount('http://', default_adapter)
+
+    # requests usa el prefijo montado más largo, así cada host tiene su propio pool
+    for prefix, size in (pool_sizes or HOST_POOL_SIZES).items():
+        session.mount(prefix, HTTPAdapter(pool_connections=1, pool_maxsize=size, max_retries=retry))
+
+    return session
@@ -5,11 +5,17 @@ Sistema de dos niveles:
 2. Elige una ciudad/municipio para consultar APIs en tiempo real
 """
 
-from flask import Flask, render_template, jsonify, request, send_from_directory
+from flask import Flask, Response, render_template, jsonify, request, send_from_directory
 from mexico_health_analyzer import MexicoHealthAnalyzer
 from mexico_data import ESTADOS_MEXICO, MUNICIPIOS_POR_ESTADO
+from mexico_scheduler import SnapshotScheduler
+from functools import lru_cache
+from types import MappingProxyType
+import gzip
+import hashlib
 import json
 import os
+import unicodedata
 
 app = Flask(__name__, static_folder='.')
 analyzer = MexicoHealthAnalyzer()
@@ -20,6 +26,122 @@ analyzer = MexicoHealthAnalyzer()
 # Cargar municipios en el analyzer para análisis extendido
 analyzer.load_municipios_from_external(MUNICIPIOS_POR_ESTADO)
 
+# Instantánea nacional renovada en segundo plano (el hilo se inicia en __main__)
+snapshots = SnapshotScheduler(
+    analyzer,
+    refresh_interval=int(os.environ.get('SNAPSHOT_REFRESH_INTERVAL', 3 * 3600)),
+    batch_size=int(os.environ.get('SNAPSHOT_BATCH_SIZE', 50))
+)
+
+class PrecomputedPayload:
+    """
+    Respuesta inmutable calculada una sola vez: cuerpo, versión gzip y ETag.
+    Las cargas repetidas se resuelven con 304 o con los bytes ya comprimidos
+    """
+    
+    def __init__(self, body):
+        if isinstance(body, str):
+            body = body.encode('utf-8')
+        self.body = body
+        self.gzip_body = gzip.compress(body, compresslevel=6)
+        # Un ETag por representación: identidad y gzip son cuerpos distintos
+        self.etag = hashlib.sha1(body).hexdigest()
+        self.gzip_etag = f'{self.etag}-gzip'
+
+
+def payload_response(payload, mimetype, max_age=300):
+    """Sirve un PrecomputedPayload respetando If-None-Match y Accept-Encoding"""
+    # accept_encodings respeta los valores q (gzip;q=0 = no aceptado)
+    use_gzip = request.accept_encodings['gzip'] > 0
+    etag = payload.gzip_etag if use_gzip else payload.etag
+    
+    if etag in request.if_none_match:
+        response = Response(status=304)
+    elif use_gzip:
+        response = Response(payload.gzip_body, mimetype=mimetype)
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        response = Response(payload.body, mimetype=mimetype)
+    
+    response.set_etag(etag)
+    response.headers['Vary'] = 'Accept-Encoding'
+    response.headers['Cache-Control'] = f'public, max-age={max_age}'
+    return response
+
+
+def city_summary(record):
+    """Registro del catálogo en el formato que consume el frontend"""
+    return {
+        'id': record['id'],
+        'name': record['nombre'],
+        'estado': record['estado'],
+        'lat': record['lat'],
+        'lon': record['lon'],
+        'poblacion': record['poblacion'],
+        'tipo': record['tipo'],
+        'coords': record['coords']
+    }
+
+
+def normalize_name(name):
+    """Nombre normalizado para búsquedas: sin acentos, minúsculas y espacios simples"""
+    text = unicodedata.normalize('NFKD', str(name or ''))
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch))
+    return ' '.join(text.lower().split())
+
+
+def build_lookup_indexes(catalog):
+    """
+    Índices construidos una sola vez al iniciar a partir del catálogo del analizador:
+    - nombre normalizado -> registros (un registro por estado en caso de homónimos)
+    - estado -> respuesta pre-calculada de /api/estado/<estado>
+    """
+    name_index = {}
+    for record in catalog:
+        name_index.setdefault(normalize_name(record['nombre']), []).append(record)
+    
+    state_payloads = {}
+    for estado, estado_info in ESTADOS_MEXICO.items():
+        municipios_in_state = [city_summary(record) for record in catalog.by_state(estado)]
+        state_payloads[estado] = PrecomputedPayload(json.dumps({
+            'estado': estado,
+            'info': {
+                'capital': estado_info.get('capital'),
+                'poblacion': estado_info.get('poblacion'),
+                'superficie': estado_info.get('superficie'),
+                'descripcion': estado_info.get('info')
+            },
+            'municipios': municipios_in_state,
+            'count': len(municipios_in_state)
+        }, ensure_ascii=False))
+    
+    # Homónimos: primero el más poblado
+    name_index = {
+        key: tuple(sorted(records, key=lambda r: -r['poblacion'])) for key, records in name_index.items()
+    }
+    return MappingProxyType(name_index), MappingProxyType(state_payloads)
+
+
+# Catálogo inmutable construido una sola vez al iniciar (clave: id estable del municipio)
+CITY_LIST = tuple(city_summary(record) for record in analyzer.catalog)
+CITY_CATALOG = MappingProxyType({str(city['id']): city for city in CITY_LIST})
+CITIES_PAYLOAD = PrecomputedPayload(json.dumps({
+    'total_municipios': len(CITY_LIST),
+    'municipios': CITY_LIST
+}, ensure_ascii=False))
+
+CITY_NAME_INDEX, STATE_PAYLOADS = build_lookup_indexes(analyzer.catalog)
+ESTADO_POR_NOMBRE = MappingProxyType({normalize_name(estado): estado for estado in ESTADOS_MEXICO})
+
+
+@lru_cache(maxsize=None)
+def _index_payload():
+    """HTML de la página principal, renderizado en la primera visita y reutilizado"""
+    html = render_template('interactive_map.html',
+                           estados=ESTADOS_MEXICO,
+                           cities=dict(CITY_CATALOG))
+    return PrecomputedPayload(html)
+
 @app.route('/health')
 def health_check():
     """Health check endpoint para Render"""
@@ -30,49 +152,29 @@ def ping():
     """Endpoint alternativo para health check"""
     return 'OK', 200
 
+@app.route('/api/cache/stats')
+def cache_stats():
+    """Aciertos/fallos de la caché de fuentes externas por proveedor y de las recomendaciones de IA"""
+    stats = analyzer.cache.stats()
+    stats['ai_recommendations'] = analyzer.ai_cache.stats()
+    stats['inflight_cities'] = analyzer.city_flight.stats()
+    stats['inflight_ai'] = analyzer.ai_flight.stats()
+    stats['waqi_stations'] = analyzer.air_stations.stats()
+    stats['openaq_stations'] = analyzer.openaq_stations.stats()
+    stats['weather_grid'] = analyzer.weather_grid.stats()
+    stats['ndvi_modis'] = analyzer.ndvi_engine.stats()
+    stats['green_spaces'] = {'municipios': len(analyzer.green_spaces), 'built_at': analyzer.green_spaces.built_at}
+    return jsonify(stats)
+
+@app.route('/api/snapshot/stats')
+def snapshot_stats():
+    """Cobertura y frescura de la instantánea nacional en segundo plano"""
+    return jsonify(snapshots.stats())
+
 @app.route('/')
 def index():
-    """Página principal con mapa interactivo jerárquico"""
-    # Crear diccionario completo de todas las ciudades/municipios
-    all_cities_dict = {}
-    
-    # Agregar ciudades del analyzer (excluyendo estados ya definidos en MUNICIPIOS_POR_ESTADO)
-    estados_definidos = set(MUNICIPIOS_POR_ESTADO.keys())
-    
-    for city_name, city_info in analyzer.mexican_cities.items():
-        estado = city_info.get('estado', city_info.get('state', 'Unknown'))
-        # Solo agregar si el estado NO está en MUNICIPIOS_POR_ESTADO
-        if estado not in estados_definidos:
-            # Usar clave única con estado para evitar conflictos
-            clave_unica = f"{city_name}, {estado}"
-            all_cities_dict[clave_unica] = {
-                'coords': city_info['coords'],
-                'estado': estado,
-                'poblacion': city_info.get('pop', city_info.get('poblacion', 0)),
-                'lat': city_info['coords'][0],
-                'lon': city_info['coords'][1],
-                'tipo': city_info.get('tipo', 'ciudad'),
-                'nombre': city_name  # Agregar nombre original para el frontend
-            }
-    
-    # Agregar todos los municipios de MUNICIPIOS_POR_ESTADO (prioridad completa)
-    for estado, municipios in MUNICIPIOS_POR_ESTADO.items():
-        for municipio_name, municipio_info in municipios.items():
-            # Usar clave única con estado para evitar conflictos
-            clave_unica = f"{municipio_name}, {estado}"
-            all_cities_dict[clave_unica] = {
-                'coords': municipio_info['coords'],
-                'estado': municipio_info['estado'],
-                'poblacion': municipio_info['poblacion'],
-                'lat': municipio_info['lat'],
-                'lon': municipio_info['lon'],
-                'tipo': municipio_info.get('tipo', 'municipio'),
-                'nombre': municipio_name  # Agregar nombre original para el frontend
-            }
-    
-    return render_template('interactive_map.html', 
-                         estados=ESTADOS_MEXICO,
-                         cities=all_cities_dict)
+    """Página principal con mapa interactivo jerárquico (HTML pre-renderizado)"""
+    return payload_response(_index_payload(), 'text/html; charset=utf-8')
 
 @app.route('/img/<path:filename>')
 def serve_image(filename):
@@ -83,33 +185,31 @@ def serve_image(filename):
 def analyze_city():
     """API endpoint para analizar una ciudad bajo demanda"""
     data = request.get_json()
-    city_name = data.get('city_name')
-    
-    # Buscar la ciudad en ambos diccionarios
-    city_found = False
-    
-    # Primero buscar en MUNICIPIOS_POR_ESTADO
-    for estado, municipios in MUNICIPIOS_POR_ESTADO.items():
-        if city_name in municipios:
-            city_found = True
-            break
     
-    # Si no se encuentra, buscar en el analyzer tradicional
-    if not city_found and city_name not in analyzer.mexican_cities:
+    # Preferir la clave estable; el nombre (con estado opcional) se acepta por compatibilidad
+    city = resolve_city(data.get('city_id'), data.get('city_name'), data.get('estado'))
+    if city is None:
         return jsonify({'error': 'Ciudad no encontrada'}), 404
     
-    print(f"\n🔍 Consultando APIs para: {city_name}")
-    
     try:
-        # Analizar ciudad individual
-        city_data = analyzer.analyze_single_city(city_name)
+        # Responder desde la instantánea nacional; consulta en vivo solo si no hay datos vigentes
+        city_data = snapshots.get(city['id']) if snapshots.running else None
+        from_snapshot = city_data is not None
+        if not from_snapshot:
+            print(f"\n🔍 Consultando APIs para: {city['nombre']}, {city['estado']}")
+            # La IA se genera en segundo plano; el índice y los indicadores se responden ya
+            city_data = analyzer.analyze_single_city(city['id'], include_ai=False)
+            if city_data and snapshots.running:
+                snapshots.store(city['id'], city_data)
         
         if city_data:
             # Adaptar formato para el frontend
             response_data = {
+                'city_id': city['id'],
+                'from_snapshot': from_snapshot,
                 'air_quality': {
-                    'aqi': city_data.get('air_quality_index', 0),
-                    'status': get_aqi_status(city_data.get('air_quality_index', 0)),
+                    'aqi': city_data.get('air_quality_index'),
+                    'status': get_aqi_status(city_data.get('air_quality_index')),
                     'pm25': city_data.get('pm25_concentration'),
                     'pm10': city_data.get('pm10_concentration')
                 },
@@ -123,10 +223,7 @@ def analyze_city():
                     'cobertura_verde': int(city_data.get('ndvi_value', 0) * 100)
                 },
                 'health_score': city_data.get('health_score', 0),
-                'ai_insights': {
-                    'prediction': city_data.get('ai_prediction', 'No disponible'),
-                    'recommendations': city_data.get('ai_recommendations', [])
-                }
+                'ai_insights': analyzer.start_ai_insights(city_data)
             }
             
             return jsonify({
@@ -140,8 +237,42 @@ def analyze_city():
         print(f"❌ Error: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/ai_insights/<job_id>')
+def get_ai_insights(job_id):
+    """Predicción y recomendaciones de IA generadas en segundo plano para /api/analyze_city"""
+    job = analyzer.get_ai_insights(job_id)
+    if job is None:
+        return jsonify({'error': 'Análisis de IA no encontrado o expirado'}), 404
+    
+    if job['status'] != 'ready':
+        return jsonify({'status': 'pending'}), 202
+    
+    return jsonify({
+        'status': 'ready',
+        'prediction': job.get('prediction'),
+        'recommendations': job.get('recommendations', [])
+    })
+
+def resolve_city(city_id=None, city_name=None, estado=None):
+    """Registro del catálogo por clave estable o por nombre normalizado (O(1))"""
+    if city_id is not None:
+        try:
+            return analyzer.catalog.get(int(city_id))
+        except (TypeError, ValueError):
+            return None
+    
+    records = CITY_NAME_INDEX.get(normalize_name(city_name))
+    if not records:
+        return None
+    if estado:
+        estado = ESTADO_POR_NOMBRE.get(normalize_name(estado), estado)
+        records = [r for r in records if r['estado'] == estado]
+    return records[0] if records else None
+
 def get_aqi_status(aqi):
     """Convierte AQI en status legible"""
+    if aqi is None:
+        return 'Sin datos'
     if aqi <= 50:
         return 'Bueno'
     elif aqi <= 100:
@@ -157,89 +288,17 @@ def get_aqi_status(aqi):
 
 @app.route('/api/estado/<estado_nombre>')
 def get_cities_by_state(estado_nombre):
-    """Obtiene información y ciudades de un estado específico"""
-    
-    # Información del estado
-    estado_info = ESTADOS_MEXICO.get(estado_nombre)
-    if not estado_info:
+    """Obtiene información y ciudades de un estado específico (respuesta pre-calculada)"""
+    estado = ESTADO_POR_NOMBRE.get(normalize_name(estado_nombre))
+    if estado is None:
         return jsonify({'error': 'Estado no encontrado'}), 404
     
-    # Municipios del estado desde MUNICIPIOS_POR_ESTADO
-    municipios_in_state = []
-    if estado_nombre in MUNICIPIOS_POR_ESTADO:
-        for municipio_name, municipio_info in MUNICIPIOS_POR_ESTADO[estado_nombre].items():
-            municipios_in_state.append({
-                'name': municipio_name,
-                'lat': municipio_info['lat'],
-                'lon': municipio_info['lon'],
-                'poblacion': municipio_info['poblacion'],  # Consistente con 'poblacion'
-                'estado': municipio_info['estado'],
-                'tipo': municipio_info['tipo'],
-                'coords': municipio_info['coords']
-            })
-    
-    # También incluir ciudades del analyzer si no están en el diccionario completo
-    municipios_agregados = set(m['name'] for m in municipios_in_state)
-    for name, info in analyzer.mexican_cities.items():
-        if (info.get('estado') == estado_nombre or info.get('state') == estado_nombre) and name not in municipios_agregados:
-            municipios_in_state.append({
-                'name': name,
-                'lat': info['coords'][0],
-                'lon': info['coords'][1],
-                'poblacion': info.get('pop', info.get('poblacion', 0)),
-                'estado': info.get('estado', info.get('state', estado_nombre)),
-                'tipo': info.get('tipo', 'ciudad'),
-                'coords': info['coords']
-            })
-    
-    return jsonify({
-        'estado': estado_nombre,
-        'info': {
-            'capital': estado_info.get('capital'),
-            'poblacion': estado_info.get('poblacion'),
-            'superficie': estado_info.get('superficie'),
-            'descripcion': estado_info.get('info')
-        },
-        'municipios': municipios_in_state,
-        'count': len(municipios_in_state)
-    })
+    return payload_response(STATE_PAYLOADS[estado], 'application/json')
 
 @app.route('/api/cities')
 def get_cities():
-    """Obtiene lista de ciudades disponibles de todos los estados"""
-    cities_data = []
-    
-    # Obtener ciudades del diccionario completo MUNICIPIOS_POR_ESTADO
-    for estado, municipios in MUNICIPIOS_POR_ESTADO.items():
-        for municipio_name, municipio_info in municipios.items():
-            cities_data.append({
-                'name': municipio_name,
-                'estado': municipio_info['estado'],  # Usamos 'estado' en lugar de 'state'
-                'lat': municipio_info['lat'],
-                'lon': municipio_info['lon'],
-                'poblacion': municipio_info['poblacion'],  # Usamos 'poblacion' en lugar de 'pop'
-                'tipo': municipio_info['tipo'],
-                'coords': municipio_info['coords']
-            })
-    
-    # También agregar las ciudades del analyzer para compatibilidad (evitando duplicados)
-    municipios_agregados = set(cities_data[i]['name'] for i in range(len(cities_data)))
-    for name, info in analyzer.mexican_cities.items():
-        if name not in municipios_agregados:
-            cities_data.append({
-                'name': name,
-                'estado': info.get('state', info.get('estado', 'No especificado')),
-                'lat': info['coords'][0],
-                'lon': info['coords'][1],
-                'poblacion': info.get('pop', info.get('poblacion', 0)),
-                'tipo': info.get('tipo', 'ciudad'),
-                'coords': info['coords']
-            })
-    
-    return jsonify({
-        'total_municipios': len(cities_data),
-        'municipios': cities_data
-    })
+    """Obtiene lista de ciudades disponibles de todos los estados (JSON pre-serializado)"""
+    return payload_response(CITIES_PAYLOAD, 'application/json')
 
 if __name__ == '__main__':
     # Configuración para despliegue en producción
@@ -258,6 +317,11 @@ if __name__ == '__main__':
         print("🌐 Servidor iniciando en modo PRODUCCIÓN")
         print(f"🔗 Puerto: {port}")
     
+    # Programador de la instantánea nacional (en modo desarrollo, solo en el proceso del reloader)
+    if os.environ.get('SNAPSHOT_SCHEDULER', 'true').lower() == 'true':
+        if not debug or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+            snapshots.start()
+    
     print("👆 Haz clic en las ciudades del mapa para consultar datos")
     print("🛑 Presiona Ctrl+C para detener el servidor")
     print("=" * 60 + "\n")
@@ -0,0 +1,275 @@
+"""
+NDVI REAL DESDE COMPUESTOS MODIS LOCALES
+Los compuestos MODIS NDVI (MOD13Q1 / MOD13A1 / MOD13C1, o salidas de AppEEARS) se
+descargan fuera del servidor y se importan una vez a data/ndvi/ como:
+  <periodo>.npy   arreglo int16 en lat/lon (EPSG:4326), valores MODIS escalados
+  <periodo>.json  geotransformación, escala, valor sin dato y periodo del compuesto
+El .npy se abre con memoria mapeada: cada muestreo lee solo las ventanas que
+rodean a las ciudades. Todas las ciudades del catálogo se muestrean en una sola
+pasada vectorizada (buffer circular por ciudad) y el resultado se guarda por
+periodo; un compuesto nuevo en el directorio se detecta sin reiniciar.
+"""
+
+import glob
+import json
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+from mexico_firms import MEXICO_BBOX
+from mexico_spatial import KM_PER_DEG
+
+# Convenciones de los productos MODIS NDVI (MOD13): int16 escalado, -3000 = sin dato
+MODIS_SCALE = 0.0001
+MODIS_NODATA = -3000
+MODIS_VALID_RANGE = (-2000, 10000)
+
+# Directorio por defecto de los compuestos importados
+NDVI_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'ndvi')
+
+
+def save_ndvi_composite(array, west, north, pixel_width, pixel_height, period, directory=NDVI_DIR,
+                        scale=MODIS_SCALE, nodata=MODIS_NODATA):
+    """
+    Guarda un compuesto (arreglo 2D en lat/lon, fila 0 = norte) en el formato del motor.
+    pixel_height es el tamaño del píxel en grados (positivo)
+    """
+    os.makedirs(directory, exist_ok=True)
+    np.save(os.path.join(directory, f'{period}.npy'), np.ascontiguousarray(array, dtype=np.int16))
+    meta = {
+        'period': period,
+        'west': float(west),
+        'north': float(north),
+        'pixel_width': float(pixel_width),
+        'pixel_height': float(abs(pixel_height)),
+        'scale': scale,
+        'nodata': nodata,
+    }
+    with open(os.path.join(directory, f'{period}.json'), 'w', encoding='utf-8') as f:
+        json.dump(meta, f, indent=2)
+    return meta
+
+
+def import_modis_raster(path, period, directory=NDVI_DIR, bbox=MEXICO_BBOX):
+    """
+    Importa un GeoTIFF/HDF de NDVI MODIS en lat/lon recortado a la caja de México.
+    Requiere rasterio (solo para importar; el servidor lee el .npy resultante).
+    Para HDF se pasa el subdataset, p. ej. 'HDF4_EOS:EOS_GRID:"MOD13C1.hdf":MODIS_Grid_16Day_VI_CMG:"CMG 0.05 Deg 16 days NDVI"'
+    """
+    try:
+        import rasterio
+        from rasterio.windows import from_bounds
+    except ImportError:
+        raise RuntimeError("Para importar GeoTIFF/HDF instala rasterio: pip install rasterio")
+
+    west, south, east, north = bbox
+    with rasterio.open(path) as src:
+        if src.crs is not None and not src.crs.is_geographic:
+            raise ValueError("El compuesto debe estar en lat/lon (EPSG:4326); reproyecta la salida de MODIS/AppEEARS")
+        window = from_bounds(west, south, east, north, transform=src.transform).round_offsets().round_lengths()
+        array = src.read(1, window=window, boundless=True, fill_value=MODIS_NODATA)
+        transform = src.window_transform(window)
+        nodata = src.nodata if src.nodata is not None else MODIS_NODATA
+
+    array = np.where(array == nodata, MODIS_NODATA, array)
+    meta = save_ndvi_composite(array, transform.c, transform.f, transform.a, -transform.e, period, directory)
+    print(f"🛰️  NDVI {period}: {array.shape[0]}x{array.shape[1]} píxeles importados en {directory}")
+    return meta
+
+
+class NdviComposite:
+    """Un compuesto NDVI abierto con memoria mapeada"""
+
+    def __init__(self, npy_path, meta):
+        self.meta = meta
+        self.period = meta['period']
+        self.data = np.load(npy_path, mmap_mode='r')
+        self.west = meta['west']
+        self.north = meta['north']
+        self.pixel_width = meta['pixel_width']
+        self.pixel_height = meta['pixel_height']
+        self.scale = meta.get('scale', MODIS_SCALE)
+        self.nodata = meta.get('nodata', MODIS_NODATA)
+
+    def sample(self, lats, lons, radius_km=5.0, chunk=256):
+        """
+        NDVI medio en un buffer circular de radius_km alrededor de cada punto.
+        Ventanas por lotes de ciudades con índices vectorizados (solo se leen esas
+        páginas del archivo); píxeles sin dato o fuera del raster se ignoran.
+        Retorna float32 con NaN donde no hay píxeles válidos
+        """
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        n_rows, n_cols = self.data.shape
+
+        km_row = self.pixel_height * KM_PER_DEG
+        km_col = self.pixel_width * KM_PER_DEG * np.cos(np.radians(lats))
+        half_rows = max(0, int(np.ceil(radius_km / km_row)))
+        half_cols = max(0, int(np.ceil(radius_km / max(km_col.min(), 1e-6)))) if len(lats) else 0
+        d_row = np.arange(-half_rows, half_rows + 1)
+        d_col = np.arange(-half_cols, half_cols + 1)
+
+        center_rows = np.floor((self.north - lats) / self.pixel_height).astype(np.int64)
+        center_cols = np.floor((lons - self.west) / self.pixel_width).astype(np.int64)
+
+        low, high = MODIS_VALID_RANGE
+        result = np.full(len(lats), np.nan, dtype=np.float32)
+        for start in range(0, len(lats), chunk):
+            stop = min(start + chunk, len(lats))
+            rows = center_rows[start:stop, None, None] + d_row[None, :, None]
+            cols = center_cols[start:stop, None, None] + d_col[None, None, :]
+
+            # Buffer circular: distancia en km de cada píxel de la ventana al centro
+            dist = np.hypot((d_row * km_row)[None, :, None],
+                            d_col[None, None, :] * km_col[start:stop, None, None])
+            inside = ((dist <= max(radius_km, km_row / 2)) & (rows >= 0) & (rows < n_rows)
+                      & (cols >= 0) & (cols < n_cols))
+
+            values = self.data[np.clip(rows, 0, n_rows - 1), np.clip(cols, 0, n_cols - 1)]
+            valid = inside & (values != self.nodata) & (values >= low) & (values <= high)
+            counts = valid.sum(axis=(1, 2))
+            sums = np.where(valid, values, 0).sum(axis=(1, 2), dtype=np.float64)
+            with np.errstate(invalid='ignore', divide='ignore'):
+                result[start:stop] = np.where(counts > 0, sums / counts * self.scale, np.nan)
+        return result
+
+
+class NdviEngine:
+    """
+    NDVI por ciudad desde el compuesto más reciente del directorio.
+    Los valores de todo el catálogo se calculan en una pasada y se guardan por periodo
+    """
+
+    def __init__(self, directory=NDVI_DIR, radius_km=5.0, rescan_interval=600):
+        self.directory = directory
+        self.radius_km = radius_km
+        self.rescan_interval = rescan_interval  # Cada cuánto se buscan compuestos nuevos
+        self._composite = None
+        self._next_scan_at = 0.0
+        self._tables = {}  # (periodo, catálogo) -> {city_id: ndvi}
+        self._lock = threading.Lock()
+        self.last_sample_seconds = 0.0
+
+    def latest_period(self):
+        """Periodo del compuesto más reciente del directorio (o None)"""
+        periods = sorted(os.path.splitext(os.path.basename(path))[0]
+                         for path in glob.glob(os.path.join(self.directory, '*.json')))
+        periods = [p for p in periods if os.path.exists(os.path.join(self.directory, f'{p}.npy'))]
+        return periods[-1] if periods else None
+
+    def composite(self):
+        """Compuesto vigente (se vuelve a buscar en disco cada rescan_interval)"""
+        if time.time() < self._next_scan_at:
+            return self._composite
+
+        with self._lock:
+            if time.time() >= self._next_scan_at:
+                self._next_scan_at = time.time() + self.rescan_interval
+                period = self.latest_period()
+                if period is None:
+                    self._composite = None
+                elif self._composite is None or self._composite.period != period:
+                    try:
+                        with open(os.path.join(self.directory, f'{period}.json'), encoding='utf-8') as f:
+                            meta = json.load(f)
+                        self._composite = NdviComposite(os.path.join(self.directory, f'{period}.npy'), meta)
+                        self._tables = {}
+                        print(f"🛰️  NDVI MODIS: compuesto {period} {self._composite.data.shape} (memoria mapeada)")
+                    except (OSError, ValueError, KeyError) as e:
+                        print(f"⚠️  NDVI MODIS: no se pudo abrir {period} ({str(e)[:50]})")
+        return self._composite
+
+    @property
+    def available(self):
+        return self.composite() is not None
+
+    def city_table(self, catalog):
+        """{city_id: ndvi o NaN} de todo el catálogo para el compuesto vigente"""
+        composite = self.composite()
+        if composite is None:
+            return None, None
+
+        key = (composite.period, id(catalog))
+        table = self._tables.get(key)
+        if table is None:
+            start = time.perf_counter()
+            values = composite.sample(catalog.column('lat'), catalog.column('lon'), self.radius_km)
+            table = dict(zip(catalog.ids().tolist(), values.tolist()))
+            self.last_sample_seconds = time.perf_counter() - start
+            with self._lock:
+                # Solo se conserva el catálogo vigente del periodo vigente
+                self._tables = {key: table}
+            print(f"🛰️  NDVI MODIS {composite.period}: {len(catalog)} ciudades muestreadas "
+                  f"en {self.last_sample_seconds:.2f}s")
+        return composite.period, table
+
+    def city_ndvi(self, catalog, city_id):
+        """NDVI de una ciudad del catálogo (None si no hay compuesto o píxeles válidos)"""
+        period, table = self.city_table(catalog)
+        if table is None:
+            return None, None
+        value = table.get(city_id)
+        if value is None or np.isnan(value):
+            return period, None
+        return period, value
+
+    def point_ndvi(self, lat, lon):
+        """NDVI en un punto fuera del catálogo"""
+        composite = self.composite()
+        if composite is None:
+            return None, None
+        value = float(composite.sample([lat], [lon], self.radius_km)[0])
+        return composite.period, (None if np.isnan(value) else value)
+
+    def stats(self):
+        composite = self._composite
+        return {
+            'directory': self.directory,
+            'period': composite.period if composite is not None else None,
+            'shape': list(composite.data.shape) if composite is not None else None,
+            'radius_km': self.radius_km,
+            'last_sample_seconds': round(self.last_sample_seconds, 3)
+        }
+
+
+def benchmark_ndvi_sampling(n_cities=1800, pixel_deg=0.0025, radius_km=5.0):
+    """Muestrea un compuesto sintético del tamaño de México a 250 m (~190 MB int16 en disco temporal)"""
+    import tempfile
+
+    west, south, east, north = MEXICO_BBOX
+    shape = (int((north - south) / pixel_deg), int((east - west) / pixel_deg))
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'sintetico.npy')
+        data = np.lib.format.open_memmap(path, mode='w+', dtype=np.int16, shape=shape)
+        for start in range(0, shape[0], 1000):
+            data[start:start + 1000] = rng.integers(-2000, 10000, size=data[start:start + 1000].shape,
+                                                    dtype=np.int16)
+        data.flush()
+        del data
+        meta = {'period': 'sintetico', 'west': west, 'north': north,
+                'pixel_width': pixel_deg, 'pixel_height': pixel_deg}
+
+        composite = NdviComposite(path, meta)
+        lats = rng.uniform(south, north, n_cities)
+        lons = rng.uniform(west, east, n_cities)
+        start = time.perf_counter()
+        values = composite.sample(lats, lons, radius_km)
+        elapsed = time.perf_counter() - start
+        del composite
+
+    print(f"📏 NDVI sintético {shape[0]}x{shape[1]} ({shape[0] * shape[1] * 2 / 1e9:.1f} GB), "
+          f"{n_cities} ciudades, buffer {radius_km} km: {elapsed * 1000:.0f} ms "
+          f"(NDVI medio {np.nanmean(values):.2f})")
+    return elapsed
+
+
+if __name__ == "__main__":
+    # python mexico_ndvi.py importar <GeoTIFF/HDF> <periodo AAAA-MM-DD>
+    if len(sys.argv) == 4 and sys.argv[1] == 'importar':
+        import_modis_raster(sys.argv[2], sys.argv[3])
+    else:
+        benchmark_ndvi_sampling()
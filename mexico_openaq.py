@@ -0,0 +1,94 @@
+"""
+CAPA NACIONAL DE ESTACIONES OPENAQ
+La búsqueda de OpenAQ v3 por coordenadas admite como máximo 25 km de radio, así
+que consultarla desde el centro de una celda de caché pierde estaciones vecinas de
+la ciudad y suma otras lejanas. En su lugar se descarga una vez al día el catálogo
+de estaciones de México (ubicación + sensores) y cada ciudad toma las estaciones
+más cercanas a sus propias coordenadas; la última medición se pide por estación
+(y se cachea por estación, compartida por todas las ciudades vecinas)
+"""
+
+import numpy as np
+
+from mexico_spatial import GridIndex, NationalLayer
+
+
+def parse_openaq_locations(results):
+    """
+    Convierte resultados de /v3/locations en estaciones {id, name, lat, lon, sensors}
+    (sensors: {id de sensor: parámetro}); se descartan las que no tienen sensores o coordenadas
+    """
+    stations = []
+    for location in results or []:
+        sensors = {}
+        for sensor in location.get('sensors') or []:
+            param_name = ((sensor.get('parameter') or {}).get('name') or '').lower()
+            if param_name and sensor.get('id'):
+                sensors[sensor['id']] = param_name
+        coordinates = location.get('coordinates') or {}
+        try:
+            station = {
+                'id': int(location['id']),
+                'name': location.get('name') or '',
+                'lat': float(coordinates['latitude']),
+                'lon': float(coordinates['longitude']),
+                'sensors': sensors,
+            }
+        except (KeyError, TypeError, ValueError):
+            continue
+        if sensors:
+            stations.append(station)
+    return stations
+
+
+class OpenAqStationIndex(NationalLayer):
+    """
+    Estaciones OpenAQ de México en memoria con índice espacial.
+    fetch_stations: función sin argumentos que retorna la lista de parse_openaq_locations() o None
+    """
+
+    name = 'openaq'
+
+    def __init__(self, fetch_stations, refresh_interval=24 * 3600, retry_interval=900,
+                 cell_deg=0.5, max_distance_km=25, max_stations=5):
+        # El catálogo de estaciones cambia poco; se descarga en segundo plano
+        super().__init__(fetch_stations, refresh_interval, retry_interval, block_first_load=False)
+        self.cell_deg = cell_deg
+        self.max_distance_km = max_distance_km  # Mismo radio que la búsqueda original de OpenAQ
+        self.max_stations = max_stations        # Estaciones promediadas por ciudad
+
+    def build(self, stations):
+        """Coordenadas + ids + sensores por estación + índice por celdas"""
+        lats = np.array([station['lat'] for station in stations], dtype=np.float64)
+        lons = np.array([station['lon'] for station in stations], dtype=np.float64)
+        ids = np.array([station['id'] for station in stations], dtype=np.int64)
+        sensors = tuple(station['sensors'] for station in stations)
+        index = GridIndex(lats, lons, cell_deg=self.cell_deg)
+        print(f"💨 OpenAQ nacional: {len(stations)} estaciones indexadas")
+        return ids, sensors, index
+
+    def nearby(self, lat, lon, wait=None):
+        """
+        Estaciones a menos de max_distance_km de (lat, lon), de la más cercana a la más lejana
+        (máximo max_stations): lista de (id, {sensor: parámetro}, distancia km).
+        None si el catálogo aún no se ha podido descargar
+        """
+        state = self.current(wait=wait)
+        if state is None:
+            return None
+        ids, sensors, index = state
+
+        positions, distances = index.within(lat, lon, self.max_distance_km)
+        return [
+            (int(ids[position]), sensors[position], round(float(distance), 1))
+            for position, distance in zip(positions[:self.max_stations], distances[:self.max_stations])
+        ]
+
+    def stats(self):
+        state = self._state
+        return {
+            'loaded': state is not None,
+            'stations': len(state[0]) if state is not None else 0,
+            'refresh_interval_seconds': self.refresh_interval,
+            'max_distance_km': self.max_distance_km
+        }
@@ -0,0 +1,165 @@
+"""
+PROGRAMADOR DE ACTUALIZACIÓN EN SEGUNDO PLANO
+Mantiene una instantánea nacional de todos los municipios: un hilo del
+proceso web recolecta las fuentes por lotes (mismo motor que el barrido
+nacional) y prioriza los municipios más poblados y los datos más viejos.
+/api/analyze_city responde desde la instantánea y solo consulta las APIs
+en vivo cuando la ciudad todavía no tiene datos vigentes
+"""
+
+import heapq
+import math
+import threading
+import time
+
+from mexico_sweep import NationalSweep
+
+
+class SnapshotScheduler:
+    """
+    Instantánea {city_id: registro} renovada continuamente.
+    refresh_interval: antigüedad a partir de la cual un municipio se vuelve a consultar
+    max_age: antigüedad máxima con la que todavía se responde desde la instantánea
+    """
+
+    def __init__(self, analyzer, refresh_interval=3 * 3600, max_age=None, batch_size=50, idle_seconds=30):
+        self.analyzer = analyzer
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age or 2 * refresh_interval
+        self.batch_size = batch_size
+        self.idle_seconds = idle_seconds  # Espera cuando no hay municipios por renovar
+
+        self._snapshot = {}  # city_id -> (actualizado_en, registro)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+        self.cycles = 0
+        self.refreshed = 0
+        self.hits = 0
+        self.misses = 0
+        self.last_batch_seconds = 0.0
+
+    # === Consulta ===
+
+    def get(self, city_id):
+        """Registro vigente de la ciudad (o None si no hay o es demasiado viejo)"""
+        with self._lock:
+            entry = self._snapshot.get(city_id)
+            if entry is not None and time.time() - entry[0] <= self.max_age:
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+            return None
+
+    def store(self, city_id, city_data, updated_at=None):
+        """Guarda un registro (también lo usa la consulta en vivo tras un fallo)"""
+        with self._lock:
+            self._snapshot[city_id] = (updated_at or time.time(), city_data)
+
+    # === Prioridad ===
+
+    def due_batch(self, now=None):
+        """
+        Siguiente lote a renovar: municipios sin datos o con antigüedad >= refresh_interval.
+        Prioridad = antigüedad ponderada por log(población); los nunca consultados
+        van primero, de mayor a menor población
+        """
+        now = now or time.time()
+        with self._lock:
+            updated = {city_id: entry[0] for city_id, entry in self._snapshot.items()}
+
+        candidates = []
+        for record in self.analyzer.catalog:
+            age = now - updated[record['id']] if record['id'] in updated else math.inf
+            if age < self.refresh_interval:
+                continue
+            weight = math.log10(max(record['poblacion'], 10))
+            priority = (1, record['poblacion']) if age == math.inf else (0, age * weight)
+            candidates.append((priority, record['id']))
+
+        return [city_id for _, city_id in heapq.nlargest(self.batch_size, candidates)]
+
+    # === Recolección ===
+
+    def refresh_batch(self, city_ids):
+        """Consulta las fuentes del lote con NationalSweep y guarda los registros con su índice"""
+        records = [self.analyzer.catalog.get(city_id) for city_id in city_ids]
+        cities = [(record['nombre'], record) for record in records if record is not None]
+        if not cities:
+            return 0
+
+        start = time.monotonic()
+        sweep = NationalSweep(self.analyzer, progress_every=max(1, len(cities)),
+                              progress_callback=lambda *args: None)
+        sources_by_city = sweep.run(cities)
+
+        for (city_name, city_info), sources in zip(cities, sources_by_city):
+            city_data = self.analyzer._build_sweep_record(city_name, city_info, sources)
+            city_data['health_score'] = self.analyzer._calculate_city_health_score(city_data)
+            self.store(city_info['id'], city_data)
+
+        self.last_batch_seconds = time.monotonic() - start
+        self.refreshed += len(cities)
+        return len(cities)
+
+    def run_once(self):
+        """Renueva un lote; retorna cuántos municipios se actualizaron"""
+        batch = self.due_batch()
+        if not batch:
+            return 0
+        refreshed = self.refresh_batch(batch)
+        self.cycles += 1
+        print(f"🔄 Instantánea: {refreshed} municipios renovados en {self.last_batch_seconds:.1f}s "
+              f"({len(self._snapshot)}/{len(self.analyzer.catalog)} con datos)")
+        return refreshed
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                refreshed = self.run_once()
+            except Exception as e:
+                print(f"⚠️  Instantánea: error al renovar ({str(e)[:50]})")
+                refreshed = 0
+            if not refreshed:
+                self._stop.wait(self.idle_seconds)
+
+    def start(self):
+        """Inicia el hilo de actualización (idempotente)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name='instantanea', daemon=True)
+        self._thread.start()
+        print(f"🔄 Programador de instantánea iniciado: {len(self.analyzer.catalog)} municipios, "
+              f"renovación cada {self.refresh_interval // 60:.0f} min, lotes de {self.batch_size}")
+
+    def stop(self):
+        self._stop.set()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive() and not self._stop.is_set()
+
+    def stats(self):
+        """Cobertura y frescura de la instantánea"""
+        now = time.time()
+        with self._lock:
+            ages = [now - entry[0] for entry in self._snapshot.values()]
+        fresh = sum(1 for age in ages if age < self.refresh_interval)
+        total = self.hits + self.misses
+        return {
+            'running': self.running,
+            'municipios': len(self.analyzer.catalog),
+            'with_data': len(ages),
+            'fresh': fresh,
+            'oldest_age_seconds': round(max(ages), 1) if ages else None,
+            'refresh_interval_seconds': self.refresh_interval,
+            'max_age_seconds': self.max_age,
+            'cycles': self.cycles,
+            'refreshed': self.refreshed,
+            'last_batch_seconds': round(self.last_batch_seconds, 2),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0
+        }
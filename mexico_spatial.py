@@ -0,0 +1,201 @@
+"""
+ÍNDICE ESPACIAL EN MEMORIA
+Rejilla regular de celdas lat/lon sobre arreglos NumPy: los puntos se ordenan
+por celda una sola vez y cada consulta por caja solo revisa las celdas que
+la tocan (búsqueda binaria), sin recorrer todos los puntos.
+NationalLayer es la base de las capas nacionales (incendios, estaciones de aire...)
+que se descargan una vez por intervalo y se consultan en memoria
+"""
+
+import threading
+import time
+
+import numpy as np
+
+# Kilómetros por grado de latitud
+KM_PER_DEG = 111.0
+
+
+class GridIndex:
+    """Índice por celdas de tamaño fijo (grados) para puntos lat/lon"""
+
+    def __init__(self, lats, lons, cell_deg=0.5):
+        self.lats = np.asarray(lats, dtype=np.float64)
+        self.lons = np.asarray(lons, dtype=np.float64)
+        self.cell_deg = cell_deg
+
+        if len(self.lats) == 0:
+            self.lat0 = self.lon0 = 0.0
+            self.n_cols = 1
+            self._order = np.empty(0, dtype=np.int64)
+            self._sorted_cells = np.empty(0, dtype=np.int64)
+            return
+
+        self.lat0 = float(self.lats.min())
+        self.lon0 = float(self.lons.min())
+        self.n_cols = int((self.lons.max() - self.lon0) // cell_deg) + 1
+
+        cells = self._cell_ids(self.lats, self.lons)
+        self._order = np.argsort(cells, kind='stable')
+        self._sorted_cells = cells[self._order]
+
+    def __len__(self):
+        return len(self.lats)
+
+    def _cell_ids(self, lats, lons):
+        rows = np.floor((lats - self.lat0) / self.cell_deg).astype(np.int64)
+        cols = np.floor((lons - self.lon0) / self.cell_deg).astype(np.int64)
+        return rows * self.n_cols + cols
+
+    def query_box(self, south, west, north, east):
+        """Índices de los puntos dentro de la caja [south, north] x [west, east]"""
+        if len(self.lats) == 0:
+            return np.empty(0, dtype=np.int64)
+
+        row_start = int(np.floor((south - self.lat0) / self.cell_deg))
+        row_end = int(np.floor((north - self.lat0) / self.cell_deg))
+        col_start = max(0, int(np.floor((west - self.lon0) / self.cell_deg)))
+        col_end = min(self.n_cols - 1, int(np.floor((east - self.lon0) / self.cell_deg)))
+        if col_start > col_end:
+            return np.empty(0, dtype=np.int64)
+
+        # Las celdas de una misma fila de la rejilla son contiguas en el orden
+        candidates = []
+        for row in range(max(0, row_start), row_end + 1):
+            lo = np.searchsorted(self._sorted_cells, row * self.n_cols + col_start, side='left')
+            hi = np.searchsorted(self._sorted_cells, row * self.n_cols + col_end, side='right')
+            if hi > lo:
+                candidates.append(self._order[lo:hi])
+
+        if not candidates:
+            return np.empty(0, dtype=np.int64)
+
+        idx = np.concatenate(candidates)
+        lats = self.lats[idx]
+        lons = self.lons[idx]
+        inside = (lats >= south) & (lats <= north) & (lons >= west) & (lons <= east)
+        return idx[inside]
+
+    def within(self, lat, lon, max_distance_km):
+        """
+        Índices de los puntos a menos de max_distance_km de (lat, lon) y sus distancias
+        en km, ordenados del más cercano al más lejano
+        """
+        dlat = max_distance_km / KM_PER_DEG
+        dlon = max_distance_km / (KM_PER_DEG * max(np.cos(np.radians(lat)), 0.01))
+        idx = self.query_box(lat - dlat, lon - dlon, lat + dlat, lon + dlon)
+
+        # Distancia equirectangular (suficiente a escala de decenas de km)
+        dy = (self.lats[idx] - lat) * KM_PER_DEG
+        dx = (self.lons[idx] - lon) * KM_PER_DEG * np.cos(np.radians(lat))
+        distances = np.hypot(dx, dy)
+        inside = distances <= max_distance_km
+        idx, distances = idx[inside], distances[inside]
+        order = np.argsort(distances, kind='stable')
+        return idx[order], distances[order]
+
+    def nearest(self, lat, lon, max_distance_km):
+        """
+        Índice del punto más cercano a (lat, lon) y su distancia en km,
+        o (None, None) si no hay ninguno a menos de max_distance_km
+        """
+        idx, distances = self.within(lat, lon, max_distance_km)
+        if len(idx) == 0:
+            return None, None
+        return int(idx[0]), float(distances[0])
+
+
+class NationalLayer:
+    """
+    Capa nacional en memoria renovada periódicamente.
+    fetch: función sin argumentos que descarga los datos (o None si falla).
+    Las subclases implementan build(datos) -> estado inmutable que se reemplaza de una vez.
+    Primera carga: bloquea hasta tener datos (o, con block_first_load=False, se hace en
+    segundo plano y mientras tanto current() retorna None). Capa vencida: se sigue
+    respondiendo con la anterior y se renueva en segundo plano
+    """
+
+    name = 'capa'
+
+    def __init__(self, fetch, refresh_interval, retry_interval=300, block_first_load=True):
+        self.fetch = fetch
+        self.refresh_interval = refresh_interval
+        self.retry_interval = retry_interval  # Espera tras una descarga fallida
+        self.block_first_load = block_first_load
+        self._state = None
+        self._loaded_at = 0.0
+        self._next_refresh_at = 0.0
+        self._lock = threading.Lock()
+        self._refresh_done = threading.Condition(self._lock)  # Avisa a quien espera la primera carga
+        self._refreshing = False
+
+    @property
+    def is_loaded(self):
+        return self._state is not None
+
+    @property
+    def is_stale(self):
+        return time.time() >= self._next_refresh_at
+
+    def build(self, payload):
+        raise NotImplementedError
+
+    def refresh(self):
+        """Descarga y reconstruye la capa; si falla conserva la anterior"""
+        payload = self.fetch()
+        if payload is None:
+            self._next_refresh_at = time.time() + self.retry_interval
+            return False
+
+        state = self.build(payload)
+        with self._lock:
+            self._state = state
+            self._loaded_at = time.time()
+            self._next_refresh_at = self._loaded_at + self.refresh_interval
+        return True
+
+    def _ensure_fresh(self, block=None):
+        if not self.is_stale:
+            return
+        block = self.block_first_load if block is None else block
+
+        with self._lock:
+            if self._refreshing or not self.is_stale:
+                refresh_now = False
+            else:
+                self._refreshing = True
+                refresh_now = True
+            loaded = self._state is not None
+
+        if not refresh_now:
+            if loaded or not block:
+                return
+            # Otro hilo está haciendo la primera descarga: esperar su aviso al terminar
+            with self._refresh_done:
+                self._refresh_done.wait_for(lambda: not self._refreshing or self._state is not None)
+            return
+
+        def run():
+            try:
+                self.refresh()
+            finally:
+                with self._refresh_done:
+                    self._refreshing = False
+                    self._refresh_done.notify_all()
+
+        if loaded or not block:
+            threading.Thread(target=run, name=f'{self.name}-refresh', daemon=True).start()
+        else:
+            run()
+
+    def current(self, wait=None):
+        """
+        Estado vigente de la capa (None si nunca se pudo descargar).
+        wait=True espera la primera descarga aunque la capa no bloquee por defecto
+        """
+        self._ensure_fresh(wait)
+        return self._state
+
+    def invalidate(self):
+        """Fuerza una nueva descarga en la siguiente consulta"""
+        self._next_refresh_at = 0.0
@@ -0,0 +1,126 @@
+"""
+RASGOS ESTÁTICOS PRECALCULADOS POR MUNICIPIO
+Área urbana, densidad, ruido estimado y acceso a salud dependen solo de datos
+censales (población INEGI del catálogo), así que se calculan una vez, sin
+componentes aleatorios, y se guardan en una tabla versionada
+(data/static_features.npz). El analizador la carga al iniciar: el mismo
+municipio da siempre el mismo índice y los resultados se pueden cachear y comparar.
+
+Regenerar la tabla (al cambiar el catálogo o las fórmulas):
+  python mexico_static_features.py
+"""
+
+import hashlib
+import os
+import time
+
+import numpy as np
+
+# Versión de las fórmulas; cambiarla obliga a recalcular la tabla
+STATIC_FEATURES_VERSION = 2
+STATIC_FEATURES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'static_features.npz')
+
+FEATURE_COLUMNS = ('area_km2', 'population_density', 'noise_pollution_db', 'healthcare_accessibility')
+
+
+def catalog_fingerprint(catalog, version=STATIC_FEATURES_VERSION, columns=(('poblacion', np.int64),)):
+    """
+    Huella de los insumos de una tabla por municipio: versión de la tabla, claves y
+    columnas del catálogo de las que depende (por defecto la población censal)
+    """
+    digest = hashlib.sha1()
+    digest.update(str(version).encode())
+    digest.update(catalog.ids().astype(np.int64).tobytes())
+    for name, dtype in columns:
+        digest.update(catalog.column(name, dtype=dtype).tobytes())
+    return digest.hexdigest()
+
+
+def compute_static_features(catalog):
+    """Rasgos estáticos de todo el catálogo (vectorizado, determinista)"""
+    population = np.maximum(catalog.column('poblacion', dtype=np.float64), 1.0)
+
+    # Área urbana ~ población^0.85 (ley de escala urbana)
+    area_km2 = (population / 5000) ** 0.85
+    density = population / area_km2
+
+    # Ruido de tráfico ~ logaritmo del tamaño de la ciudad: +5 dB por cada factor 10 de
+    # población (45 dB con 1 mil hab., 60 dB con 1 millón). La densidad no sirve aquí:
+    # con la ley de escala crece como población^0.15 y saturaría el rango en casi todos
+    noise_db = np.clip(45 + 5 * np.log10(population / 1000), 40, 75)
+
+    # Acceso a salud mejor en ciudades grandes
+    healthcare = np.clip(3 + population / 1_000_000 * 0.8, 2, 10)
+
+    return {
+        'ids': catalog.ids(),
+        'area_km2': area_km2.astype(np.float32),
+        'population_density': density.astype(np.float32),
+        'noise_pollution_db': noise_db.astype(np.float32),
+        'healthcare_accessibility': healthcare.astype(np.float32),
+    }
+
+
+def save_static_features(catalog, path=STATIC_FEATURES_PATH):
+    features = compute_static_features(catalog)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    np.savez_compressed(path, version=np.int32(STATIC_FEATURES_VERSION),
+                        fingerprint=np.array(catalog_fingerprint(catalog)),
+                        built_at=np.array(time.strftime('%Y-%m-%d')), **features)
+    return features
+
+
+class StaticFeatureTable:
+    """
+    {clave de municipio: rasgos estáticos}.
+    Se lee del archivo si corresponde al catálogo y a la versión vigente; si no, se
+    recalcula en memoria (son unas cuantas operaciones vectorizadas)
+    """
+
+    def __init__(self, catalog, path=STATIC_FEATURES_PATH):
+        self.path = path
+        self.fingerprint = catalog_fingerprint(catalog)
+        self.source = 'calculada al iniciar'
+
+        features = self._load(path)
+        if features is None:
+            features = compute_static_features(catalog)
+
+        self._rows = {
+            city_id: row for city_id, row in zip(
+                features['ids'].tolist(),
+                zip(*(features[column].tolist() for column in FEATURE_COLUMNS))
+            )
+        }
+
+    def _load(self, path):
+        if not os.path.exists(path):
+            return None
+        try:
+            with np.load(path) as data:
+                if int(data['version']) != STATIC_FEATURES_VERSION or str(data['fingerprint']) != self.fingerprint:
+                    return None
+                self.source = f"{os.path.basename(path)} ({data['built_at']})"
+                return {name: data[name] for name in ('ids',) + FEATURE_COLUMNS}
+        except (OSError, KeyError, ValueError) as e:
+            print(f"⚠️  Rasgos estáticos: no se pudo leer {path} ({str(e)[:50]})")
+            return None
+
+    def __len__(self):
+        return len(self._rows)
+
+    def get(self, city_id):
+        """Rasgos del municipio ({columna: valor}) o None si no está en la tabla"""
+        row = self._rows.get(city_id)
+        return None if row is None else dict(zip(FEATURE_COLUMNS, row))
+
+
+if __name__ == "__main__":
+    from mexico_data import MUNICIPIOS_POR_ESTADO
+    from mexico_health_analyzer import MexicoHealthAnalyzer
+
+    analyzer = MexicoHealthAnalyzer()
+    analyzer.load_municipios_from_external(MUNICIPIOS_POR_ESTADO)
+    features = save_static_features(analyzer.catalog)
+    print(f"✓ Rasgos estáticos v{STATIC_FEATURES_VERSION} guardados en {STATIC_FEATURES_PATH}: "
+          f"{len(features['ids'])} municipios")
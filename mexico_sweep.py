@@ -0,0 +1,97 @@
+"""
+MOTOR DE BARRIDO NACIONAL
+Consulta las fuentes externas de muchas ciudades a la vez. Cada proveedor tiene
+su propio pool de hilos del tamaño de su límite de concurrencia, de modo que
+un proveedor lento (p. ej. OpenWeatherMap con 60 llamadas/minuto) no bloquea
+a los demás y ninguno excede su cuota.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class NationalSweep:
+    """
+    Ejecuta la recolección de fuentes para una lista de ciudades con
+    concurrencia acotada por proveedor y reporte de progreso
+    """
+
+    def __init__(self, analyzer, progress_every=25, progress_callback=None):
+        self.analyzer = analyzer
+        self.progress_every = progress_every
+        self.progress_callback = progress_callback or self._print_progress
+
+        # Fuentes independientes por ciudad (mismas que analyze_single_city)
+        self.providers = {
+            'air': lambda name, coords: analyzer.get_real_air_quality_data(name, coords),
+            'weather': lambda name, coords: analyzer.get_real_weather_data(name, coords),
+            'openaq': lambda name, coords: analyzer.get_openaq_air_quality(coords, name),
+            'fires': lambda name, coords: analyzer.get_nasa_firms_fires(coords, name),
+        }
+
+    def run(self, cities):
+        """
+        Recolecta las fuentes de cada ciudad.
+        cities: lista de tuplas (city_name, city_info)
+        Retorna una lista de dicts {proveedor: datos o None} en el mismo orden
+        """
+        total = len(cities)
+        results = [dict() for _ in range(total)]
+        if total == 0:
+            return results
+
+        pending = [len(self.providers)] * total
+        # Sin la rejilla de clima, cada ciudad haría su propia llamada a OpenWeatherMap
+        self.analyzer.load_national_layers()
+
+        state = {'done': 0, 'start': time.monotonic()}
+        lock = threading.Lock()
+
+        executors = {
+            provider: ThreadPoolExecutor(
+                max_workers=self.analyzer.provider_limits[provider].max_concurrent,
+                thread_name_prefix=f'barrido-{provider}'
+            )
+            for provider in self.providers
+        }
+
+        def on_done(idx, provider, future):
+            try:
+                value = future.result()
+            except Exception:
+                value = None
+
+            with lock:
+                results[idx][provider] = value
+                pending[idx] -= 1
+                if pending[idx] > 0:
+                    return
+                state['done'] += 1
+                done = state['done']
+                elapsed = time.monotonic() - state['start']
+
+            if done == total or done % self.progress_every == 0:
+                self.progress_callback(done, total, cities[idx][0], elapsed)
+
+        try:
+            for idx, (city_name, city_info) in enumerate(cities):
+                coords = city_info['coords']
+                for provider, fetch in self.providers.items():
+                    future = executors[provider].submit(fetch, city_name, coords)
+                    future.add_done_callback(
+                        lambda f, idx=idx, provider=provider: on_done(idx, provider, f)
+                    )
+        finally:
+            for executor in executors.values():
+                executor.shutdown(wait=True)
+
+        return results
+
+    @staticmethod
+    def _print_progress(done, total, city_name, elapsed):
+        """Reporte de progreso por defecto (consola)"""
+        rate = done / elapsed if elapsed > 0 else 0
+        eta = (total - done) / rate if rate > 0 else 0
+        print(f"   📡 [{done}/{total}] {done / total:.1%} · {rate:.1f} ciudades/s · "
+              f"ETA {int(eta // 60)}m{int(eta % 60):02d}s · última: {city_name}")
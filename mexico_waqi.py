@@ -0,0 +1,123 @@
+"""
+CAPA NACIONAL DE CALIDAD DEL AIRE (WAQI)
+En lugar de consultar WAQI por nombre de ciudad (o por coordenadas) para cada
+municipio, se descargan periódicamente todas las estaciones dentro de la caja
+de México, se guardan como arreglos NumPy y se indexan por celdas. Cada ciudad
+toma el AQI y los contaminantes de la estación más cercana, en memoria.
+"""
+
+import numpy as np
+
+from mexico_spatial import GridIndex, NationalLayer
+
+# Contaminantes que se guardan por estación (subíndices iaqi de WAQI)
+POLLUTANTS = ('pm25', 'pm10', 'no2', 'o3', 'co')
+
+# Arreglo compacto de estaciones (NaN = la estación no reporta ese valor)
+STATION_DTYPE = np.dtype([
+    ('lat', np.float32),
+    ('lon', np.float32),
+    ('aqi', np.float32),
+] + [(name, np.float32) for name in POLLUTANTS])
+
+
+def _as_float(value):
+    """Valores de WAQI ('57', 57, '-', None) -> float o NaN"""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def parse_waqi_bounds(data):
+    """
+    Convierte la respuesta de map/bounds de WAQI en una lista de estaciones
+    {uid, name, lat, lon, aqi}; se descartan las que no reportan AQI
+    """
+    stations = []
+    for item in data.get('data') or []:
+        aqi = _as_float(item.get('aqi'))
+        if np.isnan(aqi) or aqi <= 0:
+            continue
+        try:
+            stations.append({
+                'uid': int(item['uid']),
+                'name': (item.get('station') or {}).get('name', ''),
+                'lat': float(item['lat']),
+                'lon': float(item['lon']),
+                'aqi': aqi,
+            })
+        except (KeyError, TypeError, ValueError):
+            continue
+    return stations
+
+
+def station_pollutants(feed_data):
+    """Subíndices de contaminantes de la respuesta feed/@uid ({nombre: float o NaN})"""
+    iaqi = (feed_data or {}).get('iaqi') or {}
+    return {name: _as_float((iaqi.get(name) or {}).get('v')) for name in POLLUTANTS}
+
+
+class WaqiStationIndex(NationalLayer):
+    """
+    Estaciones WAQI de todo México en memoria con índice espacial.
+    fetch_stations: función sin argumentos que retorna la lista de estaciones
+    ({uid, name, lat, lon, aqi, pm25, pm10, no2, o3, co}) o None si falla
+    """
+
+    name = 'waqi'
+
+    def __init__(self, fetch_stations, refresh_interval=30 * 60, retry_interval=300,
+                 cell_deg=0.5, max_distance_km=75):
+        # La primera descarga (una llamada por estación) se hace en segundo plano:
+        # mientras tanto query() retorna None y la ciudad sale sin AQI
+        super().__init__(fetch_stations, refresh_interval, retry_interval, block_first_load=False)
+        self.cell_deg = cell_deg
+        self.max_distance_km = max_distance_km  # Más lejos, la estación ya no representa a la ciudad
+
+    def build(self, stations):
+        """Arreglo de estaciones + nombres + índice por celdas"""
+        array = np.empty(len(stations), dtype=STATION_DTYPE)
+        for name in STATION_DTYPE.names:
+            array[name] = [station.get(name, np.nan) for station in stations]
+        names = tuple(station.get('name', '') for station in stations)
+        uids = np.array([station.get('uid', -1) for station in stations], dtype=np.int64)
+        index = GridIndex(array['lat'], array['lon'], cell_deg=self.cell_deg)
+        print(f"🌬️  WAQI nacional: {len(stations)} estaciones indexadas")
+        return array, names, uids, index
+
+    def query(self, lat, lon, max_distance_km=None):
+        """
+        AQI y contaminantes de la estación más cercana a (lat, lon).
+        Retorna None si la capa no se ha podido descargar o no hay estación en el radio
+        """
+        state = self.current()
+        if state is None:
+            return None
+        stations, names, uids, index = state
+
+        position, distance = index.nearest(lat, lon, max_distance_km or self.max_distance_km)
+        if position is None:
+            return None
+
+        station = stations[position]
+        result = {'aqi': float(station['aqi'])}
+        for name in POLLUTANTS:
+            value = float(station[name])
+            result[name] = None if np.isnan(value) else value
+        result.update({
+            'station': names[position],
+            'station_uid': int(uids[position]),
+            'distance_km': round(distance, 1),
+            'source': 'WAQI API (estación más cercana)'
+        })
+        return result
+
+    def stats(self):
+        state = self._state
+        return {
+            'loaded': state is not None,
+            'stations': len(state[0]) if state is not None else 0,
+            'refresh_interval_seconds': self.refresh_interval,
+            'max_distance_km': self.max_distance_km
+        }
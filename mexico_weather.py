@@ -0,0 +1,136 @@
+"""
+CAPA NACIONAL DE CLIMA (OPENWEATHERMAP EN REJILLA)
+En lugar de una llamada a OpenWeatherMap por municipio, se consulta una rejilla
+regular de nodos (por defecto 0.5°) que cubre solo las celdas donde hay municipios.
+Los valores se guardan como arreglos NumPy y cada ciudad obtiene temperatura,
+humedad y viento por interpolación bilineal de los cuatro nodos de su celda.
+El número de llamadas depende del tamaño de la rejilla, no de cuántos municipios hay
+"""
+
+import numpy as np
+
+from mexico_spatial import NationalLayer
+
+# Variables numéricas que se interpolan
+WEATHER_FIELDS = ('temperature', 'feels_like', 'humidity', 'pressure', 'wind_speed', 'clouds')
+
+
+class WeatherGrid(NationalLayer):
+    """
+    Rejilla de clima renovada periódicamente.
+    fetch_nodes: función sin argumentos que retorna [(nodo, datos o None), ...] para self.nodes()
+    El nodo (fila, columna) está en (fila * step_deg, columna * step_deg)
+    """
+
+    name = 'clima'
+
+    def __init__(self, fetch_nodes, step_deg=0.5, refresh_interval=3600, retry_interval=300):
+        # La primera descarga tarda minutos por la cuota: no se bloquea la consulta
+        super().__init__(fetch_nodes, refresh_interval, retry_interval, block_first_load=False)
+        self.step_deg = step_deg
+        self._nodes = ()
+
+    def set_points(self, lats, lons):
+        """Define los nodos a consultar: las esquinas de cada celda que contiene un municipio"""
+        rows = np.floor(np.asarray(lats, dtype=np.float64) / self.step_deg).astype(np.int64)
+        cols = np.floor(np.asarray(lons, dtype=np.float64) / self.step_deg).astype(np.int64)
+        nodes = set()
+        for d_row in (0, 1):
+            for d_col in (0, 1):
+                nodes.update(zip((rows + d_row).tolist(), (cols + d_col).tolist()))
+
+        nodes = tuple(sorted(nodes))
+        if nodes != self._nodes:
+            self._nodes = nodes
+            self.invalidate()
+
+    def nodes(self):
+        return self._nodes
+
+    def node_coords(self, node):
+        """Coordenadas (lat, lon) de un nodo"""
+        return (round(node[0] * self.step_deg, 4), round(node[1] * self.step_deg, 4))
+
+    def build(self, results):
+        """Arreglos (campo, fila, columna) con NaN en los nodos sin datos + descripción por nodo"""
+        rows = [node[0] for node, _ in results]
+        cols = [node[1] for node, _ in results]
+        row0, col0 = min(rows), min(cols)
+        shape = (len(WEATHER_FIELDS), max(rows) - row0 + 1, max(cols) - col0 + 1)
+
+        values = np.full(shape, np.nan, dtype=np.float32)
+        descriptions = {}
+        fetched = 0
+        for (row, col), data in results:
+            if not data:
+                continue
+            fetched += 1
+            for i, field in enumerate(WEATHER_FIELDS):
+                value = data.get(field)
+                if value is not None:
+                    values[i, row - row0, col - col0] = value
+            descriptions[(row, col)] = data.get('weather_desc')
+
+        print(f"🌡️  Clima nacional: {fetched}/{len(results)} nodos de {self.step_deg}° con datos")
+        return row0, col0, values, descriptions
+
+    def query(self, lat, lon, wait=None):
+        """
+        Clima interpolado en (lat, lon); los nodos sin datos se ignoran y los pesos
+        se renormalizan. Retorna None si la rejilla no está cargada o no hay nodos con datos
+        """
+        state = self.current(wait=wait)
+        if state is None:
+            return None
+        row0, col0, values, descriptions = state
+
+        y = lat / self.step_deg
+        x = lon / self.step_deg
+        row, col = int(np.floor(y)), int(np.floor(x))
+        ty, tx = y - row, x - col
+
+        corners = []
+        for d_row, d_col, weight in ((0, 0, (1 - ty) * (1 - tx)), (1, 0, ty * (1 - tx)),
+                                     (0, 1, (1 - ty) * tx), (1, 1, ty * tx)):
+            r, c = row + d_row - row0, col + d_col - col0
+            if 0 <= r < values.shape[1] and 0 <= c < values.shape[2]:
+                corners.append((r, c, weight))
+        if not corners:
+            return None
+
+        r_idx = np.array([r for r, _, _ in corners])
+        c_idx = np.array([c for _, c, _ in corners])
+        weights = np.array([w for _, _, w in corners], dtype=np.float64)
+        samples = values[:, r_idx, c_idx].astype(np.float64)
+
+        result = {}
+        for i, field in enumerate(WEATHER_FIELDS):
+            valid = ~np.isnan(samples[i])
+            if not valid.any():
+                result[field] = None
+                continue
+            w = weights[valid]
+            if w.sum() <= 0:
+                # Punto sobre el borde de la celda: los nodos con peso no tienen datos
+                w = np.ones_like(w)
+            result[field] = round(float(np.dot(samples[i][valid], w) / w.sum()), 2)
+
+        if result['temperature'] is None:
+            return None
+
+        # Descripción del nodo con datos más cercano
+        valid = ~np.isnan(samples[0])
+        nearest = int(np.argmax(np.where(valid, weights, -1.0)))
+        result['weather_desc'] = descriptions.get((r_idx[nearest] + row0, c_idx[nearest] + col0))
+        result['source'] = f'OpenWeatherMap API (rejilla {self.step_deg}°)'
+        return result
+
+    def stats(self):
+        state = self._state
+        return {
+            'loaded': state is not None,
+            'step_deg': self.step_deg,
+            'nodes': len(self._nodes),
+            'nodes_with_data': int((~np.isnan(state[2][0])).sum()) if state is not None else 0,
+            'refresh_interval_seconds': self.refresh_interval
+        }
@@ -0,0 +1,42 @@
+"""
+Claves estables del catálogo: vienen de data/municipios.npz y no dependen de qué
+otros registros estén presentes (agregar un municipio no renumera a los demás)
+"""
+
+import os
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from mexico_catalog import MunicipioCatalog  # noqa: E402
+from mexico_data import MUNICIPIOS_POR_ESTADO, MunicipiosPorEstado, save_municipios  # noqa: E402
+
+
+def _full_catalog():
+    return MunicipioCatalog.build({}, MUNICIPIOS_POR_ESTADO)
+
+
+def test_base_city_keeps_its_id_without_the_full_catalog():
+    full = _full_catalog()
+    tijuana = full.find('Tijuana', 'Baja California')
+    base = {'Tijuana': {'coords': tijuana['coords'], 'estado': 'Baja California',
+                        'poblacion': tijuana['poblacion']}}
+    assert MunicipioCatalog.build(base).find('Tijuana')['id'] == tijuana['id']
+
+
+def test_new_municipio_does_not_renumber_existing_ids(tmp_path):
+    full = _full_catalog()
+    municipios = {estado: dict(filas) for estado, filas in MUNICIPIOS_POR_ESTADO.items()}
+    municipios['Puebla']['AAA Municipio Nuevo'] = {
+        'coords': [19.0, -98.0], 'estado': 'Puebla', 'poblacion': 1000, 'lat': 19.0, 'lon': -98.0
+    }
+    path = str(tmp_path / 'municipios.npz')
+    save_municipios(municipios, path)
+
+    grown = MunicipioCatalog.build({}, MunicipiosPorEstado(path))
+    assert len(grown) == len(full) + 1
+    for record in full:
+        assert grown.find(record['nombre'], record['estado'])['id'] == record['id']
+    new_id = grown.find('AAA Municipio Nuevo', 'Puebla')['id']
+    assert new_id // 1000 == 21 and new_id not in full
@@ -0,0 +1,32 @@
+"""
+La tabla de espacios verdes se descarta si se construyó para otro catálogo
+(sus filas están indexadas por clave de municipio)
+"""
+
+import os
+import sys
+
+import numpy as np
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from mexico_catalog import MunicipioCatalog  # noqa: E402
+from mexico_data import MUNICIPIOS_POR_ESTADO  # noqa: E402
+from mexico_green_spaces import GreenSpaceTable, build_green_table, save_green_table  # noqa: E402
+
+
+def test_green_table_is_discarded_for_another_catalog(tmp_path, capsys):
+    catalog = MunicipioCatalog.build({}, MUNICIPIOS_POR_ESTADO)
+    first = next(iter(catalog))
+    table = build_green_table(catalog, np.array([first['lat']]), np.array([first['lon']]), np.array([2.0]))
+    path = str(tmp_path / 'green_spaces.npz')
+    save_green_table(table, path)
+
+    loaded = GreenSpaceTable(catalog, path)
+    assert len(loaded) == len(catalog)
+    assert loaded.get(first['id'])['green_area_km2'] > 0
+
+    other = MunicipioCatalog.build({}, {'Puebla': dict(MUNICIPIOS_POR_ESTADO['Puebla'])})
+    assert len(GreenSpaceTable(other, path)) == 0
+    assert 'reconstruir' in capsys.readouterr().out
@@ -0,0 +1,56 @@
+"""
+calculate_health_scores (vectorizado) da lo mismo que _calculate_city_health_score
+ciudad por ciudad, también cuando faltan datos (None/NaN)
+"""
+
+import os
+import sys
+
+import numpy as np
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_DIR)
+
+from mexico_health_analyzer import MexicoHealthAnalyzer  # noqa: E402
+
+NAN = float('nan')
+
+ROWS = [
+    # Todos los componentes con datos
+    {'air_quality_index': 85, 'pm25_concentration': 22.5, 'green_space_ratio': 0.18, 'ndvi_value': 0.35,
+     'temperature_avg': 24.0, 'humidity_avg': 55, 'population_density': 6500, 'noise_pollution_db': 68,
+     'healthcare_accessibility': 7.5},
+    # Valores fuera de rango (recortes a 0/100 y ramas no óptimas de clima/densidad)
+    {'air_quality_index': 350, 'pm25_concentration': 80.0, 'green_space_ratio': 0.02, 'ndvi_value': -0.4,
+     'temperature_avg': 38.0, 'humidity_avg': 15, 'population_density': 16000, 'noise_pollution_db': 95,
+     'healthcare_accessibility': 3.0},
+    # Sin aire (None) ni ruido (None): se renormalizan los pesos
+    {'air_quality_index': None, 'pm25_concentration': None, 'green_space_ratio': 0.25, 'ndvi_value': 0.5,
+     'temperature_avg': 12.0, 'humidity_avg': 70, 'population_density': 1500, 'noise_pollution_db': None,
+     'healthcare_accessibility': 9.0},
+    # Componentes incompletos: basta un dato faltante (NaN) para descartar el componente
+    {'air_quality_index': 60, 'pm25_concentration': NAN, 'green_space_ratio': NAN, 'ndvi_value': 0.1,
+     'temperature_avg': 20.0, 'humidity_avg': 45, 'population_density': 3000, 'noise_pollution_db': 55,
+     'healthcare_accessibility': None},
+    # Sin ningún dato: score neutral
+    {'air_quality_index': None, 'pm25_concentration': NAN, 'green_space_ratio': None, 'ndvi_value': NAN,
+     'temperature_avg': None, 'humidity_avg': None, 'population_density': NAN, 'noise_pollution_db': None,
+     'healthcare_accessibility': NAN},
+]
+
+
+def _scalar_row(row):
+    # El cálculo por ciudad solo reconoce None como dato faltante
+    return {key: None if value is None or value != value else value for key, value in row.items()}
+
+
+def test_vectorized_scores_match_scalar_scores():
+    import pandas as pd
+    # Ninguno de los dos cálculos usa el estado del analizador (evita APIs y catálogos)
+    analyzer = MexicoHealthAnalyzer.__new__(MexicoHealthAnalyzer)
+
+    expected = [analyzer._calculate_city_health_score(_scalar_row(row)) for row in ROWS]
+    scores = analyzer.calculate_health_scores(pd.DataFrame(ROWS))
+
+    np.testing.assert_allclose(scores, expected, rtol=0, atol=1e-9)
+    assert scores[-1] == 50.0
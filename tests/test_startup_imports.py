@@ -0,0 +1,47 @@
+"""
+Presupuesto de arranque del servidor web: importar mexico_interactive_map no debe
+cargar pandas, plotly, folium ni google.generativeai (se importan al usarse)
+y debe mantenerse dentro de un tiempo acotado
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Bibliotecas pesadas que solo usan el tablero, el mapa nacional o Gemini
+DEFERRED_MODULES = ('pandas', 'plotly', 'folium', 'google.generativeai')
+
+# Segundos; medido ~0.6 s, holgura para máquinas de CI lentas
+IMPORT_BUDGET_SECONDS = float(os.getenv("IMPORT_BUDGET_SECONDS", "3.0"))
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import mexico_interactive_map
+elapsed = time.perf_counter() - start
+print(json.dumps({'seconds': elapsed, 'loaded': [m for m in %r if m in sys.modules]}))
+""" % (DEFERRED_MODULES,)
+
+
+def _import_in_subprocess():
+    env = dict(os.environ, SNAPSHOT_SCHEDULER='false', PYTHONPATH=REPO_DIR)
+    result = subprocess.run([sys.executable, '-c', PROBE], cwd=REPO_DIR, env=env,
+                            capture_output=True, text=True, timeout=120)
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_web_import_defers_heavy_libraries():
+    probe = _import_in_subprocess()
+    assert probe['loaded'] == []
+
+
+def test_web_import_within_budget():
+    probe = _import_in_subprocess()
+    assert probe['seconds'] < IMPORT_BUDGET_SECONDS, (
+        f"importar mexico_interactive_map tardó {probe['seconds']:.2f}s "
+        f"(presupuesto {IMPORT_BUDGET_SECONDS}s)"
+    )